@@ -0,0 +1,83 @@
+"""
+Benchmark for local app name search.
+
+Builds a synthetic catalog the size of Steam's (about 200k apps), then
+times index construction and autocomplete, token and typo-tolerant
+queries behind the search_games and resolve_app_name tools.
+
+Usage:
+    python benchmarks/bench_app_search.py [--apps 200000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.appsearch import AppSearchIndex  # noqa: E402
+from steam.catalog import AppCatalog  # noqa: E402
+
+SYLLABLES = ["ka", "ro", "mi", "zen", "tor", "vel", "dra", "quin", "sol", "mar", "ix", "lu",
+             "ne", "shad", "ow", "fall", "star", "craft", "war", "hunt", "ter", "ra", "bo", "rn"]
+WORDS = ["the", "of", "legends", "2", "3", "simulator", "online", "remastered", "edition",
+         "soundtrack", "dlc", "pack", "tales", "chronicles", "vr", "deluxe"]
+
+
+def _word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _name(rng):
+    parts = [_word(rng).capitalize() for _ in range(rng.randint(1, 3))]
+    parts += rng.sample(WORDS, rng.randint(0, 2))
+    return " ".join(parts)
+
+
+def _timeit(label, func, repeat=200, setup=None):
+    """Run func repeatedly and print the mean time per call."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if setup:
+            setup()
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1e6:10.1f} us")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--apps", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = [(10 * (i + 1), _name(rng), 0) for i in range(args.apps)]
+    catalog = AppCatalog()
+    catalog.replace(entries)
+    index = AppSearchIndex(catalog)
+
+    start = time.perf_counter()
+    len(index)
+    print(f"{'index build (' + str(args.apps) + ' apps)':<40} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+    target = entries[args.apps // 2][1]
+    words = target.lower().split()
+    longest = max(words, key=len)
+    typo = " ".join(words).replace(longest, longest[:2] + longest[3] + longest[2] + longest[4:])
+
+    _timeit(f"exact name ({target!r})", lambda: index.search(target))
+    _timeit(f"prefix ({target[:5]!r})", lambda: index.search(target[:5]))
+    _timeit(f"tokens ({' '.join(reversed(words))!r})", lambda: index.search(" ".join(reversed(words))))
+    _timeit(f"typo, cold ({typo!r})", lambda: index.search(typo), repeat=20,
+            setup=lambda: index._current().fuzzy_cache.clear())
+    _timeit(f"typo, warm ({typo!r})", lambda: index.search(typo))
+    _timeit("resolve", lambda: index.resolve(target))
+
+
+if __name__ == "__main__":
+    main()
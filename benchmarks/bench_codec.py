@@ -0,0 +1,127 @@
+"""
+Microbenchmark for the JSON codec.
+
+Compares decode and encode throughput of the stdlib json module and the
+fast backend (orjson, when installed) on appdetails, owned-games and
+pricehistory payloads, plus encoding typed records through to_dict()
+against encoding the dataclasses directly.
+
+Payloads are synthetic but shaped like real responses; pass recorded
+bodies with --payload name=path.json to benchmark those instead.
+
+Usage:
+    python benchmarks/bench_codec.py [--payload appdetails=recorded/570.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam import codec  # noqa: E402
+from steam.schemas import Game  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOREM = ("Every day, millions of players worldwide enter battle as one of over a hundred "
+         "heroes. <strong>Whether it's their 10th hour of play or 1,000th</strong>, there's "
+         "always something new to discover. <br><img src=\"https://cdn.example/a.gif\"> ")
+
+
+def _appdetails(rng):
+    return {"570": {"success": True, "data": {
+        "type": "game", "name": "Dota 2", "steam_appid": 570, "required_age": 0, "is_free": True,
+        "detailed_description": LOREM * 40, "about_the_game": LOREM * 40, "short_description": LOREM,
+        "supported_languages": ", ".join(["English<strong>*</strong>"] * 30),
+        "pc_requirements": {"minimum": LOREM * 3}, "mac_requirements": {"minimum": LOREM * 3},
+        "developers": ["Valve"], "publishers": ["Valve"],
+        "packages": list(range(20)),
+        "platforms": {"windows": True, "mac": True, "linux": True},
+        "categories": [{"id": i, "description": f"Category {i}"} for i in range(15)],
+        "genres": [{"id": str(i), "description": f"Genre {i}"} for i in range(4)],
+        "screenshots": [{"id": i, "path_thumbnail": f"https://cdn.example/ss_{i:040x}.600x338.jpg",
+                         "path_full": f"https://cdn.example/ss_{i:040x}.1920x1080.jpg"} for i in range(30)],
+        "movies": [{"id": i, "name": f"Trailer {i}", "webm": {"480": "https://cdn.example/m.webm"}}
+                   for i in range(10)],
+        "recommendations": {"total": 2000000},
+        "release_date": {"coming_soon": False, "date": "9 Jul, 2013"},
+    }}}
+
+
+def _owned_games(rng, count=20000):
+    return {"response": {"game_count": count, "games": [
+        {"appid": 10 * (i + 1), "name": f"Game {i}", "playtime_forever": rng.randint(0, 100000),
+         "img_icon_url": "%040x" % rng.getrandbits(160), "has_community_visible_stats": True,
+         "playtime_windows_forever": rng.randint(0, 100000), "rtime_last_played": 1700000000 + i}
+        for i in range(count)]}}
+
+
+def _price_history(rng, count=20000):
+    return {"success": True, "price_prefix": "$", "price_suffix": "", "prices": [
+        [f"Jan {1 + i % 28:02d} 2020 {i % 24:02d}: +0", round(rng.uniform(0.03, 500), 3),
+         str(rng.randint(1, 5000))] for i in range(count)]}
+
+
+def _throughput(func, size, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    return size / elapsed / 1e6, elapsed
+
+
+def _row(label, func, size, repeat):
+    mb_per_s, elapsed = _throughput(func, size, repeat)
+    print(f"  {label:<34} {elapsed * 1e3:9.2f} ms  {mb_per_s:8.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payload", action="append", default=[], metavar="NAME=PATH",
+                        help="Recorded response body to benchmark (repeatable)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    if args.payload:
+        payloads = {}
+        for item in args.payload:
+            name, _, path = item.partition("=")
+            with open(path, "rb") as f:
+                payloads[name] = f.read()
+    else:
+        payloads = {
+            "appdetails": json.dumps(_appdetails(rng)).encode(),
+            "owned-games (20k)": json.dumps(_owned_games(rng)).encode(),
+            "pricehistory (20k)": json.dumps(_price_history(rng)).encode(),
+        }
+
+    print(f"active backend: {codec.BACKEND}")
+    for name, body in payloads.items():
+        data = json.loads(body)
+        print(f"{name} ({len(body) / 1e3:.0f} kB)")
+        _row("decode json.loads(bytes.decode())", lambda: json.loads(body.decode()), len(body), args.repeat)
+        if orjson is not None:
+            _row("decode orjson.loads", lambda: orjson.loads(body), len(body), args.repeat)
+        _row("encode json.dumps", lambda: json.dumps(data).encode(), len(body), args.repeat)
+        _row("encode codec.dumps", lambda: codec.dumps(data), len(body), args.repeat)
+
+    games = Game.from_api_response(_owned_games(rng))
+    size = len(codec.dumps(games))
+    print(f"owned-games as Game records ({len(games)})")
+    _row("json.dumps([g.to_dict() ...])", lambda: json.dumps([g.to_dict() for g in games]), size, args.repeat)
+    _row("codec.dumps([g.to_dict() ...])", lambda: codec.dumps([g.to_dict() for g in games]), size, args.repeat)
+    _row("codec.dumps(games) (dataclasses)", lambda: codec.dumps(games), size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
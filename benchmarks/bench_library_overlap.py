@@ -0,0 +1,70 @@
+"""
+Benchmark for AppSet library overlap queries.
+
+Builds synthetic libraries of 10k+ games for a group of users and times
+the set operations behind the get_common_games tool.
+
+Usage:
+    python benchmarks/bench_library_overlap.py [--users 12] [--games 12000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.library import AppSet  # noqa: E402
+
+# Real appids are multiples of 10 spread over roughly 0..3.5M
+APPID_UNIVERSE = range(10, 3_500_000, 10)
+
+
+def _timeit(label, func, repeat=200):
+    """Run func repeatedly and print the mean time per call."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<32} {elapsed * 1e6:10.1f} us")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=12)
+    parser.add_argument("--games", type=int, default=12000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # A shared pool of popular games makes the intersection non-trivial
+    popular = rng.sample(APPID_UNIVERSE, args.games)
+    libraries = []
+    for _ in range(args.users):
+        owned = set(rng.sample(popular, args.games // 2))
+        owned.update(rng.sample(APPID_UNIVERSE, args.games - len(owned)))
+        libraries.append(sorted(owned))
+
+    print(f"{args.users} users, ~{args.games} games each")
+    start = time.perf_counter()
+    sets = [AppSet.from_appids(lib) for lib in libraries]
+    print(f"{'encode all libraries':<32} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+    common = _timeit("intersection", lambda: AppSet.intersection(sets))
+    union = _timeit("union", lambda: AppSet.union(sets))
+    _timeit("jaccard (one pair)", lambda: sets[0].jaccard(sets[1]))
+    k = max(2, args.users // 2)
+    at_least = _timeit(f"owned by at least {k}", lambda: AppSet.at_least(sets, k), repeat=50)
+
+    py_sets = [set(lib) for lib in libraries]
+    _timeit("baseline: set.intersection", lambda: set.intersection(*py_sets))
+
+    print(f"common={len(common)} union={len(union)} at_least_{k}={len(at_least)}")
+
+
+if __name__ == "__main__":
+    main()
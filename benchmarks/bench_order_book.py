@@ -0,0 +1,84 @@
+"""
+Benchmark for order book snapshot storage.
+
+Polls a simulated order book for a batch of items, changing a few levels
+between polls, and compares:
+- memory held by full snapshots against delta-encoded OrderBookHistory
+- reconstructing a snapshot from the nearest keyframe
+- computing the summary metrics of a book
+
+Usage:
+    python benchmarks/bench_order_book.py [--items 100] [--polls 288] [--levels 100]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.orderbook import OrderBook, OrderBookHistory  # noqa: E402
+
+
+def _book(rng, levels):
+    buy = np.sort(np.array(rng.sample(range(100, 5000), levels), dtype=np.int64))
+    sell = np.sort(np.array(rng.sample(range(5001, 10000), levels), dtype=np.int64))
+    quantities = lambda: np.array([rng.randint(1, 100) for _ in range(levels)], dtype=np.int32)  # noqa: E731
+    return OrderBook(buy, quantities(), sell, quantities())
+
+
+def _poll(rng, book, timestamp):
+    buy_quantities, sell_quantities = book.buy_quantities.copy(), book.sell_quantities.copy()
+    for quantities in (buy_quantities, sell_quantities):
+        for _ in range(3):
+            quantities[rng.randrange(len(quantities))] = rng.randint(1, 100)
+    return OrderBook(book.buy_prices, buy_quantities, book.sell_prices, sell_quantities, timestamp=timestamp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--polls", type=int, default=288)
+    parser.add_argument("--levels", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    histories, full = [], 0
+    start = time.perf_counter()
+    for _ in range(args.items):
+        history = OrderBookHistory(max_snapshots=args.polls)
+        book = _book(rng, args.levels)
+        for poll in range(args.polls):
+            history.append(book)
+            full += book.nbytes
+            book = _poll(rng, book, float(poll + 1))
+        histories.append(history)
+    append = time.perf_counter() - start
+
+    delta = sum(h.nbytes for h in histories)
+    print(f"{args.items} items x {args.polls} polls, {args.levels} levels per side")
+    print(f"  {'full snapshots':<30} {full / 1e6:8.2f} MB")
+    print(f"  {'delta-encoded history':<30} {delta / 1e6:8.2f} MB  {full / delta:5.1f}x smaller")
+
+    start = time.perf_counter()
+    for history in histories:
+        history.snapshot(len(history) - 2)
+    reconstruct = time.perf_counter() - start
+    start = time.perf_counter()
+    for history in histories:
+        history.latest.summary()
+    summary = time.perf_counter() - start
+
+    print("per item:")
+    print(f"  {'append one poll':<30} {append / args.items / args.polls * 1e6:8.1f} us")
+    print(f"  {'reconstruct a snapshot':<30} {reconstruct / args.items * 1e6:8.1f} us")
+    print(f"  {'summary metrics':<30} {summary / args.items * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark for the local price-history archive.
+
+Archives multi-year price histories for a batch of items and compares:
+- disk size of the archive against the pricehistory JSON bodies
+- serving a repeat query by parsing the JSON body again vs reading the archive
+- reading the last 30 days through the block index
+- an incremental merge of one new hourly point per item
+
+Usage:
+    python benchmarks/bench_price_archive.py [--items 200] [--years 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_price_series import _history  # noqa: E402
+from steam.pricearchive import PriceArchive  # noqa: E402
+from steam.priceseries import PriceSeries  # noqa: E402
+
+
+def _disk_usage(root):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bodies = [json.dumps({"success": True, "price_prefix": "$", "price_suffix": "",
+                          "prices": _history(rng, args.years)}) for _ in range(args.items)]
+    names = [f"Item {i}" for i in range(args.items)]
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = PriceArchive(root)
+        series = [PriceSeries.from_api_response(json.loads(body)) for body in bodies]
+        start = time.perf_counter()
+        for name, s in zip(names, series):
+            archive.merge(730, name, 1, s)
+        backfill = time.perf_counter() - start
+
+        json_size, disk_size = sum(len(b) for b in bodies), _disk_usage(root)
+        points = sum(len(s) for s in series)
+        print(f"{args.items} items, {points} points")
+        print(f"  {'pricehistory JSON':<30} {json_size / 1e6:8.2f} MB")
+        print(f"  {'archive on disk':<30} {disk_size / 1e6:8.2f} MB  {json_size / disk_size:5.1f}x smaller")
+
+        start = time.perf_counter()
+        for body in bodies:
+            PriceSeries.from_api_response(json.loads(body))
+        reparse = time.perf_counter() - start
+        start = time.perf_counter()
+        for name in names:
+            archive.read(730, name, 1)
+        full = time.perf_counter() - start
+        recent_start = int(series[0].timestamps[-1]) - 30 * 86400
+        start = time.perf_counter()
+        for name in names:
+            archive.read(730, name, 1, start=recent_start)
+        recent = time.perf_counter() - start
+
+        grown = [PriceSeries(np.append(s.timestamps, s.timestamps[-1] + 3600), np.append(s.prices, 1.0),
+                             np.append(s.volumes, 1).astype(np.int32), "$", "") for s in series]
+        start = time.perf_counter()
+        for name, s in zip(names, grown):
+            archive.merge(730, name, 1, s)
+        merge = time.perf_counter() - start
+
+    print("per item:")
+    print(f"  {'parse JSON body again':<30} {reparse / args.items * 1e3:8.2f} ms")
+    print(f"  {'archive read, full history':<30} {full / args.items * 1e3:8.2f} ms")
+    print(f"  {'archive read, last 30 days':<30} {recent / args.items * 1e3:8.2f} ms")
+    print(f"  {'initial merge':<30} {backfill / args.items * 1e3:8.2f} ms")
+    print(f"  {'merge one new point':<30} {merge / args.items * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
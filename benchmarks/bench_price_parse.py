@@ -0,0 +1,72 @@
+"""
+Benchmark for localized price-string parsing.
+
+Generates market price strings in several currency formats and compares
+turning them into integer hundredths:
+- a per-string parser that works out the separators from each string
+- steam.currency.parse_prices with the cached parser of the list's currency
+
+Usage:
+    python benchmarks/bench_price_parse.py [--strings 200000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.currency import parse_prices  # noqa: E402
+
+FORMATS = {
+    "USD": lambda v: f"${v / 100:,.2f}",
+    "EUR": lambda v: f"{v / 100:,.2f}".replace(",", " ").replace(".", ",") + "€",
+    "RUB": lambda v: f"{v / 100:,.2f}".replace(",", " ").replace(".", ",") + " pуб.",
+    "JPY": lambda v: f"¥ {v // 100:,}",
+}
+
+
+def _naive(text):
+    """Strip everything but digits and separators, then guess the decimal separator."""
+    number = re.sub(r"[^\d.,]", "", text or "")
+    if not number:
+        return None
+    tail = max(number.rfind("."), number.rfind(","))
+    if tail != -1 and len(number) - tail - 1 <= 2:
+        whole, fraction = number[:tail], number[tail + 1:]
+    else:
+        whole, fraction = number, ""
+    whole = re.sub(r"\D", "", whole)
+    return int(whole or 0) * 100 + int((fraction + "00")[:2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strings", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{args.strings} strings per currency")
+    for code, fmt in FORMATS.items():
+        values = [int(rng.lognormvariate(4, 2.5)) * (100 if code == "JPY" else 1) for _ in range(args.strings)]
+        texts = [fmt(v) for v in values]
+
+        start = time.perf_counter()
+        naive = [_naive(t) for t in texts]
+        naive_time = time.perf_counter() - start
+        start = time.perf_counter()
+        parsed = parse_prices(texts, code)
+        parsed_time = time.perf_counter() - start
+
+        assert parsed == values, code
+        wrong = sum(a != b for a, b in zip(naive, values))
+        print(f"  {code}  per-string {naive_time * 1e9 / args.strings:6.0f} ns ({wrong} wrong)"
+              f"   parse_prices {parsed_time * 1e9 / args.strings:6.0f} ns  {naive_time / parsed_time:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark for price history resampling and downsampling.
+
+Compares the serialized size of a multi-year price history returned as
+raw points against OHLC bars (1h, 1d, 1w) and LTTB-downsampled points,
+with the time to produce each from the raw pricehistory rows.
+
+Usage:
+    python benchmarks/bench_price_resample.py [--years 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_price_series import _history  # noqa: E402
+from steam.priceseries import PriceSeries  # noqa: E402
+
+
+def _timeit(func, repeat=50):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    prices = _history(random.Random(args.seed), args.years)
+    raw_size = len(json.dumps(prices))
+    print(f"{len(prices)} points, {raw_size / 1e3:.1f} kB as returned by Steam")
+    print(f"  {'output':<24} {'rows':>6} {'kB':>8} {'smaller':>8} {'time (ms)':>10}")
+
+    variants = [("raw points", lambda: prices)]
+    for interval in ("1h", "1d", "1w"):
+        variants.append((f"{interval} bars", lambda i=interval: PriceSeries.from_prices(prices).resample(i).to_dict()["bars"]))
+    variants.append(("1d bars, last 90", lambda: PriceSeries.from_prices(prices).resample("1d").last(90).to_dict()["bars"]))
+    for max_points in (500, 200, 50):
+        variants.append((f"LTTB {max_points} points",
+                         lambda n=max_points: PriceSeries.from_prices(prices).downsample(n).to_prices()))
+
+    for label, func in variants:
+        elapsed, rows = _timeit(func)
+        size = len(json.dumps(rows))
+        print(f"  {label:<24} {len(rows):6d} {size / 1e3:8.1f} {raw_size / size:7.1f}x {elapsed * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
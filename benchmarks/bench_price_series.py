@@ -0,0 +1,84 @@
+"""
+Benchmark for columnar price-history parsing.
+
+Builds multi-year histories shaped like market/pricehistory responses
+(daily points for older data, hourly points for the last month) for a
+batch of items and compares:
+- strptime per row into Python lists
+- PriceSeries.from_prices (vectorized dates, NumPy columns)
+and the cost of a time-range slice by linear scan vs binary search.
+
+Usage:
+    python benchmarks/bench_price_series.py [--items 1000] [--years 5]
+"""
+
+import argparse
+import calendar
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.priceseries import PriceSeries, format_dates  # noqa: E402
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+def _history(rng, years, end=1704067200):
+    start = end - years * 365 * DAY
+    recent = end - 30 * DAY
+    stamps = list(range(start, recent, DAY)) + list(range(recent, end, HOUR))
+    return [[date, round(rng.uniform(0.03, 500), 3), str(rng.randint(1, 5000))]
+            for date in format_dates(stamps)]
+
+
+def _strptime_rows(prices):
+    timestamps, values, volumes = [], [], []
+    for date, price, volume in prices:
+        parsed = datetime.strptime(date[:-3], "%b %d %Y %H:")
+        timestamps.append(calendar.timegm(parsed.timetuple()))
+        values.append(float(price))
+        volumes.append(int(volume))
+    return timestamps, values, volumes
+
+
+def _timeit(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    histories = [_history(rng, args.years) for _ in range(args.items)]
+    points = sum(len(h) for h in histories)
+    print(f"{args.items} items, {points} points ({points // args.items} per item)")
+
+    naive = _timeit(lambda: [_strptime_rows(h) for h in histories])
+    columnar = _timeit(lambda: [PriceSeries.from_prices(h) for h in histories])
+    print(f"  {'strptime per row':<28} {naive:8.2f} s  {points / naive / 1e6:6.2f} M points/s")
+    print(f"  {'PriceSeries.from_prices':<28} {columnar:8.2f} s  {points / columnar / 1e6:6.2f} M points/s")
+
+    timestamps, _, _ = _strptime_rows(histories[0])
+    series = PriceSeries.from_prices(histories[0])
+    lo, hi = timestamps[len(timestamps) // 3], timestamps[2 * len(timestamps) // 3]
+    scan = _timeit(lambda: [i for i, t in enumerate(timestamps) if lo <= t <= hi], 1000)
+    search = _timeit(lambda: series.between(lo, hi), 1000)
+    print(f"one-third range slice of {len(timestamps)} points")
+    print(f"  {'linear scan':<28} {scan * 1e6:8.1f} us")
+    print(f"  {'PriceSeries.between':<28} {search * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for vectorized price indicators.
+
+Builds multi-year price histories for a batch of items, resamples them into
+daily bars and compares computing the get_item_price_stats summary
+(SMA, EMA, VWAP, volatility, drawdown, change over 7 and 30 bars):
+- with plain Python loops, one item at a time
+- with steam.pricestats on one items x bars matrix
+
+Usage:
+    python benchmarks/bench_price_stats.py [--items 500] [--years 5]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_price_series import _history  # noqa: E402
+from steam.priceseries import PriceSeries  # noqa: E402
+from steam.pricestats import align, summarize  # noqa: E402
+
+WINDOWS = (7, 30)
+
+
+def _loop_stats(close, volume, turnover):
+    stats = {}
+    peak, max_dd = close[0], 0.0
+    for price in close:
+        peak = max(peak, price)
+        max_dd = min(max_dd, price / peak - 1.0)
+    stats["drawdown"] = close[-1] / peak - 1.0
+    stats["max_drawdown"] = max_dd
+    returns = [math.log(b / a) for a, b in zip(close, close[1:])]
+    for window in WINDOWS:
+        alpha, average = 2.0 / (window + 1), close[0]
+        for price in close[1:]:
+            average += alpha * (price - average)
+        recent, weights = close[-window:], volume[-window:]
+        stats[f"change_{window}"] = close[-1] / close[-window - 1] - 1.0
+        stats[f"sma_{window}"] = sum(recent) / window
+        stats[f"ema_{window}"] = average
+        stats[f"vwap_{window}"] = sum(turnover[-window:]) / (sum(weights) or 1)
+        stats[f"volatility_{window}"] = statistics.pstdev(returns[-window:])
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    series = [PriceSeries.from_prices(_history(rng, args.years)) for _ in range(args.items)]
+    matrix = align(series, "1d")
+    print(f"{args.items} items, {matrix.close.shape[1]} daily bars each")
+
+    start = time.perf_counter()
+    close, volume, turnover = matrix.close.tolist(), matrix.volume.tolist(), matrix.turnover.tolist()
+    for row in range(matrix.items):
+        _loop_stats(close[row], volume[row], turnover[row])
+    loops = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summarize(matrix, WINDOWS)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summarize(align(series, "1d"), WINDOWS)
+    with_align = time.perf_counter() - start
+
+    print(f"  {'Python loops per item':<32} {loops * 1e3:9.1f} ms")
+    print(f"  {'summarize (matrix)':<32} {vectorized * 1e3:9.1f} ms  {loops / vectorized:5.1f}x")
+    print(f"  {'align + summarize':<32} {with_align * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
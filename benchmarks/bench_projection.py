@@ -0,0 +1,57 @@
+"""
+Benchmark for field projection.
+
+Compares output size and extract + serialize time of full records
+against projections with the fields parameter, for an appdetails
+payload and a 20k-game owned-games payload.
+
+Usage:
+    python benchmarks/bench_projection.py
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_codec import _appdetails, _owned_games  # noqa: E402
+from steam.schemas import AppDetails, Game, project, select_fields  # noqa: E402
+
+
+def _timeit(func, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def _row(label, func, repeat):
+    elapsed, output = _timeit(func, repeat)
+    print(f"  {label:<44} {elapsed * 1e6:10.1f} us {len(output) / 1e3:10.1f} kB")
+
+
+def main():
+    rng = random.Random(42)
+
+    details = _appdetails(rng)
+    print("appdetails (extract + json.dumps)")
+    _row("all fields", lambda: json.dumps(AppDetails.from_api_response(details, 570).to_dict()), 2000)
+    for names in (["name", "price_overview"], ["name", "short_description", "developers", "release_date"]):
+        fields = select_fields(AppDetails, names, always=("appid",))
+        _row(",".join(names), lambda: json.dumps(AppDetails.project_response(details, 570, fields)), 2000)
+
+    owned = _owned_games(rng)
+    print(f"owned games, {len(owned['response']['games'])} records (extract + json.dumps)")
+    _row("all fields", lambda: json.dumps([g.to_dict() for g in Game.from_api_response(owned)]), 10)
+    for names in (["name"], ["name", "playtime_forever"]):
+        fields = select_fields(Game, names, always=("appid",))
+        _row(",".join(names), lambda: json.dumps([project(g, fields) for g in owned["response"]["games"]]), 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark for slots-based record types.
+
+Builds a 20k-game library (and matching friend and news lists) with the
+__slots__ schema classes and with plain-dataclass twins of the same
+fields, and reports memory per record (tracemalloc) and construction
+time.
+
+Usage:
+    python benchmarks/bench_records.py [--games 20000]
+"""
+
+import argparse
+import dataclasses
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.schemas import Friend, Game, GameNews  # noqa: E402
+
+
+def _plain_twin(cls):
+    """The same dataclass without __slots__."""
+    spec = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default=f.default)))
+        else:
+            spec.append((f.name, f.type))
+    twin = dataclasses.make_dataclass(f"Plain{cls.__name__}", spec)
+    twin.from_api_response = classmethod(cls.from_api_response.__func__)
+    if hasattr(cls, "from_record"):
+        twin.from_record = classmethod(cls.from_record.__func__)
+    return twin
+
+
+def _payloads(rng, games):
+    owned = {"response": {"games": [
+        {"appid": 10 * (i + 1), "name": f"Game {i}", "playtime_forever": rng.randint(0, 100000),
+         "img_icon_url": "%040x" % rng.getrandbits(160), "has_community_visible_stats": True,
+         "playtime_2weeks": rng.randint(0, 100)}
+        for i in range(games)]}}
+    friends = {"friendslist": {"friends": [
+        {"steamid": str(76561197960265728 + i), "relationship": "friend", "friend_since": 1500000000 + i}
+        for i in range(games)]}}
+    news = {"appnews": {"newsitems": [
+        {"gid": str(5000000000000000000 + i), "title": f"Patch {i}", "url": "https://example.com",
+         "is_external_url": False, "author": "dev", "contents": "notes", "feedlabel": "Community",
+         "date": 1600000000 + i, "feedname": "steam_community", "feed_type": 1, "appid": 570}
+        for i in range(games)]}}
+    return {Game: owned, Friend: friends, GameNews: news}
+
+
+def _measure(cls, payload, repeat=5):
+    """Bytes per record held by the built list, and construction time."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = cls.from_api_response(payload)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_record = (after - before) / len(records)
+    del records
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cls.from_api_response(payload)
+    elapsed = (time.perf_counter() - start) / repeat
+    return per_record, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payloads = _payloads(random.Random(args.seed), args.games)
+    print(f"{'records':<26} {'bytes/record':>14} {'build (ms)':>12}")
+    for cls, payload in payloads.items():
+        for label, impl in ((f"{cls.__name__} (dataclass)", _plain_twin(cls)),
+                            (f"{cls.__name__} (slots)", cls)):
+            per_record, elapsed = _measure(impl, payload)
+            print(f"{label:<26} {per_record:14.0f} {elapsed * 1e3:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark for streaming JSON parsing of large responses.
+
+Builds synthetic GetOwnedGames, GetAppList and pricehistory bodies and
+compares peak memory (tracemalloc) and time of the buffered path
+(decode and json.loads of the whole body, as requests' .json() does,
+then typed records) against JSONArrayStream fed in socket-sized chunks.
+
+Usage:
+    python benchmarks/bench_streaming.py [--games 20000] [--apps 50000] [--prices 20000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from steam.schemas import Game, PriceHistory, PricePoint  # noqa: E402
+from steam.streaming import JSONArrayStream  # noqa: E402
+
+CHUNK_SIZE = 65536
+
+
+def _owned_games(rng, count):
+    games = [
+        {
+            "appid": 10 * (i + 1),
+            "name": f"Game {i} " + "x" * rng.randint(5, 30),
+            "playtime_forever": rng.randint(0, 100000),
+            "img_icon_url": "%040x" % rng.getrandbits(160),
+            "has_community_visible_stats": True,
+            "playtime_windows_forever": rng.randint(0, 100000),
+            "playtime_mac_forever": 0,
+            "playtime_linux_forever": 0,
+            "rtime_last_played": 1700000000 + i,
+        }
+        for i in range(count)
+    ]
+    return {"response": {"game_count": count, "games": games}}
+
+
+def _app_list(rng, count):
+    apps = [{"appid": 10 * (i + 1), "name": f"App {i} " + "y" * rng.randint(5, 40),
+             "last_modified": 1600000000 + i, "price_change_number": i} for i in range(count)]
+    return {"response": {"apps": apps, "have_more_results": True, "last_appid": 10 * count}}
+
+
+def _price_history(rng, count):
+    prices = [[f"Jan {1 + i % 28:02d} 20{10 + i // 8760} {i % 24:02d}: +0",
+               round(rng.uniform(0.03, 500), 3), str(rng.randint(1, 5000))] for i in range(count)]
+    return {"success": True, "price_prefix": "$", "price_suffix": "", "prices": prices}
+
+
+def _measure(func):
+    """Return (seconds, peak traced bytes) of one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _chunks(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i:i + CHUNK_SIZE]
+
+
+def _report(label, body, buffered, streamed):
+    # Time without tracemalloc overhead, memory in a separate run
+    timings = []
+    for func in (buffered, streamed):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    peaks = [_measure(func)[1] for func in (buffered, streamed)]
+    print(f"{label} ({len(body) / 1e6:.1f} MB body)")
+    for name, seconds, peak in zip(("buffered", "streamed"), timings, peaks):
+        print(f"  {name:<10} {seconds * 1e3:9.1f} ms   peak {peak / 1e6:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--apps", type=int, default=50000)
+    parser.add_argument("--prices", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    body = json.dumps(_owned_games(rng, args.games)).encode()
+    _report(
+        f"GetOwnedGames, {args.games} games", body,
+        lambda: [g.to_dict() for g in Game.from_api_response(json.loads(body.decode()))],
+        lambda: sum(1 for g in JSONArrayStream(_chunks(body), ("response", "games"))
+                    if Game.from_record(g)),
+    )
+
+    body = json.dumps(_app_list(rng, args.apps)).encode()
+    _report(
+        f"GetAppList, {args.apps} apps", body,
+        lambda: [(a["appid"], a["name"], a["last_modified"])
+                 for a in json.loads(body.decode())["response"]["apps"]],
+        lambda: [(a["appid"], a["name"], a["last_modified"])
+                 for a in JSONArrayStream(_chunks(body), ("response", "apps"))],
+    )
+
+    body = json.dumps(_price_history(rng, args.prices)).encode()
+    _report(
+        f"pricehistory, {args.prices} points", body,
+        lambda: [PricePoint.from_record(p) for p in PriceHistory.from_api_response(json.loads(body.decode())).prices],
+        lambda: sum(1 for p in JSONArrayStream(_chunks(body), ("prices",)) if PricePoint.from_record(p)),
+    )
+
+
+if __name__ == "__main__":
+    main()
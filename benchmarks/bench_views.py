@@ -0,0 +1,104 @@
+"""
+Benchmark for lazy views.
+
+Normalizes 20k-record owned-games, friends and market search payloads the
+old way (schema dataclass per record, then a dict per dataclass) and with
+lazy views, and reports per call:
+- blocks and bytes held by the normalized data (tracemalloc)
+- peak traced memory for normalize + serialize through APIResponse.to_json
+- normalize and normalize + serialize time
+
+Usage:
+    python benchmarks/bench_views.py [--records 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_codec import _owned_games  # noqa: E402
+from steam.client import APIResponse  # noqa: E402
+from steam.schemas import Friend, Game, MarketItem  # noqa: E402
+from steam.views import list_view  # noqa: E402
+
+
+def _payloads(rng, count):
+    friends = {"friendslist": {"friends": [
+        {"steamid": str(76561197960265728 + i), "relationship": "friend", "friend_since": 1500000000 + i}
+        for i in range(count)]}}
+    market = {"success": True, "total_count": count, "results": [
+        {"name": f"Item {i}", "hash_name": f"Item {i}", "sell_listings": rng.randint(1, 500),
+         "sell_price": rng.randint(3, 100000), "sell_price_text": "$1.00", "app_name": "Counter-Strike 2",
+         "asset_description": {"appid": 730, "classid": str(i), "type": "Rifle"}}
+        for i in range(count)]}
+    return [
+        ("games", Game, _owned_games(rng, count), lambda d: d["response"]["games"]),
+        ("friends", Friend, friends, lambda d: d["friendslist"]["friends"]),
+        ("items", MarketItem, market, lambda d: d["results"]),
+    ]
+
+
+def _held(normalize, data):
+    """Blocks and bytes allocated by normalize() and still referenced by its result."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = normalize(data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(max(stat.count_diff, 0) for stat in diff)
+    size = sum(max(stat.size_diff, 0) for stat in diff)
+    del result
+    return blocks, size
+
+
+def _peak(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _timeit(func, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'payload':<20} {'held blocks':>12} {'held kB':>10} {'peak kB':>10} "
+          f"{'normalize':>11} {'+ to_json':>11}")
+    for key, schema, payload, records in _payloads(random.Random(args.seed), args.records):
+        variants = (
+            ("copy", lambda d: {key: [r.to_dict() for r in map(schema.from_record, records(d))]}),
+            ("view", lambda d: {key: list_view(schema, records(d))}),
+        )
+        for label, normalize in variants:
+            def serialize():
+                return APIResponse(ok=True, source="bench", data=normalize(payload)).to_json()
+
+            blocks, size = _held(normalize, payload)
+            peak = _peak(serialize)
+            norm = _timeit(lambda: normalize(payload), args.repeat)
+            total = _timeit(serialize, args.repeat)
+            print(f"{key + ' (' + label + ')':<20} {blocks:12d} {size / 1e3:10.0f} {peak / 1e3:10.0f} "
+                  f"{norm * 1e3:9.2f}ms {total * 1e3:9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
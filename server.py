@@ -10,32 +10,51 @@ from steam.adapters import (
     fetch_owned_games,
     fetch_recently_played_games,
     fetch_game_news,
+    fetch_news_since,
+    search_news as search_news_index,
     fetch_game_schema,
     fetch_app_details,
     resolve_vanity_url,
+    resolve_steam_ids,
     fetch_user_level,
     fetch_user_badges,
     fetch_global_achievement_percentages,
     fetch_player_bans,
+    fetch_common_games,
+    fetch_achievement_rarity,
+    fetch_library_achievements,
+    fetch_current_players,
+    fetch_player_count_stats,
+    fetch_most_played,
+    fetch_player_rank,
+    start_background_workers,
 )
 from steam.adapters import (
     fetch_top_market,
     search_market,
     fetch_item_price_history,
+    backfill_price_archive,
+    fetch_item_price_stats,
     fetch_item_price_overview,
+    fetch_item_price_overviews,
+    fetch_price_matrix,
     fetch_market_popular_items,
     fetch_market_recent_activity,
     fetch_item_listings,
     fetch_item_orders_histogram,
+    fetch_item_orders_histogram_by_name,
+    fetch_order_book_summary,
+    resolve_item_nameids,
 )
 from steam.adapters import (
-    search_games,
-    get_featured_specials,
-    get_store_highlights,
-    get_app_reviews_summary,
-    get_app_tags,
-    get_release_calendar,
-    get_app_update_signal,
+    search_games as fetch_search_games,
+    get_featured_specials as fetch_featured_specials,
+    get_store_highlights as fetch_store_highlights,
+    get_app_reviews_summary as fetch_app_reviews_summary,
+    get_app_tags as fetch_app_tags,
+    get_release_calendar as fetch_release_calendar,
+    get_app_update_signal as fetch_app_update_signal,
+    resolve_app_name as fetch_app_by_name,
 )
 
 logging.basicConfig(
@@ -92,6 +111,24 @@ def resolve_vanity_url_name(vanity_url_name: str) -> dict:
     return resolve_vanity_url(vanity_url_name)
 
 
+@mcp.tool()
+def resolve_steam_id_list(values: list[str]) -> dict:
+    """
+    Resolve a list of mixed Steam identifiers to SteamID64s
+
+    Accepts vanity names, profile URLs, SteamID64, STEAM_0:x:y and [U:1:n] forms.
+    Vanity lookups are cached, including names that do not exist.
+
+    Args:
+        values: Steam identifiers in any supported form
+
+    Returns:
+        Dict mapping each input to its SteamID64 (None if unresolved)
+    """
+    logger.info(f"Resolving {len(values)} Steam identifiers")
+    return resolve_steam_ids(values)
+
+
 @mcp.tool()
 def get_player_achievements(steam_id: str, app_id: int) -> dict:
     """
@@ -125,7 +162,8 @@ def get_user_stats(steam_id: str, app_id: int) -> dict:
 
 
 @mcp.tool()
-def get_owned_games(steam_id: str, include_appinfo: bool = True, include_played_free_games: bool = True) -> dict:
+def get_owned_games(steam_id: str, include_appinfo: bool = True, include_played_free_games: bool = True,
+                    fields: list[str] | None = None) -> dict:
     """
     Fetch owned games for a Steam user
 
@@ -133,43 +171,98 @@ def get_owned_games(steam_id: str, include_appinfo: bool = True, include_played_
         steam_id: Steam ID of the user
         include_appinfo: Include game name and icon information
         include_played_free_games: Include free games that the user has played
+        fields: Only return these game fields, e.g. ["name", "playtime_forever"]
+            (appid is always included; all fields by default)
 
     Returns:
         Dict containing owned games information
     """
     logger.info(f"Fetching owned games for Steam ID: {steam_id}")
-    return fetch_owned_games(steam_id, include_appinfo, include_played_free_games)
+    return fetch_owned_games(steam_id, include_appinfo, include_played_free_games, fields)
 
 
 @mcp.tool()
-def get_recently_played_games(steam_id: str, count: int = 10) -> dict:
+def get_recently_played_games(steam_id: str, count: int = 10, fields: list[str] | None = None) -> dict:
     """
     Fetch recently played games for a Steam user
 
     Args:
         steam_id: Steam ID of the user
         count: Number of games to return
+        fields: Only return these game fields, e.g. ["name", "playtime_2weeks"]
+            (appid is always included; all fields by default)
 
     Returns:
         Dict containing recently played games information
     """
     logger.info(f"Fetching recently played games for Steam ID: {steam_id}")
-    return fetch_recently_played_games(steam_id, count)
+    return fetch_recently_played_games(steam_id, count, fields)
 
 
 @mcp.tool()
-def get_game_news(app_id: int) -> dict:
+def get_game_news(app_id: int, fields: list[str] | None = None) -> dict:
     """
     Fetch news articles for a specific game
 
     Args:
         app_id: Application ID of the game
+        fields: Only return these news fields, e.g. ["title", "url", "date"]
+            (gid is always included; all fields by default)
 
     Returns:
         Dict containing game news articles
     """
     logger.info(f"Fetching game news for App ID: {app_id}")
-    return fetch_game_news(app_id)
+    return fetch_game_news(app_id, fields=fields)
+
+
+@mcp.tool()
+def get_news_since(app_id: int | None = None, since: int | None = None, limit: int = 20) -> dict:
+    """
+    Get game news published since a given time
+
+    Served from a local store that only fetches items newer than the
+    last one seen for each app. Without app_id, returns news for the
+    apps tracked in the background (STEAM_NEWS_APPIDS).
+
+    Args:
+        app_id: Application ID of the game (optional)
+        since: Unix timestamp; only newer items are returned (default: 7 days ago)
+        limit: Maximum number of items to return (1-100, default: 20)
+
+    Returns:
+        Dict containing news items (newest first) and per-app cursors
+    """
+    logger.info(f"Fetching news since {since} for App ID: {app_id}")
+    if limit < 1 or limit > 100:
+        raise ValueError("limit must be between 1 and 100")
+    return fetch_news_since(app_id, since, limit)
+
+
+@mcp.tool()
+def search_news(query: str, app_ids: list[int] | None = None, since: int | None = None,
+                until: int | None = None, limit: int = 10) -> dict:
+    """
+    Full-text search over game news fetched so far
+
+    Searches a local BM25 index of every news item returned by
+    get_game_news, get_news_since and the background news refresh,
+    without calling Steam.
+
+    Args:
+        query: Search terms (e.g. "anti-cheat")
+        app_ids: Only search news for these apps (optional)
+        since: Only items published at or after this Unix timestamp (optional)
+        until: Only items published at or before this Unix timestamp (optional)
+        limit: Maximum number of results (1-100, default: 10)
+
+    Returns:
+        Dict containing ranked news items with title, url, date, snippet and score
+    """
+    logger.info(f"Searching news: query='{query}', app_ids={app_ids}")
+    if limit < 1 or limit > 100:
+        raise ValueError("limit must be between 1 and 100")
+    return search_news_index(query, app_ids, since, until, limit)
 
 
 @mcp.tool()
@@ -188,18 +281,21 @@ def get_game_schema(app_id: int) -> dict:
 
 
 @mcp.tool()
-def get_app_details(app_id: int) -> dict:
+def get_app_details(app_id: int, fields: list[str] | None = None) -> dict:
     """
     Fetch detailed information for a specific app from the Steam Store
 
     Args:
         app_id: Application ID
+        fields: Only return these fields, e.g. ["name", "price_overview"]
+            (appid is always included; all fields by default). Skipping the
+            HTML descriptions and media lists makes responses much smaller.
 
     Returns:
         Dict containing app details
     """
     logger.info(f"Fetching app details for App ID: {app_id}")
-    return fetch_app_details(app_id)
+    return fetch_app_details(app_id, fields=fields)
 
 
 @mcp.tool()
@@ -243,19 +339,71 @@ def search_market_items(query: str, app_id: int | None = None, count: int = 100,
 
 
 @mcp.tool()
-def get_item_price_history(app_id: int, market_hash_name: str) -> dict:
+def get_item_price_history(app_id: int, market_hash_name: str, start: int | None = None,
+                           end: int | None = None, interval: str | None = None,
+                           max_points: int | None = None, currency: int = 1) -> dict:
     """
     Fetch price history for a specific market item
 
+    Served from the local price archive when STEAM_PRICE_ARCHIVE_DIR is set.
+
     Args:
         app_id: App ID of the game
         market_hash_name: Market hash name of the item
+        start: Only return points at or after this Unix time
+        end: Only return points at or before this Unix time
+        interval: Return OHLC bars instead of points: "1h", "1d" or "1w"
+        max_points: Maximum number of points (downsampled) or bars (most recent) to return
+        currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
 
     Returns:
         Dict containing item price history data
     """
     logger.info(f"Fetching price history for item: {market_hash_name}")
-    return fetch_item_price_history(app_id, market_hash_name)
+    return fetch_item_price_history(app_id, market_hash_name, start=start, end=end,
+                                    interval=interval, max_points=max_points, currency=currency)
+
+
+@mcp.tool()
+def archive_price_histories(app_id: int, market_hash_names: list[str], currency: int = 1) -> dict:
+    """
+    Download price histories of many market items into the local archive
+
+    Requires STEAM_PRICE_ARCHIVE_DIR. Later get_item_price_history calls for
+    these items are served from the archive.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_names: Market hash names of the items
+        currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+
+    Returns:
+        Dict containing archived and newly added point counts per item
+    """
+    logger.info(f"Archiving price histories for {len(market_hash_names)} items")
+    return backfill_price_archive(app_id, market_hash_names, currency=currency)
+
+
+@mcp.tool()
+def get_item_price_stats(app_id: int, market_hash_names: list[str], interval: str = "1d",
+                         windows: list[int] | None = None) -> dict:
+    """
+    Fetch summary price indicators for one or more market items
+
+    Returns moving averages (SMA, EMA, VWAP), percent change, volatility,
+    high/low, traded volume and drawdown per item instead of the raw history.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_names: Market hash names of the items (up to 50)
+        interval: Bar width the windows are counted in: "1h", "1d" or "1w"
+        windows: Window lengths in bars (default: 7 and 30)
+
+    Returns:
+        Dict containing per-item price statistics
+    """
+    logger.info(f"Fetching price stats for {len(market_hash_names)} items")
+    return fetch_item_price_stats(app_id, market_hash_names, interval=interval, windows=windows)
 
 
 @mcp.tool()
@@ -275,6 +423,123 @@ def get_item_price_overview(app_id: int, market_hash_name: str, currency: int =
     return fetch_item_price_overview(app_id, market_hash_name, currency)
 
 
+@mcp.tool()
+def get_item_price_overviews(app_id: int, market_hash_names: list[str], currency: int = 1,
+                             max_wait: float = 60) -> dict:
+    """
+    Fetch current price overviews for many market items
+
+    Items are served from a short-lived cache when possible; the rest are
+    requested in list order through a shared queue paced to the market rate
+    limit (about 20 requests per minute), pausing after 429 responses. Items
+    not done within max_wait are returned as pending with an ETA and keep
+    loading in the background, so calling again later returns them.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_names: Market hash names of the items (max 500), most important first
+        currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+        max_wait: Seconds to wait for items that need a request (default: 60)
+
+    Returns:
+        Dict containing price overviews, pending items and the ETA in seconds
+    """
+    logger.info(f"Fetching price overviews for {len(market_hash_names)} items")
+    return fetch_item_price_overviews(app_id, market_hash_names, currency, max_wait=max_wait)
+
+
+@mcp.tool()
+def get_market_price_matrix(app_id: int, market_hash_names: list[str], currencies: list[str],
+                            base_currency: str = "USD", anchors: int = 3, max_wait: float = 60) -> dict:
+    """
+    Price a basket of market items across many currencies
+
+    Every item is fetched in the base currency; in each other currency only
+    a few anchor items are fetched, and the exchange rate they imply prices
+    the rest (Steam converts all listings with one rate per currency).
+    Implied rates are reused for several hours, so repeat calls need even
+    fewer requests.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_names: Market hash names of the items (max 100)
+        currencies: Currency codes or Steam currency IDs (e.g. ["EUR", "RUB", "JPY"])
+        base_currency: Currency every item is fetched in (default: USD)
+        anchors: Items fetched per currency to derive its exchange rate (default: 3)
+        max_wait: Seconds to wait for market requests (default: 60)
+
+    Returns:
+        Dict containing an items x currencies table of prices in hundredths,
+        cell ages, estimated-cell flags and the implied exchange rates
+    """
+    logger.info(f"Fetching price matrix for {len(market_hash_names)} items in {len(currencies)} currencies")
+    return fetch_price_matrix(app_id, market_hash_names, currencies, base_currency,
+                              anchors=anchors, max_wait=max_wait)
+
+
+@mcp.tool()
+def get_item_orders_histogram(app_id: int, market_hash_name: str, currency: int = 1) -> dict:
+    """
+    Fetch the buy and sell order book for a specific market item
+
+    Orders are returned as [price, quantity] levels, best price first. The
+    item's internal item_nameid is scraped from its listing page the first
+    time and remembered afterwards.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_name: Market hash name of the item
+        currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+
+    Returns:
+        Dict containing buy and sell price levels and order counts
+    """
+    logger.info(f"Fetching order histogram for item: {market_hash_name}")
+    return fetch_item_orders_histogram_by_name(app_id, market_hash_name, currency)
+
+
+@mcp.tool()
+def get_order_book_summary(app_id: int, market_hash_name: str, currency: int = 1,
+                           depths: list[float] | None = None) -> dict:
+    """
+    Fetch order book metrics for a specific market item
+
+    Returns best bid/ask, spread, mid price, order counts and the quantity
+    and value of orders within each percentage of the mid price, plus the
+    change since the previous call for the same item.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_name: Market hash name of the item
+        currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+        depths: Distances from the mid price in percent (default: 1, 5, 10)
+
+    Returns:
+        Dict containing the derived order book metrics
+    """
+    logger.info(f"Fetching order book summary for item: {market_hash_name}")
+    return fetch_order_book_summary(app_id, market_hash_name, currency, depths=depths)
+
+
+@mcp.tool()
+def resolve_market_item_nameids(app_id: int, market_hash_names: list[str]) -> dict:
+    """
+    Resolve market hash names to the item_nameids used by the order book
+
+    Unknown items are scraped concurrently within the market rate limit;
+    known ones are answered from the local store.
+
+    Args:
+        app_id: App ID of the game
+        market_hash_names: Market hash names of the items
+
+    Returns:
+        Dict mapping each resolved name to its item_nameid
+    """
+    logger.info(f"Resolving item_nameids for {len(market_hash_names)} items")
+    return resolve_item_nameids(app_id, market_hash_names)
+
+
 @mcp.tool()
 def get_popular_market_items(count: int = 10) -> dict:
     """
@@ -371,11 +636,66 @@ def get_current_players(app_id: int) -> dict:
         Dict containing current player count data
     """
     logger.info(f"Fetching current players for App ID: {app_id}")
-    # Import here to avoid circular dependency
-    from steam.web import SteamWebAPI
-    web = SteamWebAPI()
-    response = web.get_current_players(app_id)
-    return response.to_dict()
+    return fetch_current_players(app_id)
+
+
+@mcp.tool()
+def get_player_count_stats(app_id: int) -> dict:
+    """
+    Get locally sampled player count statistics for a game
+
+    Served entirely from the background sampler without calling Steam.
+    Only apps listed in STEAM_PLAYER_SAMPLER_APPIDS are sampled.
+
+    Args:
+        app_id: Application ID of the game
+
+    Returns:
+        Dict containing current count, 24h peak/min/average,
+        all-time peak since sampling began and the 24h trend
+    """
+    logger.info(f"Fetching sampled player count stats for App ID: {app_id}")
+    return fetch_player_count_stats(app_id)
+
+
+@mcp.tool()
+def get_most_played_games(limit: int = 10, offset: int = 0) -> dict:
+    """
+    Get the most played games right now from the local leaderboard
+
+    Served from memory; the leaderboard is refreshed in the background
+    for the apps listed in STEAM_LEADERBOARD_APPIDS.
+
+    Args:
+        limit: Number of games to return (1-100, default: 10)
+        offset: Number of top games to skip (default: 0)
+
+    Returns:
+        Dict containing ranked games with current players, rank change
+        since the previous refresh, and the age of the data
+    """
+    logger.info(f"Fetching most played games: limit={limit}, offset={offset}")
+    if limit < 1 or limit > 100:
+        raise ValueError("limit must be between 1 and 100")
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    return fetch_most_played(limit, offset)
+
+
+@mcp.tool()
+def get_player_rank(app_id: int) -> dict:
+    """
+    Get a game's rank on the local concurrent players leaderboard
+
+    Args:
+        app_id: Application ID of the game
+
+    Returns:
+        Dict containing rank, current players, previous rank,
+        rank change and the age of the data
+    """
+    logger.info(f"Fetching leaderboard rank for App ID: {app_id}")
+    return fetch_player_rank(app_id)
 
 
 @mcp.tool()
@@ -393,6 +713,69 @@ def get_global_achievement_percentages(app_id: int) -> dict:
     return fetch_global_achievement_percentages(app_id)
 
 
+@mcp.tool()
+def get_achievement_rarity(steam_id: str, app_id: int, unlocked_only: bool = False,
+                           limit: int | None = None, language: str = "english") -> dict:
+    """
+    Fetch a player's achievements with names and global unlock rates, rarest first
+
+    Args:
+        steam_id: Steam ID of the player
+        app_id: Application ID of the game
+        unlocked_only: Only return achievements the player has unlocked
+        limit: Maximum number of achievements to return (optional)
+        language: Language for achievement names and descriptions
+
+    Returns:
+        Dict containing achievements sorted by global unlock percentage,
+        with unlock times for the player
+    """
+    logger.info(f"Fetching achievement rarity for Steam ID: {steam_id}, App ID: {app_id}")
+    return fetch_achievement_rarity(steam_id, app_id, language, unlocked_only, limit)
+
+
+@mcp.tool()
+def get_library_achievements(steam_id: str, limit: int | None = 50, max_workers: int = 8) -> dict:
+    """
+    Fetch achievement completion across a user's whole library
+
+    Only games with community-visible stats are queried, in parallel.
+
+    Args:
+        steam_id: Steam ID of the user
+        limit: Maximum number of games to list (totals always cover the whole library)
+        max_workers: Maximum number of concurrent requests (1-16)
+
+    Returns:
+        Dict containing library-wide achievement totals and per-game completion,
+        most completed games first
+    """
+    if max_workers <= 0 or max_workers > 16:
+        raise ValueError("max_workers must be between 1 and 16")
+    logger.info(f"Fetching library achievements for Steam ID: {steam_id}")
+    return fetch_library_achievements(steam_id, max_workers, limit)
+
+
+@mcp.tool()
+def get_common_games(steam_ids: list[str], min_owners: int | None = None, limit: int = 100) -> dict:
+    """
+    Compare the game libraries of a group of Steam users
+
+    Args:
+        steam_ids: Steam IDs of the group members (at least two)
+        min_owners: Also list games owned by at least this many members (optional)
+        limit: Maximum number of games listed per result set
+
+    Returns:
+        Dict containing games owned by everyone, union size,
+        pairwise Jaccard similarity and optional "owned by at least k" games
+    """
+    if limit <= 0:
+        raise ValueError("Limit must be positive")
+    logger.info(f"Comparing libraries for {len(steam_ids)} Steam IDs")
+    return fetch_common_games(steam_ids, min_owners, limit)
+
+
 # ============ Stage 2: Store & Discovery Tools ============
 
 @mcp.tool()
@@ -400,6 +783,13 @@ def search_games(query: str, country_code: str = "US", language: str = "english"
     """
     Search for games in the Steam Store
 
+    Runs locally against the synced app catalog with prefix
+    autocomplete and typo tolerance; uses the store search
+    endpoint until the catalog is available. Both return
+    {total, items} with type, id and name per item. Catalog
+    results add score and match but have no prices or images,
+    and ignore country_code and language.
+
     Args:
         query: Search query
         country_code: Country code for localized content (default: US)
@@ -410,7 +800,28 @@ def search_games(query: str, country_code: str = "US", language: str = "english"
         Dict containing search results
     """
     logger.info(f"Searching games with query: {query}")
-    return search_games(query, country_code, language, limit)
+    return fetch_search_games(query, country_code, language, limit)
+
+
+@mcp.tool()
+def resolve_app_name(name: str, limit: int = 5) -> dict:
+    """
+    Resolve a game name to its Steam App ID
+
+    Matches against the local app catalog, tolerating partial names
+    and typos. Use the returned appid with tools that take app_id.
+
+    Args:
+        name: Game name (e.g. "Counter Strike 2", "portal2")
+        limit: Number of alternative candidates to include (1-20, default: 5)
+
+    Returns:
+        Dict containing the best match (appid, name) and ranked candidates
+    """
+    logger.info(f"Resolving app name: {name}")
+    if limit < 1 or limit > 20:
+        raise ValueError("limit must be between 1 and 20")
+    return fetch_app_by_name(name, limit)
 
 
 @mcp.tool()
@@ -426,7 +837,7 @@ def get_featured_specials(country_code: str = "US", language: str = "english") -
         Dict containing featured specials data
     """
     logger.info("Fetching featured specials")
-    return get_featured_specials(country_code, language)
+    return fetch_featured_specials(country_code, language)
 
 
 @mcp.tool()
@@ -442,7 +853,7 @@ def get_store_highlights(country_code: str = "US", language: str = "english") ->
         Dict containing store highlights data
     """
     logger.info("Fetching store highlights")
-    return get_store_highlights(country_code, language)
+    return fetch_store_highlights(country_code, language)
 
 
 @mcp.tool()
@@ -459,7 +870,7 @@ def get_app_reviews_summary(app_id: int, country_code: str = "US", language: str
         Dict containing reviews summary data
     """
     logger.info(f"Fetching reviews summary for App ID: {app_id}")
-    return get_app_reviews_summary(app_id, country_code, language)
+    return fetch_app_reviews_summary(app_id, country_code, language)
 
 
 @mcp.tool()
@@ -476,7 +887,7 @@ def get_app_tags(app_id: int, country_code: str = "US", language: str = "english
         Dict containing app tags data
     """
     logger.info(f"Fetching tags for App ID: {app_id}")
-    return get_app_tags(app_id, country_code, language)
+    return fetch_app_tags(app_id, country_code, language)
 
 
 @mcp.tool()
@@ -495,7 +906,7 @@ def get_release_calendar(country_code: str = "US", language: str = "english",
         Dict containing release calendar data
     """
     logger.info("Fetching release calendar")
-    return get_release_calendar(country_code, language, start_date, end_date)
+    return fetch_release_calendar(country_code, language, start_date, end_date)
 
 
 @mcp.tool()
@@ -520,9 +931,10 @@ def get_app_update_signal(app_id: int) -> dict:
         - last_updated: Last update timestamp
     """
     logger.info(f"Fetching update signal for App ID: {app_id}")
-    return get_app_update_signal(app_id)
+    return fetch_app_update_signal(app_id)
 
 
 if __name__ == "__main__":
     logger.info("Starting Steam MCP server")
+    start_background_workers()
     mcp.run()
\ No newline at end of file
@@ -7,6 +7,26 @@ This package contains:
 - steam.web: Steam Web API functions
 - steam.store: Steam Store API functions  
 - steam.market: Steam Community Market functions
+- steam.steamid: Steam ID parsing and cached vanity URL resolution
+- steam.library: Library bitsets and group overlap queries
+- steam.background: Base class for periodic background workers
+- steam.players: Background current-player sampler with ring-buffer history
+- steam.leaderboard: Background-refreshed concurrent players leaderboard
+- steam.news: Incremental per-app news tracking
+- steam.newsindex: Local BM25 full-text index over fetched news
+- steam.catalog: Local appid <-> name catalog with delta sync
+- steam.appsearch: Local name search, autocomplete and name -> appid resolution
+- steam.streaming: Incremental JSON array parsing for very large responses
+- steam.codec: JSON codec using orjson when installed, stdlib json otherwise
+- steam.views: Lazy read-only views over decoded record lists
+- steam.priceseries: Columnar NumPy price histories with fast date parsing
+- steam.pricestats: Vectorized price indicators over many items at once
+- steam.pricearchive: Local append-only archive of compressed price histories
+- steam.nameids: Persistent market_hash_name -> item_nameid resolution
+- steam.orderbook: Order book levels, depth metrics and delta-encoded snapshots
+- steam.scheduler: Priority queue pacing market requests with 429 cooldowns
+- steam.currency: Steam currency formats and localized price-string parsing
+- steam.pricematrix: Cross-currency price tables with implied exchange rates
 
 Usage:
     from steam.client import SteamClient, APIResponse, SteamAPIError
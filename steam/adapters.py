@@ -6,17 +6,29 @@ but maintain the same interface as the old modules.
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from steam.client import SteamClient, APIResponse
 from steam.web import SteamWebAPI
 from steam.market import SteamMarketAPI
+from steam.library import GroupLibraries
+from steam.players import PlayerCountSampler
+from steam.leaderboard import PlayerLeaderboard
+from steam.news import NewsTracker
+from steam.newsindex import news_index
+from steam.catalog import CatalogSyncer
+from steam.appsearch import app_search
 
 logger = logging.getLogger(__name__)
 
 # Create singleton instances
 _web_api: Optional[SteamWebAPI] = None
 _market_api: Optional[SteamMarketAPI] = None
+_group_libraries: Optional[GroupLibraries] = None
+_player_sampler: Optional[PlayerCountSampler] = None
+_leaderboard: Optional[PlayerLeaderboard] = None
+_news_tracker: Optional[NewsTracker] = None
+_catalog_syncer: Optional[CatalogSyncer] = None
 
 
 def _get_web_api() -> SteamWebAPI:
@@ -35,6 +47,54 @@ def _get_market_api() -> SteamMarketAPI:
     return _market_api
 
 
+def _get_group_libraries() -> GroupLibraries:
+    """Get or create singleton GroupLibraries instance."""
+    global _group_libraries
+    if _group_libraries is None:
+        _group_libraries = GroupLibraries(_get_web_api())
+    return _group_libraries
+
+
+def _get_player_sampler() -> PlayerCountSampler:
+    """Get or create singleton PlayerCountSampler configured from the environment."""
+    global _player_sampler
+    if _player_sampler is None:
+        _player_sampler = PlayerCountSampler.from_env(_get_web_api())
+    return _player_sampler
+
+
+def _get_leaderboard() -> PlayerLeaderboard:
+    """Get or create singleton PlayerLeaderboard configured from the environment."""
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = PlayerLeaderboard.from_env(_get_web_api(), sampler=_get_player_sampler())
+    return _leaderboard
+
+
+def _get_news_tracker() -> NewsTracker:
+    """Get or create singleton NewsTracker configured from the environment."""
+    global _news_tracker
+    if _news_tracker is None:
+        _news_tracker = NewsTracker.from_env(_get_web_api())
+    return _news_tracker
+
+
+def _get_catalog_syncer() -> CatalogSyncer:
+    """Get or create singleton CatalogSyncer configured from the environment."""
+    global _catalog_syncer
+    if _catalog_syncer is None:
+        _catalog_syncer = CatalogSyncer.from_env(_get_web_api().client, on_sync=[app_search.refresh])
+    return _catalog_syncer
+
+
+def start_background_workers() -> None:
+    """Start the catalog sync and the samplers that have apps configured."""
+    _get_catalog_syncer().start()
+    for worker in (_get_player_sampler(), _get_leaderboard(), _get_news_tracker()):
+        if worker.appids:
+            worker.start()
+
+
 # ============ Fetcher Adapters ============
 
 def fetch_steam_profile(steam_id: str) -> Dict[str, Any]:
@@ -65,24 +125,42 @@ def fetch_user_stats_for_game(steam_id: str, app_id: Union[str, int]) -> Dict[st
     return response.to_dict()
 
 
-def fetch_owned_games(steam_id: str, include_appinfo: bool = True, include_played_free_games: bool = True) -> Dict[str, Any]:
+def fetch_owned_games(steam_id: str, include_appinfo: bool = True, include_played_free_games: bool = True,
+                      fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Adapter for old fetch_owned_games function."""
     web = _get_web_api()
-    response = web.get_owned_games(steam_id, include_appinfo, include_played_free_games)
+    response = web.get_owned_games(steam_id, include_appinfo, include_played_free_games, fields)
     return response.to_dict()
 
 
-def fetch_recently_played_games(steam_id: str, count: int = 10) -> Dict[str, Any]:
+def fetch_recently_played_games(steam_id: str, count: int = 10,
+                                fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Adapter for old fetch_recently_played_games function."""
     web = _get_web_api()
-    response = web.get_recently_played_games(steam_id, count)
+    response = web.get_recently_played_games(steam_id, count, fields)
     return response.to_dict()
 
 
-def fetch_game_news(app_id: Union[str, int], count: int = 3, maxlength: int = 300, feed_name: Optional[str] = None) -> Dict[str, Any]:
+def fetch_game_news(app_id: Union[str, int], count: int = 3, maxlength: int = 300, feed_name: Optional[str] = None,
+                    enddate: Optional[int] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Adapter for old fetch_game_news function."""
     web = _get_web_api()
-    response = web.get_game_news(app_id, count, maxlength, feed_name)
+    response = web.get_game_news(app_id, count, maxlength, feed_name, enddate, fields)
+    return response.to_dict()
+
+
+def fetch_news_since(app_id: Optional[Union[str, int]] = None, since: Optional[int] = None,
+                     limit: int = 20) -> Dict[str, Any]:
+    """Adapter for incremental news queries served from the local store."""
+    tracker = _get_news_tracker()
+    response = tracker.get_news_since(app_id, since, limit)
+    return response.to_dict()
+
+
+def search_news(query: str, app_ids: Optional[List[int]] = None, since: Optional[int] = None,
+                until: Optional[int] = None, limit: int = 10) -> Dict[str, Any]:
+    """Adapter for full-text search over locally indexed news."""
+    response = news_index.search_news(query, app_ids, since, until, limit)
     return response.to_dict()
 
 
@@ -93,10 +171,11 @@ def fetch_game_schema(app_id: Union[str, int], language: str = "english") -> Dic
     return response.to_dict()
 
 
-def fetch_app_details(app_id: Union[str, int], country_code: str = "US") -> Dict[str, Any]:
+def fetch_app_details(app_id: Union[str, int], country_code: str = "US",
+                      fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Adapter for old fetch_app_details function."""
     web = _get_web_api()
-    response = web.get_app_details(app_id, country_code)
+    response = web.get_app_details(app_id, country_code, fields)
     return response.to_dict()
 
 
@@ -128,6 +207,13 @@ def resolve_vanity_url(vanity_url_name: str) -> Dict[str, Any]:
     return response.to_dict()
 
 
+def resolve_steam_ids(values: List[str]) -> Dict[str, Any]:
+    """Adapter for bulk Steam ID resolution."""
+    web = _get_web_api()
+    response = web.resolve_steam_ids(values)
+    return response.to_dict()
+
+
 def fetch_player_bans(steam_id: str) -> Dict[str, Any]:
     """Adapter for fetch_player_bans function."""
     web = _get_web_api()
@@ -135,6 +221,63 @@ def fetch_player_bans(steam_id: str) -> Dict[str, Any]:
     return response.to_dict()
 
 
+def fetch_achievement_rarity(steam_id: str, app_id: Union[str, int], language: str = "english",
+                             unlocked_only: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Adapter for the achievement rarity join."""
+    web = _get_web_api()
+    response = web.get_achievement_rarity(steam_id, app_id, language, unlocked_only, limit)
+    return response.to_dict()
+
+
+def fetch_library_achievements(steam_id: str, max_workers: int = 8, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Adapter for the whole-library achievement sweep."""
+    web = _get_web_api()
+    response = web.get_library_achievements(steam_id, max_workers, limit)
+    return response.to_dict()
+
+
+def fetch_common_games(steam_ids: List[str], min_owners: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+    """Adapter for group library overlap queries."""
+    groups = _get_group_libraries()
+    response = groups.compare(steam_ids, min_owners, limit)
+    return response.to_dict()
+
+
+def fetch_current_players(app_id: Union[str, int]) -> Dict[str, Any]:
+    """Adapter for current player count, enriched with sampled peaks when available."""
+    web = _get_web_api()
+    response = web.get_current_players(app_id)
+    sampler = _get_player_sampler()
+    player_count = response.data.get("player_count") if response.ok else None
+    if player_count and sampler.is_tracked(player_count["appid"]):
+        sampler.record(player_count["appid"], player_count["current_players"])
+        stats = sampler.stats(player_count["appid"])
+        player_count["current_24h_peak"] = stats["peak_24h"]
+        player_count["current_all_time_peak"] = stats["all_time_peak"]
+    return response.to_dict()
+
+
+def fetch_player_count_stats(app_id: Union[str, int]) -> Dict[str, Any]:
+    """Adapter for locally sampled player count statistics."""
+    sampler = _get_player_sampler()
+    response = sampler.get_stats(app_id)
+    return response.to_dict()
+
+
+def fetch_most_played(limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+    """Adapter for the in-memory concurrent players leaderboard."""
+    leaderboard = _get_leaderboard()
+    response = leaderboard.get_top(limit, offset)
+    return response.to_dict()
+
+
+def fetch_player_rank(app_id: Union[str, int]) -> Dict[str, Any]:
+    """Adapter for a single app's leaderboard rank."""
+    leaderboard = _get_leaderboard()
+    response = leaderboard.get_rank(app_id)
+    return response.to_dict()
+
+
 # ============ Market Adapters ============
 
 def fetch_top_market(count: int = 100, start: int = 0, sort_column: str = "popular", sort_dir: str = "desc") -> Dict[str, Any]:
@@ -151,10 +294,28 @@ def search_market(query: str, appid: Optional[int] = None, count: int = 100, sta
     return response.to_dict()
 
 
-def fetch_item_price_history(appid: int, market_hash_name: str) -> Dict[str, Any]:
+def fetch_item_price_history(appid: int, market_hash_name: str, start: Optional[int] = None,
+                             end: Optional[int] = None, interval: Optional[str] = None,
+                             max_points: Optional[int] = None, currency: int = 1) -> Dict[str, Any]:
     """Adapter for old fetch_item_price_history function."""
     market = _get_market_api()
-    response = market.get_item_price_history(appid, market_hash_name)
+    response = market.get_item_price_history(appid, market_hash_name, start=start, end=end,
+                                             interval=interval, max_points=max_points, currency=currency)
+    return response.to_dict()
+
+
+def backfill_price_archive(appid: int, market_hash_names: List[str], currency: int = 1) -> Dict[str, Any]:
+    """Fetch price histories of many market items into the local archive."""
+    market = _get_market_api()
+    response = market.backfill_price_archive(appid, market_hash_names, currency=currency)
+    return response.to_dict()
+
+
+def fetch_item_price_stats(appid: int, market_hash_names: List[str], interval: str = "1d",
+                           windows: Optional[List[int]] = None) -> Dict[str, Any]:
+    """Fetch summary price indicators for one or more market items."""
+    market = _get_market_api()
+    response = market.get_item_price_stats(appid, market_hash_names, interval=interval, windows=windows)
     return response.to_dict()
 
 
@@ -165,6 +326,25 @@ def fetch_item_price_overview(appid: int, market_hash_name: str, currency: int =
     return response.to_dict()
 
 
+def fetch_item_price_overviews(appid: int, market_hash_names: List[str], currency: int = 1,
+                               max_wait: Optional[float] = None) -> Dict[str, Any]:
+    """Fetch price overviews of many items of one app through the market scheduler."""
+    market = _get_market_api()
+    items = [(appid, name, currency, priority) for priority, name in enumerate(market_hash_names)]
+    response = market.get_item_price_overviews(items, currency, max_wait=max_wait)
+    return response.to_dict()
+
+
+def fetch_price_matrix(appid: int, market_hash_names: List[str], currencies: List[str],
+                       base_currency: str = "USD", anchors: int = 3,
+                       max_wait: Optional[float] = None) -> Dict[str, Any]:
+    """Fetch a cross-currency price table for a basket of market items."""
+    market = _get_market_api()
+    response = market.get_price_matrix(appid, market_hash_names, currencies, base_currency,
+                                       anchors=anchors, max_wait=max_wait)
+    return response.to_dict()
+
+
 def fetch_market_popular_items(count: int = 10) -> Dict[str, Any]:
     """Adapter for old fetch_market_popular_items function."""
     market = _get_market_api()
@@ -193,6 +373,28 @@ def fetch_item_orders_histogram(item_nameid: str, currency: int = 1) -> Dict[str
     return response.to_dict()
 
 
+def fetch_item_orders_histogram_by_name(appid: int, market_hash_name: str, currency: int = 1) -> Dict[str, Any]:
+    """Fetch the order histogram of a market item by its hash name."""
+    market = _get_market_api()
+    response = market.get_item_orders_histogram_by_name(appid, market_hash_name, currency)
+    return response.to_dict()
+
+
+def fetch_order_book_summary(appid: int, market_hash_name: str, currency: int = 1,
+                             depths: Optional[List[float]] = None) -> Dict[str, Any]:
+    """Fetch derived order book metrics for a market item."""
+    market = _get_market_api()
+    response = market.get_order_book_summary(appid, market_hash_name, currency, depths=depths)
+    return response.to_dict()
+
+
+def resolve_item_nameids(appid: int, market_hash_names: List[str]) -> Dict[str, Any]:
+    """Resolve market hash names to item_nameids."""
+    market = _get_market_api()
+    response = market.resolve_item_nameids(appid, market_hash_names)
+    return response.to_dict()
+
+
 # ============ Store Adapters ============
 
 def search_games(query: str, country_code: str = "US", language: str = "english", limit: int = 20) -> Dict[str, Any]:
@@ -203,6 +405,12 @@ def search_games(query: str, country_code: str = "US", language: str = "english"
     return response.to_dict()
 
 
+def resolve_app_name(name: str, limit: int = 5) -> Dict[str, Any]:
+    """Adapter for resolving a game name to an appid through the local catalog."""
+    response = app_search.resolve_response(name, limit)
+    return response.to_dict()
+
+
 def get_featured_specials(country_code: str = "US", language: str = "english") -> Dict[str, Any]:
     """Adapter for get_featured_specials function."""
     from steam.store import SteamStoreAPI
@@ -0,0 +1,439 @@
+"""
+Local name search over the app catalog.
+
+This module provides:
+- normalize_name: case, accent and punctuation folding for app names
+- AppSearchIndex: prefix autocomplete (sorted-array bisect), token search
+  (inverted index) and typo-tolerant matching (trigram candidates checked
+  with a bounded edit distance), plus a name -> appid resolver
+- app_search: the shared index over steam.catalog.app_catalog
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from steam.catalog import AppCatalog, app_catalog
+from steam.client import APIResponse
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+_SYMBOLS_RE = re.compile(r"[\u2122\u00ae\u00a9]")
+
+# Vocabulary expansions per query token
+MAX_PREFIX_EXPANSIONS = 200
+MAX_FUZZY_EXPANSIONS = 20
+
+# Trigram candidates checked with the edit distance per query token
+MAX_FUZZY_CANDIDATES = 500
+
+# Fuzzy expansions remembered per index build
+FUZZY_CACHE_SIZE = 4096
+
+# Weights of the ways a query token can match a name token
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.9
+FUZZY_WEIGHT = 0.6
+
+# Cap on candidates scored for one query
+MAX_CANDIDATES = 20000
+
+# Minimum score for resolve() to accept a non-exact match
+RESOLVE_MIN_SCORE = 90.0
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents, trademarks and punctuation, collapse spaces."""
+    name = unicodedata.normalize("NFKD", _SYMBOLS_RE.sub("", name or ""))
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = name.lower().replace("&", " and ")
+    return " ".join(_NON_WORD_RE.sub(" ", name).split())
+
+
+# Tokens up to this length are matched through single-deletion variants,
+# longer ones through trigrams
+SHORT_TOKEN_LENGTH = 5
+
+
+def _deletions(token: str) -> List[str]:
+    """The token and every variant with one character removed."""
+    return [token] + [token[:i] + token[i + 1:] for i in range(len(token))]
+
+
+def _trigrams(token: str) -> List[str]:
+    padded = f"${token}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """
+    Edit distance check (adjacent transpositions count as one edit)
+    that gives up once every alignment exceeds limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return False
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current.append(value)
+        if min(current) > limit:
+            return False
+        before, previous = previous, current
+    return previous[-1] <= limit
+
+
+class _Snapshot:
+    """Search structures built from one catalog version."""
+
+    def __init__(self, catalog: AppCatalog):
+        self.version = catalog.version
+        self.appids = array("I")
+        self.names: List[str] = []
+        self.normalized: List[str] = []
+        self.tokens: List[Tuple[str, ...]] = []
+        postings: Dict[str, List[int]] = {}
+
+        for pos, (appid, name, _) in enumerate(catalog.entries()):
+            norm = normalize_name(name)
+            tokens = tuple(dict.fromkeys(norm.split()))
+            self.appids.append(appid)
+            self.names.append(name)
+            self.normalized.append(norm)
+            self.tokens.append(tokens)
+            for token in tokens:
+                postings.setdefault(token, []).append(pos)
+
+        self.sorted_names: List[Tuple[str, int]] = sorted((n, i) for i, n in enumerate(self.normalized) if n)
+        self.vocab: List[str] = sorted(postings)
+        self.postings: Dict[str, array] = {t: array("I", p) for t, p in postings.items()}
+        self.trigrams: Dict[str, List[int]] = {}
+        self.deletions: Dict[str, List[int]] = {}
+        self.fuzzy_cache: Dict[str, List[str]] = {}
+        for vid, token in enumerate(self.vocab):
+            if len(token) < 3:
+                continue
+            # One longer than short so a query missing a letter still meets it
+            if len(token) <= SHORT_TOKEN_LENGTH + 1:
+                for variant in set(_deletions(token)):
+                    self.deletions.setdefault(variant, []).append(vid)
+            if len(token) >= SHORT_TOKEN_LENGTH:
+                for gram in set(_trigrams(token)):
+                    self.trigrams.setdefault(gram, []).append(vid)
+
+
+class AppSearchIndex:
+    """
+    In-memory name search over an AppCatalog.
+
+    The index is rebuilt lazily on the first query after the catalog
+    version changes, or ahead of time by refresh() (run by the catalog
+    syncer after each sync); queries then only bisect sorted arrays, look
+    up postings and score a bounded candidate set. Queries made with
+    build=False never rebuild and use the last built index; resolve() and
+    resolve_response(), which run on the request path, always do so and
+    match nothing until the index is first built.
+
+    Usage:
+        index = AppSearchIndex(catalog)
+        index.search("counter str")      # autocomplete
+        index.search("portla 2")         # typo tolerant
+        index.resolve("Dota 2")          # 570
+    """
+
+    def __init__(self, catalog: Optional[AppCatalog] = None):
+        """
+        Initialize the index.
+
+        Args:
+            catalog: Catalog to index (defaults to the shared app_catalog)
+        """
+        self.catalog = catalog if catalog is not None else app_catalog
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.catalog.version:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.catalog.version:
+                self._snapshot = _Snapshot(self.catalog)
+                logger.info(f"Built app search index over {len(self._snapshot.names)} apps")
+            return self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._current().names)
+
+    @property
+    def ready(self) -> bool:
+        """Whether a non-empty index has been built and can serve build=False queries."""
+        snapshot = self._snapshot
+        return snapshot is not None and bool(snapshot.names)
+
+    def refresh(self) -> None:
+        """Rebuild the index now if the catalog changed since the last build."""
+        self._current()
+
+    @staticmethod
+    def _vocab_prefix(snapshot: _Snapshot, prefix: str) -> List[str]:
+        """Vocabulary tokens starting with prefix, found by bisection."""
+        vocab = snapshot.vocab
+        start = bisect_left(vocab, prefix)
+        end = min(len(vocab), start + MAX_PREFIX_EXPANSIONS)
+        matches = []
+        for i in range(start, end):
+            if not vocab[i].startswith(prefix):
+                break
+            matches.append(vocab[i])
+        return matches
+
+    @staticmethod
+    def _name_prefix(snapshot: _Snapshot, prefix: str) -> List[Tuple[str, int]]:
+        """(normalized name, position) pairs starting with prefix, found by bisection."""
+        names = snapshot.sorted_names
+        start = bisect_left(names, (prefix,))
+        end = min(len(names), start + MAX_PREFIX_EXPANSIONS)
+        matches = []
+        for i in range(start, end):
+            if not names[i][0].startswith(prefix):
+                break
+            matches.append(names[i])
+        return matches
+
+    def _fuzzy(self, snapshot: _Snapshot, token: str) -> List[str]:
+        """Vocabulary tokens within a small edit distance of token."""
+        if len(token) < 3:
+            return []
+        # Autocomplete re-sends earlier words on every keystroke
+        cached = snapshot.fuzzy_cache.get(token)
+        if cached is not None:
+            return cached
+        if len(token) <= SHORT_TOKEN_LENGTH:
+            # Short tokens share too few trigrams; two strings within one
+            # edit always share a single-deletion variant
+            limit = 1
+            candidates = list(dict.fromkeys(
+                vid for variant in _deletions(token) for vid in snapshot.deletions.get(variant, ())
+            ))[:MAX_FUZZY_CANDIDATES]
+        else:
+            limit = 2
+            grams = set(_trigrams(token))
+            shared = Counter(chain.from_iterable(snapshot.trigrams.get(gram, ()) for gram in grams))
+            # Each edit destroys at most three trigrams
+            needed = max(1, len(grams) - 3 * limit)
+            candidates = [vid for vid, n in shared.most_common(MAX_FUZZY_CANDIDATES) if n >= needed]
+        matches = []
+        for vid in candidates:
+            if _within_distance(token, snapshot.vocab[vid], limit):
+                matches.append(snapshot.vocab[vid])
+                if len(matches) >= MAX_FUZZY_EXPANSIONS:
+                    break
+        if len(snapshot.fuzzy_cache) >= FUZZY_CACHE_SIZE:
+            snapshot.fuzzy_cache.clear()
+        snapshot.fuzzy_cache[token] = matches
+        return matches
+
+    def _expand(self, snapshot: _Snapshot, token: str, is_last: bool) -> Dict[str, float]:
+        """Map a query token to the name tokens it can match, with weights."""
+        expansions: Dict[str, float] = {}
+        if token in snapshot.postings:
+            expansions[token] = EXACT_WEIGHT
+        if is_last and len(token) >= 2:
+            for candidate in self._vocab_prefix(snapshot, token):
+                expansions.setdefault(candidate, PREFIX_WEIGHT)
+        if not expansions:
+            for candidate in self._fuzzy(snapshot, token):
+                expansions[candidate] = FUZZY_WEIGHT
+        return expansions
+
+    def search(self, query: str, limit: int = 10, build: bool = True) -> List[Dict[str, Any]]:
+        """
+        Rank catalog apps against a name query.
+
+        The last query token also matches as a prefix, so partial input
+        autocompletes; tokens with no exact match fall back to fuzzy
+        matching.
+
+        Args:
+            query: Full or partial app name
+            limit: Maximum number of results
+            build: Rebuild a stale index first; if False, search the last
+                built index (no results before the first build)
+
+        Returns:
+            List of {"appid", "name", "score", "match"} dicts, best first
+        """
+        snapshot = self._current() if build else self._snapshot
+        normalized = normalize_name(query)
+        if not normalized or snapshot is None or not snapshot.names:
+            return []
+
+        scores: Dict[int, Tuple[float, str]] = {}
+
+        # Whole-name prefix (autocomplete) and exact matches
+        for name, pos in self._name_prefix(snapshot, normalized):
+            exact = name == normalized
+            scores[pos] = (200.0 if exact else 150.0, "exact" if exact else "prefix")
+
+        # Whole-name matches always outrank token matches, so a full page
+        # of them answers the query
+        if len(scores) >= limit:
+            return self._format(snapshot, scores, limit)
+
+        # Token matches
+        tokens = list(dict.fromkeys(normalized.split()))
+        expansions = [self._expand(snapshot, t, i == len(tokens) - 1) for i, t in enumerate(tokens)]
+        sizes = [sum(len(snapshot.postings[t]) for t in e) for e in expansions]
+        if any(sizes):
+            # Position -> best weight for each query token, built from postings;
+            # very common tokens are checked against candidate names instead
+            weights_by_pos: List[Optional[Dict[int, float]]] = []
+            for expansion, size in zip(expansions, sizes):
+                if size > MAX_CANDIDATES:
+                    weights_by_pos.append(None)
+                    continue
+                weights: Dict[int, float] = {}
+                for token, weight in expansion.items():
+                    for pos in snapshot.postings[token]:
+                        if weight > weights.get(pos, 0.0):
+                            weights[pos] = weight
+                weights_by_pos.append(weights)
+
+            driver = min((i for i, size in enumerate(sizes) if size), key=lambda i: sizes[i])
+            candidates = weights_by_pos[driver]
+            if candidates is None:
+                candidates = dict.fromkeys(
+                    pos for token in expansions[driver] for pos in snapshot.postings[token][:MAX_CANDIDATES]
+                )
+
+            required = len(tokens) if len(tokens) < 3 else len(tokens) - 1
+            for pos in candidates:
+                if pos in scores:
+                    continue
+                total = 0.0
+                matched = 0
+                fuzzy = False
+                for expansion, weights in zip(expansions, weights_by_pos):
+                    if weights is not None:
+                        weight = weights.get(pos, 0.0)
+                    else:
+                        weight = max((expansion[t] for t in snapshot.tokens[pos] if t in expansion), default=0.0)
+                    if weight:
+                        matched += 1
+                        total += weight
+                        fuzzy = fuzzy or weight == FUZZY_WEIGHT
+                if matched >= required:
+                    scores[pos] = (100.0 * total / len(tokens), "fuzzy" if fuzzy else "tokens")
+
+        return self._format(snapshot, scores, limit)
+
+    @staticmethod
+    def _format(snapshot: _Snapshot, scores: Dict[int, Tuple[float, str]],
+                limit: int) -> List[Dict[str, Any]]:
+        # Prefer fewer unmatched words, then lower appids (usually the base game)
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1][0], len(snapshot.tokens[item[0]]), snapshot.appids[item[0]])
+        )
+        return [
+            {
+                "appid": snapshot.appids[pos],
+                "name": snapshot.names[pos],
+                "score": round(score, 1),
+                "match": kind,
+            }
+            for pos, (score, kind) in ranked[:limit]
+        ]
+
+    def resolve(self, value: Union[str, int]) -> Optional[int]:
+        """
+        Resolve an appid or game name to an appid.
+
+        Args:
+            value: Appid (int or numeric string) or game name
+
+        Returns:
+            Appid, or None if nothing matches confidently or the index
+            has not been built yet
+        """
+        if isinstance(value, int):
+            return value
+        value = (value or "").strip()
+        if value.isdigit():
+            return int(value)
+        if not self.ready:
+            return None
+        results = self.search(value, limit=1, build=False)
+        if results and results[0]["score"] >= RESOLVE_MIN_SCORE:
+            return results[0]["appid"]
+        return None
+
+    def search_response(self, query: str, limit: int = 10) -> APIResponse:
+        """
+        Search and wrap the results in an APIResponse.
+
+        Returns:
+            APIResponse with ranked results or error
+        """
+        if not normalize_name(query):
+            return APIResponse(
+                ok=False,
+                source="app_catalog",
+                data={},
+                warnings=["Empty query"],
+                error={"message": "Search query cannot be empty"}
+            )
+        results = self.search(query, limit)
+        return APIResponse(
+            ok=True,
+            source="app_catalog",
+            data={"query": query, "total": len(results), "results": results},
+        )
+
+    def resolve_response(self, name: str, limit: int = 5) -> APIResponse:
+        """
+        Resolve a game name to an appid, with ranked alternatives.
+
+        Returns:
+            APIResponse with {"appid", "name", "candidates"} or error
+        """
+        if not self.ready:
+            return APIResponse(
+                ok=False,
+                source="app_catalog",
+                data={},
+                warnings=["App search index is not built"],
+                error={"message": "The app catalog has not been synced and indexed yet"}
+            )
+        candidates = self.search(name, limit, build=False)
+        best = candidates[0] if candidates and candidates[0]["score"] >= RESOLVE_MIN_SCORE else None
+        if best is None:
+            return APIResponse(
+                ok=False,
+                source="app_catalog",
+                data={"candidates": candidates},
+                warnings=["No confident match"],
+                error={"message": f"Could not resolve app name '{name}'"}
+            )
+        return APIResponse(
+            ok=True,
+            source="app_catalog",
+            data={"appid": best["appid"], "name": best["name"], "candidates": candidates},
+        )
+
+
+# Shared index over the shared catalog
+app_search = AppSearchIndex()
@@ -0,0 +1,86 @@
+"""
+Background workers for periodic polling.
+
+This module provides a small base class for daemon threads that run a
+unit of work at a fixed cadence, used by the samplers and trackers that
+keep local copies of frequently requested Steam data.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker(ABC):
+    """
+    Base class for work that runs on a fixed interval in a daemon thread.
+
+    Subclasses must implement run_once(); one that does not cannot be
+    instantiated. Exceptions raised by run_once() are logged and do not
+    stop the worker.
+
+    Usage:
+        class Poller(PeriodicWorker):
+            def run_once(self):
+                ...
+
+        poller = Poller(interval=60)
+        poller.start()
+        ...
+        poller.stop()
+    """
+
+    def __init__(self, interval: float, name: Optional[str] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            interval: Seconds between the starts of consecutive runs
+            name: Thread name (defaults to the class name)
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        self.interval = interval
+        self.name = name or type(self).__name__
+        self.last_run_at: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    def run_once(self) -> None:
+        """Perform one unit of work."""
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if already running)."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"{self.name} started with interval={self.interval}s")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the worker to stop and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Check whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.run_once()
+                self.last_run_at = time.time()
+            except Exception as e:
+                logger.warning(f"{self.name} run failed: {e}")
+            elapsed = time.monotonic() - started
+            self._stop_event.wait(max(0.0, self.interval - elapsed))
@@ -269,3 +269,8 @@ class TTLCache:
 store_cache = TTLCache(default_ttl=300, max_size=1000)  # 5 minutes for store data
 discovery_cache = TTLCache(default_ttl=600, max_size=500)  # 10 minutes for discovery data
 app_cache = TTLCache(default_ttl=1800, max_size=2000)  # 30 minutes for app details
+schema_cache = TTLCache(default_ttl=86400, max_size=2000)  # 24 hours for game schemas
+vanity_cache = TTLCache(default_ttl=7 * 86400, max_size=10000)  # 7 days for vanity URL lookups
+library_cache = TTLCache(default_ttl=3600, max_size=500)  # 1 hour for owned-game bitsets
+price_cache = TTLCache(default_ttl=3600, max_size=1000)  # 1 hour for parsed price histories and stats
+overview_cache = TTLCache(default_ttl=300, max_size=5000)  # 5 minutes for market price overviews
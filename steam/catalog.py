@@ -0,0 +1,359 @@
+"""
+Local Steam app catalog.
+
+This module provides:
+- AppCatalog: appid -> name mapping held in parallel sorted arrays with
+  O(log n) lookup and a compact on-disk format
+- CatalogSyncer: pages through IStoreService/GetAppList with last_appid,
+  and after the first full sync only asks for apps changed since the
+  previous one (if_modified_since)
+- app_catalog: the shared catalog used to name apps in tool output
+"""
+
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from steam.background import PeriodicWorker
+from steam.client import APIResponse, SteamAPIError, SteamClient
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MAGIC = b"STEAMCAT"
+CATALOG_FORMAT_VERSION = 1
+
+DEFAULT_SYNC_INTERVAL = 86400
+
+# GetAppList returns at most 50000 apps per page
+MAX_PAGE_SIZE = 50000
+
+CatalogEntry = Tuple[int, str, int]
+
+
+class AppCatalog:
+    """
+    Sorted appid -> (name, last_modified) mapping.
+
+    Appids and modification times live in array('I') columns next to a
+    list of names, which keeps 200k entries in a few megabytes. Updates
+    build new columns and swap them in, so readers never see a partial
+    state. `version` increases on every change so derived indexes can
+    tell when to rebuild.
+
+    Usage:
+        catalog = AppCatalog()
+        catalog.load("catalog.bin")
+        catalog.name_for(730)       # "Counter-Strike 2"
+    """
+
+    def __init__(self):
+        self._columns: Tuple[array, List[str], array] = (array("I"), [], array("I"))
+        self.synced_at: Optional[int] = None
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __contains__(self, appid: int) -> bool:
+        return self._position(appid, self._columns[0]) is not None
+
+    @staticmethod
+    def _position(appid: int, appids: array) -> Optional[int]:
+        i = bisect_left(appids, appid)
+        if i < len(appids) and appids[i] == appid:
+            return i
+        return None
+
+    def name_for(self, appid: int) -> Optional[str]:
+        """Get the name of an app, or None if it is not in the catalog."""
+        appids, names, _ = self._columns
+        i = self._position(appid, appids)
+        return names[i] if i is not None else None
+
+    def get(self, appid: int) -> Optional[Dict[str, Any]]:
+        """Get the catalog entry for an app."""
+        appids, names, modified = self._columns
+        i = self._position(appid, appids)
+        if i is None:
+            return None
+        return {"appid": appid, "name": names[i], "last_modified": modified[i]}
+
+    def entries(self) -> Iterator[CatalogEntry]:
+        """Iterate over (appid, name, last_modified) in appid order."""
+        appids, names, modified = self._columns
+        return zip(appids, names, modified)
+
+    def replace(self, entries: List[CatalogEntry], synced_at: Optional[int] = None) -> None:
+        """Replace the whole catalog."""
+        entries = sorted({e[0]: e for e in entries}.values())
+        columns = (
+            array("I", (e[0] for e in entries)),
+            [e[1] for e in entries],
+            array("I", (e[2] for e in entries)),
+        )
+        with self._lock:
+            self._columns = columns
+            self.synced_at = synced_at
+            self.version += 1
+
+    def merge(self, changes: List[CatalogEntry], synced_at: Optional[int] = None) -> None:
+        """
+        Insert or update entries with a single linear merge.
+
+        Args:
+            changes: Changed entries in any order
+            synced_at: Time of the sync that produced the changes
+        """
+        changes = sorted({e[0]: e for e in changes}.values())
+        with self._lock:
+            old_appids, old_names, old_modified = self._columns
+            appids, names, modified = array("I"), [], array("I")
+            i = j = 0
+            while i < len(old_appids) or j < len(changes):
+                if j == len(changes) or (i < len(old_appids) and old_appids[i] < changes[j][0]):
+                    appids.append(old_appids[i])
+                    names.append(old_names[i])
+                    modified.append(old_modified[i])
+                    i += 1
+                    continue
+                if i < len(old_appids) and old_appids[i] == changes[j][0]:
+                    i += 1
+                appid, name, last_modified = changes[j]
+                appids.append(appid)
+                names.append(name)
+                modified.append(last_modified)
+                j += 1
+            self._columns = (appids, names, modified)
+            if synced_at is not None:
+                self.synced_at = synced_at
+            self.version += 1
+
+    def save(self, path: str) -> None:
+        """Write the catalog to a compact binary file."""
+        appids, names, modified = self._columns
+        header = json.dumps({
+            "version": CATALOG_FORMAT_VERSION,
+            "count": len(appids),
+            "synced_at": self.synced_at,
+            "byteorder": sys.byteorder,
+        }).encode("utf-8")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(CATALOG_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(appids.tobytes())
+            f.write(modified.tobytes())
+            f.write("\x00".join(names).encode("utf-8"))
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        """
+        Load the catalog from a file written by save().
+
+        Returns:
+            True if the file was loaded
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if not data.startswith(CATALOG_MAGIC):
+                raise ValueError("not a catalog file")
+            offset = len(CATALOG_MAGIC)
+            (header_length,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            header = json.loads(data[offset:offset + header_length])
+            offset += header_length
+            if header.get("version") != CATALOG_FORMAT_VERSION:
+                raise ValueError(f"unsupported version {header.get('version')}")
+
+            count = header["count"]
+            appids, modified = array("I"), array("I")
+            size = count * appids.itemsize
+            appids.frombytes(data[offset:offset + size])
+            modified.frombytes(data[offset + size:offset + 2 * size])
+            if header.get("byteorder") != sys.byteorder:
+                appids.byteswap()
+                modified.byteswap()
+            names = data[offset + 2 * size:].decode("utf-8").split("\x00") if count else []
+            if len(names) != count:
+                raise ValueError("name count mismatch")
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            logger.warning(f"Failed to load app catalog from {path}: {e}")
+            return False
+
+        with self._lock:
+            self._columns = (appids, names, modified)
+            self.synced_at = header.get("synced_at")
+            self.version += 1
+        logger.info(f"Loaded {count} apps from {path}")
+        return True
+
+
+# Shared catalog used to name apps in tool output
+app_catalog = AppCatalog()
+
+
+class CatalogSyncer(PeriodicWorker):
+    """
+    Keeps an AppCatalog in sync with IStoreService/GetAppList.
+
+    The first sync pages through the full list; later syncs pass the
+    previous sync time as if_modified_since so only changed apps are
+    transferred. The catalog is saved to disk after each sync when a
+    path is configured, and loaded from it on construction. Callbacks in
+    on_sync run in the worker after each successful sync, and once on the
+    first run for a catalog loaded from disk, so indexes derived from the
+    catalog are built off the request path even if that sync fails.
+
+    Usage:
+        syncer = CatalogSyncer(SteamClient(), path="catalog.bin")
+        syncer.start()
+    """
+
+    def __init__(self, client: SteamClient, catalog: Optional[AppCatalog] = None,
+                 path: Optional[str] = None, interval: float = DEFAULT_SYNC_INTERVAL,
+                 page_size: int = MAX_PAGE_SIZE, include_dlc: bool = False,
+                 include_software: bool = False, on_sync: Iterable[Callable[[], Any]] = ()):
+        """
+        Initialize the syncer.
+
+        Args:
+            client: SteamClient used for GetAppList requests
+            catalog: Catalog to update (defaults to the shared app_catalog)
+            path: Optional file the catalog is loaded from and saved to
+            interval: Seconds between syncs
+            page_size: Apps requested per page (at most 50000)
+            include_dlc: Also list DLC
+            include_software: Also list software
+            on_sync: Callables run after each successful sync
+        """
+        super().__init__(interval, name="CatalogSyncer")
+        self.client = client
+        self.catalog = catalog if catalog is not None else app_catalog
+        self.path = path
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self.include_dlc = include_dlc
+        self.include_software = include_software
+        self.on_sync: List[Callable[[], Any]] = list(on_sync)
+        self.last_sync: Optional[Dict[str, Any]] = None
+        self._loaded = bool(path and os.path.exists(path) and self.catalog.load(path))
+
+    @classmethod
+    def from_env(cls, client: SteamClient, on_sync: Iterable[Callable[[], Any]] = ()) -> 'CatalogSyncer':
+        """
+        Create a syncer configured from environment variables.
+
+        STEAM_CATALOG_FILE: file the catalog is persisted to
+        STEAM_CATALOG_SYNC_INTERVAL: seconds between syncs
+        """
+        path = os.getenv("STEAM_CATALOG_FILE") or None
+        interval = float(os.getenv("STEAM_CATALOG_SYNC_INTERVAL") or DEFAULT_SYNC_INTERVAL)
+        return cls(client, path=path, interval=interval, on_sync=on_sync)
+
+    def fetch(self, if_modified_since: Optional[int] = None) -> Optional[List[CatalogEntry]]:
+        """
+        Page through GetAppList.
+
+        Args:
+            if_modified_since: Only list apps modified after this Unix time
+
+        Returns:
+            List of (appid, name, last_modified), or None if a request failed
+        """
+        url = f"{self.client.STEAM_API_BASE}/IStoreService/GetAppList/v1/"
+        entries: List[CatalogEntry] = []
+        last_appid = 0
+        while True:
+            params = {
+                "max_results": self.page_size,
+                "last_appid": last_appid,
+                "include_games": "true",
+                "include_dlc": "true" if self.include_dlc else "false",
+                "include_software": "true" if self.include_software else "false",
+            }
+            if if_modified_since is not None:
+                params["if_modified_since"] = if_modified_since
+
+            # Pages hold up to 50k apps; stream them rather than decoding whole bodies
+            try:
+                with self.client.stream(url, ("response", "apps"), params=params) as apps:
+                    for app in apps:
+                        name = (app.get("name") or "").replace("\x00", "")
+                        entries.append((int(app["appid"]), name, int(app.get("last_modified", 0))))
+            except (SteamAPIError, ValueError) as e:
+                logger.warning(f"GetAppList failed after {len(entries)} apps: {e}")
+                return None
+
+            if not apps.envelope.get("have_more_results") or not apps.envelope.get("last_appid"):
+                return entries
+            last_appid = apps.envelope["last_appid"]
+
+    def sync(self, full: bool = False) -> APIResponse:
+        """
+        Bring the catalog up to date.
+
+        Args:
+            full: Refetch the whole list instead of changes only
+
+        Returns:
+            APIResponse with sync statistics or error
+        """
+        started = int(time.time())
+        since = None if full or not len(self.catalog) else self.catalog.synced_at
+        entries = self.fetch(since)
+        if entries is None:
+            return APIResponse(
+                ok=False,
+                source="app_catalog",
+                data={},
+                warnings=["Catalog sync failed"],
+                error={"message": "GetAppList request failed"}
+            )
+
+        if since is None:
+            self.catalog.replace(entries, synced_at=started)
+        else:
+            self.catalog.merge(entries, synced_at=started)
+
+        if self.path:
+            try:
+                self.catalog.save(self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save app catalog: {e}")
+
+        self.last_sync = {
+            "mode": "full" if since is None else "delta",
+            "changed": len(entries),
+            "total": len(self.catalog),
+            "synced_at": started,
+            "seconds": round(time.time() - started, 1),
+        }
+        logger.info(f"App catalog sync: {self.last_sync}")
+
+        self._loaded = False
+        self._notify()
+        return APIResponse(ok=True, source="app_catalog", data=self.last_sync)
+
+    def _notify(self) -> None:
+        """Run the on_sync callbacks, logging their failures."""
+        for callback in self.on_sync:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"App catalog sync callback failed: {e}")
+
+    def run_once(self) -> None:
+        """Index a catalog loaded from disk on the first run, then sync it."""
+        if self._loaded:
+            self._loaded = False
+            self._notify()
+        self.sync()
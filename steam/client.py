@@ -11,14 +11,19 @@ This module provides a centralized HTTP client that:
 
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 from urllib.parse import urlparse
 
 import requests
 
+from steam import codec
+from steam.streaming import JSONArrayStream
+from steam.views import materialize
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,11 +81,11 @@ class APIResponse:
     error: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization; lazy views in data are materialized."""
         result = {
             "ok": self.ok,
             "source": self.source,
-            "data": self.data,
+            "data": materialize(self.data),
             "warnings": self.warnings,
             "fetched_at": self.fetched_at,
         }
@@ -89,6 +94,10 @@ class APIResponse:
         if self.error:
             result["error"] = self.error
         return result
+    
+    def to_json(self) -> bytes:
+        """Serialize to UTF-8 JSON with the fast codec; dataclasses in data are encoded directly."""
+        return codec.dumps(self.to_dict())
 
 
 @dataclass
@@ -98,6 +107,77 @@ class RateLimitInfo:
     reset_at: Optional[datetime] = None
     retry_after: Optional[int] = None
     limited: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "remaining": self.remaining,
+            "reset_at": self.reset_at.isoformat() if self.reset_at else None,
+            "retry_after": self.retry_after,
+            "limited": self.limited,
+        }
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the rate of outgoing requests.
+    
+    Tokens refill continuously at `rate` per second up to `burst`;
+    acquire() blocks until a token is available.
+    
+    Usage:
+        limiter = RateLimiter(rate=10, burst=10)
+        limiter.acquire()
+        client.get(url)
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum requests allowed back to back (defaults to rate)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def try_acquire(self) -> bool:
+        """Take a token if one is available without waiting."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+    
+    def acquire(self) -> float:
+        """
+        Take a token, waiting for one if necessary.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
 
 
 class SteamClient:
@@ -167,13 +247,19 @@ class SteamClient:
         """Calculate backoff time using exponential backoff."""
         return self.backoff_factor * (2 ** attempt)
     
-    def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
+    def _make_request(self, method: str, url: str, retry_rate_limited: bool = True,
+                      **kwargs) -> requests.Response:
         """
         Make an HTTP request with retry logic and error handling.
         
+        A 429 response is retried after waiting; once retries are exhausted
+        (or right away with retry_rate_limited=False) it is returned as is,
+        so callers see the rate limit and its Retry-After.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL
+            retry_rate_limited: Whether to wait and retry on 429 responses
             **kwargs: Additional arguments for requests.request()
             
         Returns:
@@ -199,6 +285,8 @@ class SteamClient:
                 
                 # Check for rate limiting
                 if response.status_code == 429:
+                    if not retry_rate_limited or attempt >= self.max_retries:
+                        return response
                     retry_after = int(response.headers.get("Retry-After", 5))
                     wait_time = self._calculate_backoff(attempt)
                     actual_wait = max(wait_time, retry_after)
@@ -263,6 +351,42 @@ class SteamClient:
                 error=e.to_dict()
             )
     
+    def stream(self, url: str, path: Sequence[str], chunk_size: int = 65536,
+               **kwargs) -> JSONArrayStream:
+        """
+        Make a GET request and stream one array out of the JSON body.
+        
+        Elements are decoded as they arrive from the socket instead of
+        parsing the whole body first, so peak memory stays flat for very
+        large responses (owned games, app lists, price histories).
+        
+        Args:
+            url: Request URL
+            path: Object keys leading to the array (e.g. ("response", "games"))
+            chunk_size: Bytes read from the socket at a time
+            **kwargs: Additional arguments for requests.get()
+            
+        Returns:
+            JSONArrayStream yielding the array elements
+            
+        Raises:
+            SteamAPIError: If the request fails or is interrupted
+        """
+        source = self._get_source_from_url(url)
+        response = self._make_request("GET", url, stream=True, **kwargs)
+        if response.status_code != 200:
+            message = response.text[:500]
+            response.close()
+            raise SteamAPIError(response.status_code, message or None, endpoint=url, source=source)
+        
+        def chunks():
+            try:
+                yield from response.iter_content(chunk_size)
+            except requests.RequestException as e:
+                raise SteamAPIError(500, f"Stream interrupted: {str(e)}", endpoint=url, source=source)
+        
+        return JSONArrayStream(chunks(), path, on_close=response.close)
+    
     def post(self, url: str, **kwargs) -> APIResponse:
         """
         Make a POST request and return a normalized APIResponse.
@@ -298,7 +422,9 @@ class SteamClient:
             APIResponse with normalized structure
         """
         try:
-            data = response.json()
+            content = response.content
+            # Decode the raw body ourselves; requests would decode to str first
+            data = codec.loads(content) if isinstance(content, bytes) else response.json()
         except Exception:
             data = {"raw_text": response.text}
         
@@ -312,9 +438,10 @@ class SteamClient:
         warnings = self._extract_warnings(data, response)
         
         # Determine if response is OK
-        # For Steam API, 200 with "ok": true means success
+        # Steam endpoints rarely send an "ok" flag, so only an explicit
+        # "ok": false on a 200 response marks it as failed
         is_ok = (response.status_code == 200 and 
-                (isinstance(data, dict) and data.get("ok", False)))
+                not (isinstance(data, dict) and data.get("ok") is False))
         
         # For market endpoints, check different success indicators
         if "steamcommunity.com" in url:
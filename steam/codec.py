@@ -0,0 +1,86 @@
+"""
+JSON codec used for response decoding and serialized output.
+
+This module provides:
+- loads / dumps / dumps_str: JSON decode and encode through orjson when it
+  is installed, falling back to the standard library
+- BACKEND: name of the active backend
+
+Dataclasses (schemas, APIResponse) are encoded field by field without
+building an intermediate dict first; bytes are encoded as UTF-8 text, or
+base64 when they are not valid UTF-8. Other mappings and sequences (such as
+the lazy views in steam.views) are encoded as objects and arrays.
+
+Set STEAM_JSON_CODEC=json to force the standard library backend.
+"""
+
+import base64
+import dataclasses
+import json
+import os
+from collections.abc import Mapping, Sequence
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if os.getenv("STEAM_JSON_CODEC", "").lower() == "json":
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _encode_bytes(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return base64.b64encode(value).decode("ascii")
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the backend does not handle natively."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return _encode_bytes(bytes(obj))
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow: nested values are handed back to the encoder as they are
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+else:
+    _decoder = json.JSONDecoder()
+    _encoder = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document."""
+        if not isinstance(data, str):
+            data = bytes(data).decode("utf-8")
+        return _decoder.decode(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return _encoder.encode(obj).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Encode an object as a JSON string."""
+    return dumps(obj).decode("utf-8")
@@ -0,0 +1,250 @@
+"""
+Steam currencies and localized price strings.
+
+The market formats prices for the requested currency ("$1,234.56",
+"1.234,56€", "1 234,56 pуб.", "¥ 1,234") and counts with grouping
+separators ("12,345"). This module turns them into integers.
+
+This module provides:
+- CurrencyFormat / CURRENCIES: Steam currency IDs with their symbols and
+  decimal and grouping separators
+- get_currency: look up a format by ID or ISO code
+- PriceParser / price_parser: precompiled parser for one currency, cached
+  per currency; parse() and parse_many() for lists of strings
+- parse_price / parse_prices / parse_count / detect_currency
+
+Amounts are returned in hundredths of the currency, the unit Steam uses
+internally for every currency (including ones displayed in whole units,
+such as JPY), so they compare directly with sell_price and order book
+prices.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
+
+# Regular, no-break and narrow no-break spaces
+_SPACES = " \u00a0\u202f"
+
+
+@dataclass(frozen=True)
+class CurrencyFormat:
+    """How the market displays one currency."""
+    id: int
+    code: str
+    symbol: str
+    decimal: str = "."
+    grouping: str = ","
+    whole_units: bool = False
+
+
+CURRENCIES: Dict[int, CurrencyFormat] = {c.id: c for c in (
+    CurrencyFormat(1, "USD", "$"),
+    CurrencyFormat(2, "GBP", "£"),
+    CurrencyFormat(3, "EUR", "€", ",", "." + _SPACES),
+    CurrencyFormat(4, "CHF", "CHF", ".", "'" + _SPACES),
+    CurrencyFormat(5, "RUB", "pуб.", ",", _SPACES),
+    CurrencyFormat(6, "PLN", "zł", ",", _SPACES),
+    CurrencyFormat(7, "BRL", "R$", ",", "."),
+    CurrencyFormat(8, "JPY", "¥", whole_units=True),
+    CurrencyFormat(9, "NOK", "kr", ",", "." + _SPACES),
+    CurrencyFormat(10, "IDR", "Rp", ".", _SPACES, whole_units=True),
+    CurrencyFormat(11, "MYR", "RM"),
+    CurrencyFormat(12, "PHP", "P"),
+    CurrencyFormat(13, "SGD", "S$"),
+    CurrencyFormat(14, "THB", "฿"),
+    CurrencyFormat(15, "VND", "₫", ",", ".", whole_units=True),
+    CurrencyFormat(16, "KRW", "₩", whole_units=True),
+    CurrencyFormat(17, "TRY", "TL", ",", "."),
+    CurrencyFormat(18, "UAH", "₴", ",", _SPACES),
+    CurrencyFormat(19, "MXN", "Mex$"),
+    CurrencyFormat(20, "CAD", "CDN$"),
+    CurrencyFormat(21, "AUD", "A$"),
+    CurrencyFormat(22, "NZD", "NZ$"),
+    CurrencyFormat(23, "CNY", "¥"),
+    CurrencyFormat(24, "INR", "₹", whole_units=True),
+    CurrencyFormat(25, "CLP", "CLP$", ",", ".", whole_units=True),
+    CurrencyFormat(26, "PEN", "S/."),
+    CurrencyFormat(27, "COP", "COL$", ",", ".", whole_units=True),
+    CurrencyFormat(28, "ZAR", "R", ".", _SPACES),
+    CurrencyFormat(29, "HKD", "HK$"),
+    CurrencyFormat(30, "TWD", "NT$", whole_units=True),
+    CurrencyFormat(31, "SAR", "SR"),
+    CurrencyFormat(32, "AED", "AED"),
+    CurrencyFormat(34, "ARS", "ARS$", ",", "."),
+    CurrencyFormat(35, "ILS", "₪"),
+    CurrencyFormat(37, "KZT", "₸", ",", _SPACES),
+    CurrencyFormat(38, "KWD", "KD"),
+    CurrencyFormat(39, "QAR", "QR"),
+    CurrencyFormat(40, "CRC", "₡", ",", ".", whole_units=True),
+    CurrencyFormat(41, "UYU", "$U", ",", ".", whole_units=True),
+)}
+
+_BY_CODE = {c.code: c for c in CURRENCIES.values()}
+
+# Symbols shared by several currencies cannot identify one
+_AMBIGUOUS = {"¥"}
+
+_COUNT_DIGITS = re.compile(r"\d+")
+
+
+def get_currency(currency: Union[int, str]) -> CurrencyFormat:
+    """
+    Look up a currency by Steam currency ID or ISO code.
+
+    Raises:
+        ValueError: If the currency is unknown
+    """
+    if isinstance(currency, str) and not currency.isdigit():
+        fmt = _BY_CODE.get(currency.upper())
+    else:
+        fmt = CURRENCIES.get(int(currency))
+    if fmt is None:
+        raise ValueError(f"Unknown currency: {currency}")
+    return fmt
+
+
+class PriceParser:
+    """
+    Parser for the price strings of one currency.
+
+    The number pattern and the separators are worked out once; parse() is
+    then one regex search, a replace per grouping character and two int()
+    calls per string.
+
+    Usage:
+        parser = price_parser("EUR")
+        parser.parse("1.234,56€")              # 123456
+        parser.parse_many(["0,03€", "--"])     # [3, None]
+    """
+
+    def __init__(self, fmt: Optional[CurrencyFormat] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            fmt: Currency format; None guesses the decimal separator per string
+        """
+        self.format = fmt
+        self.currency = fmt.id if fmt else None
+        if fmt is None:
+            separators = ".,'" + _SPACES
+            self._decimal = None
+        else:
+            separators = fmt.decimal + fmt.grouping
+            self._decimal = fmt.decimal
+            self._grouping = tuple(fmt.grouping)
+        self._number = re.compile(rf"\d(?:[\d{re.escape(separators)}]*\d)?")
+
+    def parse(self, text: Optional[str]) -> Optional[int]:
+        """
+        Parse one price string.
+
+        Returns:
+            Amount in hundredths, or None if the string has no number
+        """
+        if not text:
+            return None
+        match = self._number.search(text)
+        if match is None:
+            return None
+        number = match.group()
+        if self._decimal is None:
+            return self._parse_guessed(number)
+        for separator in self._grouping:
+            if separator in number:
+                number = number.replace(separator, "")
+        whole, _, fraction = number.partition(self._decimal)
+        return self._amount(whole, fraction)
+
+    def parse_many(self, texts: Iterable[Optional[str]]) -> List[Optional[int]]:
+        """Parse many price strings; unparseable ones become None."""
+        parse = self.parse
+        return [parse(text) for text in texts]
+
+    @staticmethod
+    def _amount(whole: str, fraction: str) -> Optional[int]:
+        # The pattern only admits digits and separators, so int() fails
+        # only on leftover separators, e.g. a second decimal point
+        try:
+            if not fraction:
+                return int(whole) * 100
+            return int(whole) * 100 + (int(fraction) * 10 if len(fraction) == 1 else int(fraction[:2]))
+        except ValueError:
+            return None
+
+    def _parse_guessed(self, number: str) -> Optional[int]:
+        """Without a currency, a final '.' or ',' before 1-2 digits is the decimal separator."""
+        tail = max(number.rfind("."), number.rfind(","))
+        if tail != -1 and 0 < len(number) - tail - 1 <= 2:
+            whole, fraction = number[:tail], number[tail + 1:]
+        else:
+            whole, fraction = number, ""
+        return self._amount("".join(c for c in whole if c.isdigit()), fraction)
+
+
+@lru_cache(maxsize=None)
+def price_parser(currency: Union[int, str, None] = None) -> PriceParser:
+    """
+    Cached parser for a currency ID or ISO code.
+
+    Unknown currencies and None get a parser that guesses the decimal
+    separator from each string.
+    """
+    if currency is None:
+        return PriceParser()
+    try:
+        return PriceParser(get_currency(currency))
+    except ValueError:
+        return price_parser(None)
+
+
+def parse_price(text: Optional[str], currency: Union[int, str, None] = None) -> Optional[int]:
+    """
+    Parse a localized price string into hundredths of the currency.
+
+    Args:
+        text: Price as displayed by the market, e.g. "1 234,56€"
+        currency: Steam currency ID or ISO code of the string (guessed if None)
+
+    Returns:
+        Amount in hundredths, or None if the string has no number
+    """
+    return price_parser(currency).parse(text)
+
+
+def parse_prices(texts: Iterable[Optional[str]], currency: Union[int, str, None] = None) -> List[Optional[int]]:
+    """Parse many price strings of one currency; see parse_price()."""
+    return price_parser(currency).parse_many(texts)
+
+
+def parse_count(text: Union[str, int, None]) -> Optional[int]:
+    """Parse a count such as "12,345" or "12 345"; None if it has no digits."""
+    if text is None or isinstance(text, int):
+        return text
+    digits = "".join(_COUNT_DIGITS.findall(text))
+    return int(digits) if digits else None
+
+
+@lru_cache(maxsize=1)
+def _symbol_pattern() -> re.Pattern:
+    # Longest first, so "CDN$" wins over "$"
+    symbols = sorted({c.symbol for c in CURRENCIES.values()}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(s) for s in symbols))
+
+
+def detect_currency(text: Optional[str]) -> Optional[int]:
+    """
+    Identify the currency of a price string by its symbol.
+
+    Returns:
+        Steam currency ID, or None if the symbol is missing or shared by
+        several currencies (e.g. "¥" for JPY and CNY)
+    """
+    if not text:
+        return None
+    match = _symbol_pattern().search(text)
+    if match is None or match.group() in _AMBIGUOUS:
+        return None
+    return next(c.id for c in CURRENCIES.values() if c.symbol == match.group())
@@ -0,0 +1,258 @@
+"""
+Local leaderboard of concurrent players.
+
+This module provides:
+- PlayerLeaderboard: a background worker that refreshes current player
+  counts for a tracked universe of apps with a rate-limited concurrent
+  sweep, and serves top-N, rank and rank-change queries from memory
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from steam.background import PeriodicWorker
+from steam.catalog import app_catalog
+from steam.client import APIResponse, RateLimiter
+from steam.players import PlayerCountSampler, fetch_player_counts
+from steam.schemas import AppID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 900
+DEFAULT_RATE = 10.0
+DEFAULT_MAX_WORKERS = 16
+
+
+class _Snapshot:
+    """Immutable ranking built from one refresh."""
+
+    __slots__ = ("keys", "counts", "refreshed_at")
+
+    def __init__(self, counts: Dict[int, int], refreshed_at: Optional[float]):
+        # Sorted by descending count, ties broken by appid
+        self.keys: List[Tuple[int, int]] = sorted((-count, appid) for appid, count in counts.items())
+        self.counts = counts
+        self.refreshed_at = refreshed_at
+
+    def rank(self, appid: int) -> Optional[int]:
+        """1-based rank of an app, found by bisecting on its sort key."""
+        count = self.counts.get(appid)
+        if count is None:
+            return None
+        return bisect.bisect_left(self.keys, (-count, appid)) + 1
+
+
+class PlayerLeaderboard(PeriodicWorker):
+    """
+    Concurrent-players leaderboard for a tracked set of apps.
+
+    Each refresh polls every tracked app through a shared token bucket and
+    swaps in a new sorted snapshot; the previous snapshot is kept for
+    rank-change queries. Apps whose poll fails keep their last known count.
+    Reads never touch the network.
+
+    Usage:
+        leaderboard = PlayerLeaderboard(SteamWebAPI(), [730, 570, 440])
+        leaderboard.start()
+        ...
+        leaderboard.top(10)
+    """
+
+    def __init__(self, web, appids: Iterable[Union[str, int]], interval: float = DEFAULT_INTERVAL,
+                 rate: float = DEFAULT_RATE, max_workers: int = DEFAULT_MAX_WORKERS,
+                 sampler: Optional[PlayerCountSampler] = None):
+        """
+        Initialize the leaderboard.
+
+        Args:
+            web: SteamWebAPI instance used for polling
+            appids: Application IDs to rank
+            interval: Seconds between refreshes
+            rate: Maximum requests per second during a refresh
+            max_workers: Maximum number of concurrent requests
+            sampler: Optional sampler that receives counts for the apps it tracks
+        """
+        super().__init__(interval, name="PlayerLeaderboard")
+        self.web = web
+        self.limiter = RateLimiter(rate)
+        self.max_workers = max_workers
+        self.sampler = sampler
+        self.last_refresh_seconds: Optional[float] = None
+        self.last_failed = 0
+        self._appids: List[int] = []
+        self._current = _Snapshot({}, None)
+        self._previous = _Snapshot({}, None)
+        self._lock = threading.Lock()
+        self.add_appids(appids)
+
+    @classmethod
+    def from_env(cls, web, sampler: Optional[PlayerCountSampler] = None) -> 'PlayerLeaderboard':
+        """
+        Create a leaderboard configured from environment variables.
+
+        STEAM_LEADERBOARD_APPIDS: comma-separated appids to rank
+        STEAM_LEADERBOARD_INTERVAL: seconds between refreshes
+        STEAM_LEADERBOARD_RATE: maximum requests per second
+        """
+        raw_appids = os.getenv("STEAM_LEADERBOARD_APPIDS", "")
+        appids = [a.strip() for a in raw_appids.split(",") if a.strip()]
+        interval = float(os.getenv("STEAM_LEADERBOARD_INTERVAL") or DEFAULT_INTERVAL)
+        rate = float(os.getenv("STEAM_LEADERBOARD_RATE") or DEFAULT_RATE)
+        return cls(web, appids, interval=interval, rate=rate, sampler=sampler)
+
+    @property
+    def appids(self) -> List[int]:
+        """Tracked application IDs."""
+        with self._lock:
+            return list(self._appids)
+
+    def add_appids(self, appids: Iterable[Union[str, int]]) -> None:
+        """Add apps to the tracked universe; they are ranked from the next refresh."""
+        with self._lock:
+            known = set(self._appids)
+            for app_id in appids:
+                appid = AppID.validate(app_id).appid
+                if appid not in known:
+                    known.add(appid)
+                    self._appids.append(appid)
+
+    def run_once(self) -> None:
+        """Refresh counts for every tracked app and swap in a new ranking."""
+        started = time.monotonic()
+        polled = fetch_player_counts(self.web, self.appids, self.max_workers, self.limiter)
+        now = time.time()
+
+        with self._lock:
+            counts = dict(self._current.counts)
+            failed = 0
+            for appid, count in polled.items():
+                if count is None:
+                    failed += 1
+                else:
+                    counts[appid] = count
+            self._previous = self._current
+            self._current = _Snapshot(counts, now)
+            self.last_failed = failed
+            self.last_refresh_seconds = round(time.monotonic() - started, 2)
+
+        if self.sampler is not None:
+            for appid, count in polled.items():
+                if count is not None and self.sampler.is_tracked(appid):
+                    self.sampler.record(appid, count, now)
+
+        logger.info(f"Leaderboard refreshed {len(polled)} apps in {self.last_refresh_seconds}s "
+                    f"({failed} failed)")
+
+    def _entry(self, appid: int, current: _Snapshot, previous: _Snapshot) -> Dict[str, Any]:
+        rank = current.rank(appid)
+        previous_rank = previous.rank(appid)
+        return {
+            "appid": appid,
+            "name": app_catalog.name_for(appid),
+            "rank": rank,
+            "current_players": current.counts.get(appid),
+            "previous_rank": previous_rank,
+            "rank_change": previous_rank - rank if rank and previous_rank else None,
+        }
+
+    def _meta(self, current: _Snapshot) -> Dict[str, Any]:
+        age = round(time.time() - current.refreshed_at, 1) if current.refreshed_at else None
+        return {
+            "tracked_apps": len(self._appids),
+            "ranked_apps": len(current.keys),
+            "refreshed_at": current.refreshed_at,
+            "age_seconds": age,
+            "last_refresh_seconds": self.last_refresh_seconds,
+            "last_failed": self.last_failed,
+        }
+
+    def top(self, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """
+        Get the most played apps.
+
+        Args:
+            limit: Number of entries to return
+            offset: Number of top entries to skip
+
+        Returns:
+            Dict with ranked entries and data age
+        """
+        with self._lock:
+            current, previous = self._current, self._previous
+        entries = [self._entry(appid, current, previous)
+                   for _, appid in current.keys[offset:offset + limit]]
+        return {**self._meta(current), "entries": entries}
+
+    def rank(self, appid: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the rank of a single app.
+
+        Returns:
+            Dict with rank, count, previous rank and rank change, or None if unranked
+        """
+        with self._lock:
+            current, previous = self._current, self._previous
+        if appid not in current.counts:
+            return None
+        return {**self._meta(current), **self._entry(appid, current, previous)}
+
+    def get_top(self, limit: int = 10, offset: int = 0) -> APIResponse:
+        """
+        Get the most played apps as an APIResponse.
+
+        Args:
+            limit: Number of entries to return
+            offset: Number of top entries to skip
+
+        Returns:
+            APIResponse with ranked entries or error
+        """
+        if not self.appids:
+            return APIResponse(
+                ok=False,
+                source="player_leaderboard",
+                data={},
+                warnings=["Leaderboard is not configured"],
+                error={"message": "No apps are tracked; set STEAM_LEADERBOARD_APPIDS"}
+            )
+
+        data = self.top(limit, offset)
+        warnings = [] if data["refreshed_at"] else ["Leaderboard has not been refreshed yet"]
+        return APIResponse(ok=True, source="player_leaderboard", data=data, warnings=warnings)
+
+    def get_rank(self, app_id: Union[str, int]) -> APIResponse:
+        """
+        Get the rank of a single app as an APIResponse.
+
+        Args:
+            app_id: Application ID of the game
+
+        Returns:
+            APIResponse with rank data or error
+        """
+        try:
+            appid = AppID.validate(app_id).appid
+        except ValueError as e:
+            return APIResponse(
+                ok=False,
+                source="player_leaderboard",
+                data={},
+                warnings=["Invalid app ID"],
+                error={"message": str(e)}
+            )
+
+        data = self.rank(appid)
+        if data is None:
+            return APIResponse(
+                ok=False,
+                source="player_leaderboard",
+                data={},
+                warnings=["App is not ranked"],
+                error={"message": f"App {appid} is not on the leaderboard"}
+            )
+
+        return APIResponse(ok=True, source="player_leaderboard", data=data)
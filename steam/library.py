@@ -0,0 +1,354 @@
+"""
+Game library set operations for groups of Steam users.
+
+This module provides:
+- AppIndex: dense bit positions for app IDs
+- AppSet: a compressed bitset of app IDs
+- GroupLibraries: cached per-user library bitsets and overlap queries
+  (intersection, union, Jaccard similarity, "owned by at least k")
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from steam.cache import library_cache
+from steam.catalog import app_catalog
+from steam.client import APIResponse
+from steam.web import SteamWebAPI
+
+logger = logging.getLogger(__name__)
+
+
+class AppIndex:
+    """
+    Dense bit positions for app IDs.
+
+    App IDs are sparse (a few thousand owned games spread over a range of
+    several million), so bitsets are not indexed by the raw appid. Each
+    appid gets the next free bit position the first time it is seen, which
+    keeps every bitset as small as the set of apps actually observed.
+    Positions are never reassigned, so bitsets built at different times
+    against the same index stay comparable.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._positions: Dict[int, int] = {}
+        self._appids: List[int] = []
+        self._lock = Lock()
+
+    def position(self, appid: int) -> int:
+        """Get the bit position for an app ID, assigning one if needed."""
+        pos = self._positions.get(appid)
+        if pos is None:
+            with self._lock:
+                pos = self._positions.get(appid)
+                if pos is None:
+                    pos = len(self._appids)
+                    self._appids.append(appid)
+                    self._positions[appid] = pos
+        return pos
+
+    def find(self, appid: int) -> Optional[int]:
+        """Get the bit position for an app ID without assigning one."""
+        return self._positions.get(appid)
+
+    def appid(self, position: int) -> int:
+        """Get the app ID stored at a bit position."""
+        return self._appids[position]
+
+    def __len__(self) -> int:
+        return len(self._appids)
+
+
+# Shared index so that cached libraries can be combined with each other
+app_index = AppIndex()
+
+
+class AppSet:
+    """
+    Compressed bitset of Steam app IDs.
+
+    Bits are addressed through an AppIndex, so a set is a single Python int
+    whose size depends on how many distinct apps have been seen, not on the
+    largest appid. Set operations are one big-integer AND/OR each.
+
+    Usage:
+        a = AppSet.from_appids([10, 570, 730])
+        b = AppSet.from_appids([570, 730, 440])
+        common = a & b            # AppSet({570, 730})
+        score = a.jaccard(b)      # 0.5
+    """
+
+    __slots__ = ("bits", "index")
+
+    def __init__(self, bits: int = 0, index: Optional[AppIndex] = None):
+        """
+        Initialize the set.
+
+        Args:
+            bits: Bitmap of positions in the index
+            index: AppIndex the bits refer to (defaults to the shared index)
+        """
+        self.bits = bits
+        self.index = index if index is not None else app_index
+
+    @classmethod
+    def from_appids(cls, appids: Iterable[int], index: Optional[AppIndex] = None) -> 'AppSet':
+        """Create an AppSet from an iterable of app IDs."""
+        index = index if index is not None else app_index
+        positions = [index.position(int(appid)) for appid in appids]
+        if not positions:
+            return cls(0, index)
+        # Build the bitmap in a bytearray; OR-ing into an int per appid is quadratic
+        buf = bytearray(max(positions) // 8 + 1)
+        for pos in positions:
+            buf[pos >> 3] |= 1 << (pos & 7)
+        return cls(int.from_bytes(buf, "little"), index)
+
+    def _check(self, other: 'AppSet') -> None:
+        if other.index is not self.index:
+            raise ValueError("AppSets built on different indexes cannot be combined")
+
+    def __contains__(self, appid: object) -> bool:
+        if not isinstance(appid, int):
+            return False
+        pos = self.index.find(appid)
+        return pos is not None and bool(self.bits >> pos & 1)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return bool(self.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_list())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AppSet):
+            return NotImplemented
+        return self.index is other.index and self.bits == other.bits
+
+    def __repr__(self) -> str:
+        return f"AppSet(size={len(self)})"
+
+    def __and__(self, other: 'AppSet') -> 'AppSet':
+        self._check(other)
+        return AppSet(self.bits & other.bits, self.index)
+
+    def __or__(self, other: 'AppSet') -> 'AppSet':
+        self._check(other)
+        return AppSet(self.bits | other.bits, self.index)
+
+    def __sub__(self, other: 'AppSet') -> 'AppSet':
+        self._check(other)
+        return AppSet(self.bits & ~other.bits, self.index)
+
+    def intersection_count(self, other: 'AppSet') -> int:
+        """Count common app IDs without building an AppSet."""
+        self._check(other)
+        return (self.bits & other.bits).bit_count()
+
+    def jaccard(self, other: 'AppSet') -> float:
+        """Jaccard similarity |A & B| / |A | B| (0.0 for two empty sets)."""
+        self._check(other)
+        union = (self.bits | other.bits).bit_count()
+        return (self.bits & other.bits).bit_count() / union if union else 0.0
+
+    def to_list(self) -> List[int]:
+        """Return the app IDs as a sorted list."""
+        appids = []
+        raw = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little")
+        for byte_pos, byte in enumerate(raw):
+            while byte:
+                low = byte & -byte
+                appids.append(self.index.appid((byte_pos << 3) + low.bit_length() - 1))
+                byte ^= low
+        appids.sort()
+        return appids
+
+    @classmethod
+    def intersection(cls, sets: Sequence['AppSet']) -> 'AppSet':
+        """Intersection of all sets (empty for an empty sequence)."""
+        if not sets:
+            return cls()
+        bits = sets[0].bits
+        for s in sets[1:]:
+            sets[0]._check(s)
+            bits &= s.bits
+        return cls(bits, sets[0].index)
+
+    @classmethod
+    def union(cls, sets: Sequence['AppSet']) -> 'AppSet':
+        """Union of all sets."""
+        if not sets:
+            return cls()
+        bits = 0
+        for s in sets:
+            sets[0]._check(s)
+            bits |= s.bits
+        return cls(bits, sets[0].index)
+
+    @classmethod
+    def at_least(cls, sets: Sequence['AppSet'], k: int) -> 'AppSet':
+        """
+        App IDs present in at least k of the given sets.
+
+        ge[j] holds the bits seen in at least j of the sets processed so
+        far, which costs O(len(sets) * k) bitmap operations.
+        """
+        if k <= 1:
+            return cls.union(sets)
+        if k > len(sets):
+            return cls(0, sets[0].index if sets else None)
+
+        ge = [-1] + [0] * k
+        for s in sets:
+            sets[0]._check(s)
+            for j in range(k, 0, -1):
+                ge[j] |= ge[j - 1] & s.bits
+        return cls(ge[k], sets[0].index)
+
+
+class GroupLibraries:
+    """
+    Overlap queries across the game libraries of several Steam users.
+
+    Each user's owned games are fetched once, encoded as an AppSet and kept
+    in library_cache, so follow-up questions about the same group are
+    answered from memory.
+
+    Usage:
+        groups = GroupLibraries()
+        response = groups.compare(["76561198006409530", "76561197960287930"])
+    """
+
+    def __init__(self, web: Optional[SteamWebAPI] = None, max_workers: int = 8):
+        """
+        Initialize the group library helper.
+
+        Args:
+            web: SteamWebAPI instance used to fetch owned games
+            max_workers: Maximum number of concurrent owned-games requests
+        """
+        self.web = web or SteamWebAPI()
+        self.max_workers = max_workers
+        self._names: Dict[int, str] = {}
+
+    def get_library(self, steam_id: str) -> Optional[AppSet]:
+        """
+        Get the owned-games bitset for a user.
+
+        Args:
+            steam_id: Steam ID of the user
+
+        Returns:
+            AppSet of owned app IDs, or None if the library could not be fetched
+        """
+        cache_key = f"library:{steam_id}"
+        cached_result = library_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        response = self.web.get_owned_games(steam_id, include_appinfo=True,
+                                            include_played_free_games=True)
+        if not response.ok:
+            logger.warning(f"Failed to fetch owned games for {steam_id}")
+            return None
+
+        games = response.data.get("games", [])
+        for game in games:
+            if game.get("name"):
+                self._names[game["appid"]] = game["name"]
+
+        library = AppSet.from_appids(g["appid"] for g in games if g.get("appid"))
+        library_cache.set(cache_key, library)
+        return library
+
+    def get_libraries(self, steam_ids: Sequence[str]) -> Dict[str, Optional[AppSet]]:
+        """Fetch the bitsets for several users concurrently."""
+        unique_ids = list(dict.fromkeys(steam_ids))
+        if not unique_ids:
+            return {}
+        workers = max(1, min(self.max_workers, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_ids, executor.map(self.get_library, unique_ids)))
+
+    def app_name(self, appid: int) -> Optional[str]:
+        """Get the app name seen in any fetched library, falling back to the catalog."""
+        return self._names.get(appid) or app_catalog.name_for(appid)
+
+    def compare(self, steam_ids: Sequence[str], min_owners: Optional[int] = None,
+                limit: int = 100) -> APIResponse:
+        """
+        Compare the libraries of a group of users.
+
+        Args:
+            steam_ids: Steam IDs of the group members (any form accepted by SteamIDResolver)
+            min_owners: Also report games owned by at least this many members
+            limit: Maximum number of games listed per result set
+
+        Returns:
+            APIResponse with common games, union size and pairwise similarity
+        """
+        if not steam_ids or len(steam_ids) < 2:
+            return APIResponse(
+                ok=False,
+                source="steam_web_api",
+                data={},
+                warnings=["Not enough Steam IDs"],
+                error={"message": "At least two Steam IDs are required"}
+            )
+
+        warnings = []
+        resolved = self.web.resolver.resolve_many(steam_ids)
+        for value, steam_id in resolved.items():
+            if not steam_id:
+                warnings.append(f"Could not resolve Steam ID: {value}")
+
+        libraries = self.get_libraries([steam_id for steam_id in resolved.values() if steam_id])
+        usable: Dict[str, AppSet] = {}
+        for steam_id, library in libraries.items():
+            if not library:
+                warnings.append(f"Library for {steam_id} is private, empty or unavailable")
+            else:
+                usable[steam_id] = library
+
+        sets = list(usable.values())
+        common = AppSet.intersection(sets)
+        union = AppSet.union(sets)
+
+        data: Dict[str, Any] = {
+            "library_sizes": {sid: (len(lib) if lib else None) for sid, lib in libraries.items()},
+            "common": self._describe(common, limit),
+            "union_count": len(union),
+            "similarity": [
+                {"a": a, "b": b, "jaccard": round(usable[a].jaccard(usable[b]), 4)}
+                for a, b in combinations(usable, 2)
+            ],
+        }
+
+        if min_owners is not None:
+            data["min_owners"] = min_owners
+            data["owned_by_at_least"] = self._describe(AppSet.at_least(sets, min_owners), limit)
+
+        return APIResponse(
+            ok=len(usable) >= 2,
+            source="steam_web_api",
+            data=data,
+            warnings=warnings,
+            error=None if len(usable) >= 2 else {"message": "Fewer than two libraries available"}
+        )
+
+    def _describe(self, apps: AppSet, limit: int) -> Dict[str, Any]:
+        """Render an AppSet as a count plus a limited list of games."""
+        games = []
+        for appid in apps:
+            if len(games) >= limit:
+                break
+            games.append({"appid": appid, "name": self.app_name(appid)})
+        return {"count": len(apps), "games": games}
@@ -2,21 +2,119 @@
 Steam Community Market functions.
 
 This module provides functions for interacting with the Steam Community Market:
-- Search and browse items
-- Get price history and overviews
+- Search and browse items, and crawl every page of a search concurrently
+- Get price history and overviews, including batches of overviews paced
+  through a shared MarketScheduler
+- Price items across currencies, estimating most cells from implied FX rates
 - Get popular and recent items
 - Get market activity
 """
 
 import logging
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
-from steam.client import SteamClient, APIResponse, MarketAPIError
-from steam.schemas import AppID, MarketItem, PriceOverview, PriceHistory
+from steam.client import SteamClient, APIResponse, MarketAPIError, RateLimiter
+from steam.schemas import AppID, MarketItem, PriceOverview, PriceHistory, PricePoint
+from steam.cache import overview_cache, price_cache
+from steam.currency import get_currency
+from steam.nameids import ItemNameIDResolver
+from steam.orderbook import DEFAULT_DEPTHS, OrderBook, OrderBookStore
+from steam.pricearchive import PriceArchive
+from steam.pricematrix import DEFAULT_FX_MAX_AGE, PriceMatrix
+from steam.priceseries import INTERVALS, PriceSeries
+from steam.scheduler import MarketScheduler
+from steam.views import list_view
 
 logger = logging.getLogger(__name__)
 
+# Largest page served by market/search/render
+SEARCH_PAGE_SIZE = 100
+
+# Default request rate of a full search crawl; the market rate limit is
+# much stricter than the Web API's
+DEFAULT_CRAWL_RATE = 1.0
+DEFAULT_CRAWL_WORKERS = 4
+
+# Most items summarized by one get_item_price_stats call
+MAX_STATS_ITEMS = 50
+DEFAULT_STATS_WINDOWS = (7, 30)
+
+# Archived histories younger than this are served without a request;
+# Steam adds a point per hour
+DEFAULT_ARCHIVE_MAX_AGE = 3600
+
+# Most items accepted by one get_item_price_overviews call
+MAX_OVERVIEW_ITEMS = 500
+
+# Limits of one get_price_matrix call
+MAX_MATRIX_ITEMS = 100
+MAX_MATRIX_CURRENCIES = 40
+
+# Items fetched in each currency that has no fresh implied rate
+DEFAULT_FX_ANCHORS = 3
+
+# Fetched matrix cells younger than this are not requested again
+DEFAULT_MATRIX_MAX_AGE = 900
+
+
+@dataclass
+class SearchCheckpoint:
+    """
+    Progress of a market search crawl, for resuming it later.
+    
+    Pages are identified by their start offset; seen holds the hash names
+    already yielded so a resumed crawl does not repeat items.
+    """
+    query: str = ""
+    appid: Optional[int] = None
+    sort_column: str = "popular"
+    sort_dir: str = "desc"
+    total_count: Optional[int] = None
+    done: Set[int] = field(default_factory=set)
+    seen: Set[str] = field(default_factory=set)
+    
+    @property
+    def pending(self) -> List[int]:
+        """Start offsets of the pages not fetched yet."""
+        if self.total_count is None:
+            return [0]
+        return [start for start in range(0, self.total_count, SEARCH_PAGE_SIZE) if start not in self.done]
+    
+    @property
+    def complete(self) -> bool:
+        """Whether every page has been fetched."""
+        return not self.pending
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "query": self.query,
+            "appid": self.appid,
+            "sort_column": self.sort_column,
+            "sort_dir": self.sort_dir,
+            "total_count": self.total_count,
+            "done": sorted(self.done),
+            "seen": sorted(self.seen),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SearchCheckpoint':
+        """Create a checkpoint from to_dict() output."""
+        return cls(
+            query=data.get("query", ""),
+            appid=data.get("appid"),
+            sort_column=data.get("sort_column", "popular"),
+            sort_dir=data.get("sort_dir", "desc"),
+            total_count=data.get("total_count"),
+            done=set(data.get("done", [])),
+            seen=set(data.get("seen", [])),
+        )
+
 
 class SteamMarketAPI:
     """
@@ -32,14 +130,20 @@ class SteamMarketAPI:
         items = market.search_items("AK-47", appid=730)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, archive: Optional[PriceArchive] = None):
         """
         Initialize the Steam Market API client.
         
         Args:
             api_key: Steam Web API key (optional, can also use STEAM_API_KEY env var)
+            archive: Local price-history archive (defaults to STEAM_PRICE_ARCHIVE_DIR, if set)
         """
         self.client = SteamClient(api_key=api_key)
+        self.archive = archive if archive is not None else PriceArchive.from_env()
+        self.nameids = ItemNameIDResolver(self.client)
+        self.order_books = OrderBookStore()
+        self.scheduler = MarketScheduler()
+        self.price_matrix = PriceMatrix()
     
     def search_items(self, query: str, appid: Optional[int] = None, 
                      count: int = 100, start: int = 0) -> APIResponse:
@@ -84,8 +188,7 @@ class SteamMarketAPI:
         # Normalize the response
         if response.ok:
             try:
-                items = MarketItem.from_api_response(response.data)
-                response.data = {"items": [i.to_dict() for i in items]}
+                response.data = {"items": list_view(MarketItem, MarketItem.parse_record_prices(response.data.get("results", [])))}
             except Exception as e:
                 logger.warning(f"Failed to parse market items: {e}")
         
@@ -146,20 +249,150 @@ class SteamMarketAPI:
         # Normalize the response
         if response.ok:
             try:
-                items = MarketItem.from_api_response(response.data)
-                response.data = {"items": [i.to_dict() for i in items]}
+                response.data = {"items": list_view(MarketItem, MarketItem.parse_record_prices(response.data.get("results", [])))}
             except Exception as e:
                 logger.warning(f"Failed to parse top items: {e}")
         
         return response
     
-    def get_item_price_history(self, appid: Union[str, int], market_hash_name: str) -> APIResponse:
+    def _search_page(self, checkpoint: SearchCheckpoint, start: int) -> APIResponse:
+        """Fetch one raw page of market/search/render for a crawl."""
+        url = f"{self.client.STEAM_COMMUNITY_BASE}/market/search/render"
+        params = {
+            "norender": 1,
+            "query": checkpoint.query,
+            "start": start,
+            "count": SEARCH_PAGE_SIZE,
+            "sort_column": checkpoint.sort_column,
+            "sort_dir": checkpoint.sort_dir,
+        }
+        if checkpoint.appid is not None:
+            params["appid"] = checkpoint.appid
+        return self.client.get(url, params=params)
+    
+    def iter_search(self, query: str = "", appid: Optional[Union[str, int]] = None,
+                    sort_column: str = "popular", sort_dir: str = "desc",
+                    max_workers: int = DEFAULT_CRAWL_WORKERS, rate: float = DEFAULT_CRAWL_RATE,
+                    checkpoint: Optional[SearchCheckpoint] = None) -> Iterator[MarketItem]:
+        """
+        Crawl every page of a market search.
+        
+        The first page gives total_count; the remaining pages are fetched
+        concurrently, at most `rate` requests per second, and their items
+        are yielded as each page arrives. Listings move between pages while
+        the crawl runs, so items are deduplicated by hash name.
+        
+        Pass a SearchCheckpoint to record progress: it is updated as pages
+        complete and can be saved with to_dict() and passed back (restored
+        with from_dict()) to resume. Pages that fail are logged and left
+        pending; checkpoint.complete tells whether the crawl finished.
+        
+        Args:
+            query: Search query (empty for every item of the app)
+            appid: Filter by app ID (optional)
+            sort_column: Column to sort by (popular, quantity, price, name)
+            sort_dir: Sort direction (desc, asc)
+            max_workers: Maximum number of concurrent requests
+            rate: Maximum requests per second
+            checkpoint: Progress to resume and update (optional)
+            
+        Yields:
+            MarketItem records, each hash name once
+            
+        Raises:
+            ValueError: If a parameter is invalid or the checkpoint belongs to another search
+            SteamAPIError: If the first page fails
+        """
+        if appid is not None:
+            appid = AppID.validate(appid).appid
+        if sort_column not in ["popular", "quantity", "price", "name"]:
+            raise ValueError("Sort column must be one of: popular, quantity, price, name")
+        if sort_dir not in ["desc", "asc"]:
+            raise ValueError("Sort direction must be one of: desc, asc")
+        
+        if checkpoint is None:
+            checkpoint = SearchCheckpoint()
+        search = (query, appid, sort_column, sort_dir)
+        if checkpoint.total_count is None and not checkpoint.done:
+            checkpoint.query, checkpoint.appid, checkpoint.sort_column, checkpoint.sort_dir = search
+        elif (checkpoint.query, checkpoint.appid, checkpoint.sort_column, checkpoint.sort_dir) != search:
+            raise ValueError("Checkpoint belongs to a different search")
+        
+        limiter = RateLimiter(rate)
+        
+        def fetch(start: int) -> APIResponse:
+            limiter.acquire()
+            return self._search_page(checkpoint, start)
+        
+        def consume(start: int, response: APIResponse) -> Iterator[MarketItem]:
+            for record in response.data.get("results", []):
+                item = MarketItem.from_record(record)
+                key = item.hash_name or item.name
+                if key in checkpoint.seen:
+                    continue
+                checkpoint.seen.add(key)
+                yield item
+            checkpoint.done.add(start)
+        
+        def failure(response: APIResponse) -> Optional[str]:
+            if not response.ok:
+                return (response.error or {}).get("message") or "request failed"
+            if not isinstance(response.data, dict) or response.data.get("success") is False:
+                return "unsuccessful search response"
+            return None
+        
+        if checkpoint.total_count is None:
+            first = fetch(0)
+            error = failure(first)
+            if error is not None:
+                raise MarketAPIError((first.error or {}).get("status_code", 500),
+                                     f"Market search failed: {error}")
+            checkpoint.total_count = int(first.data.get("total_count", 0) or 0)
+            yield from consume(0, first)
+        
+        pending = checkpoint.pending
+        if not pending:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))))
+        try:
+            futures = {executor.submit(fetch, start): start for start in pending}
+            for future in as_completed(futures):
+                start = futures[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.warning(f"Market search page at {start} failed: {e}")
+                    continue
+                error = failure(response)
+                if error is not None:
+                    logger.warning(f"Market search page at {start} failed: {error}")
+                    continue
+                yield from consume(start, response)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_item_price_history(self, appid: Union[str, int], market_hash_name: str,
+                               start: Optional[int] = None, end: Optional[int] = None,
+                               interval: Optional[str] = None,
+                               max_points: Optional[int] = None, currency: int = 1) -> APIResponse:
         """
         Get price history for a specific market item.
         
+        Without interval the history is returned as [date, price, volume]
+        points; max_points reduces them with LTTB downsampling. With interval
+        it is returned as OHLC bars, and max_points keeps the most recent bars.
+        When a price archive is configured the history is served from it and
+        refreshed at most once per DEFAULT_ARCHIVE_MAX_AGE.
+        
         Args:
             appid: App ID of the game
             market_hash_name: Market hash name of the item
+            start: Only return points at or after this Unix time (optional)
+            end: Only return points at or before this Unix time (optional)
+            interval: Resample into OHLC bars: "1h", "1d" or "1w" (optional)
+            max_points: Maximum number of points or bars to return (optional, at least 3)
+            currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
             
         Returns:
             APIResponse with price history data or error
@@ -175,24 +408,370 @@ class SteamMarketAPI:
                 error={"message": "Market hash name cannot be empty"}
             )
         
-        # URL encode the market hash name
-        encoded_name = urllib.parse.quote(market_hash_name)
+        if start is not None and end is not None and start > end:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid time range"],
+                error={"message": "start must not be after end"}
+            )
         
-        url = f"{self.client.STEAM_COMMUNITY_BASE}/market/pricehistory"
-        params = {"appid": appid, "market_hash_name": encoded_name}
+        if interval is not None and interval not in INTERVALS:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid interval"],
+                error={"message": f"Interval must be one of: {', '.join(INTERVALS)}"}
+            )
         
-        response = self.client.get(url, params=params)
+        if max_points is not None and max_points < 3:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid max_points"],
+                error={"message": "max_points must be at least 3"}
+            )
+        
+        series = None
+        if self.archive is not None:
+            try:
+                series, _ = self._archived_series(appid, market_hash_name, currency, start=start, end=end)
+            except MarketAPIError as e:
+                return APIResponse(
+                    ok=False,
+                    source="steam_community",
+                    data={},
+                    warnings=["Price history request failed"],
+                    error={"message": e.message, "status_code": e.status_code}
+                )
+            response = APIResponse(ok=True, source="steam_community", data={
+                "success": True, "price_prefix": series.price_prefix, "price_suffix": series.price_suffix,
+            })
+        else:
+            url = f"{self.client.STEAM_COMMUNITY_BASE}/market/pricehistory"
+            # requests encodes the query string; quoting here would encode it twice
+            params = {"appid": appid, "market_hash_name": market_hash_name, "currency": currency}
+            response = self.client.get(url, params=params)
         
         # Normalize the response
         if response.ok:
             try:
                 price_history = PriceHistory.from_api_response(response.data)
-                response.data = {"price_history": price_history.to_dict()}
+                result = price_history.to_dict()
+                if series is not None or any(p is not None for p in (start, end, interval, max_points)):
+                    if series is None:
+                        series = price_history.to_series()
+                    series = series.between(start, end)
+                    if interval is not None:
+                        bars = series.resample(interval)
+                        if max_points is not None and len(bars) > max_points:
+                            response.warnings.append(
+                                f"Returned the most recent {max_points} of {len(bars)} bars")
+                            bars = bars.last(max_points)
+                        del result["prices"]
+                        result.update(bars.to_dict())
+                    else:
+                        if max_points is not None:
+                            series = series.downsample(max_points)
+                        result["prices"] = series.to_prices()
+                response.data = {"price_history": result}
             except Exception as e:
                 logger.warning(f"Failed to parse price history: {e}")
         
         return response
     
+    def iter_price_history(self, appid: Union[str, int], market_hash_name: str) -> Iterator[PricePoint]:
+        """
+        Stream the price history of a market item.
+        
+        Multi-year histories hold thousands of points; they are parsed one
+        at a time as the body arrives.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_name: Market hash name of the item
+            
+        Yields:
+            PricePoint records, oldest first
+            
+        Raises:
+            ValueError: If the market hash name is empty
+            SteamAPIError: If the request fails
+        """
+        appid = AppID.validate(appid).appid
+        if not market_hash_name:
+            raise ValueError("Market hash name cannot be empty")
+        
+        url = f"{self.client.STEAM_COMMUNITY_BASE}/market/pricehistory"
+        params = {"appid": appid, "market_hash_name": market_hash_name}
+        
+        with self.client.stream(url, ("prices",), params=params) as prices:
+            for record in prices:
+                yield PricePoint.from_record(record)
+    
+    def _fetch_price_series(self, appid: int, market_hash_name: str, currency: int = 1,
+                            limiter: Optional[RateLimiter] = None) -> PriceSeries:
+        """
+        Fetch and parse the full price history of an item.
+        
+        A token is taken from limiter, if given, before the request.
+        
+        Raises:
+            MarketAPIError: If the history cannot be fetched or parsed
+        """
+        url = f"{self.client.STEAM_COMMUNITY_BASE}/market/pricehistory"
+        params = {"appid": appid, "market_hash_name": market_hash_name, "currency": currency}
+        if limiter is not None:
+            limiter.acquire()
+        response = self.client.get(url, params=params)
+        if not response.ok:
+            error = response.error or {}
+            raise MarketAPIError(error.get("status_code", 500), error.get("message", "Price history request failed"),
+                                 endpoint="market/pricehistory")
+        try:
+            return PriceSeries.from_api_response(response.data)
+        except Exception as e:
+            raise MarketAPIError(500, f"Failed to parse price history: {e}", endpoint="market/pricehistory")
+    
+    def _archived_series(self, appid: int, market_hash_name: str, currency: int = 1,
+                         max_age: float = DEFAULT_ARCHIVE_MAX_AGE,
+                         limiter: Optional[RateLimiter] = None,
+                         start: Optional[int] = None, end: Optional[int] = None) -> Tuple[PriceSeries, int]:
+        """
+        Get the price history of an item between two Unix times through the archive.
+        
+        The archived copy is used while it is younger than max_age;
+        otherwise the history is fetched and merged into the archive first.
+        Only the archive blocks overlapping [start, end] are decoded.
+        
+        Returns:
+            Tuple of the series and the number of new points merged
+            
+        Raises:
+            MarketAPIError: If a refresh is needed and the fetch fails
+        """
+        info = self.archive.info(appid, market_hash_name, currency)
+        if info is not None and time.time() - (info.get("refreshed_at") or 0) < max_age:
+            series = self.archive.read(appid, market_hash_name, currency, start, end)
+            if series is not None:
+                return series, 0
+        
+        fetched = self._fetch_price_series(appid, market_hash_name, currency, limiter)
+        added = self.archive.merge(appid, market_hash_name, currency, fetched)
+        series = self.archive.read(appid, market_hash_name, currency, start, end)
+        return (series if series is not None else fetched.between(start, end)), added
+    
+    def _price_series(self, appid: int, market_hash_name: str, currency: int = 1,
+                      limiter: Optional[RateLimiter] = None) -> PriceSeries:
+        """
+        Full price history of an item, cached per item and read through the archive if configured.
+        
+        Only an actual request takes a token from limiter.
+        
+        Raises:
+            MarketAPIError: If the history cannot be fetched or parsed
+        """
+        cache_key = f"pricehistory:{appid}:{market_hash_name}:{currency}"
+        series = price_cache.get(cache_key)
+        if series is not None:
+            return series
+        if self.archive is not None:
+            series, _ = self._archived_series(appid, market_hash_name, currency, limiter=limiter)
+        else:
+            series = self._fetch_price_series(appid, market_hash_name, currency, limiter)
+        price_cache.set(cache_key, series)
+        return series
+    
+    def backfill_price_archive(self, appid: Union[str, int], market_hash_names: List[str],
+                               currency: int = 1, max_workers: int = DEFAULT_CRAWL_WORKERS,
+                               rate: float = DEFAULT_CRAWL_RATE,
+                               max_age: float = DEFAULT_ARCHIVE_MAX_AGE) -> APIResponse:
+        """
+        Fetch the price histories of many items into the archive.
+        
+        Items are fetched concurrently, at most `rate` requests per second;
+        items archived less than max_age ago are skipped.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_names: Market hash names of the items
+            currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+            max_workers: Maximum number of concurrent requests
+            rate: Maximum requests per second
+            max_age: Seconds an archived history stays fresh
+            
+        Returns:
+            APIResponse with {"items": [{"market_hash_name", "points", "new_points"}]};
+            items that failed are listed in warnings
+        """
+        appid = AppID.validate(appid).appid
+        if self.archive is None:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["No price archive configured"],
+                error={"message": "Set STEAM_PRICE_ARCHIVE_DIR to enable the price archive"}
+            )
+        names = list(dict.fromkeys(n for n in market_hash_names if n))
+        if not names:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Empty market hash name"],
+                error={"message": "At least one market hash name is required"}
+            )
+        
+        limiter = RateLimiter(rate)
+        
+        def refresh(name: str) -> Tuple[PriceSeries, int]:
+            info = self.archive.info(appid, name, currency)
+            if info is None or time.time() - (info.get("refreshed_at") or 0) >= max_age:
+                limiter.acquire()
+            return self._archived_series(appid, name, currency, max_age)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        warnings = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+            futures = {executor.submit(refresh, name): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    series, added = future.result()
+                except MarketAPIError as e:
+                    logger.warning(f"Price history for {name} failed: {e}")
+                    warnings.append(f"No price history for {name}: {e}")
+                    continue
+                results[name] = {"market_hash_name": name, "points": len(series), "new_points": added}
+        
+        return APIResponse(
+            ok=bool(results),
+            source="steam_community",
+            data={"items": [results[name] for name in names if name in results]},
+            warnings=warnings,
+            error=None if results else {"message": "No price history could be fetched"}
+        )
+    
+    def get_item_price_stats(self, appid: Union[str, int], market_hash_names: Union[str, List[str]],
+                             interval: str = "1d", windows: Optional[List[int]] = None,
+                             rate: float = DEFAULT_CRAWL_RATE) -> APIResponse:
+        """
+        Get summary indicators over the price history of one or more items.
+        
+        Histories are resampled onto one grid of bars and the indicators are
+        computed for all items at once; see steam.pricestats.summarize for
+        the fields. Histories and per-item statistics are cached for an hour;
+        missing histories are fetched concurrently, at most `rate` requests
+        per second.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_names: Market hash name, or a list of up to 50 names
+            interval: Bar width: "1h", "1d" or "1w"
+            windows: Window lengths in bars (default: 7 and 30)
+            rate: Maximum history requests per second
+            
+        Returns:
+            APIResponse with {"interval", "windows", "items"}; items that could
+            not be fetched are skipped with a warning
+        """
+        from steam.pricestats import align, summarize
+        
+        appid = AppID.validate(appid).appid
+        if isinstance(market_hash_names, str):
+            market_hash_names = [market_hash_names]
+        names = list(dict.fromkeys(n for n in market_hash_names if n))
+        windows = tuple(windows) if windows else DEFAULT_STATS_WINDOWS
+        
+        if not names:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Empty market hash name"],
+                error={"message": "At least one market hash name is required"}
+            )
+        
+        if len(names) > MAX_STATS_ITEMS:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Too many items"],
+                error={"message": f"At most {MAX_STATS_ITEMS} items per request"}
+            )
+        
+        if interval not in INTERVALS:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid interval"],
+                error={"message": f"Interval must be one of: {', '.join(INTERVALS)}"}
+            )
+        
+        if any(not isinstance(w, int) or w < 1 for w in windows):
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid windows"],
+                error={"message": "Windows must be positive integers"}
+            )
+        
+        window_key = ",".join(map(str, windows))
+        stats: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for name in names:
+            cached = price_cache.get(f"pricestats:{appid}:{name}:{interval}:{window_key}")
+            if cached is not None:
+                stats[name] = cached
+            else:
+                missing.append(name)
+        
+        warnings = []
+        series: Dict[str, PriceSeries] = {}
+        if missing:
+            limiter = RateLimiter(rate)
+            with ThreadPoolExecutor(max_workers=min(DEFAULT_CRAWL_WORKERS, len(missing))) as executor:
+                futures = {executor.submit(self._price_series, appid, name, limiter=limiter): name
+                           for name in missing}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        series[name] = future.result()
+                    except MarketAPIError as e:
+                        logger.warning(f"Price history for {name} failed: {e}")
+                        warnings.append(f"No price history for {name}: {e}")
+        
+        if series:
+            fetched = [name for name in missing if name in series]
+            matrix = align([series[name] for name in fetched], interval)
+            for name, item_stats in zip(fetched, summarize(matrix, windows)):
+                stats[name] = item_stats
+                price_cache.set(f"pricestats:{appid}:{name}:{interval}:{window_key}", item_stats)
+        
+        if not stats:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=warnings,
+                error={"message": "No price history could be fetched"}
+            )
+        
+        items = [{"market_hash_name": name, **stats[name]} for name in names if name in stats]
+        return APIResponse(
+            ok=True,
+            source="steam_community",
+            data={"interval": interval, "windows": list(windows), "items": items},
+            warnings=warnings
+        )
+    
     def get_item_price_overview(self, appid: Union[str, int], market_hash_name: str,
                                 currency: int = 1) -> APIResponse:
         """
@@ -217,24 +796,321 @@ class SteamMarketAPI:
                 error={"message": "Market hash name cannot be empty"}
             )
         
-        # URL encode the market hash name
-        encoded_name = urllib.parse.quote(market_hash_name)
-        
+        return self._fetch_price_overview(appid, market_hash_name, currency)
+    
+    def _fetch_price_overview(self, appid: int, market_hash_name: str, currency: int = 1,
+                              retry_rate_limited: bool = True) -> APIResponse:
+        """Request and normalize one price overview."""
         url = f"{self.client.STEAM_COMMUNITY_BASE}/market/priceoverview"
-        params = {"appid": appid, "currency": currency, "market_hash_name": encoded_name}
+        # requests encodes the params itself
+        params = {"appid": appid, "currency": currency, "market_hash_name": market_hash_name}
         
-        response = self.client.get(url, params=params)
+        response = self.client.get(url, params=params, retry_rate_limited=retry_rate_limited)
         
         # Normalize the response
         if response.ok:
             try:
-                price_overview = PriceOverview.from_api_response(response.data)
+                price_overview = PriceOverview.from_api_response(response.data, currency)
                 response.data = {"price_overview": price_overview.to_dict()}
             except Exception as e:
                 logger.warning(f"Failed to parse price overview: {e}")
         
         return response
     
+    def _scheduled_price_overview(self, appid: int, market_hash_name: str, currency: int) -> APIResponse:
+        """Scheduler job: fetch one overview and cache it, with its fetch time, if Steam had one."""
+        # 429s are left to the scheduler's cooldown
+        response = self._fetch_price_overview(appid, market_hash_name, currency, retry_rate_limited=False)
+        overview = response.data.get("price_overview") if response.ok and isinstance(response.data, dict) else None
+        if overview and overview.get("success"):
+            overview_cache.set(f"priceoverview:{appid}:{market_hash_name}:{currency}",
+                               (overview, self._fetch_time(response)))
+        return response
+    
+    @staticmethod
+    def _fetch_time(response: APIResponse) -> float:
+        """Unix time a response was fetched."""
+        try:
+            return datetime.fromisoformat(response.fetched_at).timestamp()
+        except (TypeError, ValueError):
+            return time.time()
+    
+    @staticmethod
+    def _overview_requests(items: Iterable[Union[Sequence[Any], Dict[str, Any]]],
+                           currency: int) -> List[Tuple[int, str, int, int]]:
+        """
+        Normalize batch items to (appid, market_hash_name, currency, priority).
+        
+        Items are (appid, market_hash_name[, currency[, priority]]) tuples or
+        dicts with the same keys. Duplicates keep their lowest priority.
+        
+        Raises:
+            ValueError: If an item is malformed
+        """
+        requests: Dict[Tuple[int, str, int], int] = {}
+        for position, item in enumerate(items):
+            if isinstance(item, dict):
+                fields = (item.get("appid"), item.get("market_hash_name"),
+                          item.get("currency", currency), item.get("priority", 0))
+            elif isinstance(item, (list, tuple)) and 2 <= len(item) <= 4:
+                fields = (tuple(item) + (currency, 0)[len(item) - 2:])
+            else:
+                raise ValueError(f"Item {position} must be (appid, market_hash_name[, currency[, priority]])")
+            appid, name, item_currency, priority = fields
+            if not name:
+                raise ValueError(f"Item {position} has an empty market hash name")
+            try:
+                key = (AppID.validate(appid).appid, str(name), int(item_currency))
+                priority = int(priority)
+            except TypeError:
+                raise ValueError(f"Item {position} has a malformed currency or priority")
+            requests[key] = min(priority, requests.get(key, priority))
+        return [key + (priority,) for key, priority in requests.items()]
+    
+    def iter_price_overviews(self, items: Iterable[Union[Sequence[Any], Dict[str, Any]]],
+                             currency: int = 1, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream price overviews of many items through the market scheduler.
+        
+        Overviews cached in the last few minutes are yielded first without a
+        request; the rest are queued on self.scheduler by priority (lower
+        first, then input order) and yielded as they complete. Items still
+        queued when the iterator stops or times out keep draining in the
+        background into the cache, so asking again later picks them up.
+        
+        Args:
+            items: (appid, market_hash_name[, currency[, priority]]) tuples or
+                dicts with those keys
+            currency: Currency ID for items that do not give one
+            timeout: Seconds to wait for queued items (default: until done)
+            
+        Yields:
+            {"appid", "market_hash_name", "currency", "cached", "price_overview"
+            and "fetched_at" (Unix time of the request, also for cached
+            overviews) or "error", "remaining", "eta_seconds"}; eta_seconds
+            estimates when the scheduler queue drains
+            
+        Raises:
+            ValueError: If an item is malformed
+        """
+        requests = sorted(self._overview_requests(items, currency), key=lambda request: request[3])
+        futures = {}
+        remaining = len(requests)
+        for appid, name, item_currency, priority in requests:
+            cached = overview_cache.get(f"priceoverview:{appid}:{name}:{item_currency}")
+            if cached is None:
+                future = self.scheduler.submit(
+                    lambda appid=appid, name=name, item_currency=item_currency:
+                        self._scheduled_price_overview(appid, name, item_currency),
+                    priority=priority,
+                    key=("priceoverview", appid, name, item_currency),
+                )
+                futures[future] = (appid, name, item_currency)
+                continue
+            remaining -= 1
+            overview, fetched_at = cached
+            yield {"appid": appid, "market_hash_name": name, "currency": item_currency, "cached": True,
+                   "price_overview": overview, "fetched_at": fetched_at,
+                   "remaining": remaining, "eta_seconds": self.scheduler.eta()}
+        
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                appid, name, item_currency = futures[future]
+                remaining -= 1
+                record = {"appid": appid, "market_hash_name": name, "currency": item_currency, "cached": False}
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.warning(f"Price overview for {name} failed: {e}")
+                    record["error"] = str(e)
+                else:
+                    overview = response.data.get("price_overview") if response.ok else None
+                    if overview and overview.get("success"):
+                        record["price_overview"] = overview
+                        record["fetched_at"] = self._fetch_time(response)
+                    else:
+                        record["error"] = (response.error or {}).get("message") or "No price overview"
+                record.update(remaining=remaining, eta_seconds=self.scheduler.eta())
+                yield record
+        except TimeoutError:
+            logger.info(f"Stopped waiting for {remaining} price overviews")
+    
+    def get_item_price_overviews(self, items: List[Union[Sequence[Any], Dict[str, Any]]],
+                                 currency: int = 1, max_wait: Optional[float] = None) -> APIResponse:
+        """
+        Get price overviews of many items, paced to the market rate limit.
+        
+        Collects iter_price_overviews(). Items not done within max_wait are
+        listed under "pending" with the ETA of the scheduler queue; they stay
+        queued and are served from cache by a later call.
+        
+        Args:
+            items: (appid, market_hash_name[, currency[, priority]]) tuples or
+                dicts with those keys
+            currency: Currency ID for items that do not give one
+            max_wait: Seconds to wait for queued items (default: until done)
+            
+        Returns:
+            APIResponse with {"items", "pending", "cached", "fetched",
+            "eta_seconds", "scheduler"} or error; failed items are listed in warnings
+        """
+        if not items:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["No items"],
+                error={"message": "At least one item is required"}
+            )
+        if len(items) > MAX_OVERVIEW_ITEMS:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Too many items"],
+                error={"message": f"At most {MAX_OVERVIEW_ITEMS} items per call"}
+            )
+        try:
+            requests = self._overview_requests(items, currency)
+        except ValueError as e:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid items"],
+                error={"message": str(e)}
+            )
+        
+        results: Dict[Tuple[int, str, int], Dict[str, Any]] = {}
+        warnings = []
+        for record in self.iter_price_overviews(requests, currency, timeout=max_wait):
+            key = (record["appid"], record["market_hash_name"], record["currency"])
+            if "error" in record:
+                warnings.append(f"No price overview for {record['market_hash_name']}: {record['error']}")
+                results[key] = None
+                continue
+            results[key] = {k: record[k] for k in ("appid", "market_hash_name", "currency", "cached",
+                                                   "fetched_at", "price_overview")}
+        
+        found = [results[request[:3]] for request in requests if results.get(request[:3])]
+        pending = [{"appid": appid, "market_hash_name": name, "currency": item_currency}
+                   for appid, name, item_currency, _ in requests if (appid, name, item_currency) not in results]
+        return APIResponse(
+            ok=bool(found) or bool(pending),
+            source="steam_community",
+            data={
+                "items": found,
+                "pending": pending,
+                "cached": sum(1 for item in found if item["cached"]),
+                "fetched": sum(1 for item in found if not item["cached"]),
+                "eta_seconds": self.scheduler.eta() if pending else 0.0,
+                "scheduler": self.scheduler.stats(),
+            },
+            warnings=warnings,
+            error=None if found or pending else {"message": "No price overview could be fetched"}
+        )
+    
+    def get_price_matrix(self, appid: Union[str, int], market_hash_names: List[str],
+                         currencies: List[Union[int, str]], base_currency: Union[int, str] = 1,
+                         anchors: int = DEFAULT_FX_ANCHORS, max_age: float = DEFAULT_MATRIX_MAX_AGE,
+                         fx_max_age: float = DEFAULT_FX_MAX_AGE,
+                         max_wait: Optional[float] = None) -> APIResponse:
+        """
+        Price a basket of items in many currencies with few market requests.
+        
+        Every item is fetched in the base currency. The market converts all
+        listings with Steam's exchange rates, so for each other currency only
+        `anchors` items are fetched and the rate implied by them prices the
+        rest; while that rate is younger than fx_max_age, the currency costs
+        no requests at all. Requests go through self.scheduler; fetched cells
+        are kept in self.price_matrix with their fetch times and reused for
+        max_age seconds.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_names: Market hash names of the items (max 100)
+            currencies: Steam currency IDs or ISO codes (max 40)
+            base_currency: Currency fetched for every item
+            anchors: Items fetched per currency to derive its rate
+            max_age: Seconds a fetched price is reused
+            fx_max_age: Seconds an implied rate is reused
+            max_wait: Seconds to wait for requests (default: until done)
+            
+        Returns:
+            APIResponse with PriceMatrix.table() output plus "base_currency",
+            "requests" and "pending", or error
+        """
+        appid = AppID.validate(appid).appid
+        names = list(dict.fromkeys(n for n in market_hash_names if n))
+        try:
+            base = get_currency(base_currency).id
+            columns = list(dict.fromkeys([base] + [get_currency(c).id for c in currencies]))
+        except (ValueError, TypeError) as e:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid currency"],
+                error={"message": str(e)}
+            )
+        if not names or len(names) > MAX_MATRIX_ITEMS:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid item count"],
+                error={"message": f"Between 1 and {MAX_MATRIX_ITEMS} market hash names are required"}
+            )
+        if len(columns) > MAX_MATRIX_CURRENCIES:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Too many currencies"],
+                error={"message": f"At most {MAX_MATRIX_CURRENCIES} currencies per call"}
+            )
+        
+        matrix = self.price_matrix
+        requests = [(appid, name, base, 0) for name in names
+                    if matrix.cell(appid, name, base, max_age) is None]
+        derive = [c for c in columns[1:] if matrix.rate(base, c, fx_max_age) is None]
+        for currency in derive:
+            requests.extend((appid, name, currency, 1) for name in names[:max(1, anchors)]
+                            if matrix.cell(appid, name, currency, max_age) is None)
+        
+        fetched = 0
+        done = set()
+        warnings = []
+        for record in self.iter_price_overviews(requests, base, timeout=max_wait):
+            name, currency = record["market_hash_name"], record["currency"]
+            done.add((name, currency))
+            fetched += not record["cached"]
+            overview = record.get("price_overview") or {}
+            amount = overview.get("lowest_price_minor")
+            if amount is None:
+                amount = overview.get("median_price_minor")
+            if amount is None:
+                warnings.append(f"No {get_currency(currency).code} price for {name}")
+                continue
+            # Cached overviews keep the time they were fetched, not the time they were served
+            matrix.record(appid, name, currency, amount, record["fetched_at"])
+        
+        for currency in derive:
+            if matrix.derive_rate(appid, names, base, currency, max_age) is None:
+                warnings.append(f"No implied {get_currency(currency).code} rate: no item priced in both currencies")
+        
+        table = matrix.table(appid, names, columns, base, max_age, fx_max_age)
+        pending = [{"market_hash_name": name, "currency": get_currency(currency).code}
+                   for _, name, currency, _ in requests if (name, currency) not in done]
+        priced = any(p is not None for row in table["prices"] for p in row)
+        return APIResponse(
+            ok=priced or bool(pending),
+            source="steam_community",
+            data={"base_currency": get_currency(base).code, **table, "requests": fetched, "pending": pending},
+            warnings=warnings,
+            error=None if priced or pending else {"message": "No price could be fetched"}
+        )
+    
     def get_popular_items(self, count: int = 10) -> APIResponse:
         """
         Get popular items from the Steam Community Market.
@@ -262,8 +1138,7 @@ class SteamMarketAPI:
         # Normalize the response
         if response.ok:
             try:
-                items = MarketItem.from_api_response(response.data)
-                response.data = {"items": [i.to_dict() for i in items]}
+                response.data = {"items": list_view(MarketItem, MarketItem.parse_record_prices(response.data.get("results", [])))}
             except Exception as e:
                 logger.warning(f"Failed to parse popular items: {e}")
         
@@ -373,3 +1248,170 @@ class SteamMarketAPI:
         
         response = self.client.get(url, params=params)
         return response
+    
+    def resolve_item_nameids(self, appid: Union[str, int], market_hash_names: Union[str, List[str]]) -> APIResponse:
+        """
+        Resolve market hash names to the item_nameids used by the order book.
+        
+        Each item's listing page is scraped once; the IDs never change and
+        are kept in the NameIDStore (persisted when STEAM_NAMEID_FILE is set).
+        
+        Args:
+            appid: App ID of the game
+            market_hash_names: Market hash name, or a list of names
+            
+        Returns:
+            APIResponse with {"item_nameids": {name: item_nameid}}; names that
+            could not be resolved are listed in warnings
+        """
+        appid = AppID.validate(appid).appid
+        if isinstance(market_hash_names, str):
+            market_hash_names = [market_hash_names]
+        names = [n for n in dict.fromkeys(market_hash_names) if n]
+        if not names:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Empty market hash name"],
+                error={"message": "At least one market hash name is required"}
+            )
+        
+        resolved = self.nameids.resolve_many(appid, names)
+        item_nameids = {name: item_nameid for name, item_nameid in resolved.items() if item_nameid}
+        warnings = [f"Could not resolve item_nameid for {name}" for name in names if name not in item_nameids]
+        return APIResponse(
+            ok=bool(item_nameids),
+            source="steam_community",
+            data={"item_nameids": item_nameids},
+            warnings=warnings,
+            error=None if item_nameids else {"message": "No item_nameid could be resolved"}
+        )
+    
+    def _order_book(self, appid: int, market_hash_name: str, currency: int) -> APIResponse:
+        """
+        Fetch, parse and record the order book of an item.
+        
+        Returns:
+            APIResponse whose data is {"item_nameid", "book", "previous"}
+            (the parsed OrderBook and the prior snapshot, if any) or error
+        """
+        lookup = self.nameids.lookup(appid, market_hash_name)
+        if not lookup.ok:
+            return lookup
+        item_nameid = lookup.data["item_nameid"]
+        
+        response = self.get_item_orders_histogram(item_nameid, currency)
+        if not response.ok:
+            return response
+        if not isinstance(response.data, dict) or response.data.get("success") != 1:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Unsuccessful order histogram response"],
+                error={"message": f"No order book for '{market_hash_name}'"}
+            )
+        try:
+            book = OrderBook.from_histogram(response.data, timestamp=time.time())
+        except (ValueError, TypeError, IndexError) as e:
+            logger.warning(f"Failed to parse order histogram: {e}")
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Unparseable order histogram"],
+                error={"message": f"Failed to parse order histogram: {e}"}
+            )
+        previous = self.order_books.record(item_nameid, currency, book)
+        response.data = {"item_nameid": item_nameid, "book": book, "previous": previous}
+        return response
+    
+    def get_item_orders_histogram_by_name(self, appid: Union[str, int], market_hash_name: str,
+                                          currency: int = 1) -> APIResponse:
+        """
+        Get the buy and sell order book of an item by its market hash name.
+        
+        The histogram's HTML tables and cumulative graphs are reduced to
+        price levels: [price, quantity] pairs, best price first.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_name: Market hash name of the item
+            currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+            
+        Returns:
+            APIResponse with {"item_nameid", "price_prefix", "price_suffix",
+            "buy_order_count", "sell_order_count", "buy", "sell"} or error
+        """
+        appid = AppID.validate(appid).appid
+        if not market_hash_name:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Empty market hash name"],
+                error={"message": "Market hash name cannot be empty"}
+            )
+        
+        response = self._order_book(appid, market_hash_name, currency)
+        if response.ok:
+            response.data = {"item_nameid": response.data["item_nameid"], **response.data["book"].to_dict()}
+        return response
+    
+    def get_order_book_summary(self, appid: Union[str, int], market_hash_name: str, currency: int = 1,
+                               depths: Optional[List[float]] = None) -> APIResponse:
+        """
+        Get derived order book metrics for an item.
+        
+        Returns spread, mid price, order counts and depth within each
+        percentage of the mid price, plus the change since the previous
+        snapshot of the same item. Snapshots are kept as deltas in
+        self.order_books, so repeated polling stays cheap in memory.
+        
+        Args:
+            appid: App ID of the game
+            market_hash_name: Market hash name of the item
+            currency: Currency ID (1 = USD, 2 = GBP, 3 = EUR, etc.)
+            depths: Distances from the mid price in percent (default: 1, 5, 10)
+            
+        Returns:
+            APIResponse with the summary metrics or error
+        """
+        appid = AppID.validate(appid).appid
+        depths = list(depths) if depths else list(DEFAULT_DEPTHS)
+        if not market_hash_name:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Empty market hash name"],
+                error={"message": "Market hash name cannot be empty"}
+            )
+        if any(not 0 < d <= 100 for d in depths):
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["Invalid depths"],
+                error={"message": "Depths must be percentages between 0 and 100"}
+            )
+        
+        response = self._order_book(appid, market_hash_name, currency)
+        if not response.ok:
+            return response
+        book, previous = response.data["book"], response.data["previous"]
+        summary = {"market_hash_name": market_hash_name, "item_nameid": response.data["item_nameid"],
+                   **book.summary(depths)}
+        if previous is not None:
+            before = previous.summary(())
+            summary["change"] = {
+                "seconds": round(book.timestamp - previous.timestamp, 1),
+                **{key: round(summary[key] - before[key], 3)
+                   if summary[key] is not None and before[key] is not None else None
+                   for key in ("best_bid", "best_ask", "mid")},
+                "buy_order_count": book.buy_order_count - previous.buy_order_count,
+                "sell_order_count": book.sell_order_count - previous.sell_order_count,
+            }
+        response.data = summary
+        return response
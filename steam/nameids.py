@@ -0,0 +1,209 @@
+"""
+Market item_nameid resolution.
+
+itemordershistogram is keyed by item_nameid, an internal ID that only
+appears in the HTML of an item's listing page. It never changes, so each
+item is scraped once and the ID is kept for good.
+
+This module provides:
+- extract_item_nameid: pull the item_nameid out of a listing page
+- NameIDStore: (appid, market_hash_name) -> item_nameid mapping persisted
+  in an append-only JSONL file
+- ItemNameIDResolver: scrapes listing pages for unknown items, one at a
+  time or concurrently under a rate limit, and records them in the store
+"""
+
+import logging
+import os
+import re
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from steam import codec
+from steam.client import APIResponse, RateLimiter, SteamClient
+
+logger = logging.getLogger(__name__)
+
+# Listing pages are full HTML documents; keep well under the market rate limit
+DEFAULT_SCRAPE_RATE = 0.5
+DEFAULT_SCRAPE_WORKERS = 4
+
+# The listing page starts the order book and activity widgets with the ID
+_NAMEID_RE = re.compile(r"(?:Market_LoadOrderSpread|ItemActivityTicker\.Start)\(\s*(\d+)\s*\)")
+
+
+def extract_item_nameid(html: str) -> Optional[str]:
+    """
+    Find the item_nameid in a market listing page.
+
+    Args:
+        html: HTML of steamcommunity.com/market/listings/<appid>/<name>
+
+    Returns:
+        The item_nameid as a string, or None if the page has none
+    """
+    match = _NAMEID_RE.search(html or "")
+    return match.group(1) if match else None
+
+
+class NameIDStore:
+    """
+    Persistent (appid, market_hash_name) -> item_nameid mapping.
+
+    Lookups are served from memory. When a path is given, the file is
+    loaded on construction and every new mapping is appended to it as one
+    JSON line; mappings never change, so the file is never rewritten.
+
+    Usage:
+        store = NameIDStore("item_nameids.jsonl")
+        store.set(730, "Recoil Case", "176321160")
+        store.get(730, "Recoil Case")   # "176321160"
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: Optional JSONL file the mapping is loaded from and appended to
+        """
+        self.path = path
+        self._ids: Dict[Tuple[int, str], str] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> 'NameIDStore':
+        """
+        Create a store configured from environment variables.
+
+        STEAM_NAMEID_FILE: JSONL file for persisting item_nameids
+        """
+        return cls(os.getenv("STEAM_NAMEID_FILE") or None)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get(self, appid: int, market_hash_name: str) -> Optional[str]:
+        """Get the item_nameid of an item, or None if it is not known."""
+        return self._ids.get((appid, market_hash_name))
+
+    def set(self, appid: int, market_hash_name: str, item_nameid: str) -> None:
+        """Record the item_nameid of an item."""
+        key = (appid, market_hash_name)
+        with self._lock:
+            if self._ids.get(key) == item_nameid:
+                return
+            self._ids[key] = item_nameid
+            if self.path:
+                try:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write(codec.dumps_str({"appid": appid, "market_hash_name": market_hash_name,
+                                                 "item_nameid": item_nameid}) + "\n")
+                except OSError as e:
+                    logger.warning(f"Failed to persist item_nameid: {e}")
+
+    def _load(self) -> None:
+        """Read mappings from the JSONL file; later lines win."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = codec.loads(line)
+                    key = (int(entry["appid"]), str(entry["market_hash_name"]))
+                    self._ids[key] = str(entry["item_nameid"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+        logger.info(f"Loaded {len(self._ids)} item_nameids from {self.path}")
+
+
+class ItemNameIDResolver:
+    """
+    Resolves market hash names to item_nameids.
+
+    Known items are answered from the store; unknown ones cost one listing
+    page request, made at most `rate` times per second across all threads.
+
+    Usage:
+        resolver = ItemNameIDResolver(SteamClient())
+        resolver.resolve(730, "Recoil Case")
+        resolver.resolve_many(730, ["Recoil Case", "Kilowatt Case"])
+    """
+
+    def __init__(self, client: SteamClient, store: Optional[NameIDStore] = None,
+                 rate: float = DEFAULT_SCRAPE_RATE, max_workers: int = DEFAULT_SCRAPE_WORKERS):
+        """
+        Initialize the resolver.
+
+        Args:
+            client: SteamClient used for listing page requests
+            store: Mapping store (defaults to one configured from STEAM_NAMEID_FILE)
+            rate: Maximum listing page requests per second
+            max_workers: Maximum number of concurrent requests in resolve_many
+        """
+        self.client = client
+        self.store = store if store is not None else NameIDStore.from_env()
+        self.max_workers = max_workers
+        self._limiter = RateLimiter(rate)
+
+    def lookup(self, appid: int, market_hash_name: str) -> APIResponse:
+        """
+        Resolve one item, scraping its listing page if it is not stored yet.
+
+        Args:
+            appid: App ID of the game
+            market_hash_name: Market hash name of the item
+
+        Returns:
+            APIResponse with {"item_nameid": ...} or error
+        """
+        item_nameid = self.store.get(appid, market_hash_name)
+        if item_nameid is not None:
+            return APIResponse(ok=True, source="steam_community", data={"item_nameid": item_nameid})
+
+        self._limiter.acquire()
+        url = f"{self.client.STEAM_COMMUNITY_BASE}/market/listings/{appid}/{urllib.parse.quote(market_hash_name)}"
+        response = self.client.get(url)
+        if not response.ok:
+            return response
+
+        html = response.data.get("raw_text", "") if isinstance(response.data, dict) else ""
+        item_nameid = extract_item_nameid(html)
+        if item_nameid is None:
+            return APIResponse(
+                ok=False,
+                source="steam_community",
+                data={},
+                warnings=["No item_nameid on listing page"],
+                error={"message": f"Could not find item_nameid for '{market_hash_name}'"}
+            )
+        self.store.set(appid, market_hash_name, item_nameid)
+        return APIResponse(ok=True, source="steam_community", data={"item_nameid": item_nameid})
+
+    def resolve(self, appid: int, market_hash_name: str) -> Optional[str]:
+        """Resolve one item to its item_nameid, or None if it cannot be resolved."""
+        response = self.lookup(appid, market_hash_name)
+        return response.data.get("item_nameid") if response.ok else None
+
+    def resolve_many(self, appid: int, market_hash_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many items, scraping unknown ones concurrently.
+
+        Args:
+            appid: App ID of the game
+            market_hash_names: Market hash names of the items
+
+        Returns:
+            Mapping of each name to its item_nameid (None if unresolved)
+        """
+        names = list(dict.fromkeys(market_hash_names))
+        resolved = {name: self.store.get(appid, name) for name in names}
+        missing = [name for name, item_nameid in resolved.items() if item_nameid is None]
+        if missing:
+            workers = max(1, min(self.max_workers, len(missing)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for name, item_nameid in zip(missing, executor.map(lambda n: self.resolve(appid, n), missing)):
+                    resolved[name] = item_nameid
+        return resolved
@@ -0,0 +1,424 @@
+"""
+Incremental game news tracking.
+
+This module provides:
+- NewsStore: a deduplicated in-memory store of news items with a cursor
+  (newest gid and date, feeds seen, last check, unfetched gap) per app
+- NewsTracker: fetches only items newer than each app's cursor, using a
+  one-item probe and enddate-paged windows, resumes catch-ups cut short
+  by max_pages on later syncs, and refreshes tracked apps in the
+  background
+- news_store: the shared store used by default
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from steam.background import PeriodicWorker
+from steam.client import APIResponse, RateLimiter
+from steam.schemas import AppID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 900
+DEFAULT_PAGE_SIZE = 10
+DEFAULT_MAX_PAGES = 5
+DEFAULT_MAXLENGTH = 2000
+
+# Cursors checked more recently than this are served without a request
+DEFAULT_MIN_AGE = 60
+
+
+@dataclass
+class NewsCursor:
+    """
+    Newest item seen for an app and when the app was last checked.
+
+    A catch-up that runs out of pages before reaching the stored items
+    leaves a gap: items dated from gap_floor up to gap_enddate that have
+    not been fetched yet. Later syncs page through it until it closes.
+    """
+    appid: int
+    newest_gid: Optional[str] = None
+    newest_date: int = 0
+    feeds: Set[str] = field(default_factory=set)
+    checked_at: float = 0.0
+    gap_enddate: Optional[int] = None
+    gap_floor: int = 0
+
+    @property
+    def gap(self) -> Optional[Tuple[int, int]]:
+        """(enddate, floor) of the unfetched range, or None if complete."""
+        return None if self.gap_enddate is None else (self.gap_enddate, self.gap_floor)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "appid": self.appid,
+            "newest_gid": self.newest_gid,
+            "newest_date": self.newest_date,
+            "feeds": sorted(self.feeds),
+            "checked_at": self.checked_at,
+            "gap_enddate": self.gap_enddate,
+            "gap_floor": self.gap_floor if self.gap_enddate is not None else None,
+        }
+
+
+class NewsStore:
+    """
+    Thread-safe store of news items deduplicated by gid.
+
+    Only the newest max_items_per_app items are kept for each app.
+    """
+
+    def __init__(self, max_items_per_app: int = 500):
+        self.max_items_per_app = max_items_per_app
+        self._items: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._cursors: Dict[int, NewsCursor] = {}
+        self._lock = threading.Lock()
+
+    def cursor(self, appid: int) -> Optional[NewsCursor]:
+        """Get the cursor for an app, or None if it was never synced."""
+        with self._lock:
+            return self._cursors.get(appid)
+
+    def has(self, appid: int, gid: str) -> bool:
+        """Check whether an item has already been stored."""
+        with self._lock:
+            return gid in self._items.get(appid, {})
+
+    def add(self, appid: int, items: Iterable[Dict[str, Any]],
+            checked_at: Optional[float] = None,
+            gap: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+        """
+        Store items and advance the app's cursor.
+
+        Args:
+            appid: Application ID
+            items: News item dicts (GameNews.to_dict() shape)
+            checked_at: Time of the check (defaults to now)
+            gap: (enddate, floor) of items still to fetch, or None if the
+                stored items are complete down to the previous cursor
+
+        Returns:
+            Items that were not stored before
+        """
+        checked_at = time.time() if checked_at is None else checked_at
+        added = []
+        with self._lock:
+            stored = self._items.setdefault(appid, {})
+            cursor = self._cursors.setdefault(appid, NewsCursor(appid))
+            cursor.gap_enddate, cursor.gap_floor = gap if gap is not None else (None, 0)
+            for item in items:
+                gid = item.get("gid")
+                if not gid or gid in stored:
+                    continue
+                item = {**item, "appid": appid}
+                stored[gid] = item
+                added.append(item)
+                if item.get("feedname"):
+                    cursor.feeds.add(item["feedname"])
+                if item.get("date", 0) >= cursor.newest_date:
+                    cursor.newest_date = item.get("date", 0)
+                    cursor.newest_gid = gid
+            cursor.checked_at = checked_at
+
+            if len(stored) > self.max_items_per_app:
+                keep = sorted(stored.values(), key=lambda n: n.get("date", 0), reverse=True)
+                self._items[appid] = {n["gid"]: n for n in keep[:self.max_items_per_app]}
+        return added
+
+    def since(self, appids: Optional[Iterable[int]] = None, since: float = 0,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get stored items published at or after a time, newest first.
+
+        Args:
+            appids: Apps to include (defaults to all stored apps)
+            since: Unix time lower bound
+            limit: Maximum number of items to return
+
+        Returns:
+            List of news item dicts
+        """
+        with self._lock:
+            apps = list(self._items) if appids is None else list(appids)
+            items = [
+                item
+                for appid in apps
+                for item in self._items.get(appid, {}).values()
+                if item.get("date", 0) >= since
+            ]
+        items.sort(key=lambda n: (n.get("date", 0), n["gid"]), reverse=True)
+        return items[:limit] if limit is not None else items
+
+    def clear(self) -> None:
+        """Remove all items and cursors."""
+        with self._lock:
+            self._items.clear()
+            self._cursors.clear()
+
+
+# Shared store used by the tracker and the update signal
+news_store = NewsStore()
+
+
+class NewsTracker(PeriodicWorker):
+    """
+    Incremental news fetcher for a set of apps.
+
+    GetNewsForApp has no "newer than" parameter, so a sync first asks for
+    a single truncated item. If it is the newest item already stored,
+    nothing else is fetched; otherwise pages of page_size items are walked
+    back with enddate until a stored item or the cursor date is reached.
+    When max_pages runs out first, the unfetched range is kept on the
+    cursor and later syncs spend their remaining pages walking it.
+
+    Usage:
+        tracker = NewsTracker(SteamWebAPI(), [730, 570])
+        tracker.start()
+        ...
+        tracker.get_news_since(since=time.time() - 86400)
+    """
+
+    def __init__(self, web, appids: Iterable[Union[str, int]] = (), interval: float = DEFAULT_INTERVAL,
+                 store: Optional[NewsStore] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                 max_pages: int = DEFAULT_MAX_PAGES, maxlength: int = DEFAULT_MAXLENGTH,
+                 min_age: float = DEFAULT_MIN_AGE, rate: float = 10.0, max_workers: int = 8):
+        """
+        Initialize the tracker.
+
+        Args:
+            web: SteamWebAPI instance used for fetching
+            appids: Application IDs to refresh in the background
+            interval: Seconds between background refreshes
+            store: Store for items and cursors (defaults to the shared news_store)
+            page_size: Items requested per page when catching up
+            max_pages: Maximum pages fetched per sync
+            maxlength: Maximum length of stored item contents (0 for full text)
+            min_age: Seconds during which a fresh cursor is trusted without a request
+            rate: Maximum requests per second across all syncs
+            max_workers: Maximum number of apps synced concurrently
+        """
+        super().__init__(interval, name="NewsTracker")
+        self.web = web
+        self.store = store if store is not None else news_store
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.maxlength = maxlength
+        self.min_age = min_age
+        self.limiter = RateLimiter(rate)
+        self.max_workers = max_workers
+        self._appids: List[int] = []
+        self._lock = threading.Lock()
+        self.track(appids)
+
+    @classmethod
+    def from_env(cls, web) -> 'NewsTracker':
+        """
+        Create a tracker configured from environment variables.
+
+        STEAM_NEWS_APPIDS: comma-separated appids to refresh in the background
+        STEAM_NEWS_INTERVAL: seconds between refreshes
+        """
+        raw_appids = os.getenv("STEAM_NEWS_APPIDS", "")
+        appids = [a.strip() for a in raw_appids.split(",") if a.strip()]
+        interval = float(os.getenv("STEAM_NEWS_INTERVAL") or DEFAULT_INTERVAL)
+        return cls(web, appids, interval=interval)
+
+    @property
+    def appids(self) -> List[int]:
+        """Application IDs refreshed in the background."""
+        with self._lock:
+            return list(self._appids)
+
+    def track(self, appids: Iterable[Union[str, int]]) -> None:
+        """Add apps to the background refresh."""
+        with self._lock:
+            for app_id in appids:
+                appid = AppID.validate(app_id).appid
+                if appid not in self._appids:
+                    self._appids.append(appid)
+
+    def _fetch(self, appid: int, count: int, maxlength: int,
+               enddate: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        self.limiter.acquire()
+        response = self.web.get_game_news(appid, count=count, maxlength=maxlength, enddate=enddate)
+        if not response.ok:
+            return None
+        return response.data.get("news", [])
+
+    def _walk(self, appid: int, enddate: Optional[int], floor: int, stop_at_stored: bool,
+              pages: int) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """
+        Page back through an app's news from enddate.
+
+        The walk ends at the first item older than floor and, with
+        stop_at_stored, at the first item already stored; otherwise stored
+        items are skipped.
+
+        Returns:
+            (new items newest first, enddate to resume from or None once
+            the end was reached, pages fetched)
+        """
+        items: List[Dict[str, Any]] = []
+        for used in range(1, pages + 1):
+            page = self._fetch(appid, self.page_size, self.maxlength, enddate)
+            if page is None:
+                return items, enddate, used
+            for item in page:
+                if item.get("date", 0) < floor:
+                    return items, None, used
+                if self.store.has(appid, item.get("gid", "")):
+                    if stop_at_stored:
+                        return items, None, used
+                    continue
+                items.append(item)
+            if len(page) < self.page_size:
+                return items, None, used
+            oldest = page[-1].get("date", 0)
+            # enddate is inclusive; step past a page that shares one timestamp
+            enddate = oldest - 1 if enddate == oldest else oldest
+        return items, enddate, pages
+
+    def sync(self, app_id: Union[str, int], force: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch items newer than the app's cursor into the store.
+
+        Args:
+            app_id: Application ID
+            force: Ignore min_age and always check upstream
+
+        Returns:
+            Newly stored items (newest first), or None if a request failed;
+            the app's cursor records any range left for later syncs
+        """
+        appid = AppID.validate(app_id).appid
+        now = time.time()
+        cursor = self.store.cursor(appid)
+
+        if cursor is None:
+            page = self._fetch(appid, self.page_size, self.maxlength)
+            if page is None:
+                return None
+            return self.store.add(appid, page, now)
+
+        if not force and now - cursor.checked_at < self.min_age:
+            return []
+
+        probe = self._fetch(appid, 1, 1)
+        if probe is None:
+            return None
+
+        collected: List[Dict[str, Any]] = []
+        gap = cursor.gap
+        pages = self.max_pages
+        if probe and not self.store.has(appid, probe[0].get("gid", "")):
+            collected, resume, used = self._walk(appid, None, cursor.newest_date, True, pages)
+            pages -= used
+            if resume is not None and collected:
+                # Storing these moves the cursor past the items between them
+                # and the old cursor, so keep that range (merged with any
+                # older gap) for later syncs
+                gap = (resume, gap[1] if gap else cursor.newest_date)
+                pages = 0
+
+        if gap is not None and pages > 0:
+            items, resume, _ = self._walk(appid, gap[0], gap[1], False, pages)
+            collected.extend(items)
+            gap = None if resume is None else (resume, gap[1])
+
+        return self.store.add(appid, collected, now, gap)
+
+    def sync_many(self, appids: Iterable[Union[str, int]],
+                  force: bool = False) -> Dict[int, Optional[List[Dict[str, Any]]]]:
+        """
+        Sync several apps concurrently.
+
+        Returns:
+            Mapping of appid to newly stored items (None if the sync failed)
+        """
+        appids = list(dict.fromkeys(AppID.validate(a).appid for a in appids))
+        if not appids:
+            return {}
+        workers = max(1, min(self.max_workers, len(appids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(appids, executor.map(lambda a: self.sync(a, force), appids)))
+
+    def run_once(self) -> None:
+        """Sync all tracked apps."""
+        results = self.sync_many(self.appids, force=True)
+        new_items = sum(len(items) for items in results.values() if items)
+        failed = [appid for appid, items in results.items() if items is None]
+        logger.info(f"News sync: {new_items} new items for {len(results)} apps ({len(failed)} failed)")
+
+    def get_news_since(self, app_id: Optional[Union[str, int]] = None, since: Optional[float] = None,
+                       limit: int = 20) -> APIResponse:
+        """
+        Get news published since a time from the local store.
+
+        An app that is not tracked is synced on demand, so repeated
+        queries only fetch items newer than its cursor.
+
+        Args:
+            app_id: Application ID (defaults to all tracked apps)
+            since: Unix time lower bound (defaults to 7 days ago)
+            limit: Maximum number of items to return
+
+        Returns:
+            APIResponse with news items and cursors or error
+        """
+        since = time.time() - 7 * 86400 if since is None else since
+        warnings = []
+
+        if app_id is None:
+            appids = self.appids
+            if not appids:
+                return APIResponse(
+                    ok=False,
+                    source="news_tracker",
+                    data={},
+                    warnings=["No apps are tracked"],
+                    error={"message": "Pass an app ID or set STEAM_NEWS_APPIDS"}
+                )
+        else:
+            try:
+                appid = AppID.validate(app_id).appid
+            except ValueError as e:
+                return APIResponse(
+                    ok=False,
+                    source="news_tracker",
+                    data={},
+                    warnings=["Invalid app ID"],
+                    error={"message": str(e)}
+                )
+            appids = [appid]
+            if self.sync(appid) is None:
+                if self.store.cursor(appid) is None:
+                    return APIResponse(
+                        ok=False,
+                        source="news_tracker",
+                        data={},
+                        warnings=["News fetch failed"],
+                        error={"message": f"Could not fetch news for app {appid}"}
+                    )
+                warnings.append("News refresh failed; serving stored items")
+
+        items = self.store.since(appids, since, limit)
+        cursors = [c for c in (self.store.cursor(a) for a in appids) if c is not None]
+        for cursor in cursors:
+            if cursor.gap is not None:
+                warnings.append(f"News for app {cursor.appid} is incomplete between dates "
+                                f"{cursor.gap_floor} and {cursor.gap_enddate}; later syncs fetch the rest")
+        cursors = [c.to_dict() for c in cursors]
+        return APIResponse(
+            ok=True,
+            source="news_tracker",
+            data={"since": since, "count": len(items), "news": items, "cursors": cursors},
+            warnings=warnings
+        )
@@ -0,0 +1,258 @@
+"""
+Local full-text index over fetched game news.
+
+This module provides:
+- tokenize: lowercase word tokenizer that strips HTML and BBCode markup
+- NewsIndex: an incremental inverted index with BM25 ranking, app and
+  date filters, and a per-app cap that evicts the oldest items
+- news_index: the shared index fed by every news fetch
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from steam.catalog import app_catalog
+from steam.client import APIResponse
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Title terms count this many times towards term frequency
+TITLE_WEIGHT = 2
+
+SNIPPET_LENGTH = 240
+
+# Newest items kept per app, matching the NewsStore default
+DEFAULT_MAX_ITEMS_PER_APP = 500
+
+_MARKUP_RE = re.compile(r"<[^>]*>|\[/?[a-z0-9*]+(?:=[^\]]*)?\]", re.IGNORECASE)
+_URL_RE = re.compile(r"https?://\S+|\{STEAM_CLAN_IMAGE\}\S*")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the "
+    "this to was we were will with you your our".split()
+)
+
+
+def clean_text(text: str) -> str:
+    """Remove markup and URLs and collapse whitespace."""
+    text = _URL_RE.sub(" ", text or "")
+    text = _MARKUP_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms, dropping stopwords and single letters."""
+    return [
+        token for token in _TOKEN_RE.findall(clean_text(text).lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+class NewsIndex:
+    """
+    Incremental inverted index over news items.
+
+    Items are keyed by gid. Re-adding an item only replaces the indexed
+    copy when its contents are longer, so truncated copies from small
+    requests never shadow full ones. Only the newest max_items_per_app
+    items of each app are kept; older ones are removed from the postings.
+
+    Usage:
+        index = NewsIndex()
+        index.add_many(news_items)
+        index.search("anti-cheat", since=time.time() - 30 * 86400)
+    """
+
+    def __init__(self, max_items_per_app: int = DEFAULT_MAX_ITEMS_PER_APP):
+        self.max_items_per_app = max_items_per_app
+        self._app_docs: Dict[Optional[int], Dict[int, int]] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._docs: Dict[int, Dict[str, Any]] = {}
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._gids: Dict[str, int] = {}
+        self._next_id = 0
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, item: Dict[str, Any], appid: Optional[int] = None) -> bool:
+        """
+        Index one news item.
+
+        Args:
+            item: News item dict (GameNews.to_dict() shape)
+            appid: Application ID, if the item does not carry one
+
+        Returns:
+            True if the item was added or replaced (False if it is older
+            than every item kept for a full app)
+        """
+        gid = item.get("gid")
+        if not gid:
+            return False
+        contents = item.get("contents") or ""
+
+        with self._lock:
+            existing = self._gids.get(gid)
+            if existing is not None:
+                if len(contents) <= self._docs[existing]["contents_length"]:
+                    return False
+                self._remove(existing)
+
+            counts = Counter(tokenize(item.get("contents", "")))
+            counts.update(tokenize(item.get("feedlabel", "")))
+            for term in tokenize(item.get("title", "")):
+                counts[term] += TITLE_WEIGHT
+
+            doc_id = self._next_id
+            self._next_id += 1
+            length = sum(counts.values())
+            for term, tf in counts.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+            self._doc_terms[doc_id] = tuple(counts)
+            self._gids[gid] = doc_id
+            self._total_length += length
+            doc_appid = item.get("appid") or appid
+            self._docs[doc_id] = {
+                "gid": gid,
+                "appid": doc_appid,
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "feedlabel": item.get("feedlabel", ""),
+                "date": item.get("date", 0),
+                "snippet": clean_text(contents)[:SNIPPET_LENGTH],
+                "contents_length": len(contents),
+                "length": length,
+            }
+            app_docs = self._app_docs.setdefault(doc_appid, {})
+            app_docs[doc_id] = item.get("date", 0)
+            if len(app_docs) > self.max_items_per_app:
+                oldest = min(app_docs, key=lambda d: (app_docs[d], d))
+                self._remove(oldest)
+                if oldest == doc_id:
+                    return False
+        return True
+
+    def add_many(self, items: Iterable[Dict[str, Any]], appid: Optional[int] = None) -> int:
+        """Index several items; returns the number added or replaced."""
+        return sum(self.add(item, appid) for item in items)
+
+    def _remove(self, doc_id: int) -> None:
+        """Remove a document; caller holds the lock."""
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        doc = self._docs.pop(doc_id)
+        del self._gids[doc["gid"]]
+        app_docs = self._app_docs[doc["appid"]]
+        del app_docs[doc_id]
+        if not app_docs:
+            del self._app_docs[doc["appid"]]
+        self._total_length -= doc["length"]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._postings.clear()
+            self._docs.clear()
+            self._doc_terms.clear()
+            self._gids.clear()
+            self._app_docs.clear()
+            self._total_length = 0
+
+    def search(self, query: str, appids: Optional[Iterable[int]] = None,
+               since: Optional[float] = None, until: Optional[float] = None,
+               limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank indexed items against a query with BM25.
+
+        Args:
+            query: Free-text query
+            appids: Only return items for these apps
+            since: Only return items published at or after this Unix time
+            until: Only return items published at or before this Unix time
+            limit: Maximum number of results
+
+        Returns:
+            Matching items with scores, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        appids = set(appids) if appids is not None else None
+
+        with self._lock:
+            n = len(self._docs)
+            if not n:
+                return []
+            avg_length = self._total_length / n
+            scores: Dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    length = self._docs[doc_id]["length"]
+                    norm = tf + K1 * (1 - B + B * length / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / norm
+
+            def matches(doc_id: int) -> bool:
+                doc = self._docs[doc_id]
+                return ((appids is None or doc["appid"] in appids)
+                        and (since is None or doc["date"] >= since)
+                        and (until is None or doc["date"] <= until))
+
+            best = heapq.nlargest(limit, (item for item in scores.items() if matches(item[0])),
+                                  key=lambda item: item[1])
+            return [
+                {
+                    **{k: v for k, v in self._docs[doc_id].items() if k not in ("length", "contents_length")},
+                    "app_name": app_catalog.name_for(self._docs[doc_id]["appid"]),
+                    "score": round(score, 4),
+                }
+                for doc_id, score in best
+            ]
+
+    def search_news(self, query: str, appids: Optional[Iterable[int]] = None,
+                    since: Optional[float] = None, until: Optional[float] = None,
+                    limit: int = 10) -> APIResponse:
+        """
+        Search the index and wrap the results in an APIResponse.
+
+        Returns:
+            APIResponse with ranked results or error
+        """
+        if not tokenize(query):
+            return APIResponse(
+                ok=False,
+                source="news_index",
+                data={},
+                warnings=["Empty query"],
+                error={"message": "Query has no searchable terms"}
+            )
+
+        results = self.search(query, appids, since, until, limit)
+        warnings = [] if len(self) else ["News index is empty; fetch news for some apps first"]
+        return APIResponse(
+            ok=True,
+            source="news_index",
+            data={"query": query, "indexed_items": len(self), "count": len(results), "results": results},
+            warnings=warnings
+        )
+
+
+# Shared index fed by SteamWebAPI.get_game_news
+news_index = NewsIndex()
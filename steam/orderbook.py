@@ -0,0 +1,364 @@
+"""
+Market order books.
+
+This module provides:
+- OrderBook: an itemordershistogram response parsed into price levels
+  (prices in minor currency units, per-level quantities) with spread,
+  mid price and depth within a percentage of the mid price
+- OrderBookHistory: successive snapshots of one item, stored as level
+  deltas against the previous book with periodic full keyframes
+- OrderBookStore: histories keyed by (item_nameid, currency)
+
+Steam reports each side as a cumulative graph: [price, total quantity at
+this price or better, label]. Per-level quantities are the differences
+between consecutive points.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Snapshots kept per item; a day of polling every five minutes
+DEFAULT_MAX_SNAPSHOTS = 288
+
+# Every n-th snapshot is stored in full, bounding reconstruction to n deltas
+KEYFRAME_INTERVAL = 32
+
+DEFAULT_DEPTHS = (1.0, 5.0, 10.0)
+
+_EMPTY_PRICES = np.empty(0, dtype=np.int64)
+_EMPTY_QUANTITIES = np.empty(0, dtype=np.int32)
+
+
+def _count(value: Any) -> int:
+    """Parse an order count that may arrive as "12,345"."""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(str(value).replace(",", "").strip() or 0)
+
+
+def _levels(graph: Sequence[Sequence[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Price levels of a cumulative graph, sorted by ascending price."""
+    if not graph:
+        return _EMPTY_PRICES, _EMPTY_QUANTITIES
+    prices = np.rint(np.array([point[0] for point in graph], dtype=np.float64) * 100).astype(np.int64)
+    totals = np.array([point[1] for point in graph], dtype=np.int64)
+    quantities = np.diff(totals, prepend=0).astype(np.int32)
+    order = np.argsort(prices, kind="stable")
+    return prices[order], quantities[order]
+
+
+def _diff(old_prices: np.ndarray, old_quantities: np.ndarray,
+          new_prices: np.ndarray, new_quantities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Levels whose quantity changed; removed levels get quantity 0."""
+    prices = np.union1d(old_prices, new_prices)
+    old = np.zeros(len(prices), dtype=np.int32)
+    new = np.zeros(len(prices), dtype=np.int32)
+    old[np.searchsorted(prices, old_prices)] = old_quantities
+    new[np.searchsorted(prices, new_prices)] = new_quantities
+    changed = old != new
+    return prices[changed], new[changed]
+
+
+def _apply(prices: np.ndarray, quantities: np.ndarray,
+           delta_prices: np.ndarray, delta_quantities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply a delta from _diff() to a side of the book."""
+    merged = np.union1d(prices, delta_prices)
+    result = np.zeros(len(merged), dtype=np.int32)
+    result[np.searchsorted(merged, prices)] = quantities
+    result[np.searchsorted(merged, delta_prices)] = delta_quantities
+    keep = result > 0
+    return merged[keep], result[keep]
+
+
+@dataclass
+class OrderBook:
+    """
+    One order book snapshot.
+
+    Both sides are sorted by ascending price; prices are in minor
+    currency units (cents). The order counts are Steam's totals, which
+    can exceed the levels it includes in the graphs.
+    """
+    buy_prices: np.ndarray = field(default_factory=lambda: _EMPTY_PRICES)
+    buy_quantities: np.ndarray = field(default_factory=lambda: _EMPTY_QUANTITIES)
+    sell_prices: np.ndarray = field(default_factory=lambda: _EMPTY_PRICES)
+    sell_quantities: np.ndarray = field(default_factory=lambda: _EMPTY_QUANTITIES)
+    buy_order_count: int = 0
+    sell_order_count: int = 0
+    timestamp: float = 0.0
+    price_prefix: Optional[str] = None
+    price_suffix: Optional[str] = None
+
+    @classmethod
+    def from_histogram(cls, data: Dict[str, Any], timestamp: float = 0.0) -> 'OrderBook':
+        """
+        Parse an itemordershistogram response.
+
+        Args:
+            data: Response body
+            timestamp: Unix time of the snapshot
+
+        Returns:
+            OrderBook with the graph levels of both sides
+        """
+        buy_prices, buy_quantities = _levels(data.get("buy_order_graph") or [])
+        sell_prices, sell_quantities = _levels(data.get("sell_order_graph") or [])
+        return cls(
+            buy_prices=buy_prices,
+            buy_quantities=buy_quantities,
+            sell_prices=sell_prices,
+            sell_quantities=sell_quantities,
+            buy_order_count=_count(data.get("buy_order_count")),
+            sell_order_count=_count(data.get("sell_order_count")),
+            timestamp=timestamp,
+            price_prefix=data.get("price_prefix"),
+            price_suffix=data.get("price_suffix"),
+        )
+
+    @property
+    def best_bid(self) -> Optional[int]:
+        """Highest buy price in minor units."""
+        return int(self.buy_prices[-1]) if len(self.buy_prices) else None
+
+    @property
+    def best_ask(self) -> Optional[int]:
+        """Lowest sell price in minor units."""
+        return int(self.sell_prices[0]) if len(self.sell_prices) else None
+
+    @property
+    def spread(self) -> Optional[int]:
+        """Best ask minus best bid in minor units."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask - self.best_bid
+
+    @property
+    def mid(self) -> Optional[float]:
+        """Midpoint of the best bid and ask in minor units."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    def depth(self, percents: Iterable[float] = DEFAULT_DEPTHS) -> Dict[str, Dict[str, Any]]:
+        """
+        Order quantity and value within a percentage of the mid price.
+
+        Args:
+            percents: Distances from the mid price, in percent
+
+        Returns:
+            {"<p>%": {"bid_quantity", "ask_quantity", "bid_value", "ask_value"}}
+            with values in major units; empty when either side is empty
+        """
+        mid = self.mid
+        if mid is None:
+            return {}
+        percents = np.asarray(list(percents), dtype=np.float64)
+        bid_cumulative = np.cumsum(self.buy_quantities[::-1], dtype=np.int64)
+        bid_value = np.cumsum((self.buy_prices * self.buy_quantities)[::-1])
+        ask_cumulative = np.cumsum(self.sell_quantities, dtype=np.int64)
+        ask_value = np.cumsum(self.sell_prices * self.sell_quantities)
+        # Levels are within reach when price >= floor (bids) or <= ceiling (asks)
+        bids = len(self.buy_prices) - np.searchsorted(self.buy_prices, mid * (1 - percents / 100), side="left")
+        asks = np.searchsorted(self.sell_prices, mid * (1 + percents / 100), side="right")
+
+        result = {}
+        for percent, bid_levels, ask_levels in zip(percents, bids, asks):
+            result[f"{percent:g}%"] = {
+                "bid_quantity": int(bid_cumulative[bid_levels - 1]) if bid_levels else 0,
+                "ask_quantity": int(ask_cumulative[ask_levels - 1]) if ask_levels else 0,
+                "bid_value": round(float(bid_value[bid_levels - 1]) / 100, 2) if bid_levels else 0.0,
+                "ask_value": round(float(ask_value[ask_levels - 1]) / 100, 2) if ask_levels else 0.0,
+            }
+        return result
+
+    def summary(self, depths: Iterable[float] = DEFAULT_DEPTHS) -> Dict[str, Any]:
+        """Derived metrics only, with prices in major units."""
+        best_bid, best_ask, spread, mid = self.best_bid, self.best_ask, self.spread, self.mid
+        return {
+            "best_bid": best_bid / 100 if best_bid is not None else None,
+            "best_ask": best_ask / 100 if best_ask is not None else None,
+            "spread": spread / 100 if spread is not None else None,
+            "spread_pct": round(spread / mid * 100, 3) if spread is not None and mid else None,
+            "mid": round(mid / 100, 3) if mid is not None else None,
+            "buy_order_count": self.buy_order_count,
+            "sell_order_count": self.sell_order_count,
+            "depth": self.depth(depths),
+            "price_prefix": self.price_prefix,
+            "price_suffix": self.price_suffix,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact levels as [price, quantity] pairs, best price first."""
+        return {
+            "price_prefix": self.price_prefix,
+            "price_suffix": self.price_suffix,
+            "buy_order_count": self.buy_order_count,
+            "sell_order_count": self.sell_order_count,
+            "buy": [[p / 100, q] for p, q in zip(self.buy_prices[::-1].tolist(), self.buy_quantities[::-1].tolist())],
+            "sell": [[p / 100, q] for p, q in zip(self.sell_prices.tolist(), self.sell_quantities.tolist())],
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return (self.buy_prices.nbytes + self.buy_quantities.nbytes
+                + self.sell_prices.nbytes + self.sell_quantities.nbytes)
+
+
+@dataclass
+class _Snapshot:
+    """A stored snapshot: a full book, or the level changes since the previous one."""
+    keyframe: bool
+    book: OrderBook
+
+    @property
+    def nbytes(self) -> int:
+        return self.book.nbytes
+
+
+class OrderBookHistory:
+    """
+    Successive order book snapshots of one item.
+
+    Most polls change a handful of levels, so each snapshot is stored as
+    the levels that changed since the previous one; every
+    KEYFRAME_INTERVAL-th snapshot is stored in full. The latest book is
+    kept materialized for diffing the next one.
+    """
+
+    def __init__(self, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+                 keyframe_interval: int = KEYFRAME_INTERVAL):
+        """
+        Initialize the history.
+
+        Args:
+            max_snapshots: Snapshots kept; the oldest are dropped
+            keyframe_interval: Store every n-th snapshot in full
+        """
+        if max_snapshots <= 0:
+            raise ValueError("max_snapshots must be positive")
+        self.max_snapshots = max_snapshots
+        self.keyframe_interval = keyframe_interval
+        self._snapshots: deque = deque()
+        self._latest: Optional[OrderBook] = None
+        self._since_keyframe = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def latest(self) -> Optional[OrderBook]:
+        return self._latest
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the stored level arrays."""
+        return sum(s.nbytes for s in self._snapshots)
+
+    def append(self, book: OrderBook) -> None:
+        """Add a snapshot, newest last."""
+        previous = self._latest
+        if previous is None or self._since_keyframe + 1 >= self.keyframe_interval:
+            self._snapshots.append(_Snapshot(True, book))
+            self._since_keyframe = 0
+        else:
+            buy_prices, buy_quantities = _diff(previous.buy_prices, previous.buy_quantities,
+                                               book.buy_prices, book.buy_quantities)
+            sell_prices, sell_quantities = _diff(previous.sell_prices, previous.sell_quantities,
+                                                 book.sell_prices, book.sell_quantities)
+            delta = OrderBook(buy_prices, buy_quantities, sell_prices, sell_quantities,
+                              book.buy_order_count, book.sell_order_count, book.timestamp,
+                              book.price_prefix, book.price_suffix)
+            self._snapshots.append(_Snapshot(False, delta))
+            self._since_keyframe += 1
+        self._latest = book
+
+        while len(self._snapshots) > self.max_snapshots:
+            # The next oldest snapshot must be self-contained once its base is gone
+            if len(self._snapshots) > 1 and not self._snapshots[1].keyframe:
+                self._snapshots[1] = _Snapshot(True, self.snapshot(1))
+            self._snapshots.popleft()
+
+    def snapshot(self, index: int) -> OrderBook:
+        """
+        Reconstruct a stored snapshot.
+
+        Args:
+            index: Position, oldest first; negative values count from the newest
+
+        Returns:
+            The full OrderBook at that position
+        """
+        if index < 0:
+            index += len(self._snapshots)
+        if not 0 <= index < len(self._snapshots):
+            raise IndexError("snapshot index out of range")
+        if index == len(self._snapshots) - 1 and self._latest is not None:
+            return self._latest
+
+        # The oldest stored snapshot is always a keyframe
+        start = index
+        while not self._snapshots[start].keyframe:
+            start -= 1
+        book = self._snapshots[start].book
+        buy = (book.buy_prices, book.buy_quantities)
+        sell = (book.sell_prices, book.sell_quantities)
+        for position in range(start + 1, index + 1):
+            delta = self._snapshots[position].book
+            buy = _apply(*buy, delta.buy_prices, delta.buy_quantities)
+            sell = _apply(*sell, delta.sell_prices, delta.sell_quantities)
+            book = delta
+        return OrderBook(buy[0], buy[1], sell[0], sell[1], book.buy_order_count, book.sell_order_count,
+                         book.timestamp, book.price_prefix, book.price_suffix)
+
+    def timestamps(self) -> List[float]:
+        """Times of the stored snapshots, oldest first."""
+        return [s.book.timestamp for s in self._snapshots]
+
+
+class OrderBookStore:
+    """
+    Thread-safe order book histories keyed by (item_nameid, currency).
+
+    Usage:
+        store = OrderBookStore()
+        previous = store.record("176321160", 1, book)
+    """
+
+    def __init__(self, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS):
+        self.max_snapshots = max_snapshots
+        self._histories: Dict[Tuple[str, int], OrderBookHistory] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def history(self, item_nameid: str, currency: int = 1) -> Optional[OrderBookHistory]:
+        """Get the history of an item, or None if it was never recorded."""
+        return self._histories.get((item_nameid, currency))
+
+    def record(self, item_nameid: str, currency: int, book: OrderBook) -> Optional[OrderBook]:
+        """
+        Add a snapshot to an item's history.
+
+        Returns:
+            The previous snapshot of the item, or None for the first one
+        """
+        with self._lock:
+            history = self._histories.get((item_nameid, currency))
+            if history is None:
+                history = self._histories[(item_nameid, currency)] = OrderBookHistory(self.max_snapshots)
+            previous = history.latest
+            history.append(book)
+            return previous
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all stored level arrays."""
+        return sum(h.nbytes for h in self._histories.values())
@@ -0,0 +1,393 @@
+"""
+Locally sampled current-player time series.
+
+This module provides:
+- RingBuffer: fixed-size (timestamp, count) storage backed by typed arrays
+- fetch_player_counts: concurrent GetNumberOfCurrentPlayers polling for many apps
+- PlayerCountSampler: a background sampler that keeps one ring buffer per app,
+  optionally appends samples to a JSONL file, and computes peaks, averages
+  and trends without any upstream call
+"""
+
+import logging
+import os
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from steam import codec
+from steam.background import PeriodicWorker
+from steam.catalog import app_catalog
+from steam.client import APIResponse, RateLimiter
+from steam.schemas import AppID
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+
+# Default cadence and history: one week of 5-minute samples per app
+DEFAULT_INTERVAL = 300
+DEFAULT_CAPACITY = 7 * 24 * 12
+
+# Relative change over the trend window below which the trend is "flat"
+FLAT_TREND_THRESHOLD = 0.05
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of (timestamp, count) samples.
+
+    Storage is preallocated, so appending never allocates and the oldest
+    sample is overwritten once the buffer is full.
+    """
+
+    __slots__ = ("capacity", "_times", "_counts", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._times = array("d", [0.0]) * capacity
+        self._counts = array("q", [0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, count: int) -> None:
+        """Add a sample, evicting the oldest one when full."""
+        end = (self._start + self._size) % self.capacity
+        self._times[end] = timestamp
+        self._counts[end] = count
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def __iter__(self) -> Iterator[Tuple[float, int]]:
+        """Iterate over samples, oldest first."""
+        for i in range(self._size):
+            pos = (self._start + i) % self.capacity
+            yield self._times[pos], self._counts[pos]
+
+    def latest(self) -> Optional[Tuple[float, int]]:
+        """Get the newest sample."""
+        if not self._size:
+            return None
+        pos = (self._start + self._size - 1) % self.capacity
+        return self._times[pos], self._counts[pos]
+
+    def since(self, timestamp: float) -> List[Tuple[float, int]]:
+        """
+        Get samples taken at or after a timestamp, oldest first.
+
+        Walks back from the newest sample, so the cost is proportional
+        to the size of the window rather than the buffer.
+        """
+        samples = []
+        for i in range(self._size - 1, -1, -1):
+            pos = (self._start + i) % self.capacity
+            if self._times[pos] < timestamp:
+                break
+            samples.append((self._times[pos], self._counts[pos]))
+        samples.reverse()
+        return samples
+
+
+def fetch_player_counts(web, appids: Iterable[int], max_workers: int = 8,
+                        limiter: Optional[RateLimiter] = None) -> Dict[int, Optional[int]]:
+    """
+    Fetch current player counts for many apps concurrently.
+
+    Args:
+        web: SteamWebAPI instance
+        appids: Application IDs to poll
+        max_workers: Maximum number of concurrent requests
+        limiter: Optional rate limiter shared by all workers
+
+    Returns:
+        Mapping of appid to current player count (None if the call failed)
+    """
+    appids = list(dict.fromkeys(appids))
+    if not appids:
+        return {}
+
+    def fetch(appid: int) -> Optional[int]:
+        if limiter is not None:
+            limiter.acquire()
+        response = web.get_current_players(appid)
+        if not response.ok:
+            return None
+        return response.data.get("player_count", {}).get("current_players")
+
+    workers = max(1, min(max_workers, len(appids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(appids, executor.map(fetch, appids)))
+
+
+def _trend(samples: List[Tuple[float, int]]) -> Dict[str, Any]:
+    """Least-squares slope of a window of samples, in players per hour."""
+    if len(samples) < 2:
+        return {"slope_per_hour": None, "direction": None}
+
+    n = len(samples)
+    t0 = samples[0][0]
+    xs = [(t - t0) / 3600 for t, _ in samples]
+    ys = [c for _, c in samples]
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        return {"slope_per_hour": None, "direction": None}
+
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+    change = slope * (xs[-1] - xs[0])
+    if mean_y == 0 or abs(change) / mean_y < FLAT_TREND_THRESHOLD:
+        direction = "flat"
+    else:
+        direction = "rising" if slope > 0 else "falling"
+    return {"slope_per_hour": round(slope, 2), "direction": direction}
+
+
+class PlayerCountSampler(PeriodicWorker):
+    """
+    Background sampler of current player counts.
+
+    Polls GetNumberOfCurrentPlayers for a fixed set of apps at a fixed
+    cadence and keeps one ring buffer per app. All statistics are computed
+    from the local samples; "all-time" means since sampling began.
+
+    When a path is given, every sample is appended to a JSONL file that is
+    replayed on startup, so history survives restarts. The file is rewritten
+    from the buffers once it grows well past their capacity.
+
+    Usage:
+        sampler = PlayerCountSampler(SteamWebAPI(), [730, 570], interval=300)
+        sampler.start()
+        ...
+        sampler.stats(730)
+    """
+
+    def __init__(self, web, appids: Iterable[Union[str, int]], interval: float = DEFAULT_INTERVAL,
+                 capacity: int = DEFAULT_CAPACITY, max_workers: int = 8, path: Optional[str] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            web: SteamWebAPI instance used for polling
+            appids: Application IDs to sample
+            interval: Seconds between polls
+            capacity: Samples kept per app
+            max_workers: Maximum number of concurrent requests per poll
+            path: Optional JSONL file for persisting samples
+        """
+        super().__init__(interval, name="PlayerCountSampler")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.web = web
+        self.capacity = capacity
+        self.max_workers = max_workers
+        self.path = path
+        self._buffers: Dict[int, RingBuffer] = {}
+        self._peaks: Dict[int, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._file_lines = 0
+
+        self.add_appids(appids)
+        if path and os.path.exists(path):
+            self._load()
+
+    @classmethod
+    def from_env(cls, web) -> 'PlayerCountSampler':
+        """
+        Create a sampler configured from environment variables.
+
+        STEAM_PLAYER_SAMPLER_APPIDS: comma-separated appids to sample
+        STEAM_PLAYER_SAMPLER_INTERVAL: seconds between polls
+        STEAM_PLAYER_SAMPLER_FILE: JSONL file for persisting samples
+        """
+        raw_appids = os.getenv("STEAM_PLAYER_SAMPLER_APPIDS", "")
+        appids = [a.strip() for a in raw_appids.split(",") if a.strip()]
+        interval = float(os.getenv("STEAM_PLAYER_SAMPLER_INTERVAL") or DEFAULT_INTERVAL)
+        path = os.getenv("STEAM_PLAYER_SAMPLER_FILE") or None
+        return cls(web, appids, interval=interval, path=path)
+
+    @property
+    def appids(self) -> List[int]:
+        """Sampled application IDs."""
+        with self._lock:
+            return sorted(self._buffers)
+
+    def add_appids(self, appids: Iterable[Union[str, int]]) -> None:
+        """Start sampling additional apps."""
+        with self._lock:
+            for app_id in appids:
+                appid = AppID.validate(app_id).appid
+                if appid not in self._buffers:
+                    self._buffers[appid] = RingBuffer(self.capacity)
+
+    def is_tracked(self, appid: int) -> bool:
+        """Check whether an app is being sampled."""
+        return appid in self._buffers
+
+    def record(self, appid: int, count: int, timestamp: Optional[float] = None,
+               persist: bool = True) -> None:
+        """
+        Record one sample for a tracked app.
+
+        Args:
+            appid: Application ID
+            count: Current player count
+            timestamp: Unix time of the sample (defaults to now)
+            persist: Whether to append the sample to the JSONL file
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            buffer = self._buffers.get(appid)
+            if buffer is None:
+                return
+            buffer.append(timestamp, count)
+            peak = self._peaks.get(appid)
+            if peak is None or count > peak[0]:
+                self._peaks[appid] = (count, timestamp)
+            if persist and self.path:
+                self._append_lines([(appid, timestamp, count)])
+
+    def run_once(self) -> None:
+        """Poll all tracked apps once."""
+        counts = fetch_player_counts(self.web, self.appids, self.max_workers)
+        now = time.time()
+        for appid, count in counts.items():
+            if count is not None:
+                self.record(appid, count, now)
+        failed = [appid for appid, count in counts.items() if count is None]
+        if failed:
+            logger.warning(f"Player count poll failed for {len(failed)} app(s): {failed[:10]}")
+
+    def stats(self, appid: int, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Compute statistics for a tracked app from local samples.
+
+        Args:
+            appid: Application ID
+            now: Reference time for the 24h window (defaults to now)
+
+        Returns:
+            Dict of statistics, or None if the app has no samples
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            buffer = self._buffers.get(appid)
+            if buffer is None or not len(buffer):
+                return None
+            latest_at, latest = buffer.latest()
+            window = buffer.since(now - DAY)
+            samples = len(buffer)
+            peak, peak_at = self._peaks[appid]
+
+        counts = [c for _, c in window]
+        return {
+            "appid": appid,
+            "name": app_catalog.name_for(appid),
+            "current_players": latest,
+            "sampled_at": latest_at,
+            "age_seconds": round(max(0.0, now - latest_at), 1),
+            "samples": samples,
+            "samples_24h": len(window),
+            "peak_24h": max(counts) if counts else None,
+            "min_24h": min(counts) if counts else None,
+            "avg_24h": round(sum(counts) / len(counts), 1) if counts else None,
+            "all_time_peak": peak,
+            "all_time_peak_at": peak_at,
+            "trend_24h": _trend(window),
+        }
+
+    def get_stats(self, app_id: Union[str, int]) -> APIResponse:
+        """
+        Get sampled statistics for an app as an APIResponse.
+
+        Args:
+            app_id: Application ID of the game
+
+        Returns:
+            APIResponse with statistics or error
+        """
+        try:
+            appid = AppID.validate(app_id).appid
+        except ValueError as e:
+            return APIResponse(
+                ok=False,
+                source="player_sampler",
+                data={},
+                warnings=["Invalid app ID"],
+                error={"message": str(e)}
+            )
+
+        if not self.is_tracked(appid):
+            return APIResponse(
+                ok=False,
+                source="player_sampler",
+                data={},
+                warnings=["App is not sampled"],
+                error={"message": f"App {appid} is not sampled; add it to STEAM_PLAYER_SAMPLER_APPIDS"}
+            )
+
+        stats = self.stats(appid)
+        if stats is None:
+            return APIResponse(
+                ok=False,
+                source="player_sampler",
+                data={},
+                warnings=["No samples yet"],
+                error={"message": f"No player count samples for app {appid} yet"}
+            )
+
+        return APIResponse(ok=True, source="player_sampler", data=stats)
+
+    def _load(self) -> None:
+        """Replay samples from the JSONL file into the buffers."""
+        loaded = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._file_lines += 1
+                try:
+                    sample = codec.loads(line)
+                    appid, timestamp, count = int(sample["appid"]), float(sample["t"]), int(sample["n"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if appid in self._buffers:
+                    self.record(appid, count, timestamp, persist=False)
+                    loaded += 1
+        logger.info(f"Loaded {loaded} player count samples from {self.path}")
+
+    def _append_lines(self, samples: List[Tuple[int, float, int]]) -> None:
+        """Append samples to the JSONL file; caller holds the lock."""
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for appid, timestamp, count in samples:
+                    f.write(codec.dumps_str({"appid": appid, "t": timestamp, "n": count}) + "\n")
+            self._file_lines += len(samples)
+            if self._file_lines > 2 * self.capacity * max(1, len(self._buffers)):
+                self._compact()
+        except OSError as e:
+            logger.warning(f"Failed to persist player count samples: {e}")
+
+    def _compact(self) -> None:
+        """Rewrite the JSONL file from the buffers; caller holds the lock."""
+        tmp_path = f"{self.path}.tmp"
+        lines = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for appid, buffer in self._buffers.items():
+                samples = list(buffer)
+                peak = self._peaks.get(appid)
+                # Keep the all-time peak even after it has left the buffer
+                if peak and samples and peak[1] < samples[0][0]:
+                    samples.insert(0, (peak[1], peak[0]))
+                for timestamp, count in samples:
+                    f.write(codec.dumps_str({"appid": appid, "t": timestamp, "n": count}) + "\n")
+                    lines += 1
+        os.replace(tmp_path, self.path)
+        self._file_lines = lines
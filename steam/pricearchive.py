@@ -0,0 +1,377 @@
+"""
+Local archive of market price histories.
+
+This module provides:
+- encode_block / decode_block: delta-encoded, zlib-compressed PriceSeries blocks
+- PriceArchive: append-only on-disk store of price histories per
+  (appid, market_hash_name, currency), with a block index for reading a
+  time range without decoding the whole history
+
+Files under the archive root, per item:
+    <appid>/<key>.dat      sealed blocks, appended and never rewritten
+    <appid>/<key>.idx      one record per block: first and last timestamp,
+                           offset, length and point count
+    <appid>/<key>.recent   header and block of the newest points, replaced
+                           on every merge
+
+Steam keeps revising the median price and volume of the latest hours, so
+points inside the mutable window stay in the .recent file and are
+overwritten by each refresh. Older points are sealed into .dat once
+BLOCK_POINTS of them have accumulated. Blocks and index records are
+written before .recent is replaced, so after an interrupted merge the
+old .recent can still hold sealed points; readers ignore every recent
+point at or before the last sealed one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from steam.priceseries import PriceSeries
+
+logger = logging.getLogger(__name__)
+
+RECENT_MAGIC = b"STEAMPRC"
+ARCHIVE_FORMAT_VERSION = 1
+
+# Points per sealed block; also the unit of random access
+BLOCK_POINTS = 1024
+
+# Points this close to the newest one are still revised by Steam
+DEFAULT_MUTABLE_WINDOW = 2 * 86400
+
+# Prices are stored as integer thousandths when that is lossless
+_PRICE_SCALE = 1000
+_SCALED_PRICES = 1
+
+_BLOCK_HEADER = struct.Struct("<BI")
+_INDEX_DTYPE = np.dtype([("first", "<i8"), ("last", "<i8"), ("offset", "<u8"),
+                         ("length", "<u4"), ("count", "<u4")])
+
+
+def _shuffle(column: np.ndarray) -> bytes:
+    """Group the bytes of a column by significance; high bytes are mostly zero."""
+    return column.view(np.uint8).reshape(len(column), column.itemsize).T.tobytes()
+
+
+def _unshuffle(data: bytes, dtype: str, count: int) -> np.ndarray:
+    size = np.dtype(dtype).itemsize
+    return np.frombuffer(data, np.uint8).reshape(size, count).T.copy().view(dtype).ravel()
+
+
+def encode_block(series: PriceSeries) -> bytes:
+    """
+    Encode the points of a series as one compressed block.
+
+    Timestamps and prices are stored as differences from the previous
+    point, which are small and repetitive (hourly or daily steps); each
+    column is byte-shuffled and the columns are compressed together with zlib.
+    """
+    count = len(series)
+    flags = 0
+    prices = series.prices.astype(np.float64)
+    scaled = np.rint(prices * _PRICE_SCALE)
+    if np.isfinite(scaled).all() and np.array_equal(scaled / _PRICE_SCALE, prices):
+        flags |= _SCALED_PRICES
+        price_column = np.diff(scaled.astype(np.int64), prepend=0).astype("<i8")
+    else:
+        price_column = prices.astype("<f8")
+    payload = b"".join((
+        _shuffle(np.diff(series.timestamps.astype(np.int64), prepend=0).astype("<i8")),
+        _shuffle(price_column),
+        _shuffle(series.volumes.astype("<i4")),
+    ))
+    return _BLOCK_HEADER.pack(flags, count) + zlib.compress(payload)
+
+
+def decode_block(data: bytes) -> PriceSeries:
+    """
+    Decode a block written by encode_block().
+
+    Raises:
+        ValueError: If the block is truncated or corrupt
+    """
+    try:
+        flags, count = _BLOCK_HEADER.unpack_from(data)
+        payload = zlib.decompress(data[_BLOCK_HEADER.size:])
+    except (struct.error, zlib.error) as e:
+        raise ValueError(f"corrupt block: {e}")
+    if len(payload) != count * 20:
+        raise ValueError("block size mismatch")
+    timestamps = np.cumsum(_unshuffle(payload[:count * 8], "<i8", count)).astype(np.int64)
+    if flags & _SCALED_PRICES:
+        prices = np.cumsum(_unshuffle(payload[count * 8:count * 16], "<i8", count)) / _PRICE_SCALE
+    else:
+        prices = _unshuffle(payload[count * 8:count * 16], "<f8", count).astype(np.float64)
+    volumes = _unshuffle(payload[count * 16:], "<i4", count).astype(np.int32)
+    return PriceSeries(timestamps, prices, volumes)
+
+
+def _concat(parts, price_prefix: Optional[str], price_suffix: Optional[str]) -> PriceSeries:
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return PriceSeries(price_prefix=price_prefix, price_suffix=price_suffix)
+    return PriceSeries(np.concatenate([p.timestamps for p in parts]),
+                       np.concatenate([p.prices for p in parts]),
+                       np.concatenate([p.volumes for p in parts]),
+                       price_prefix, price_suffix)
+
+
+class PriceArchive:
+    """
+    Append-only store of price histories on disk.
+
+    merge() adds a freshly fetched history: only points newer than the
+    last stored one are added, and the mutable window is replaced. read()
+    serves a time range by decoding just the blocks that overlap it.
+    Merges of the same item are serialized; different items can be merged
+    from several threads at once.
+
+    Usage:
+        archive = PriceArchive("price_archive")
+        archive.merge(730, "Recoil Case", 1, series)
+        archive.read(730, "Recoil Case", 1, start=1704067200)
+    """
+
+    def __init__(self, root: str, mutable_window: int = DEFAULT_MUTABLE_WINDOW,
+                 block_points: int = BLOCK_POINTS):
+        """
+        Initialize the archive.
+
+        Args:
+            root: Directory the archive lives in (created on first write)
+            mutable_window: Seconds before the newest point that are rewritten on merge
+            block_points: Points per sealed block
+        """
+        self.root = root
+        self.mutable_window = mutable_window
+        self.block_points = block_points
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional['PriceArchive']:
+        """
+        Create an archive configured from environment variables.
+
+        STEAM_PRICE_ARCHIVE_DIR: archive directory (no archive when unset)
+
+        Returns:
+            PriceArchive, or None if no directory is configured
+        """
+        root = os.getenv("STEAM_PRICE_ARCHIVE_DIR") or None
+        return cls(root) if root else None
+
+    def _path(self, appid: int, market_hash_name: str, currency: int) -> str:
+        digest = hashlib.sha1(market_hash_name.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, str(appid), f"{digest}-{currency}")
+
+    def _lock(self, path: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _read_index(path: str) -> np.ndarray:
+        try:
+            with open(f"{path}.idx", "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return np.empty(0, dtype=_INDEX_DTYPE)
+        # A torn record from an interrupted append is ignored
+        usable = len(data) - len(data) % _INDEX_DTYPE.itemsize
+        return np.frombuffer(data[:usable], dtype=_INDEX_DTYPE)
+
+    @staticmethod
+    def _read_recent(path: str) -> Tuple[Dict[str, Any], PriceSeries]:
+        try:
+            with open(f"{path}.recent", "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return {}, PriceSeries()
+        if not data.startswith(RECENT_MAGIC):
+            raise ValueError("not a price archive file")
+        offset = len(RECENT_MAGIC)
+        (header_length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        header = json.loads(data[offset:offset + header_length])
+        if header.get("version") != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"unsupported version {header.get('version')}")
+        return header, decode_block(data[offset + header_length:])
+
+    @staticmethod
+    def _unsealed(recent: PriceSeries, index: np.ndarray) -> PriceSeries:
+        """Recent points newer than the last sealed block."""
+        if not len(index) or not len(recent):
+            return recent
+        return recent.between(start=int(index["last"][-1]) + 1)
+
+    def info(self, appid: int, market_hash_name: str, currency: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Describe an archived item.
+
+        Returns:
+            Dict with points, first/last timestamp, sealed blocks and
+            refreshed_at, or None if the item is not archived
+        """
+        path = self._path(appid, market_hash_name, currency)
+        try:
+            header, recent = self._read_recent(path)
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Failed to read price archive {path}: {e}")
+            return None
+        if not header:
+            return None
+        index = self._read_index(path)
+        recent = self._unsealed(recent, index)
+        sealed = int(index["count"].sum())
+        first = int(index["first"][0]) if len(index) else (int(recent.timestamps[0]) if len(recent) else None)
+        last = int(recent.timestamps[-1]) if len(recent) else (int(index["last"][-1]) if len(index) else None)
+        return {
+            "points": sealed + len(recent),
+            "first": first,
+            "last": last,
+            "blocks": len(index),
+            "refreshed_at": header.get("refreshed_at"),
+        }
+
+    def read(self, appid: int, market_hash_name: str, currency: int = 1,
+             start: Optional[int] = None, end: Optional[int] = None) -> Optional[PriceSeries]:
+        """
+        Read the archived points between two Unix times, inclusive.
+
+        Only blocks whose time range overlaps [start, end] are read from disk.
+
+        Returns:
+            PriceSeries, or None if the item is not archived or unreadable
+        """
+        path = self._path(appid, market_hash_name, currency)
+        try:
+            header, recent = self._read_recent(path)
+            if not header:
+                return None
+            index = self._read_index(path)
+            recent = self._unsealed(recent, index)
+            lo = 0 if start is None else int(np.searchsorted(index["last"], start, side="left"))
+            hi = len(index) if end is None else int(np.searchsorted(index["first"], end, side="right"))
+            parts = []
+            if lo < hi:
+                with open(f"{path}.dat", "rb") as f:
+                    for record in index[lo:hi]:
+                        f.seek(int(record["offset"]))
+                        parts.append(decode_block(f.read(int(record["length"]))))
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Failed to read price archive {path}: {e}")
+            return None
+        parts.append(recent)
+        series = _concat(parts, header.get("price_prefix"), header.get("price_suffix"))
+        return series.between(start, end) if start is not None or end is not None else series
+
+    def merge(self, appid: int, market_hash_name: str, currency: int, series: PriceSeries,
+              refreshed_at: Optional[float] = None) -> int:
+        """
+        Merge a freshly fetched history into the archive.
+
+        Fetched points newer than the last stored point are added, and the
+        points inside the mutable window are replaced by the fetched ones.
+        Stored points older than that are kept as they are, so hourly points
+        survive after Steam folds them into daily ones.
+
+        Args:
+            appid: App ID of the game
+            market_hash_name: Market hash name of the item
+            currency: Currency ID the history was fetched in
+            series: Full history as returned by pricehistory
+            refreshed_at: Time of the fetch (defaults to now)
+
+        Returns:
+            Number of points newer than the previously stored ones
+        """
+        path = self._path(appid, market_hash_name, currency)
+        with self._lock(path):
+            try:
+                header, recent = self._read_recent(path)
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning(f"Discarding unreadable recent points of {path}: {e}")
+                header, recent = {}, PriceSeries()
+            index = self._read_index(path)
+            recent = self._unsealed(recent, index)
+            sealed_end = int(index["last"][-1]) if len(index) else None
+            stored_end = int(recent.timestamps[-1]) if len(recent) else sealed_end
+
+            if len(series):
+                window_start = int(series.timestamps[-1]) - self.mutable_window
+                fetched = series.timestamps
+                if stored_end is None:
+                    keep = np.ones(len(series), dtype=bool)
+                    added = len(series)
+                else:
+                    keep = (fetched >= window_start) | (fetched > stored_end)
+                    added = int((fetched > stored_end).sum())
+                if sealed_end is not None:
+                    keep &= fetched > sealed_end
+                old = recent.between(end=window_start - 1)
+                unsealed = _concat([old, PriceSeries(series.timestamps[keep], series.prices[keep],
+                                                     series.volumes[keep])], None, None)
+            else:
+                window_start, added, unsealed = None, 0, recent
+
+            sealable = 0
+            if window_start is not None:
+                sealable = unsealed.index_range(end=window_start - 1)[1]
+            if sealable >= self.block_points:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._append_blocks(path, index, unsealed, sealable)
+                unsealed = PriceSeries(unsealed.timestamps[sealable:], unsealed.prices[sealable:],
+                                       unsealed.volumes[sealable:])
+
+            self._write_recent(path, {
+                "version": ARCHIVE_FORMAT_VERSION,
+                "appid": appid,
+                "market_hash_name": market_hash_name,
+                "currency": currency,
+                "price_prefix": series.price_prefix or header.get("price_prefix"),
+                "price_suffix": series.price_suffix or header.get("price_suffix"),
+                "refreshed_at": refreshed_at if refreshed_at is not None else time.time(),
+            }, unsealed)
+            return added
+
+    def _append_blocks(self, path: str, index: np.ndarray, series: PriceSeries, count: int) -> None:
+        offset = int(index["offset"][-1] + index["length"][-1]) if len(index) else 0
+        records = []
+        mode = "r+b" if os.path.exists(f"{path}.dat") else "wb"
+        with open(f"{path}.dat", mode) as f:
+            # Bytes past the last indexed block are from an interrupted append
+            f.seek(offset)
+            for lo in range(0, count, self.block_points):
+                hi = min(lo + self.block_points, count)
+                block = encode_block(PriceSeries(series.timestamps[lo:hi], series.prices[lo:hi],
+                                                 series.volumes[lo:hi]))
+                f.write(block)
+                records.append((series.timestamps[lo], series.timestamps[hi - 1], offset, len(block), hi - lo))
+                offset += len(block)
+            f.truncate()
+        # Index records are appended only after their blocks are written
+        with open(f"{path}.idx", "r+b" if os.path.exists(f"{path}.idx") else "wb") as f:
+            f.seek(len(index) * _INDEX_DTYPE.itemsize)
+            f.write(np.array(records, dtype=_INDEX_DTYPE).tobytes())
+            f.truncate()
+
+    @staticmethod
+    def _write_recent(path: str, header: Dict[str, Any], series: PriceSeries) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        encoded = json.dumps(header).encode("utf-8")
+        tmp_path = f"{path}.recent.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(RECENT_MAGIC)
+            f.write(struct.pack("<I", len(encoded)))
+            f.write(encoded)
+            f.write(encode_block(series))
+        os.replace(tmp_path, f"{path}.recent")
@@ -0,0 +1,203 @@
+"""
+Cross-currency market prices.
+
+The market stores every listing in the seller's currency and converts it
+with Steam's own exchange rates when displaying it, so an item's price in
+one currency is, up to rounding, its price in another times a rate that
+is the same for every item. A few items fetched in both currencies pin
+that rate down, and the rest of the currency's column can be estimated
+instead of requested.
+
+This module provides:
+- FXRate: an implied exchange rate with the number of items it rests on
+- PriceMatrix: per-cell cache of fetched prices (hundredths of the
+  currency, with fetch times), implied rates derived from items priced
+  in both currencies, and compact item x currency tables with the gaps
+  estimated through those rates
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from steam.currency import get_currency
+
+# Fetched cells kept across calls
+DEFAULT_MAX_CELLS = 50000
+
+# Implied rates older than this are derived again before use
+DEFAULT_FX_MAX_AGE = 6 * 3600
+
+
+@dataclass(frozen=True)
+class FXRate:
+    """Price in `currency` per unit of price in `base`."""
+    base: int
+    currency: int
+    rate: float
+    items: int
+    derived_at: float
+
+
+class PriceMatrix:
+    """
+    Fetched market prices by (appid, market_hash_name, currency).
+
+    Only fetched prices are stored; estimates are computed when a table
+    is built, from the latest implied rate, so they follow the rate.
+
+    Usage:
+        matrix = PriceMatrix()
+        matrix.record(730, "Recoil Case", 1, 31)
+        matrix.record(730, "Recoil Case", 3, 29)
+        matrix.derive_rate(730, ["Recoil Case"], 1, 3)
+        matrix.table(730, ["Recoil Case", "Kilowatt Case"], [1, 3])
+    """
+
+    def __init__(self, max_cells: int = DEFAULT_MAX_CELLS):
+        self.max_cells = max_cells
+        self._cells: "OrderedDict[Tuple[int, str, int], Tuple[int, float]]" = OrderedDict()
+        self._rates: Dict[Tuple[int, int], FXRate] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def record(self, appid: int, market_hash_name: str, currency: int, amount: int,
+               fetched_at: Optional[float] = None) -> None:
+        """Store a fetched price in hundredths of the currency."""
+        key = (appid, market_hash_name, currency)
+        with self._lock:
+            self._cells.pop(key, None)
+            self._cells[key] = (int(amount), time.time() if fetched_at is None else fetched_at)
+            while len(self._cells) > self.max_cells:
+                self._cells.popitem(last=False)
+
+    def cell(self, appid: int, market_hash_name: str, currency: int,
+             max_age: Optional[float] = None) -> Optional[Tuple[int, float]]:
+        """
+        Get a fetched price.
+
+        Returns:
+            (amount, fetched_at), or None if missing or older than max_age
+        """
+        cell = self._cells.get((appid, market_hash_name, currency))
+        if cell is None or (max_age is not None and time.time() - cell[1] > max_age):
+            return None
+        return cell
+
+    def rate(self, base: int, currency: int, max_age: Optional[float] = DEFAULT_FX_MAX_AGE) -> Optional[FXRate]:
+        """The implied rate from base to currency, if one is fresh enough."""
+        if base == currency:
+            return FXRate(base, currency, 1.0, 0, time.time())
+        rate = self._rates.get((base, currency))
+        if rate is None or (max_age is not None and time.time() - rate.derived_at > max_age):
+            return None
+        return rate
+
+    def derive_rate(self, appid: int, market_hash_names: Sequence[str], base: int, currency: int,
+                    max_age: Optional[float] = None) -> Optional[FXRate]:
+        """
+        Derive the implied rate from items fetched in both currencies.
+
+        The median of the per-item ratios is used, so an item whose lowest
+        listing moved between the two requests does not skew the rate.
+
+        Args:
+            appid: App ID of the items
+            market_hash_names: Items to take the ratios from
+            base: Currency the rate converts from
+            currency: Currency the rate converts to
+            max_age: Ignore prices older than this many seconds
+
+        Returns:
+            The new FXRate (also kept for rate()), or None without overlap
+        """
+        pairs = []
+        for name in market_hash_names:
+            base_cell = self.cell(appid, name, base, max_age)
+            cell = self.cell(appid, name, currency, max_age)
+            if base_cell and cell and base_cell[0] > 0:
+                pairs.append((base_cell[0], cell[0]))
+        if not pairs:
+            return None
+        ratios = np.array([amount / base_amount for base_amount, amount in pairs])
+        rate = FXRate(base, currency, float(np.median(ratios)), len(pairs), time.time())
+        with self._lock:
+            self._rates[(base, currency)] = rate
+            self._rates[(currency, base)] = FXRate(currency, base, 1 / rate.rate, rate.items, rate.derived_at)
+        return rate
+
+    def table(self, appid: int, market_hash_names: Sequence[str], currencies: Sequence[int],
+              base: Optional[int] = None, max_age: Optional[float] = None,
+              fx_max_age: Optional[float] = DEFAULT_FX_MAX_AGE) -> Dict[str, Any]:
+        """
+        Build a compact item x currency table.
+
+        Cells without a fetched price are estimated from the item's base
+        currency price and the implied rate, when both are known.
+
+        Args:
+            appid: App ID of the items
+            market_hash_names: Rows
+            currencies: Columns, as Steam currency IDs
+            base: Currency estimates convert from (defaults to the first column)
+            max_age: Treat fetched prices older than this as missing
+            fx_max_age: Ignore implied rates older than this
+
+        Returns:
+            {"items", "currencies", "prices", "ages", "estimated", "fx"}:
+            prices in hundredths, ages in seconds since the price (or the
+            base price it was estimated from) was fetched, estimated as 0/1
+        """
+        base = currencies[0] if base is None else base
+        now = time.time()
+        rates = {c: self.rate(base, c, fx_max_age) for c in currencies}
+        prices: List[List[Optional[int]]] = []
+        ages: List[List[Optional[int]]] = []
+        estimated: List[List[int]] = []
+        for name in market_hash_names:
+            base_cell = self.cell(appid, name, base, max_age)
+            row_prices, row_ages, row_estimated = [], [], []
+            for currency in currencies:
+                cell = self.cell(appid, name, currency, max_age)
+                rate = rates[currency]
+                if cell is not None:
+                    row_prices.append(cell[0])
+                    row_ages.append(int(now - cell[1]))
+                    row_estimated.append(0)
+                elif base_cell is not None and rate is not None:
+                    row_prices.append(_round_to_unit(base_cell[0] * rate.rate, currency))
+                    row_ages.append(int(now - base_cell[1]))
+                    row_estimated.append(1)
+                else:
+                    row_prices.append(None)
+                    row_ages.append(None)
+                    row_estimated.append(0)
+            prices.append(row_prices)
+            ages.append(row_ages)
+            estimated.append(row_estimated)
+
+        return {
+            "items": list(market_hash_names),
+            "currencies": [get_currency(c).code for c in currencies],
+            "prices": prices,
+            "ages": ages,
+            "estimated": estimated,
+            "fx": {
+                get_currency(c).code: {"rate": round(rate.rate, 6), "items": rate.items,
+                                       "age": int(now - rate.derived_at)}
+                for c, rate in rates.items() if rate is not None and c != base
+            },
+        }
+
+
+def _round_to_unit(amount: float, currency: int) -> int:
+    """Round an estimate to the smallest unit the market displays."""
+    if get_currency(currency).whole_units:
+        return int(round(amount / 100)) * 100
+    return int(round(amount))
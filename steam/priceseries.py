@@ -0,0 +1,370 @@
+"""
+Columnar market price histories.
+
+This module provides:
+- PriceSeries: a price history as NumPy columns (int64 Unix timestamps,
+  float64 median prices, int32 volumes) with O(log n) time-range slicing
+- PriceBars: OHLC bars with volume resampled from a series at 1h, 1d or 1w
+- lttb_indices: Largest-Triangle-Three-Buckets downsampling to a point budget
+- parse_dates: vectorized parser for Steam's "Nov 27 2013 01: +0" dates
+- format_dates: the inverse, for output in the pricehistory format
+
+Steam dates have a fixed layout, so parse_dates decodes them with array
+arithmetic over one buffer of ASCII codes instead of calling strptime per
+row. Rows that do not match the layout go through a cached scalar parser.
+"""
+
+import calendar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Bar widths accepted by PriceSeries.resample, in seconds
+INTERVALS = {"1h": 3600, "1d": 86400, "1w": 7 * 86400}
+
+# The Unix epoch was a Thursday; weekly bars start on Monday 00:00 UTC
+_WEEK_OFFSET = 3 * 86400
+
+# Month abbreviations packed as 3 bytes, sorted for searchsorted
+_MONTH_WEIGHTS = np.array([1 << 16, 1 << 8, 1], dtype=np.int64)
+_MONTH_CODES = np.array([[ord(c) for c in m] for m in _MONTHS], dtype=np.int64) @ _MONTH_WEIGHTS
+_MONTH_ORDER = np.argsort(_MONTH_CODES)
+_MONTH_SORTED = _MONTH_CODES[_MONTH_ORDER]
+
+# Layout of "Nov 27 2013 01: +0": digit columns, and the fixed characters
+_WIDTH = 18
+_DIGITS = [4, 5, 7, 8, 9, 10, 12, 13]
+_LITERAL_COLUMNS = [3, 6, 11, 14, 15, 16, 17]
+_LITERAL_CODES = np.frombuffer(b"   : +0", dtype=np.uint8)
+
+# Days from the epoch to January 1 of each supported year, and to the
+# first of each month (common and leap years)
+_FIRST_YEAR = 1970
+_YEAR_RANGE = range(_FIRST_YEAR, 2200)
+_LEAP = np.array([calendar.isleap(y) for y in _YEAR_RANGE], dtype=np.int64)
+_YEAR_DAYS = np.concatenate(([0], np.cumsum(365 + _LEAP[:-1])))
+_MONTH_DAYS = np.array([
+    np.concatenate(([0], np.cumsum([calendar.monthrange(year, m)[1] for m in range(1, 12)])))
+    for year in (2001, 2004)
+], dtype=np.int64)
+
+# Digit weights giving (day, year, hour) with one matrix product
+_DIGIT_WEIGHTS = np.array([
+    [10, 0, 0], [1, 0, 0],
+    [0, 1000, 0], [0, 100, 0], [0, 10, 0], [0, 1, 0],
+    [0, 0, 10], [0, 0, 1],
+], dtype=np.float64)
+
+
+@lru_cache(maxsize=65536)
+def _parse_date(value: str) -> int:
+    """Parse one Steam date the slow way; handles offsets other than +0."""
+    text, _, offset = value.rpartition(" ")
+    parsed = datetime.strptime(text, "%b %d %Y %H:")
+    return calendar.timegm(parsed.timetuple()) - int(offset or 0) * 3600
+
+
+@lru_cache(maxsize=65536)
+def _format_date(timestamp: int) -> str:
+    t = datetime.fromtimestamp(timestamp, timezone.utc)
+    return f"{_MONTHS[t.month - 1]} {t.day:02d} {t.year} {t.hour:02d}: +0"
+
+
+def parse_dates(dates: Sequence[str]) -> np.ndarray:
+    """
+    Parse Steam price history dates into Unix timestamps.
+
+    Args:
+        dates: Strings such as "Nov 27 2013 01: +0"
+
+    Returns:
+        int64 array of Unix timestamps (UTC)
+
+    Raises:
+        ValueError: If a date cannot be parsed
+    """
+    count = len(dates)
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Rows of the fixed layout are decoded together as one block of ASCII codes
+    timestamps = np.empty(count, dtype=np.int64)
+    rows = np.flatnonzero(np.fromiter(map(len, dates), dtype=np.int64, count=count) == _WIDTH)
+    fixed = dates if len(rows) == count else [dates[i] for i in rows]
+    try:
+        codes = np.frombuffer("".join(fixed).encode("ascii"), dtype=np.uint8).reshape(len(rows), _WIDTH)
+    except UnicodeEncodeError:
+        rows = rows[:0]
+        codes = np.empty((0, _WIDTH), dtype=np.uint8)
+
+    valid = (codes[:, _LITERAL_COLUMNS] == _LITERAL_CODES).all(axis=1)
+    digits = codes[:, _DIGITS].astype(np.float64) - ord("0")
+    valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+    # Small integers are exact in float64, and float matmul is much faster
+    day, year, hour = (digits @ _DIGIT_WEIGHTS).astype(np.int64).T
+
+    month_code = codes[:, :3].astype(np.int64) @ _MONTH_WEIGHTS
+    slot = np.minimum(np.searchsorted(_MONTH_SORTED, month_code), 11)
+    valid &= _MONTH_SORTED[slot] == month_code
+    month = _MONTH_ORDER[slot] + 1
+    valid &= (day >= 1) & (day <= 31) & (hour <= 23)
+
+    year_index = np.clip(year - _FIRST_YEAR, 0, len(_YEAR_DAYS) - 1)
+    valid &= year_index == year - _FIRST_YEAR
+    leap = _LEAP[year_index]
+    days = _YEAR_DAYS[year_index] + _MONTH_DAYS[leap, month - 1] + day - 1
+    timestamps[rows] = days * 86400 + hour * 3600
+
+    parsed = np.zeros(count, dtype=bool)
+    parsed[rows[valid]] = True
+    for i in np.flatnonzero(~parsed):
+        timestamps[i] = _parse_date(dates[i])
+    return timestamps
+
+
+def format_dates(timestamps: Sequence[int]) -> List[str]:
+    """Format Unix timestamps as Steam price history dates."""
+    return [_format_date(int(t)) for t in timestamps]
+
+
+def _volume(value: Any) -> int:
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    return int(value) if value else 0
+
+
+def _volumes(volumes: List[Any]) -> np.ndarray:
+    """Volumes as int32; Steam sends them as digit strings."""
+    try:
+        text = "".join(volumes)
+    except TypeError:
+        text = ""
+    if text.isascii() and text.isdigit():
+        # One C-level parse of the whole column; empty strings leave it short
+        parsed = np.fromstring(" ".join(volumes), dtype=np.int32, sep=" ")
+        if len(parsed) == len(volumes):
+            return parsed
+    return np.array([_volume(v) for v in volumes], dtype=np.int32)
+
+
+def _columns(prices: Sequence[Sequence[Any]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    dates = [row[0] for row in prices]
+    values = np.array([row[1] for row in prices], dtype=np.float64)
+    try:
+        volumes = [row[2] for row in prices]
+    except IndexError:
+        # Rows without a volume
+        volumes = [row[2] if len(row) > 2 else 0 for row in prices]
+    return dates, values, _volumes(volumes)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; the points between are split
+    into threshold - 2 buckets and each contributes the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average, which preserves spikes and dips that plain striding drops.
+
+    Args:
+        x: Sorted x values (e.g. timestamps)
+        y: y values
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted int64 indices; all indices if threshold >= len(x) or < 3
+    """
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    x = np.asarray(x, dtype=np.float64) - float(x[0])
+    y = np.asarray(y, dtype=np.float64)
+    # Bucket edges over the points between the first and the last
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.int64)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    sizes = edges[1:] - edges[:-1]
+    avg_x = (cum_x[edges[1:]] - cum_x[edges[:-1]]) / sizes
+    avg_y = (cum_y[edges[1:]] - cum_y[edges[:-1]]) / sizes
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x[bucket]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (avg_y[bucket] - ay))
+        a = lo + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+@dataclass
+class PriceBars:
+    """OHLC bars of a price series; timestamps are bar start times."""
+    timestamps: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    interval: str
+    price_prefix: Optional[str] = None
+    price_suffix: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def last(self, count: int) -> 'PriceBars':
+        """The most recent `count` bars."""
+        start = max(0, len(self) - count)
+        return PriceBars(self.timestamps[start:], self.open[start:], self.high[start:], self.low[start:],
+                         self.close[start:], self.volume[start:], self.interval,
+                         self.price_prefix, self.price_suffix)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary; bars are [start date, open, high, low, close, volume] rows."""
+        return {
+            "interval": self.interval,
+            "columns": ["date", "open", "high", "low", "close", "volume"],
+            "bars": [list(row) for row in zip(
+                format_dates(self.timestamps.tolist()), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist())],
+        }
+
+
+@dataclass
+class PriceSeries:
+    """
+    Price history of a market item as columns sorted by time.
+
+    Slices returned by between() are views of the same arrays.
+    """
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    prices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    volumes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    price_prefix: Optional[str] = None
+    price_suffix: Optional[str] = None
+
+    @classmethod
+    def from_prices(cls, prices: Sequence[Sequence[Any]], price_prefix: Optional[str] = None,
+                    price_suffix: Optional[str] = None) -> 'PriceSeries':
+        """
+        Create a series from the prices array of a pricehistory response.
+
+        Args:
+            prices: [date, median price, volume] rows
+            price_prefix: Currency prefix reported with the history
+            price_suffix: Currency suffix reported with the history
+
+        Returns:
+            PriceSeries sorted by timestamp
+
+        Raises:
+            ValueError: If a row cannot be parsed
+        """
+        if not prices:
+            return cls(price_prefix=price_prefix, price_suffix=price_suffix)
+        dates, values, volumes = _columns(prices)
+        timestamps = parse_dates(dates)
+        if len(timestamps) > 1 and (np.diff(timestamps) < 0).any():
+            order = np.argsort(timestamps, kind="stable")
+            timestamps, values, volumes = timestamps[order], values[order], volumes[order]
+        return cls(timestamps, values, volumes, price_prefix, price_suffix)
+
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> 'PriceSeries':
+        """Create a series from a pricehistory response body."""
+        return cls.from_prices(data.get("prices") or [], data.get("price_prefix"), data.get("price_suffix"))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def index_range(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Indices [lo, hi) of the points with start <= timestamp <= end (binary search)."""
+        lo = 0 if start is None else int(np.searchsorted(self.timestamps, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamps, end, side="right"))
+        return lo, max(lo, hi)
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> 'PriceSeries':
+        """
+        Points between two Unix times, inclusive.
+
+        Args:
+            start: Earliest timestamp (unbounded if None)
+            end: Latest timestamp (unbounded if None)
+
+        Returns:
+            PriceSeries sharing this series' arrays
+        """
+        lo, hi = self.index_range(start, end)
+        return PriceSeries(self.timestamps[lo:hi], self.prices[lo:hi], self.volumes[lo:hi],
+                           self.price_prefix, self.price_suffix)
+
+    def resample(self, interval: str) -> PriceBars:
+        """
+        Aggregate the series into OHLC bars.
+
+        Each point is a period median reported by Steam; a bar's open and
+        close are its first and last points, high and low their extremes,
+        and volume their sum.
+
+        Args:
+            interval: Bar width: "1h", "1d" or "1w" (weeks start on Monday, UTC)
+
+        Returns:
+            PriceBars with one bar per interval that has points
+
+        Raises:
+            ValueError: If the interval is not supported
+        """
+        width = INTERVALS.get(interval)
+        if width is None:
+            raise ValueError(f"Interval must be one of: {', '.join(INTERVALS)}")
+        if not len(self):
+            empty = np.empty(0, dtype=np.float64)
+            return PriceBars(np.empty(0, dtype=np.int64), empty, empty, empty, empty,
+                             np.empty(0, dtype=np.int64), interval, self.price_prefix, self.price_suffix)
+
+        offset = _WEEK_OFFSET if interval == "1w" else 0
+        buckets = (self.timestamps + offset) // width * width - offset
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+        ends = np.append(starts[1:], len(self)) - 1
+        return PriceBars(
+            timestamps=buckets[starts],
+            open=self.prices[starts],
+            high=np.maximum.reduceat(self.prices, starts),
+            low=np.minimum.reduceat(self.prices, starts),
+            close=self.prices[ends],
+            volume=np.add.reduceat(self.volumes.astype(np.int64), starts),
+            interval=interval,
+            price_prefix=self.price_prefix,
+            price_suffix=self.price_suffix,
+        )
+
+    def downsample(self, max_points: int) -> 'PriceSeries':
+        """
+        Reduce the series to at most max_points points with LTTB.
+
+        Kept points are original rows (volume included), chosen to preserve
+        the visual shape of the price curve.
+        """
+        if len(self) <= max_points:
+            return self
+        keep = lttb_indices(self.timestamps, self.prices, max_points)
+        return PriceSeries(self.timestamps[keep], self.prices[keep], self.volumes[keep],
+                           self.price_prefix, self.price_suffix)
+
+    def to_prices(self) -> List[List[Any]]:
+        """Rows in the pricehistory format: [date, median price, volume as text]."""
+        return [[date, price, str(volume)] for date, price, volume in
+                zip(format_dates(self.timestamps.tolist()), self.prices.tolist(), self.volumes.tolist())]
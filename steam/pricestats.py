@@ -0,0 +1,270 @@
+"""
+Vectorized indicators over market price histories.
+
+This module provides:
+- PriceMatrix / align: several PriceSeries resampled onto one time grid as
+  items x bars arrays (close forward-filled, volume and turnover summed)
+- rolling_mean, rolling_std, ema, vwap, drawdown, pct_change: indicators
+  along the last axis of 1-D or 2-D arrays, for every item at once
+- summarize: summary statistics per item, as returned by the
+  get_item_price_stats tool; each item's windows end at its own last bar,
+  so an item gets the same statistics alone and in any batch
+
+Windows are counted in bars of the matrix interval. Steam reports a median
+price per period, so VWAP is the volume-weighted mean of those medians.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from steam.priceseries import INTERVALS, PriceSeries, format_dates
+
+# EMA block length; each block is one matrix product
+_EMA_BLOCK = 64
+
+
+@dataclass
+class PriceMatrix:
+    """Price histories of several items on a shared grid of bars."""
+    timestamps: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    turnover: np.ndarray
+    points: np.ndarray
+    last: np.ndarray
+    interval: str
+
+    @property
+    def items(self) -> int:
+        return self.close.shape[0]
+
+
+def align(series: Sequence[PriceSeries], interval: str = "1d") -> PriceMatrix:
+    """
+    Resample several series onto one grid of bars.
+
+    Args:
+        series: Price series, one per item
+        interval: Bar width: "1h", "1d" or "1w"
+
+    Returns:
+        PriceMatrix with one row per series; close prices are carried
+        forward over bars without points and NaN before an item's first
+        point; `last` holds the column of each item's last bar (-1 if empty)
+
+    Raises:
+        ValueError: If the interval is not supported
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Interval must be one of: {', '.join(INTERVALS)}")
+    width = INTERVALS[interval]
+    bars = [s.resample(interval) for s in series]
+    starts = [b.timestamps[0] for b in bars if len(b)]
+    if not starts:
+        empty = np.empty((len(series), 0))
+        return PriceMatrix(np.empty(0, dtype=np.int64), empty, empty, empty,
+                           np.zeros(len(series), dtype=np.int64),
+                           np.full(len(series), -1, dtype=np.int64), interval)
+
+    first = min(starts)
+    last = max(b.timestamps[-1] for b in bars if len(b))
+    timestamps = np.arange(first, last + width, width, dtype=np.int64)
+    close = np.full((len(series), len(timestamps)), np.nan)
+    volume = np.zeros_like(close)
+    turnover = np.zeros_like(close)
+    last_columns = np.full(len(series), -1, dtype=np.int64)
+    for row, (s, b) in enumerate(zip(series, bars)):
+        if not len(b):
+            continue
+        columns = (b.timestamps - first) // width
+        last_columns[row] = columns[-1]
+        close[row, columns] = b.close
+        volume[row, columns] = b.volume
+        # Grid column of every point, through the bar it was resampled into
+        point_columns = columns[np.searchsorted(b.timestamps, s.timestamps, side="right") - 1]
+        turnover[row] = np.bincount(point_columns, weights=s.prices * s.volumes, minlength=len(timestamps))
+
+    # Forward-fill each row from its last bar with a price
+    filled = np.where(np.isnan(close), 0, np.arange(len(timestamps)))
+    np.maximum.accumulate(filled, axis=1, out=filled)
+    close = np.take_along_axis(close, filled, axis=1)
+    points = np.array([len(s) for s in series], dtype=np.int64)
+    return PriceMatrix(timestamps, close, volume, turnover, points, last_columns, interval)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over trailing windows; NaN where the window is incomplete or has NaN."""
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    out = np.full(values.shape, np.nan)
+    if window > values.shape[-1]:
+        return out
+    missing = np.isnan(values)
+    sums = np.cumsum(np.where(missing, 0.0, values), axis=-1)
+    gaps = np.cumsum(missing, axis=-1)
+    sums = np.concatenate((np.zeros(values.shape[:-1] + (1,)), sums), axis=-1)
+    gaps = np.concatenate((np.zeros(values.shape[:-1] + (1,), dtype=gaps.dtype), gaps), axis=-1)
+    window_sums = sums[..., window:] - sums[..., :-window]
+    window_gaps = gaps[..., window:] - gaps[..., :-window]
+    out[..., window - 1:] = np.where(window_gaps == 0, window_sums, np.nan)
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over trailing windows."""
+    return _rolling_sum(values, window) / window
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Population standard deviation over trailing windows."""
+    mean = rolling_mean(values, window)
+    mean_sq = rolling_mean(np.square(values), window)
+    return np.sqrt(np.maximum(mean_sq - np.square(mean), 0.0))
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (span + 1).
+
+    Starts at each row's first value; leading NaNs stay NaN and later NaNs
+    count as a repeat of the previous value. Rows are processed together in blocks: each
+    block is a product with a fixed decay matrix instead of a loop per bar.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    rows, length = values.shape
+    out = np.full(values.shape, np.nan)
+    if length == 0:
+        return out
+
+    missing = np.isnan(values)
+    has_value = ~missing.all(axis=-1)
+    first = np.argmax(~missing, axis=-1)
+    # Leading NaNs take the first value; later NaNs carry the last value
+    index = np.where(missing, 0, np.arange(length))
+    np.maximum.accumulate(index, axis=-1, out=index)
+    index = np.where(np.arange(length) < first[:, None], first[:, None], index)
+    filled = np.take_along_axis(values, index, axis=-1)
+
+    alpha = 2.0 / (span + 1)
+    steps = np.arange(_EMA_BLOCK)
+    lags = steps[:, None] - steps[None, :]
+    weights = np.where(lags >= 0, alpha * (1 - alpha) ** np.maximum(lags, 0), 0.0)
+    carry = (1 - alpha) ** (steps + 1)
+
+    out[:, 0] = filled[:, 0]
+    previous = filled[:, 0]
+    for start in range(1, length, _EMA_BLOCK):
+        block = filled[:, start:start + _EMA_BLOCK]
+        size = block.shape[1]
+        result = block @ weights[:size, :size].T + previous[:, None] * carry[None, :size]
+        out[:, start:start + size] = result
+        previous = result[:, -1]
+
+    out[np.arange(length) < first[:, None]] = np.nan
+    out[~has_value] = np.nan
+    return out
+
+
+def vwap(prices: np.ndarray, volumes: np.ndarray, window: int) -> np.ndarray:
+    """Volume-weighted average price over trailing windows (NaN without volume)."""
+    traded = _rolling_sum(np.asarray(prices, dtype=np.float64) * volumes, window)
+    total = _rolling_sum(volumes, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, traded / total, np.nan)
+
+
+def drawdown(values: np.ndarray) -> np.ndarray:
+    """Fractional decline from the running peak (0 at a new high, negative below it)."""
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    peak = np.fmax.accumulate(values, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return values / peak - 1.0
+
+
+def pct_change(values: np.ndarray, periods: int) -> np.ndarray:
+    """Percent change against the value `periods` bars earlier."""
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    out = np.full(values.shape, np.nan)
+    if periods < values.shape[-1]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[..., periods:] = (values[..., periods:] / values[..., :-periods] - 1.0) * 100.0
+    return out
+
+
+def _round(values: np.ndarray, digits: int = 4) -> List[Any]:
+    return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+
+def _trailing(values: np.ndarray, end: np.ndarray, window: int, fill: float) -> np.ndarray:
+    """The `window` columns of each row ending at column end[row]; columns before the grid read as fill."""
+    index = end[:, None] - np.arange(window - 1, -1, -1)
+    out = np.take_along_axis(values, np.maximum(index, 0), axis=1)
+    out[index < 0] = fill
+    return out
+
+
+def summarize(matrix: PriceMatrix, windows: Sequence[int] = (7, 30)) -> List[Dict[str, Any]]:
+    """
+    Summary statistics for every item of a matrix.
+
+    For each window w (in bars): change_w (percent), sma_w, ema_w, vwap_w
+    (turnover over volume of the history points in the window), volume_w,
+    high_w, low_w and volatility_w (standard deviation of log returns, in
+    percent). Also the number of history points, the last price, the
+    current drawdown from the all-time peak and the maximum drawdown, both
+    in percent.
+
+    Every statistic is taken at the item's own last bar, not the last bar
+    of the grid, so it does not depend on the other items in the matrix.
+    Only the last value of each rolling indicator is needed, so windowed
+    statistics are reduced over the trailing columns; EMA and drawdown scan
+    the whole history.
+
+    Args:
+        matrix: Aligned price histories
+        windows: Window lengths in bars
+
+    Returns:
+        One dict per item, in matrix row order
+    """
+    close = matrix.close
+    count = matrix.items
+    if close.shape[1] == 0:
+        return [{"points": 0} for _ in range(count)]
+
+    end = matrix.last
+    rows = np.arange(count)
+    at_end = np.maximum(end, 0)
+    empty = end < 0
+    dd = drawdown(close)
+    # fmin/fmax skip NaN and give NaN only when a row has no values at all;
+    # bars after an item's last one repeat its close, so they add no drawdown
+    max_dd = np.fmin.reduce(dd, axis=1)
+    columns: Dict[str, List[Any]] = {
+        "last_price": _round(np.where(empty, np.nan, close[rows, at_end])),
+        "drawdown": _round(np.where(empty, np.nan, dd[rows, at_end]) * 100.0, 2),
+        "max_drawdown": _round(max_dd * 100.0, 2),
+    }
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for window in windows:
+            recent = _trailing(close, end, window, np.nan)
+            traded = _trailing(matrix.volume, end, window, 0.0).sum(axis=1)
+            turnover = _trailing(matrix.turnover, end, window, 0.0).sum(axis=1)
+            span = _trailing(close, end, window + 1, np.nan)
+            volatility = np.diff(np.log(span), axis=1).std(axis=1)
+            columns[f"change_{window}"] = _round((span[:, -1] / span[:, 0] - 1.0) * 100.0, 2)
+            columns[f"sma_{window}"] = _round(recent.mean(axis=1))
+            columns[f"ema_{window}"] = _round(np.where(empty, np.nan, ema(close, window)[rows, at_end]))
+            columns[f"vwap_{window}"] = _round(np.where(traded > 0, turnover / traded, np.nan))
+            columns[f"volume_{window}"] = [int(v) for v in traded]
+            columns[f"high_{window}"] = _round(np.fmax.reduce(recent, axis=1))
+            columns[f"low_{window}"] = _round(np.fmin.reduce(recent, axis=1))
+            columns[f"volatility_{window}"] = _round(volatility * 100.0, 2)
+
+    last_bars = format_dates(matrix.timestamps[at_end])
+    return [
+        {"points": int(matrix.points[row]), "last_bar": None if empty[row] else last_bars[row],
+         **{name: values[row] for name, values in columns.items()}}
+        for row in range(count)
+    ]
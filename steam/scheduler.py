@@ -0,0 +1,236 @@
+"""
+Request scheduling for Steam Community Market endpoints.
+
+The market allows only a handful of requests per minute per IP and
+answers bursts with 429 responses that lock the caller out for a while.
+Firing requests as they come wastes that budget on retries, so market
+batches go through one shared queue instead.
+
+This module provides:
+- MarketScheduler: a priority queue drained by a single worker thread at
+  a token-bucket pace; a 429 puts the whole queue into a cooldown
+  (Retry-After, or an exponentially growing default) and the request is
+  queued again; reports pending work and an ETA for draining it
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from steam.client import APIResponse, RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Sustained market request rate; Steam tolerates roughly 20 per minute
+DEFAULT_MARKET_RATE = 20 / 60
+
+# Cooldown after a 429 without Retry-After; doubles on consecutive 429s
+DEFAULT_COOLDOWN = 30.0
+MAX_COOLDOWN = 600.0
+
+# Attempts per request before its 429 response is returned
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds the worker thread idles on an empty queue before exiting
+_IDLE_TIMEOUT = 5.0
+
+
+def _rate_limited(response: Any) -> bool:
+    """Whether a response is a 429."""
+    return (isinstance(response, APIResponse) and not response.ok
+            and (response.error or {}).get("status_code") == 429)
+
+
+def _retry_after(response: APIResponse) -> Optional[float]:
+    """The Retry-After of a 429 response, if Steam sent one."""
+    retry_after = (response.rate_limit_hint or {}).get("retry_after")
+    return float(retry_after) if retry_after else None
+
+
+@dataclass(order=True)
+class _Job:
+    """A queued request; ordered by priority, then submission order."""
+    priority: int
+    sequence: int
+    key: Hashable = field(compare=False)
+    fn: Callable[[], APIResponse] = field(compare=False)
+    future: Future = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class MarketScheduler:
+    """
+    Shared queue pacing market requests and backing off on 429s.
+
+    Jobs are callables returning an APIResponse. They run one at a time,
+    lowest priority value first, at most `rate` per second. A job that
+    returns a 429 pauses the whole queue for the cooldown and is queued
+    again at its original position, up to max_attempts times.
+
+    Usage:
+        scheduler = MarketScheduler()
+        future = scheduler.submit(lambda: market.get_item_price_overview(730, "Recoil Case"))
+        future.result()
+        scheduler.eta()
+    """
+
+    def __init__(self, rate: float = DEFAULT_MARKET_RATE, cooldown: float = DEFAULT_COOLDOWN,
+                 max_cooldown: float = MAX_COOLDOWN, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Sustained requests per second
+            cooldown: Pause after a 429 without Retry-After, in seconds
+            max_cooldown: Upper bound of the doubling cooldown
+            max_attempts: Attempts per job before its 429 is returned
+        """
+        self.rate = rate
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_attempts = max_attempts
+        self._limiter = RateLimiter(rate, burst=1)
+        self._queue: List[_Job] = []
+        self._jobs: Dict[Hashable, _Job] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
+        self._paused_until = 0.0
+        self._strikes = 0
+        self.completed = 0
+        self.rate_limited = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        with self._condition:
+            return len(self._queue) + (1 if self._running else 0)
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Seconds left in the current 429 cooldown."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def eta(self, jobs: Optional[int] = None) -> float:
+        """
+        Estimate the seconds until jobs finish at the current pace.
+
+        Args:
+            jobs: Number of jobs to account for (defaults to all pending)
+
+        Returns:
+            Remaining cooldown plus the time to issue that many requests
+        """
+        if jobs is None:
+            jobs = self.pending
+        return round(self.cooldown_remaining + jobs / self.rate, 1) if jobs else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue state for progress reporting."""
+        return {
+            "pending": self.pending,
+            "completed": self.completed,
+            "rate_limited": self.rate_limited,
+            "cooldown_remaining": round(self.cooldown_remaining, 1),
+            "eta_seconds": self.eta(),
+        }
+
+    def submit(self, fn: Callable[[], APIResponse], priority: int = 0,
+               key: Optional[Hashable] = None) -> Future:
+        """
+        Queue a request.
+
+        Args:
+            fn: Callable making the request
+            priority: Lower values run first
+            key: Identifies the request; a job already queued under the same
+                key is reused instead of queuing it again
+
+        Returns:
+            Future resolving to the job's APIResponse
+        """
+        with self._condition:
+            if key is not None and key in self._jobs:
+                job = self._jobs[key]
+                if priority < job.priority and job in self._queue:
+                    # Move the queued job forward
+                    job.priority = priority
+                    heapq.heapify(self._queue)
+                return job.future
+
+            job = _Job(priority, next(self._sequence), key, fn, Future())
+            if key is not None:
+                self._jobs[key] = job
+            heapq.heappush(self._queue, job)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, name="market-scheduler", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+            return job.future
+
+    def _next_job(self) -> Optional[_Job]:
+        """Wait for a job whose turn has come; None once idle."""
+        with self._condition:
+            while True:
+                if not self._queue:
+                    if not self._condition.wait(_IDLE_TIMEOUT) and not self._queue:
+                        self._worker = None
+                        return None
+                    continue
+                paused = self._paused_until - time.monotonic()
+                if paused > 0:
+                    self._condition.wait(paused)
+                    continue
+                job = heapq.heappop(self._queue)
+                # A job queued again after a 429 is already running
+                if job.attempts == 0 and not job.future.set_running_or_notify_cancel():
+                    self._forget(job)
+                    continue
+                self._running = True
+                return job
+
+    def _forget(self, job: _Job) -> None:
+        if job.key is not None and self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+
+    def _drain(self) -> None:
+        """Worker loop."""
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self._limiter.acquire()
+            job.attempts += 1
+            try:
+                response = job.fn()
+            except Exception as e:
+                with self._condition:
+                    self._running = False
+                    self._forget(job)
+                job.future.set_exception(e)
+                continue
+
+            with self._condition:
+                self._running = False
+                if _rate_limited(response):
+                    self.rate_limited += 1
+                    self._strikes += 1
+                    delay = _retry_after(response) or self.cooldown * 2 ** (self._strikes - 1)
+                    delay = min(delay, self.max_cooldown)
+                    self._paused_until = time.monotonic() + delay
+                    logger.warning(f"Market rate limited; pausing {len(self._queue) + 1} requests for {delay:.0f}s")
+                    if job.attempts < self.max_attempts:
+                        # Back in the queue at its original position
+                        heapq.heappush(self._queue, job)
+                        continue
+                else:
+                    self._strikes = 0
+                self.completed += 1
+                self._forget(job)
+            job.future.set_result(response)
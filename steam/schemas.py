@@ -2,14 +2,103 @@
 Data schemas and models for Steam API responses.
 
 This module provides:
-- Dataclasses for normalized API responses
+- Dataclasses for normalized API responses; record types that come in
+  long lists (games, friends, achievements, news, market items, price
+  points) use __slots__ to keep per-instance memory small
 - Type hints for common Steam data structures
 - Validation utilities
+- Field projection (select_fields / project) for callers that only need
+  part of a record
 """
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields as dataclass_fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from steam.currency import detect_currency, parse_count, parse_price, parse_prices
+
+if TYPE_CHECKING:
+    from steam.priceseries import PriceSeries
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(f.name for f in dataclass_fields(cls)))
+
+
+def select_fields(cls: type, fields: Optional[Union[str, Iterable[str]]],
+                  always: Sequence[str] = ()) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a field projection for a schema dataclass.
+    
+    Args:
+        cls: Schema dataclass the fields belong to
+        fields: Field names, as a list or a comma-separated string; None or
+            empty selects every field
+        always: Fields included in every projection (e.g. identifiers)
+        
+    Returns:
+        Selected field names in declaration order, or None for all fields
+        
+    Raises:
+        ValueError: If a name is not a field of the schema
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    requested = {name.strip() for name in fields or () if name and name.strip()}
+    if not requested:
+        return None
+    names = _field_names(cls)
+    unknown = requested.difference(names)
+    if unknown:
+        raise ValueError(f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}. "
+                         f"Available: {', '.join(names)}")
+    requested.update(always)
+    return tuple(name for name in names if name in requested)
+
+
+@lru_cache(maxsize=None)
+def record_defaults(cls: type) -> Dict[str, Any]:
+    """
+    Values a schema gives keys missing from a record.
+    
+    Taken from cls.from_record({}).to_dict() when the schema has
+    from_record(), otherwise from the dataclass field defaults (None for
+    fields without one).
+    """
+    if hasattr(cls, "from_record"):
+        return cls.from_record({}).to_dict()
+    defaults = {}
+    for f in dataclass_fields(cls):
+        if f.default is not MISSING:
+            defaults[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            defaults[f.name] = f.default_factory()
+        else:
+            defaults[f.name] = None
+    return defaults
+
+
+def project(record: Dict[str, Any], fields: Sequence[str], schema: Optional[type] = None,
+            **known: Any) -> Dict[str, Any]:
+    """
+    Pick fields straight from a decoded API record without building the schema object.
+    
+    Args:
+        record: One decoded record (e.g. an element of response.games)
+        fields: Names returned by select_fields
+        schema: Schema dataclass whose defaults fill missing keys, so a
+            projection returns the same values as the full view
+        **known: Values not taken from the record (e.g. appid=570)
+        
+    Returns:
+        Dict with exactly the selected fields; missing ones take the
+        schema's defaults (None without a schema)
+    """
+    defaults = record_defaults(schema) if schema is not None else {}
+    return {name: known[name] if name in known else record.get(name, defaults.get(name))
+            for name in fields}
 
 
 @dataclass
@@ -18,11 +107,26 @@ class SteamID:
     steamid: str
     
     @classmethod
-    def validate(cls, steamid: str) -> 'SteamID':
-        """Validate and create a SteamID instance."""
+    def validate(cls, steamid: str, resolver: Optional[Any] = None) -> 'SteamID':
+        """
+        Validate and create a SteamID instance.
+        
+        Args:
+            steamid: Steam ID to validate
+            resolver: Optional object with a resolve(value) -> Optional[str]
+                method (such as steam.steamid.SteamIDResolver). When given,
+                vanity names, profile URLs, STEAM_X:Y:Z and [U:1:n] forms are
+                normalized to a SteamID64.
+        """
         if not steamid or not isinstance(steamid, str):
             raise ValueError("Steam ID must be a non-empty string")
         
+        if resolver is not None:
+            resolved = resolver.resolve(steamid)
+            if not resolved:
+                raise ValueError(f"Could not resolve Steam ID: {steamid}")
+            return cls(steamid=resolved)
+        
         # Basic validation: usually 17 digits
         if len(steamid) != 17 or not steamid.isdigit():
             # Allow non-standard formats but warn
@@ -37,12 +141,26 @@ class AppID:
     appid: int
     
     @classmethod
-    def validate(cls, appid: Union[str, int]) -> 'AppID':
-        """Validate and create an AppID instance."""
+    def validate(cls, appid: Union[str, int], resolver: Optional[Any] = None) -> 'AppID':
+        """
+        Validate and create an AppID instance.
+        
+        Args:
+            appid: App ID to validate
+            resolver: Optional object with a resolve(value) -> Optional[int]
+                method (such as steam.appsearch.AppSearchIndex). When given,
+                non-numeric strings are treated as game names and resolved.
+        """
         if isinstance(appid, str):
             if not appid.isdigit():
-                raise ValueError("App ID must be a numeric string")
-            appid = int(appid)
+                if resolver is None:
+                    raise ValueError("App ID must be a numeric string")
+                resolved = resolver.resolve(appid)
+                if resolved is None:
+                    raise ValueError(f"Could not resolve app name: {appid}")
+                appid = resolved
+            else:
+                appid = int(appid)
         
         if not isinstance(appid, int) or appid <= 0:
             raise ValueError("App ID must be a positive integer")
@@ -142,7 +260,7 @@ class SteamProfile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Friend:
     """Represents a Steam friend relationship."""
     steamid: str
@@ -153,17 +271,27 @@ class Friend:
     def from_api_response(cls, data: Dict[str, Any]) -> List['Friend']:
         """Create Friend list from Steam API response."""
         friends_list = data.get("friendslist", {}).get("friends", [])
-        return [
-            cls(
-                steamid=f.get("steamid", ""),
-                relationship=f.get("relationship", ""),
-                friend_since=f.get("friend_since", 0)
-            )
-            for f in friends_list
-        ]
+        return [cls.from_record(f) for f in friends_list]
+    
+    @classmethod
+    def from_record(cls, f: Dict[str, Any]) -> 'Friend':
+        """Create a Friend from one element of the friends array."""
+        return cls(
+            steamid=f.get("steamid", ""),
+            relationship=f.get("relationship", ""),
+            friend_since=f.get("friend_since", 0)
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "steamid": self.steamid,
+            "relationship": self.relationship,
+            "friend_since": self.friend_since,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Represents a Steam game."""
     appid: int
@@ -179,22 +307,37 @@ class Game:
     def from_api_response(cls, data: Dict[str, Any]) -> List['Game']:
         """Create Game list from Steam API response."""
         games = data.get("response", {}).get("games", [])
-        return [
-            cls(
-                appid=g.get("appid", 0),
-                name=g.get("name", ""),
-                playtime_forever=g.get("playtime_forever", 0),
-                img_icon_url=g.get("img_icon_url"),
-                img_logo_url=g.get("img_logo_url"),
-                has_community_visible_stats=g.get("has_community_visible_stats", False),
-                playtime_windows_forever=g.get("playtime_windows_forever"),
-                playtime_2weeks=g.get("playtime_2weeks"),
-            )
-            for g in games
-        ]
+        return [cls.from_record(g) for g in games]
+    
+    @classmethod
+    def from_record(cls, g: Dict[str, Any]) -> 'Game':
+        """Create a Game from one element of the games array."""
+        return cls(
+            appid=g.get("appid", 0),
+            name=g.get("name", ""),
+            playtime_forever=g.get("playtime_forever", 0),
+            img_icon_url=g.get("img_icon_url"),
+            img_logo_url=g.get("img_logo_url"),
+            has_community_visible_stats=g.get("has_community_visible_stats", False),
+            playtime_windows_forever=g.get("playtime_windows_forever"),
+            playtime_2weeks=g.get("playtime_2weeks"),
+        )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "appid": self.appid,
+            "name": self.name,
+            "playtime_forever": self.playtime_forever,
+            "img_icon_url": self.img_icon_url,
+            "img_logo_url": self.img_logo_url,
+            "has_community_visible_stats": self.has_community_visible_stats,
+            "playtime_windows_forever": self.playtime_windows_forever,
+            "playtime_2weeks": self.playtime_2weeks,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Achievement:
     """Represents a Steam achievement."""
     apiname: str
@@ -207,19 +350,141 @@ class Achievement:
     def from_api_response(cls, data: Dict[str, Any]) -> List['Achievement']:
         """Create Achievement list from Steam API response."""
         achievements = data.get("playerstats", {}).get("achievements", [])
-        return [
-            cls(
-                apiname=a.get("apiname", ""),
-                achieved=a.get("achieved", False),
-                unlocktime=a.get("unlocktime"),
-                name=a.get("name"),
-                description=a.get("description"),
-            )
-            for a in achievements
-        ]
+        return [cls.from_record(a) for a in achievements]
+    
+    @classmethod
+    def from_record(cls, a: Dict[str, Any]) -> 'Achievement':
+        """Create an Achievement from one element of the achievements array."""
+        return cls(
+            apiname=a.get("apiname", ""),
+            achieved=a.get("achieved", False),
+            unlocktime=a.get("unlocktime"),
+            name=a.get("name"),
+            description=a.get("description"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "apiname": self.apiname,
+            "achieved": self.achieved,
+            "unlocktime": self.unlocktime,
+            "name": self.name,
+            "description": self.description,
+        }
+
+
+@dataclass
+class AchievementRarity:
+    """An achievement joined with its schema entry and global unlock rate."""
+    apiname: str
+    achieved: bool
+    unlocktime: Optional[int] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    hidden: bool = False
+    percent: Optional[float] = None
+    
+    @classmethod
+    def join(cls, player_data: Dict[str, Any], schema_data: Dict[str, Any],
+             percentages_data: Dict[str, Any]) -> List['AchievementRarity']:
+        """
+        Join player achievements, game schema and global percentages on apiname.
+        
+        Args:
+            player_data: GetPlayerAchievements response
+            schema_data: GetSchemaForGame response
+            percentages_data: GetGlobalAchievementPercentagesForApp response
+            
+        Returns:
+            AchievementRarity list sorted from rarest to most common
+            (achievements without a known percentage come last)
+        """
+        schema = {
+            a.get("name"): a
+            for a in schema_data.get("game", {}).get("availableGameStats", {}).get("achievements", [])
+        }
+        percents = {}
+        for p in percentages_data.get("achievementpercentages", {}).get("achievements", []):
+            try:
+                percents[p.get("name")] = float(p.get("percent"))
+            except (TypeError, ValueError):
+                continue
+        
+        records = []
+        for a in player_data.get("playerstats", {}).get("achievements", []):
+            apiname = a.get("apiname", "")
+            entry = schema.get(apiname, {})
+            achieved = bool(a.get("achieved", False))
+            records.append(cls(
+                apiname=apiname,
+                achieved=achieved,
+                unlocktime=(a.get("unlocktime") or None) if achieved else None,
+                name=entry.get("displayName") or a.get("name"),
+                description=entry.get("description") or a.get("description"),
+                hidden=bool(entry.get("hidden", 0)),
+                percent=percents.get(apiname),
+            ))
+        
+        records.sort(key=lambda r: (r.percent is None, r.percent or 0.0, r.apiname))
+        return records
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "apiname": self.apiname,
+            "name": self.name,
+            "description": self.description,
+            "hidden": self.hidden,
+            "achieved": self.achieved,
+            "unlocktime": self.unlocktime,
+            "percent": self.percent,
+        }
 
 
 @dataclass
+class GameCompletion:
+    """Achievement completion of a single game in a user's library."""
+    appid: int
+    name: Optional[str] = None
+    unlocked: int = 0
+    total: int = 0
+    playtime_forever: int = 0
+    last_unlock: Optional[int] = None
+    
+    @property
+    def percent(self) -> float:
+        """Completion percentage (0.0 for games without achievements)."""
+        return round(self.unlocked / self.total * 100, 2) if self.total else 0.0
+    
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any], game: Dict[str, Any]) -> 'GameCompletion':
+        """Create GameCompletion from a GetPlayerAchievements response and owned-game entry."""
+        achievements = data.get("playerstats", {}).get("achievements", [])
+        unlock_times = [a.get("unlocktime", 0) for a in achievements if a.get("achieved")]
+        return cls(
+            appid=game.get("appid", 0),
+            name=game.get("name") or data.get("playerstats", {}).get("gameName"),
+            unlocked=len(unlock_times),
+            total=len(achievements),
+            playtime_forever=game.get("playtime_forever", 0),
+            last_unlock=max(unlock_times) if unlock_times else None,
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "appid": self.appid,
+            "name": self.name,
+            "unlocked": self.unlocked,
+            "total": self.total,
+            "percent": self.percent,
+            "playtime_forever": self.playtime_forever,
+            "last_unlock": self.last_unlock,
+        }
+
+
+@dataclass(slots=True)
 class GameNews:
     """Represents a Steam game news item."""
     gid: str
@@ -238,22 +503,40 @@ class GameNews:
     def from_api_response(cls, data: Dict[str, Any]) -> List['GameNews']:
         """Create GameNews list from Steam API response."""
         news_items = data.get("appnews", {}).get("newsitems", [])
-        return [
-            cls(
-                gid=n.get("gid", ""),
-                title=n.get("title", ""),
-                url=n.get("url", ""),
-                is_external_url=n.get("is_external_url", False),
-                author=n.get("author", ""),
-                contents=n.get("contents", ""),
-                feedlabel=n.get("feedlabel", ""),
-                date=n.get("date", 0),
-                feedname=n.get("feedname", ""),
-                feed_type=n.get("feed_type", 0),
-                appid=n.get("appid"),
-            )
-            for n in news_items
-        ]
+        return [cls.from_record(n) for n in news_items]
+    
+    @classmethod
+    def from_record(cls, n: Dict[str, Any]) -> 'GameNews':
+        """Create a GameNews from one element of the newsitems array."""
+        return cls(
+            gid=n.get("gid", ""),
+            title=n.get("title", ""),
+            url=n.get("url", ""),
+            is_external_url=n.get("is_external_url", False),
+            author=n.get("author", ""),
+            contents=n.get("contents", ""),
+            feedlabel=n.get("feedlabel", ""),
+            date=n.get("date", 0),
+            feedname=n.get("feedname", ""),
+            feed_type=n.get("feed_type", 0),
+            appid=n.get("appid"),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "gid": self.gid,
+            "title": self.title,
+            "url": self.url,
+            "is_external_url": self.is_external_url,
+            "author": self.author,
+            "contents": self.contents,
+            "feedlabel": self.feedlabel,
+            "date": self.date,
+            "feedname": self.feedname,
+            "feed_type": self.feed_type,
+            "appid": self.appid,
+        }
 
 
 @dataclass
@@ -324,6 +607,14 @@ class AppDetails:
             movies=app_info.get("movies"),
         )
     
+    @classmethod
+    def project_response(cls, data: Dict[str, Any], appid: int, fields: Sequence[str]) -> Dict[str, Any]:
+        """Extract only the selected fields from a Steam Store API response."""
+        app_data = data.get(str(appid), {})
+        if not app_data.get("success", False):
+            raise ValueError(f"Failed to get app details for appid {appid}")
+        return project(app_data.get("data") or {}, fields, cls, appid=appid)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -358,11 +649,17 @@ class AppDetails:
 
 @dataclass
 class PlayerCount:
-    """Represents current player count for a game."""
+    """
+    Represents current player count for a game.
+    
+    GetNumberOfCurrentPlayers only returns the current count; the peak
+    fields are filled from locally sampled history (steam.players) when
+    the app is tracked and are None otherwise.
+    """
     appid: int
     current_players: int
-    current_24h_peak: int
-    current_all_time_peak: int
+    current_24h_peak: Optional[int] = None
+    current_all_time_peak: Optional[int] = None
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any], appid: int) -> 'PlayerCount':
@@ -371,9 +668,16 @@ class PlayerCount:
         return cls(
             appid=appid,
             current_players=response.get("player_count", 0),
-            current_24h_peak=response.get("result_cache", {}).get("24hour", {}).get("peak", 0),
-            current_all_time_peak=response.get("result_cache", {}).get("alltime", {}).get("peak", 0),
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "appid": self.appid,
+            "current_players": self.current_players,
+            "current_24h_peak": self.current_24h_peak,
+            "current_all_time_peak": self.current_all_time_peak,
+        }
 
 
 @dataclass
@@ -396,9 +700,14 @@ class UserStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketItem:
-    """Represents a Steam Community Market item."""
+    """
+    Represents a Steam Community Market item.
+    
+    sell_price_minor is sell_price_text parsed into hundredths of its
+    currency; currency is the Steam currency ID, when the text identifies it.
+    """
     name: str
     hash_name: str
     sell_price: Optional[float] = None
@@ -407,43 +716,125 @@ class MarketItem:
     type: Optional[str] = None
     market_name: Optional[str] = None
     appid: Optional[int] = None
+    sell_price_minor: Optional[int] = None
+    currency: Optional[int] = None
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> List['MarketItem']:
         """Create MarketItem list from Steam Market API response."""
         results = data.get("results", [])
-        return [
-            cls(
-                name=r.get("name", ""),
-                hash_name=r.get("hash_name", ""),
-                sell_price=r.get("sell_price"),
-                sell_price_text=r.get("sell_price_text"),
-                app_name=r.get("app_name"),
-                type=r.get("type"),
-                market_name=r.get("market_name"),
-                appid=r.get("appid"),
-            )
-            for r in results
-        ]
+        return [cls.from_record(r) for r in results]
+    
+    @classmethod
+    def from_record(cls, r: Dict[str, Any]) -> 'MarketItem':
+        """
+        Create a MarketItem from one element of the results array.
+        
+        Parsed prices already on the record (see parse_record_prices) are
+        used as they are.
+        """
+        text = r.get("sell_price_text")
+        currency = r["currency"] if "currency" in r else detect_currency(text)
+        return cls(
+            name=r.get("name", ""),
+            hash_name=r.get("hash_name", ""),
+            sell_price=r.get("sell_price"),
+            sell_price_text=text,
+            app_name=r.get("app_name"),
+            type=r.get("type"),
+            market_name=r.get("market_name"),
+            appid=r.get("appid"),
+            sell_price_minor=r["sell_price_minor"] if "sell_price_minor" in r else parse_price(text, currency),
+            currency=currency,
+        )
+    
+    @staticmethod
+    def parse_record_prices(records: Any) -> Any:
+        """
+        Add sell_price_minor and currency to raw results in place.
+        
+        One result list comes in one currency, so it is detected once and
+        every text goes through the same cached parser.
+        """
+        if not isinstance(records, list):
+            return records
+        texts = [r.get("sell_price_text") if isinstance(r, dict) else None for r in records]
+        currency = detect_currency(next((t for t in texts if t), None))
+        for record, amount in zip(records, parse_prices(texts, currency)):
+            if isinstance(record, dict):
+                record["sell_price_minor"] = amount
+                record["currency"] = currency if amount is not None else None
+        return records
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "hash_name": self.hash_name,
+            "sell_price": self.sell_price,
+            "sell_price_text": self.sell_price_text,
+            "app_name": self.app_name,
+            "type": self.type,
+            "market_name": self.market_name,
+            "appid": self.appid,
+            "sell_price_minor": self.sell_price_minor,
+            "currency": self.currency,
+        }
 
 
 @dataclass
 class PriceOverview:
-    """Represents price overview for a market item."""
+    """
+    Represents price overview for a market item.
+    
+    The *_minor fields are the localized price strings parsed into
+    hundredths of the currency; volume_count is the parsed volume.
+    """
     success: bool
     lowest_price: Optional[str] = None
     median_price: Optional[str] = None
     volume: Optional[str] = None
+    currency: Optional[int] = None
+    lowest_price_minor: Optional[int] = None
+    median_price_minor: Optional[int] = None
+    volume_count: Optional[int] = None
     
     @classmethod
-    def from_api_response(cls, data: Dict[str, Any]) -> 'PriceOverview':
-        """Create PriceOverview from Steam Market API response."""
+    def from_api_response(cls, data: Dict[str, Any], currency: Optional[int] = None) -> 'PriceOverview':
+        """
+        Create PriceOverview from Steam Market API response.
+        
+        Args:
+            data: Response body
+            currency: Steam currency ID the prices were requested in
+                (detected from the price strings if None)
+        """
+        lowest, median = data.get("lowest_price"), data.get("median_price")
+        if currency is None:
+            currency = detect_currency(lowest or median)
         return cls(
             success=data.get("success", False),
-            lowest_price=data.get("lowest_price"),
-            median_price=data.get("median_price"),
+            lowest_price=lowest,
+            median_price=median,
             volume=data.get("volume"),
+            currency=currency,
+            lowest_price_minor=parse_price(lowest, currency),
+            median_price_minor=parse_price(median, currency),
+            volume_count=parse_count(data.get("volume")),
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "success": self.success,
+            "lowest_price": self.lowest_price,
+            "median_price": self.median_price,
+            "volume": self.volume,
+            "currency": self.currency,
+            "lowest_price_minor": self.lowest_price_minor,
+            "median_price_minor": self.median_price_minor,
+            "volume_count": self.volume_count,
+        }
 
 
 @dataclass
@@ -463,3 +854,42 @@ class PriceHistory:
             price_suffix=data.get("price_suffix"),
             prices=data.get("prices", []),
         )
+    
+    def to_series(self) -> 'PriceSeries':
+        """Parse the prices into a columnar PriceSeries (requires NumPy)."""
+        from steam.priceseries import PriceSeries
+        return PriceSeries.from_prices(self.prices, self.price_prefix, self.price_suffix)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "success": self.success,
+            "price_prefix": self.price_prefix,
+            "price_suffix": self.price_suffix,
+            "prices": self.prices,
+        }
+
+
+@dataclass(slots=True)
+class PricePoint:
+    """Represents one [date, median price, volume] entry of a price history."""
+    date: str
+    price: float
+    volume: int
+    
+    @classmethod
+    def from_record(cls, record: List[Any]) -> 'PricePoint':
+        """Create a PricePoint from one element of the prices array."""
+        return cls(
+            date=record[0],
+            price=float(record[1]),
+            volume=int(record[2]) if len(record) > 2 and record[2] else 0,
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "date": self.date,
+            "price": self.price,
+            "volume": self.volume,
+        }
@@ -0,0 +1,184 @@
+"""
+Steam ID parsing and cached vanity URL resolution.
+
+This module provides:
+- Conversion of STEAM_X:Y:Z, [U:1:n] and profile URLs to SteamID64
+- SteamIDResolver: a long-TTL vanity name -> SteamID64 index with
+  negative entries and a concurrent bulk resolver for mixed inputs
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from steam.cache import TTLCache, vanity_cache
+from steam.client import APIResponse, SteamClient
+
+logger = logging.getLogger(__name__)
+
+# SteamID64 of account ID 0 in the public universe for individual accounts
+STEAMID64_BASE = 76561197960265728
+
+# How long to remember that a vanity name does not exist
+NEGATIVE_TTL = 86400
+
+_STEAMID64_RE = re.compile(r"^\d{17}$")
+_STEAM2_RE = re.compile(r"^STEAM_[0-5]:([01]):(\d+)$", re.IGNORECASE)
+_STEAM3_RE = re.compile(r"^\[?U:1:(\d+)\]?$", re.IGNORECASE)
+_PROFILE_URL_RE = re.compile(
+    r"^(?:https?://)?(?:www\.)?steamcommunity\.com/(profiles|id)/([^/?#]+)", re.IGNORECASE
+)
+_VANITY_RE = re.compile(r"^[A-Za-z0-9_-]{2,32}$")
+
+
+def parse_steam_id(value: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse a Steam identifier without any network access.
+
+    Args:
+        value: SteamID64, STEAM_X:Y:Z, [U:1:n], profile URL or vanity name
+
+    Returns:
+        Tuple of (steamid64, vanity_name); exactly one is set for valid
+        input, both are None when the value cannot be a Steam identifier
+    """
+    value = (value or "").strip()
+    if not value:
+        return None, None
+
+    url_match = _PROFILE_URL_RE.match(value)
+    if url_match:
+        kind, ident = url_match.groups()
+        if kind.lower() == "id":
+            return (None, ident) if _VANITY_RE.match(ident) else (None, None)
+        value = ident
+
+    if _STEAMID64_RE.match(value):
+        return value, None
+
+    steam2 = _STEAM2_RE.match(value)
+    if steam2:
+        y, z = int(steam2.group(1)), int(steam2.group(2))
+        return str(STEAMID64_BASE + z * 2 + y), None
+
+    steam3 = _STEAM3_RE.match(value)
+    if steam3:
+        return str(STEAMID64_BASE + int(steam3.group(1))), None
+
+    if url_match or not _VANITY_RE.match(value):
+        return None, None
+    return None, value
+
+
+class SteamIDResolver:
+    """
+    Resolver for mixed Steam identifiers.
+
+    Numeric forms are converted locally; vanity names go through
+    ResolveVanityURL once and are then served from a long-TTL cache.
+    Names Steam reports as unknown are cached as negative entries.
+
+    Usage:
+        resolver = SteamIDResolver(SteamClient())
+        resolver.resolve("gabelogannewell")          # "76561197960287930"
+        resolver.resolve_many(["STEAM_0:0:11101", "[U:1:22202]"])
+    """
+
+    def __init__(self, client: SteamClient, cache: Optional[TTLCache] = None,
+                 max_workers: int = 8):
+        """
+        Initialize the resolver.
+
+        Args:
+            client: SteamClient used for ResolveVanityURL requests
+            cache: Cache for vanity lookups (defaults to the shared vanity_cache)
+            max_workers: Maximum number of concurrent lookups in resolve_many
+        """
+        self.client = client
+        self.cache = cache if cache is not None else vanity_cache
+        self.max_workers = max_workers
+
+    def lookup_vanity(self, vanity_url_name: str) -> APIResponse:
+        """
+        Resolve a vanity URL name, using the cache when possible.
+
+        Args:
+            vanity_url_name: The vanity URL name to resolve
+
+        Returns:
+            APIResponse with {"steamid": ...} or error
+        """
+        cache_key = f"vanity:{vanity_url_name.lower()}"
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            if cached_result:
+                return APIResponse(ok=True, source="steam_web_api", data={"steamid": cached_result})
+            return self._not_found(vanity_url_name)
+
+        url = f"{self.client.STEAM_API_BASE}/ISteamUser/ResolveVanityURL/v0001/"
+        response = self.client.get(url, params={"vanityurl": vanity_url_name})
+
+        result = response.data.get("response", {}) if isinstance(response.data, dict) else {}
+        if response.ok and result.get("steamid"):
+            self.cache.set(cache_key, result["steamid"])
+            response.data = {"steamid": result["steamid"]}
+        elif response.ok and result.get("success") == 42:
+            # 42 = no match; remember it for a shorter time than hits
+            self.cache.set(cache_key, "", ttl=NEGATIVE_TTL)
+            return self._not_found(vanity_url_name)
+
+        return response
+
+    @staticmethod
+    def _not_found(vanity_url_name: str) -> APIResponse:
+        return APIResponse(
+            ok=False,
+            source="steam_web_api",
+            data={},
+            warnings=["No match for vanity URL name"],
+            error={"message": f"No Steam account found for vanity URL name '{vanity_url_name}'"}
+        )
+
+    def resolve(self, value: str) -> Optional[str]:
+        """
+        Resolve any supported identifier to a SteamID64.
+
+        Args:
+            value: SteamID64, STEAM_X:Y:Z, [U:1:n], profile URL or vanity name
+
+        Returns:
+            SteamID64 string, or None if the value cannot be resolved
+        """
+        steamid, vanity = parse_steam_id(value)
+        if steamid or not vanity:
+            return steamid
+        response = self.lookup_vanity(vanity)
+        return response.data.get("steamid") if response.ok else None
+
+    def resolve_many(self, values: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many mixed identifiers, looking up vanity names concurrently.
+
+        Args:
+            values: Identifiers in any supported form
+
+        Returns:
+            Mapping of each input to its SteamID64 (None if unresolved)
+        """
+        values = list(dict.fromkeys(values))
+        parsed = {value: parse_steam_id(value) for value in values}
+        vanities = list(dict.fromkeys(v for _, v in parsed.values() if v))
+
+        resolved_vanities: Dict[str, Optional[str]] = {}
+        if vanities:
+            workers = max(1, min(self.max_workers, len(vanities)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = executor.map(self.lookup_vanity, vanities)
+                for vanity, response in zip(vanities, responses):
+                    resolved_vanities[vanity] = response.data.get("steamid") if response.ok else None
+
+        return {
+            value: steamid if steamid else resolved_vanities.get(vanity) if vanity else None
+            for value, (steamid, vanity) in parsed.items()
+        }
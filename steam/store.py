@@ -17,9 +17,11 @@ import time
 from typing import Any, Dict, List, Optional, Union
 
 from steam.client import SteamClient, APIResponse
-from steam.schemas import AppID
+from steam.schemas import AppDetails, AppID, select_fields
 from steam.cache import discovery_cache, app_cache
 from steam.web import SteamWebAPI
+from steam.news import NewsTracker, news_store
+from steam.appsearch import app_search
 
 logger = logging.getLogger(__name__)
 
@@ -46,45 +48,69 @@ class SteamStoreAPI:
         self.client = SteamClient(api_key=api_key)
     
     def get_app_details(self, app_id: Union[str, int], country_code: str = "US",
-                        language: str = "english") -> APIResponse:
+                        language: str = "english",
+                        fields: Optional[Union[str, List[str]]] = None) -> APIResponse:
         """
         Get detailed information about a game from the Steam Store API.
         
+        The decoded payload is cached as received; each call extracts only
+        the requested fields from it.
+        
         Args:
             app_id: Application ID
             country_code: Country code for pricing and availability
             language: Language for localized content
+            fields: AppDetails fields to return (appid is always included); all by default
             
         Returns:
             APIResponse with app details data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        try:
+            fields = select_fields(AppDetails, fields, always=("appid",))
+        except ValueError as e:
+            return APIResponse(
+                ok=False,
+                source="steam_store_api",
+                data={},
+                warnings=["Invalid fields parameter"],
+                error={"message": str(e)}
+            )
         cache_key = f"app_details:{app_id}:{country_code}:{language}"
         
         # Try to get from cache
-        cached_result = app_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-        
-        url = f"{self.client.STEAM_STORE_API_BASE}/appdetails"
-        params = {"appids": app_id, "cc": country_code, "l": language}
-        
-        response = self.client.get(url, params=params)
-        
-        # Normalize the response
-        if response.ok:
-            try:
-                from steam.schemas import AppDetails
-                app_details = AppDetails.from_api_response(response.data, app_id)
-                response.data = {"app": app_details.to_dict()}
-            except Exception as e:
-                logger.warning(f"Failed to parse app details: {e}")
-        
-        # Cache the result
-        if response.ok:
-            app_cache.set(cache_key, response, ttl=1800)  # 30 minutes
+        response = app_cache.get(cache_key)
+        if response is None:
+            url = f"{self.client.STEAM_STORE_API_BASE}/appdetails"
+            params = {"appids": app_id, "cc": country_code, "l": language}
+            
+            response = self.client.get(url, params=params)
+            
+            # Cache the raw payload
+            if response.ok:
+                app_cache.set(cache_key, response, ttl=1800)  # 30 minutes
         
-        return response
+        if not response.ok:
+            return response
+        
+        # Normalize into a new response so the cached payload stays intact
+        try:
+            if fields is None:
+                app = AppDetails.from_api_response(response.data, app_id).to_dict()
+            else:
+                app = AppDetails.project_response(response.data, app_id, fields)
+        except Exception as e:
+            logger.warning(f"Failed to parse app details: {e}")
+            return response
+        
+        return APIResponse(
+            ok=True,
+            source=response.source,
+            data={"app": app},
+            warnings=response.warnings,
+            fetched_at=response.fetched_at,
+            rate_limit_hint=response.rate_limit_hint
+        )
     
     def get_featured_categories(self, country_code: str = "US", 
                                 language: str = "english") -> APIResponse:
@@ -165,6 +191,14 @@ class SteamStoreAPI:
         """
         Search for games in the Steam Store.
         
+        Searches the local app catalog (prefix, token and typo-tolerant
+        matching) once its search index has been built, and falls back to
+        the store's storesearch endpoint otherwise. Both return
+        {"total", "items"} with "type", "id" and "name" per item; local
+        items add "score" and "match", storesearch items add price,
+        image and platform fields. country_code and language only apply
+        to storesearch, as the catalog has no prices or localized names.
+        
         Args:
             query: Search query
             country_code: Country code for localized content
@@ -183,6 +217,19 @@ class SteamStoreAPI:
                 error={"message": "Search query cannot be empty"}
             )
         
+        if app_search.ready:
+            # The catalog syncer rebuilds the index; never block a request on it
+            results = app_search.search(query, limit, build=False)
+            return APIResponse(
+                ok=True,
+                source="app_catalog",
+                data={
+                    "total": len(results),
+                    "items": [{"type": "app", "id": r["appid"], "name": r["name"],
+                               "score": r["score"], "match": r["match"]} for r in results],
+                }
+            )
+        
         # Generate cache key
         cache_key = f"search_games:{query}:{country_code}:{language}:{limit}"
         
@@ -191,12 +238,7 @@ class SteamStoreAPI:
         if cached_result is not None:
             return cached_result
         
-        # Note: Steam Store search is typically done via web scraping
-        # or unofficial APIs. This is a placeholder for the actual implementation.
-        # For now, we'll use a simple approach.
-        
-        # Try to use the store search endpoint (may not be publicly available)
-        url = f"{self.client.STEAM_STORE_API_BASE}/search"
+        url = f"{self.client.STEAM_STORE_API_BASE}/storesearch/"
         params = {
             "cc": country_code,
             "l": language,
@@ -271,7 +313,7 @@ class SteamStoreAPI:
         Returns:
             APIResponse with reviews summary data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         cache_key = f"app_reviews_summary:{app_id}:{country_code}:{language}"
         
         # Try to get from cache
@@ -310,7 +352,7 @@ class SteamStoreAPI:
         Returns:
             APIResponse with app tags data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         cache_key = f"app_tags:{app_id}:{country_code}:{language}"
         
         # Try to get from cache
@@ -391,7 +433,7 @@ class SteamStoreAPI:
         Returns:
             APIResponse with update signal data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         cache_key = f"app_update_signal:{app_id}"
         
         # Try to get from cache
@@ -400,27 +442,23 @@ class SteamStoreAPI:
             return cached_result
         
         # Get app details to check for updates
-        app_details_response = self.get_app_details(app_id)
+        app_details_response = self.get_app_details(app_id, fields=["name"])
         
         if not app_details_response.ok:
             return app_details_response
         
-        # Get recent news to check for update announcements
-        web = SteamWebAPI()
-        news_response = web.get_game_news(app_id, count=5)
+        # Bring the shared news store up to date; only items newer than
+        # the app's cursor are fetched
+        tracker = NewsTracker(SteamWebAPI(), store=news_store)
+        if tracker.sync(app_id) is None:
+            logger.warning(f"News sync failed for app {app_id}")
         
         # Build update signal
         app_data = app_details_response.data.get("app", {})
-        news_data = news_response.data.get("news", [])
         
         # Check if there are recent news items (within last 7 days)
-        recent_news = []
-        if news_data:
-            now = time.time()
-            seven_days_ago = now - (7 * 24 * 60 * 60)
-            for news_item in news_data:
-                if news_item.get("date", 0) >= seven_days_ago:
-                    recent_news.append(news_item)
+        seven_days_ago = time.time() - (7 * 24 * 60 * 60)
+        recent_news = news_store.since([app_id], seven_days_ago)
         
         update_signal = {
             "appid": app_id,
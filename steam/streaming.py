@@ -0,0 +1,189 @@
+"""
+Incremental JSON parsing for large responses.
+
+This module provides:
+- JSONArrayStream: walks a JSON document chunk by chunk and yields the
+  elements of one nested array (e.g. response.games) as they arrive,
+  without holding the whole body or the whole decoded array in memory
+"""
+
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+_WHITESPACE = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """Text window over a stream of byte or str chunks."""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False once nothing more arrives."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._utf8.decode(chunk)
+            if chunk:
+                self.text = self.text[self.pos:] + chunk
+                self.pos = 0
+                return True
+        self.eof = True
+        tail = self._utf8.decode(b"", final=True)
+        if tail:
+            self.text = self.text[self.pos:] + tail
+            self.pos = 0
+            return True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise ValueError(f"Expected one of {chars!r}, found {found}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more chunks as needed."""
+        while True:
+            self.peek()
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number or literal at the end of the window may continue in the next chunk
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+class JSONArrayStream:
+    """
+    Iterate over the elements of one array inside a streamed JSON document.
+
+    Objects along `path` are walked key by key; the array at the end of the
+    path is yielded one element at a time. Every other value met on the way
+    is decoded whole and kept in `envelope` (keyed by name), so scalars such
+    as game_count or have_more_results are available once iteration ends.
+
+    Usage:
+        stream = JSONArrayStream(response.iter_content(65536), ("response", "games"))
+        with stream:
+            for game in stream:
+                ...
+        stream.envelope.get("game_count")
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], path: Sequence[str],
+                 on_close: Optional[Callable[[], None]] = None):
+        """
+        Initialize the stream.
+
+        Args:
+            chunks: Iterable of byte (UTF-8) or str chunks of one JSON document
+            path: Object keys leading to the array; empty for a top-level array
+            on_close: Called once when the stream is closed (e.g. response.close)
+        """
+        self.path = tuple(path)
+        self.envelope: Dict[str, Any] = {}
+        self.count = 0
+        self._buffer = _Buffer(chunks)
+        self._on_close = on_close
+        self._started = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError("JSONArrayStream can only be iterated once")
+        self._started = True
+        try:
+            yield from self._document()
+        finally:
+            self.close()
+
+    def __enter__(self) -> 'JSONArrayStream':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the underlying response."""
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
+
+    def _document(self) -> Iterator[Any]:
+        buffer = self._buffer
+        if not self.path:
+            if buffer.peek() == "[":
+                yield from self._items()
+            else:
+                buffer.value()
+        elif buffer.peek() == "{":
+            yield from self._object(0)
+        else:
+            # Error bodies such as [] or false have nothing to stream
+            buffer.value()
+        if buffer.peek():
+            raise ValueError("Extra data after JSON document")
+
+    def _object(self, depth: int) -> Iterator[Any]:
+        buffer = self._buffer
+        buffer.expect("{")
+        if buffer.peek() == "}":
+            buffer.pos += 1
+            return
+        target = self.path[depth]
+        last = depth == len(self.path) - 1
+        while True:
+            key = buffer.value()
+            if not isinstance(key, str):
+                raise ValueError("Expected an object key")
+            buffer.expect(":")
+            char = buffer.peek()
+            if key == target and last and char == "[":
+                yield from self._items()
+            elif key == target and not last and char == "{":
+                yield from self._object(depth + 1)
+            else:
+                self.envelope[key] = buffer.value()
+            if buffer.expect(",}") == "}":
+                return
+
+    def _items(self) -> Iterator[Any]:
+        buffer = self._buffer
+        buffer.expect("[")
+        if buffer.peek() == "]":
+            buffer.pos += 1
+            return
+        while True:
+            item = buffer.value()
+            self.count += 1
+            yield item
+            if buffer.expect(",]") == "]":
+                return
@@ -0,0 +1,172 @@
+"""
+Lazy views over decoded API payloads.
+
+This module provides:
+- RecordView: read-only mapping over one decoded record with the keys,
+  defaults and typed attributes of a schema dataclass
+- ListView: sequence over a decoded record list; elements are wrapped on access
+- view_type / list_view: view class for a schema and list views built from it
+- materialize: plain dicts and lists for serialization
+
+Normalizing a list response used to build a dataclass per record and then
+a dict per dataclass. Views keep a reference to the decoded JSON instead and
+copy each record once, when the response is serialized (APIResponse.to_dict
+or the codec). Views are read-only; use to_dict() / to_list() for a copy
+that can be modified.
+"""
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from steam.schemas import record_defaults
+
+
+class RecordView(Mapping):
+    """
+    Read-only mapping over one raw record.
+
+    Keys are the fields of the view's schema in to_dict() order; missing
+    keys read as the schema's defaults. Subclasses are created by view_type().
+    """
+
+    __slots__ = ("_raw",)
+
+    schema: Optional[type] = None
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, raw: Any):
+        self._raw = raw if isinstance(raw, dict) else {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw.get(key, self._defaults[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._defaults)
+
+    def __len__(self) -> int:
+        return len(self._defaults)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._defaults
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._defaults:
+            return self._raw.get(key, self._defaults[key])
+        return default
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The wrapped record, including keys the schema does not define."""
+        return self._raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy into a plain dict (the schema's to_dict() output)."""
+        raw = self._raw
+        return {key: raw.get(key, default) for key, default in self._defaults.items()}
+
+    def to_record(self) -> Any:
+        """Build the schema dataclass for this record."""
+        return self.schema.from_record(self._raw)
+
+
+def _field(name: str, default: Any) -> property:
+    return property(lambda self: self._raw.get(name, default), doc=f"The {name} field.")
+
+
+@lru_cache(maxsize=None)
+def view_type(schema: type) -> Type[RecordView]:
+    """
+    View class for a schema dataclass.
+
+    The schema needs a from_record() classmethod and a to_dict() method;
+    keys and defaults are taken from from_record({}).to_dict() (see
+    steam.schemas.record_defaults, which field projections share).
+
+    Args:
+        schema: Schema dataclass
+
+    Returns:
+        RecordView subclass with one attribute per field
+    """
+    defaults = record_defaults(schema)
+    namespace = {"__slots__": (), "schema": schema, "_defaults": defaults,
+                 "__doc__": f"Lazy view with the fields of {schema.__name__}."}
+    for name, default in defaults.items():
+        if not hasattr(RecordView, name):
+            namespace[name] = _field(name, default)
+    return type(f"{schema.__name__}View", (RecordView,), namespace)
+
+
+class ListView(Sequence):
+    """Read-only sequence of RecordViews over a raw record list."""
+
+    __slots__ = ("_raw", "_view")
+
+    def __init__(self, raw: Any, view: Type[RecordView]):
+        self._raw = raw if isinstance(raw, list) else []
+        self._view = view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self._raw[index], self._view)
+        return self._view(self._raw[index])
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        return map(self._view, self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, ListView)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ListView({self._view.__name__}, {len(self._raw)} records)"
+
+    @property
+    def raw(self) -> List[Any]:
+        """The wrapped list."""
+        return self._raw
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Copy into a list of plain dicts."""
+        items = self._view._defaults.items()
+        return [{key: record.get(key, default) for key, default in items}
+                if isinstance(record, dict) else dict(items)
+                for record in self._raw]
+
+    def to_records(self) -> List[Any]:
+        """Build the schema dataclasses for every record."""
+        from_record = self._view.schema.from_record
+        return [from_record(record if isinstance(record, dict) else {}) for record in self._raw]
+
+
+def list_view(schema: type, records: Any) -> ListView:
+    """Lazy view of a raw record list as records of a schema."""
+    return ListView(records, view_type(schema))
+
+
+def materialize(data: Any) -> Any:
+    """
+    Replace views in response data with plain dicts and lists.
+
+    Views are expected as values of the top-level data dict (where the API
+    methods put them); data without views is returned as it is.
+    """
+    if isinstance(data, dict):
+        if not any(isinstance(v, (RecordView, ListView)) for v in data.values()):
+            return data
+        return {k: materialize(v) for k, v in data.items()}
+    if isinstance(data, ListView):
+        return data.to_list()
+    if isinstance(data, RecordView):
+        return data.to_dict()
+    return data
@@ -8,18 +8,31 @@ This module provides functions for interacting with the Steam Web API:
 - Owned games
 - News and updates
 - Vanity URL resolution
+
+Profile methods accept a SteamID64, STEAM_X:Y:Z, [U:1:n], a profile URL or
+a vanity name; non-numeric forms are resolved through a cached index.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from steam.cache import schema_cache
 from steam.client import SteamClient, APIResponse
+from steam.steamid import SteamIDResolver
+from steam.newsindex import news_index
+from steam.appsearch import app_search
 from steam.schemas import (
-    SteamProfile, AppID, SteamID, Friend, Game, Achievement, GameNews, UserStats
+    SteamProfile, AppID, SteamID, Friend, Game, Achievement, AchievementRarity,
+    GameCompletion, GameNews, UserStats, AppDetails, select_fields, project
 )
+from steam.views import list_view
 
 logger = logging.getLogger(__name__)
 
+# Error returned by GetPlayerAchievements for apps without achievements
+NO_STATS_ERROR = "Requested app has no stats"
+
 
 class SteamWebAPI:
     """
@@ -41,6 +54,26 @@ class SteamWebAPI:
             api_key: Steam Web API key (optional, can also use STEAM_API_KEY env var)
         """
         self.client = SteamClient(api_key=api_key)
+        self.resolver = SteamIDResolver(self.client)
+    
+    @staticmethod
+    def _invalid_fields(error: ValueError) -> APIResponse:
+        """Error response for an unknown field projection."""
+        return APIResponse(
+            ok=False,
+            source="steam_web_api",
+            data={},
+            warnings=["Invalid fields parameter"],
+            error={"message": str(error)}
+        )
+    
+    @staticmethod
+    def _games(data: Dict[str, Any], fields: Optional[Tuple[str, ...]]) -> Sequence[Dict[str, Any]]:
+        """Games from a GetOwnedGames/GetRecentlyPlayedGames body: a lazy view, or a projection."""
+        games = data.get("response", {}).get("games", [])
+        if fields is None:
+            return list_view(Game, games)
+        return [project(g, fields, Game) for g in games]
     
     def get_profile_info(self, steam_id: str) -> APIResponse:
         """
@@ -52,7 +85,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with profile data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUser/GetPlayerSummaries/v0002/"
         params = {"steamids": steam_id}
@@ -80,7 +113,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with friends list or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
         
         if relationship not in ["friend", "all"]:
             return APIResponse(
@@ -99,8 +132,8 @@ class SteamWebAPI:
         # Normalize the response
         if response.ok:
             try:
-                friends = Friend.from_api_response(response.data)
-                response.data = {"friends": [f.to_dict() for f in friends]}
+                friends = response.data.get("friendslist", {}).get("friends", [])
+                response.data = {"friends": list_view(Friend, friends)}
             except Exception as e:
                 logger.warning(f"Failed to parse friends: {e}")
         
@@ -125,17 +158,36 @@ class SteamWebAPI:
                 error={"message": "Vanity URL name must be a non-empty string"}
             )
         
-        url = f"{self.client.STEAM_API_BASE}/ISteamUser/ResolveVanityURL/v0001/"
-        params = {"vanityurl": vanity_url_name}
-        
-        response = self.client.get(url, params=params)
+        # Lookups (including misses) are cached by the resolver
+        return self.resolver.lookup_vanity(vanity_url_name)
+    
+    def resolve_steam_ids(self, values: List[str]) -> APIResponse:
+        """
+        Resolve mixed Steam identifiers to SteamID64s.
         
-        # Normalize the response
-        if response.ok and response.data.get("response", {}).get("steamid"):
-            steam_id = response.data["response"]["steamid"]
-            response.data = {"steamid": steam_id}
+        Args:
+            values: Vanity names, profile URLs, SteamID64, STEAM_X:Y:Z or [U:1:n]
+            
+        Returns:
+            APIResponse with a mapping of input to SteamID64 (None if unresolved)
+        """
+        if not values:
+            return APIResponse(
+                ok=False,
+                source="steam_web_api",
+                data={},
+                warnings=["Empty values list"],
+                error={"message": "values must be a non-empty list"}
+            )
         
-        return response
+        resolved = self.resolver.resolve_many(values)
+        unresolved = [value for value, steam_id in resolved.items() if not steam_id]
+        return APIResponse(
+            ok=True,
+            source="steam_web_api",
+            data={"resolved": resolved, "unresolved": unresolved},
+            warnings=[f"Could not resolve {len(unresolved)} value(s)"] if unresolved else []
+        )
     
     def get_player_achievements(self, steam_id: str, app_id: Union[str, int], 
                                 language: str = "english") -> APIResponse:
@@ -150,8 +202,8 @@ class SteamWebAPI:
         Returns:
             APIResponse with achievements data or error
         """
-        SteamID.validate(steam_id)
-        app_id = AppID.validate(app_id).appid
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetPlayerAchievements/v0001/"
         params = {"steamid": steam_id, "appid": app_id, "l": language}
@@ -161,8 +213,8 @@ class SteamWebAPI:
         # Normalize the response
         if response.ok:
             try:
-                achievements = Achievement.from_api_response(response.data)
-                response.data = {"achievements": [a.to_dict() for a in achievements]}
+                achievements = response.data.get("playerstats", {}).get("achievements", [])
+                response.data = {"achievements": list_view(Achievement, achievements)}
             except Exception as e:
                 logger.warning(f"Failed to parse achievements: {e}")
         
@@ -179,8 +231,8 @@ class SteamWebAPI:
         Returns:
             APIResponse with user stats data or error
         """
-        SteamID.validate(steam_id)
-        app_id = AppID.validate(app_id).appid
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetUserStatsForGame/v0002/"
         params = {"steamid": steam_id, "appid": app_id}
@@ -198,7 +250,8 @@ class SteamWebAPI:
         return response
     
     def get_owned_games(self, steam_id: str, include_appinfo: bool = True, 
-                       include_played_free_games: bool = True) -> APIResponse:
+                       include_played_free_games: bool = True,
+                       fields: Optional[Union[str, List[str]]] = None) -> APIResponse:
         """
         Get list of games owned by a user.
         
@@ -206,11 +259,16 @@ class SteamWebAPI:
             steam_id: Steam ID of the user
             include_appinfo: Include game name and other info
             include_played_free_games: Include free games that the user has played
+            fields: Game fields to return (appid is always included); all by default
             
         Returns:
             APIResponse with owned games data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        try:
+            fields = select_fields(Game, fields, always=("appid",))
+        except ValueError as e:
+            return self._invalid_fields(e)
         
         url = f"{self.client.STEAM_API_BASE}/IPlayerService/GetOwnedGames/v0001/"
         params = {
@@ -225,25 +283,63 @@ class SteamWebAPI:
         # Normalize the response
         if response.ok:
             try:
-                games = Game.from_api_response(response.data)
-                response.data = {"games": [g.to_dict() for g in games]}
+                response.data = {"games": self._games(response.data, fields)}
             except Exception as e:
                 logger.warning(f"Failed to parse owned games: {e}")
         
         return response
     
-    def get_recently_played_games(self, steam_id: str, count: int = 10) -> APIResponse:
+    def iter_owned_games(self, steam_id: str, include_appinfo: bool = True,
+                         include_played_free_games: bool = True) -> Iterator[Game]:
+        """
+        Stream the games owned by a user.
+        
+        Games are parsed one at a time as the body arrives, so very large
+        libraries never exist in memory as a whole.
+        
+        Args:
+            steam_id: Steam ID of the user
+            include_appinfo: Include game name and other info
+            include_played_free_games: Include free games that the user has played
+            
+        Yields:
+            Game records in API order
+            
+        Raises:
+            SteamAPIError: If the request fails
+        """
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        
+        url = f"{self.client.STEAM_API_BASE}/IPlayerService/GetOwnedGames/v0001/"
+        params = {
+            "steamid": steam_id,
+            "format": "json",
+            "include_appinfo": int(include_appinfo),
+            "include_played_free_games": int(include_played_free_games),
+        }
+        
+        with self.client.stream(url, ("response", "games"), params=params) as games:
+            for record in games:
+                yield Game.from_record(record)
+    
+    def get_recently_played_games(self, steam_id: str, count: int = 10,
+                                  fields: Optional[Union[str, List[str]]] = None) -> APIResponse:
         """
         Get recently played games for a user.
         
         Args:
             steam_id: Steam ID of the user
             count: Number of games to return
+            fields: Game fields to return (appid is always included); all by default
             
         Returns:
             APIResponse with recently played games data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        try:
+            fields = select_fields(Game, fields, always=("appid",))
+        except ValueError as e:
+            return self._invalid_fields(e)
         
         if count <= 0 or count > 100:
             return APIResponse(
@@ -262,15 +358,16 @@ class SteamWebAPI:
         # Normalize the response
         if response.ok:
             try:
-                games = Game.from_api_response(response.data)
-                response.data = {"games": [g.to_dict() for g in games]}
+                response.data = {"games": self._games(response.data, fields)}
             except Exception as e:
                 logger.warning(f"Failed to parse recently played games: {e}")
         
         return response
     
     def get_game_news(self, app_id: Union[str, int], count: int = 3, 
-                      maxlength: int = 300, feed_name: Optional[str] = None) -> APIResponse:
+                      maxlength: int = 300, feed_name: Optional[str] = None,
+                      enddate: Optional[int] = None,
+                      fields: Optional[Union[str, List[str]]] = None) -> APIResponse:
         """
         Get news articles for a game.
         
@@ -279,11 +376,17 @@ class SteamWebAPI:
             count: Number of news items to return
             maxlength: Maximum length of each news item
             feed_name: Name of the feed to get news from
+            enddate: Only return items published at or before this Unix time
+            fields: News item fields to return (gid is always included); all by default
             
         Returns:
             APIResponse with game news data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        try:
+            fields = select_fields(GameNews, fields, always=("gid",))
+        except ValueError as e:
+            return self._invalid_fields(e)
         
         if count <= 0:
             return APIResponse(
@@ -299,14 +402,22 @@ class SteamWebAPI:
         
         if feed_name:
             params["feedname"] = feed_name
+        if enddate is not None:
+            params["enddate"] = enddate
         
         response = self.client.get(url, params=params)
         
         # Normalize the response
         if response.ok:
             try:
-                news = GameNews.from_api_response(response.data)
-                response.data = {"news": [n.to_dict() for n in news]}
+                items = response.data.get("appnews", {}).get("newsitems", [])
+                if fields is None:
+                    response.data = {"news": list_view(GameNews, items)}
+                    news_index.add_many(response.data["news"], app_id)
+                else:
+                    # The index reads the raw items; only the projection is returned
+                    news_index.add_many(items, app_id)
+                    response.data = {"news": [project(n, fields, GameNews) for n in items]}
             except Exception as e:
                 logger.warning(f"Failed to parse game news: {e}")
         
@@ -323,26 +434,43 @@ class SteamWebAPI:
         Returns:
             APIResponse with game schema data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        cache_key = f"game_schema:{app_id}:{language}"
+        
+        # Try to get from cache
+        cached_result = schema_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetSchemaForGame/v2/"
         params = {"appid": app_id, "l": language}
         
         response = self.client.get(url, params=params)
+        
+        # Cache the result
+        if response.ok:
+            schema_cache.set(cache_key, response)  # 24 hours
+        
         return response
     
-    def get_app_details(self, app_id: Union[str, int], country_code: str = "US") -> APIResponse:
+    def get_app_details(self, app_id: Union[str, int], country_code: str = "US",
+                        fields: Optional[Union[str, List[str]]] = None) -> APIResponse:
         """
         Get detailed information about a game from the Steam Store API.
         
         Args:
             app_id: Application ID
             country_code: Country code for pricing and availability
+            fields: AppDetails fields to return (appid is always included); all by default
             
         Returns:
             APIResponse with app details data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        try:
+            fields = select_fields(AppDetails, fields, always=("appid",))
+        except ValueError as e:
+            return self._invalid_fields(e)
         
         url = f"{self.client.STEAM_STORE_API_BASE}/appdetails"
         params = {"appids": app_id, "cc": country_code, "l": "english"}
@@ -352,9 +480,11 @@ class SteamWebAPI:
         # Normalize the response
         if response.ok:
             try:
-                from steam.schemas import AppDetails
-                app_details = AppDetails.from_api_response(response.data, app_id)
-                response.data = {"app": app_details.to_dict()}
+                if fields is None:
+                    app = AppDetails.from_api_response(response.data, app_id).to_dict()
+                else:
+                    app = AppDetails.project_response(response.data, app_id, fields)
+                response.data = {"app": app}
             except Exception as e:
                 logger.warning(f"Failed to parse app details: {e}")
         
@@ -370,14 +500,250 @@ class SteamWebAPI:
         Returns:
             APIResponse with global achievement percentages data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        cache_key = f"global_achievement_percentages:{app_id}"
+        
+        # Try to get from cache
+        cached_result = schema_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v0002/"
         params = {"gameid": app_id, "format": "json"}
         
         response = self.client.get(url, params=params)
+        
+        # Cache the result
+        if response.ok:
+            schema_cache.set(cache_key, response, ttl=3600)  # 1 hour
+        
         return response
     
+    def get_achievement_rarity(self, steam_id: str, app_id: Union[str, int],
+                               language: str = "english",
+                               unlocked_only: bool = False,
+                               limit: Optional[int] = None) -> APIResponse:
+        """
+        Get a player's achievements joined with names and global unlock rates.
+        
+        Player achievements, the game schema and global percentages are
+        fetched concurrently (the latter two from cache when possible) and
+        joined on apiname.
+        
+        Args:
+            steam_id: Steam ID of the user
+            app_id: Application ID of the game
+            language: Language for achievement names and descriptions
+            unlocked_only: Only return achievements the player has unlocked
+            limit: Maximum number of achievements to return (optional)
+            
+        Returns:
+            APIResponse with achievements sorted from rarest to most common
+        """
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
+        
+        url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetPlayerAchievements/v0001/"
+        params = {"steamid": steam_id, "appid": app_id, "l": language}
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            player_future = executor.submit(self.client.get, url, params=params)
+            schema_future = executor.submit(self.get_game_schema, app_id, language)
+            percentages_future = executor.submit(self.get_global_achievement_percentages, app_id)
+            player_response = player_future.result()
+            schema_response = schema_future.result()
+            percentages_response = percentages_future.result()
+        
+        if not player_response.ok:
+            return player_response
+        
+        warnings = list(player_response.warnings)
+        if not schema_response.ok:
+            warnings.append("Game schema unavailable; achievement names may be missing")
+        if not percentages_response.ok:
+            warnings.append("Global achievement percentages unavailable")
+        
+        records = AchievementRarity.join(
+            player_response.data,
+            schema_response.data if schema_response.ok else {},
+            percentages_response.data if percentages_response.ok else {},
+        )
+        unlocked = sum(1 for r in records if r.achieved)
+        if unlocked_only:
+            records = [r for r in records if r.achieved]
+        if limit is not None:
+            records = records[:limit]
+        
+        player_stats = player_response.data.get("playerstats", {})
+        return APIResponse(
+            ok=True,
+            source="steam_web_api",
+            data={
+                "appid": app_id,
+                "game_name": player_stats.get("gameName"),
+                "total": len(player_stats.get("achievements", [])),
+                "unlocked": unlocked,
+                "achievements": [r.to_dict() for r in records],
+            },
+            warnings=warnings,
+        )
+    
+    def _has_no_stats(self, app_id: int) -> bool:
+        """Check whether an app is known to have no achievements."""
+        return schema_cache.get(f"no_stats:{app_id}") is not None
+    
+    def _mark_no_stats(self, app_id: int) -> None:
+        """Remember that an app has no achievements."""
+        schema_cache.set(f"no_stats:{app_id}", True)  # 24 hours
+    
+    def _get_game_completion(self, steam_id: str, game: Dict[str, Any],
+                             language: str) -> Optional[GameCompletion]:
+        """
+        Get achievement completion for one owned game.
+        
+        Returns None for games without achievements; the app is then
+        remembered so later sweeps (for any user) skip it without a request.
+        """
+        app_id = game["appid"]
+        if self._has_no_stats(app_id):
+            return None
+        
+        schema_response = self.get_game_schema(app_id, language)
+        if schema_response.ok:
+            schema_achievements = (schema_response.data.get("game", {})
+                                   .get("availableGameStats", {}).get("achievements", []))
+            if not schema_achievements:
+                self._mark_no_stats(app_id)
+                return None
+        
+        url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetPlayerAchievements/v0001/"
+        params = {"steamid": steam_id, "appid": app_id, "l": language}
+        response = self.client.get(url, params=params)
+        
+        player_stats = response.data.get("playerstats", {}) if isinstance(response.data, dict) else {}
+        if player_stats.get("error") == NO_STATS_ERROR:
+            self._mark_no_stats(app_id)
+            return None
+        if not response.ok:
+            raise ValueError(player_stats.get("error") or f"Failed to fetch achievements for app {app_id}")
+        
+        return GameCompletion.from_api_response(response.data, game)
+    
+    def iter_library_achievements(self, steam_id: str, max_workers: int = 8,
+                                  language: str = "english",
+                                  skipped: Optional[List[int]] = None) -> Iterator[GameCompletion]:
+        """
+        Yield achievement completion for every game in a user's library.
+        
+        Only games with has_community_visible_stats are queried. Requests are
+        spread over a bounded worker pool and results are yielded as soon as
+        each game finishes, in completion order.
+        
+        Args:
+            steam_id: Steam ID of the user
+            max_workers: Maximum number of concurrent requests
+            language: Language for the cached game schemas
+            skipped: List that receives the app IDs of games whose completion
+                could not be fetched
+            
+        Yields:
+            GameCompletion for each game that has achievements
+            
+        Raises:
+            ValueError: If the owned games cannot be fetched
+        """
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        
+        owned = self.get_owned_games(steam_id, include_appinfo=True, include_played_free_games=True)
+        if not owned.ok:
+            raise ValueError(f"Failed to fetch owned games for {steam_id}")
+        
+        games = [g for g in owned.data.get("games", [])
+                 if g.get("has_community_visible_stats") and not self._has_no_stats(g.get("appid"))]
+        if not games:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(games))))
+        try:
+            futures = {executor.submit(self._get_game_completion, steam_id, g, language): g
+                       for g in games}
+            for future in as_completed(futures):
+                try:
+                    completion = future.result()
+                except Exception as e:
+                    logger.warning(f"Skipping app {futures[future].get('appid')}: {e}")
+                    if skipped is not None:
+                        skipped.append(futures[future].get("appid"))
+                    continue
+                if completion is not None:
+                    yield completion
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_library_achievements(self, steam_id: str, max_workers: int = 8,
+                                 limit: Optional[int] = None,
+                                 language: str = "english") -> APIResponse:
+        """
+        Get achievement completion across a user's whole library.
+        
+        Args:
+            steam_id: Steam ID of the user
+            max_workers: Maximum number of concurrent requests
+            limit: Maximum number of games to list (optional, totals cover all games)
+            language: Language for the cached game schemas
+            
+        Returns:
+            APIResponse with library totals and per-game completion,
+            most completed games first; games that failed to load are left
+            out of the totals and listed in the warnings
+        """
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
+        
+        if max_workers <= 0:
+            return APIResponse(
+                ok=False,
+                source="steam_web_api",
+                data={},
+                warnings=["Invalid max_workers parameter"],
+                error={"message": "max_workers must be positive"}
+            )
+        
+        skipped: List[int] = []
+        try:
+            completions = list(self.iter_library_achievements(steam_id, max_workers, language, skipped))
+        except ValueError as e:
+            return APIResponse(
+                ok=False,
+                source="steam_web_api",
+                data={},
+                warnings=[str(e)],
+                error={"message": str(e)}
+            )
+        
+        completions.sort(key=lambda c: (-c.percent, -c.total, c.appid))
+        total = sum(c.total for c in completions)
+        unlocked = sum(c.unlocked for c in completions)
+        listed = completions[:limit] if limit is not None else completions
+        warnings = []
+        if skipped:
+            warnings.append(f"{len(skipped)} games skipped, totals exclude them: "
+                            f"{', '.join(str(a) for a in sorted(skipped))}")
+        
+        return APIResponse(
+            ok=True,
+            source="steam_web_api",
+            data={
+                "steamid": steam_id,
+                "games_with_achievements": len(completions),
+                "perfect_games": sum(1 for c in completions if c.total and c.unlocked == c.total),
+                "total_achievements": total,
+                "unlocked_achievements": unlocked,
+                "completion_percent": round(unlocked / total * 100, 2) if total else 0.0,
+                "games": [c.to_dict() for c in listed],
+            },
+            warnings=warnings
+        )
+    
     def get_user_level(self, steam_id: str) -> APIResponse:
         """
         Get Steam user level.
@@ -388,7 +754,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with user level data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
         
         url = f"{self.client.STEAM_API_BASE}/IPlayerService/GetSteamLevel/v1/"
         params = {"steamid": steam_id}
@@ -406,7 +772,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with user badges data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
         
         url = f"{self.client.STEAM_API_BASE}/IPlayerService/GetBadges/v1/"
         params = {"steamid": steam_id}
@@ -424,7 +790,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with player bans data or error
         """
-        SteamID.validate(steam_id)
+        steam_id = SteamID.validate(steam_id, resolver=self.resolver).steamid
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUser/GetPlayerBans/v1/"
         params = {"steamids": steam_id}
@@ -437,7 +803,7 @@ class SteamWebAPI:
         Get summaries for multiple Steam users.
         
         Args:
-            steam_ids: List of Steam IDs
+            steam_ids: List of Steam IDs in any form accepted by resolve_steam_ids
             
         Returns:
             APIResponse with player summaries data or error
@@ -451,6 +817,17 @@ class SteamWebAPI:
                 error={"message": "steam_ids must be a non-empty list"}
             )
         
+        resolved = self.resolver.resolve_many(steam_ids)
+        steam_ids = list(dict.fromkeys(steam_id for steam_id in resolved.values() if steam_id))
+        if not steam_ids:
+            return APIResponse(
+                ok=False,
+                source="steam_web_api",
+                data={},
+                warnings=["No valid Steam IDs"],
+                error={"message": "None of the given Steam IDs could be resolved"}
+            )
+        
         url = f"{self.client.STEAM_API_BASE}/ISteamUser/GetPlayerSummaries/v0002/"
         params = {"steamids": ",".join(steam_ids)}
         
@@ -467,7 +844,7 @@ class SteamWebAPI:
         Returns:
             APIResponse with current player count data or error
         """
-        app_id = AppID.validate(app_id).appid
+        app_id = AppID.validate(app_id, resolver=app_search).appid
         
         url = f"{self.client.STEAM_API_BASE}/ISteamUserStats/GetNumberOfCurrentPlayers/v0001/"
         params = {"appid": app_id}
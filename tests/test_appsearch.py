@@ -0,0 +1,168 @@
+"""
+Tests for the local app name search module.
+
+These tests verify:
+- Name normalization
+- Exact, prefix, token and typo-tolerant matching
+- Name -> appid resolution and AppID.validate with a resolver, never
+  building the index on the request path
+- search_games using the local index once built, storesearch before that
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.appsearch import AppSearchIndex, normalize_name
+from steam.catalog import AppCatalog
+from steam.schemas import AppID
+
+
+CATALOG = [
+    (10, "Counter-Strike", 1),
+    (220, "Half-Life 2", 1),
+    (400, "Portal", 1),
+    (620, "Portal 2", 1),
+    (570, "Dota 2", 1),
+    (730, "Counter-Strike 2", 1),
+    (1172470, "Apex Legends™", 1),
+    (1245620, "ELDEN RING", 1),
+    (1888160, "ARMORED CORE™ VI FIRES OF RUBICON™", 1),
+    (2000000, "Dota 2 Workshop Tools", 1),
+]
+
+
+@pytest.fixture
+def index():
+    catalog = AppCatalog()
+    catalog.replace(CATALOG)
+    return AppSearchIndex(catalog)
+
+
+class TestNormalizeName:
+    """Test name normalization."""
+
+    def test_folding(self):
+        """Test that case, accents, symbols and punctuation are folded."""
+        assert normalize_name("Counter-Strike: Global Offensive") == "counter strike global offensive"
+        assert normalize_name("Pokémon™ & Friends") == "pokemon and friends"
+        assert normalize_name("  ") == ""
+
+
+class TestAppSearchIndex:
+    """Test AppSearchIndex class."""
+
+    def test_exact_match_first(self, index):
+        """Test that an exact name outranks longer names sharing its tokens."""
+        results = index.search("Dota 2")
+        assert [r["appid"] for r in results[:2]] == [570, 2000000]
+        assert results[0]["match"] == "exact"
+
+    def test_prefix_autocomplete(self, index):
+        """Test that partial input completes names."""
+        assert [r["appid"] for r in index.search("counter str")][:2] == [10, 730]
+        assert index.search("eld")[0]["appid"] == 1245620
+
+    def test_token_search(self, index):
+        """Test matching tokens in any order."""
+        assert index.search("rubicon armored")[0]["appid"] == 1888160
+
+    def test_typo_tolerance(self, index):
+        """Test that misspelled tokens still match."""
+        results = index.search("portla 2")
+        assert results[0]["appid"] == 620
+        assert results[0]["match"] == "fuzzy"
+        assert index.search("elden rnig")[0]["appid"] == 1245620
+
+    def test_rebuilds_on_catalog_change(self, index):
+        """Test that catalog updates are picked up."""
+        assert index.search("hollow knight") == []
+        index.catalog.merge([(367520, "Hollow Knight", 2)])
+        assert index.search("hollow knight")[0]["appid"] == 367520
+
+    def test_resolve(self, index):
+        """Test name -> appid resolution."""
+        index.refresh()
+        assert index.resolve("Portal 2") == 620
+        assert index.resolve("apex legends") == 1172470
+        assert index.resolve("730") == 730
+        assert index.resolve("completely unknown game") is None
+
+    def test_resolve_response(self, index):
+        """Test the APIResponse wrapper with candidates."""
+        index.refresh()
+        response = index.resolve_response("half life 2")
+        assert response.ok is True
+        assert response.data["appid"] == 220
+        assert index.resolve_response("zzzz qqqq").ok is False
+        assert AppSearchIndex(AppCatalog()).resolve_response("portal").ok is False
+
+    def test_appid_validate_with_resolver(self, index):
+        """Test that AppID.validate accepts names when given a resolver."""
+        index.refresh()
+        assert AppID.validate("Elden Ring", resolver=index).appid == 1245620
+        assert AppID.validate("570", resolver=index).appid == 570
+        with pytest.raises(ValueError, match="Could not resolve"):
+            AppID.validate("zzzz qqqq", resolver=index)
+        with pytest.raises(ValueError, match="numeric string"):
+            AppID.validate("Elden Ring")
+
+    def test_resolve_never_builds_index(self, index):
+        """Test that resolving names before the first build or after a catalog change does not rebuild."""
+        assert index.resolve("Portal 2") is None
+        assert index.resolve("620") == 620
+        assert index.resolve_response("Portal 2").ok is False
+        assert index.ready is False
+
+        index.refresh()
+        index.catalog.merge([(367520, "Hollow Knight", 2)])
+        assert index.resolve("Hollow Knight") is None
+        assert index.resolve_response("Portal 2").data["appid"] == 620
+        index.refresh()
+        assert index.resolve("Hollow Knight") == 367520
+
+
+class TestStoreSearch:
+    """Test search_games on top of the catalog."""
+
+    def test_search_games_uses_catalog(self, monkeypatch, index):
+        """Test that search_games answers locally once the catalog is loaded."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        from steam.store import SteamStoreAPI
+        store = SteamStoreAPI()
+
+        index.refresh()
+        with patch('steam.store.app_search', index), \
+             patch.object(store.client, 'get') as mock_get:
+            response = store.search_games("portal")
+
+        assert response.ok is True
+        assert response.source == "app_catalog"
+        assert response.data["total"] == 2
+        assert [r["id"] for r in response.data["items"]] == [400, 620]
+        assert response.data["items"][0]["type"] == "app"
+        mock_get.assert_not_called()
+
+    def test_search_games_never_builds_index(self, monkeypatch, index):
+        """Test that requests fall back to storesearch before the first build and never rebuild."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        from steam.client import APIResponse
+        from steam.store import SteamStoreAPI
+        store = SteamStoreAPI()
+        remote = APIResponse(ok=True, source="steam_store_api",
+                             data={"total": 1, "items": [{"type": "app", "id": 400, "name": "Portal"}]})
+
+        with patch('steam.store.app_search', index), \
+             patch.object(store.client, 'get', return_value=remote) as mock_get:
+            fallback = store.search_games("portal")
+            assert index.ready is False
+            index.refresh()
+            index.catalog.merge([(367520, "Hollow Knight", 2)])
+            stale = store.search_games("hollow knight")
+
+        assert fallback.source == "steam_store_api"
+        assert mock_get.call_count == 1
+        # The merge is picked up on the next refresh, not by the request
+        assert stale.source == "app_catalog"
+        assert stale.data["items"] == []
+        index.refresh()
+        assert index.search("hollow knight", build=False)[0]["appid"] == 367520
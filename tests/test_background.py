@@ -0,0 +1,57 @@
+"""
+Tests for the background worker module.
+
+These tests verify:
+- PeriodicWorker subclasses must implement run_once
+- Failed runs are logged and do not stop the worker
+"""
+
+import threading
+
+import pytest
+
+from steam.background import PeriodicWorker
+
+
+class TestPeriodicWorker:
+    """Test PeriodicWorker class."""
+
+    def test_run_once_required(self):
+        """Test that a subclass without run_once cannot be created."""
+        class Incomplete(PeriodicWorker):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete(interval=1)
+
+    def test_invalid_interval(self):
+        """Test that the interval must be positive."""
+        class Worker(PeriodicWorker):
+            def run_once(self):
+                pass
+
+        with pytest.raises(ValueError):
+            Worker(interval=0)
+
+    def test_failures_do_not_stop_worker(self):
+        """Test that the worker keeps running after run_once raises."""
+        done = threading.Event()
+
+        class Flaky(PeriodicWorker):
+            runs = 0
+
+            def run_once(self):
+                self.runs += 1
+                if self.runs == 1:
+                    raise RuntimeError("boom")
+                done.set()
+
+        worker = Flaky(interval=0.01)
+        worker.start()
+        try:
+            assert done.wait(5)
+        finally:
+            worker.stop(timeout=5)
+        assert worker.runs >= 2
+        assert worker.last_run_at is not None
+        assert not worker.is_running()
@@ -0,0 +1,174 @@
+"""
+Tests for the local app catalog module.
+
+These tests verify:
+- Sorted-array lookup and linear merges
+- Binary persistence round trips
+- Paged full and delta syncs against GetAppList
+- Callbacks run after each sync and once for a catalog loaded from disk
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from steam.catalog import AppCatalog, CatalogSyncer
+from steam.client import SteamAPIError, SteamClient
+from steam.streaming import JSONArrayStream
+
+
+APPS = [
+    {"appid": 10, "name": "Counter-Strike", "last_modified": 100},
+    {"appid": 440, "name": "Team Fortress 2", "last_modified": 200},
+    {"appid": 570, "name": "Dota 2", "last_modified": 300},
+    {"appid": 730, "name": "Counter-Strike 2", "last_modified": 400},
+    {"appid": 1172470, "name": "Apex Legends", "last_modified": 500},
+]
+
+
+class FakeAppList:
+    """Serves GetAppList pages from a list of apps."""
+
+    def __init__(self, apps):
+        self.apps = apps
+        self.calls = []
+
+    def __call__(self, url, path, params=None):
+        self.calls.append(dict(params))
+        apps = [a for a in self.apps if a["appid"] > params["last_appid"]]
+        if "if_modified_since" in params:
+            apps = [a for a in apps if a["last_modified"] > params["if_modified_since"]]
+        page = apps[:params["max_results"]]
+        result = {"apps": page}
+        if len(apps) > len(page):
+            result["have_more_results"] = True
+            result["last_appid"] = page[-1]["appid"]
+        body = json.dumps({"response": result}).encode()
+        return JSONArrayStream((body[i:i + 64] for i in range(0, len(body), 64)), path)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamClient()
+
+
+class TestAppCatalog:
+    """Test AppCatalog class."""
+
+    def test_lookup(self):
+        """Test bisect lookup of present and missing apps."""
+        catalog = AppCatalog()
+        catalog.replace([(730, "Counter-Strike 2", 4), (10, "Counter-Strike", 1), (570, "Dota 2", 3)])
+        assert len(catalog) == 3
+        assert catalog.name_for(570) == "Dota 2"
+        assert catalog.name_for(571) is None
+        assert 730 in catalog
+        assert catalog.get(10) == {"appid": 10, "name": "Counter-Strike", "last_modified": 1}
+
+    def test_merge(self):
+        """Test that merges insert new apps and update existing ones in order."""
+        catalog = AppCatalog()
+        catalog.replace([(10, "A", 1), (30, "C", 1)])
+        version = catalog.version
+        catalog.merge([(40, "D", 2), (20, "B", 2), (10, "A2", 2)], synced_at=99)
+        assert [e[0] for e in catalog.entries()] == [10, 20, 30, 40]
+        assert catalog.name_for(10) == "A2"
+        assert catalog.synced_at == 99
+        assert catalog.version > version
+
+    def test_save_and_load(self, tmp_path):
+        """Test the binary file round trip."""
+        path = str(tmp_path / "catalog.bin")
+        catalog = AppCatalog()
+        catalog.replace([(10, "Counter-Strike", 1), (730, "Counter-Strike 2 ™", 4)], synced_at=123)
+        catalog.save(path)
+
+        restored = AppCatalog()
+        assert restored.load(path) is True
+        assert list(restored.entries()) == list(catalog.entries())
+        assert restored.synced_at == 123
+
+    def test_load_rejects_garbage(self, tmp_path):
+        """Test that unreadable files are ignored."""
+        path = tmp_path / "catalog.bin"
+        path.write_bytes(b"not a catalog")
+        assert AppCatalog().load(str(path)) is False
+
+
+class TestCatalogSyncer:
+    """Test CatalogSyncer class."""
+
+    def test_full_sync_pages(self, client):
+        """Test that the first sync pages through the whole list."""
+        catalog = AppCatalog()
+        syncer = CatalogSyncer(client, catalog=catalog, page_size=2)
+        feed = FakeAppList(APPS)
+        with patch.object(client, 'stream', side_effect=feed):
+            response = syncer.sync()
+
+        assert response.ok is True
+        assert response.data["mode"] == "full"
+        assert len(catalog) == 5
+        assert [c["last_appid"] for c in feed.calls] == [0, 440, 730]
+        assert all("if_modified_since" not in c for c in feed.calls)
+
+    def test_delta_sync(self, client, tmp_path):
+        """Test that later syncs only request changed apps and persist the result."""
+        path = str(tmp_path / "catalog.bin")
+        catalog = AppCatalog()
+        syncer = CatalogSyncer(client, catalog=catalog, path=path)
+        feed = FakeAppList(APPS)
+        with patch.object(client, 'stream', side_effect=feed):
+            syncer.sync()
+            catalog.synced_at = 450
+            feed.apps = APPS + [{"appid": 2000000, "name": "New Game", "last_modified": 600}]
+            response = syncer.sync()
+
+        assert response.data["mode"] == "delta"
+        assert response.data["changed"] == 2
+        assert feed.calls[-1]["if_modified_since"] == 450
+        assert catalog.name_for(2000000) == "New Game"
+
+        restored = AppCatalog()
+        CatalogSyncer(client, catalog=restored, path=path)
+        assert restored.name_for(2000000) == "New Game"
+
+    def test_on_sync_callbacks(self, client):
+        """Test that callbacks run after a successful sync and their errors are contained."""
+        catalog = AppCatalog()
+        calls = []
+
+        def failing():
+            raise RuntimeError("boom")
+
+        syncer = CatalogSyncer(client, catalog=catalog, on_sync=[failing, lambda: calls.append(len(catalog))])
+        with patch.object(client, 'stream', side_effect=FakeAppList(APPS)):
+            assert syncer.sync().ok is True
+        assert calls == [5]
+
+    def test_loaded_catalog_indexed_on_first_run(self, client, tmp_path):
+        """Test that a catalog loaded from disk runs the callbacks even if the first sync fails."""
+        path = str(tmp_path / "catalog.bin")
+        saved = AppCatalog()
+        saved.replace([(10, "A", 1)])
+        saved.save(path)
+        calls = []
+
+        syncer = CatalogSyncer(client, catalog=AppCatalog(), path=path, on_sync=[lambda: calls.append(1)])
+        with patch.object(client, 'stream', side_effect=SteamAPIError(500, "boom")):
+            syncer.run_once()
+            syncer.run_once()
+        assert calls == [1]
+
+    def test_failed_sync_keeps_catalog(self, client):
+        """Test that a failed request leaves the catalog untouched."""
+        catalog = AppCatalog()
+        catalog.replace([(10, "A", 1)])
+        syncer = CatalogSyncer(client, catalog=catalog)
+        error = SteamAPIError(500, "boom")
+        with patch.object(client, 'stream', side_effect=error):
+            response = syncer.sync()
+        assert response.ok is False
+        assert catalog.name_for(10) == "A"
@@ -0,0 +1,88 @@
+"""
+Tests for the JSON codec module.
+
+These tests verify:
+- Round trips through the active backend and the stdlib fallback
+- Direct encoding of dataclasses and bytes
+- Response decoding in SteamClient
+"""
+
+import importlib
+
+import pytest
+from unittest.mock import Mock
+
+from steam import codec
+from steam.client import APIResponse, SteamClient
+from steam.schemas import Game
+
+
+@pytest.fixture(params=["default", "json"])
+def backend(request, monkeypatch):
+    """The codec module with each backend."""
+    if request.param == "json":
+        monkeypatch.setenv("STEAM_JSON_CODEC", "json")
+    else:
+        monkeypatch.delenv("STEAM_JSON_CODEC", raising=False)
+    yield importlib.reload(codec)
+    monkeypatch.delenv("STEAM_JSON_CODEC", raising=False)
+    importlib.reload(codec)
+
+
+class TestCodec:
+    """Test codec functions."""
+
+    def test_forced_stdlib_backend(self, monkeypatch):
+        """Test that STEAM_JSON_CODEC=json forces the stdlib backend."""
+        monkeypatch.setenv("STEAM_JSON_CODEC", "json")
+        try:
+            assert importlib.reload(codec).BACKEND == "json"
+        finally:
+            monkeypatch.delenv("STEAM_JSON_CODEC")
+            importlib.reload(codec)
+
+    def test_round_trip(self, backend):
+        """Test decode of bytes and str and compact UTF-8 output."""
+        data = {"name": "Pokémon™", "ids": [1, 2.5, None, True], "nested": {"a": []}}
+        encoded = backend.dumps(data)
+        assert isinstance(encoded, bytes)
+        assert "Pokémon™".encode("utf-8") in encoded
+        assert backend.loads(encoded) == data
+        assert backend.loads(backend.dumps_str(data)) == data
+
+    def test_dataclasses_and_bytes(self, backend):
+        """Test that dataclasses and bytes are encoded without to_dict()."""
+        game = Game(appid=570, name="Dota 2", playtime_forever=10)
+        decoded = backend.loads(backend.dumps({"game": game, "raw": b"abc", "bin": b"\xff\x00"}))
+        assert decoded["game"] == game.to_dict()
+        assert decoded["raw"] == "abc"
+        assert decoded["bin"] == "/wA="
+
+    def test_unsupported_type(self, backend):
+        """Test that unknown objects raise TypeError."""
+        with pytest.raises(TypeError):
+            backend.dumps({"x": object()})
+
+
+class TestClientDecoding:
+    """Test response decoding through the codec."""
+
+    def test_normalize_decodes_content(self, monkeypatch):
+        """Test that raw bodies are decoded by the codec and bad bodies kept as text."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+
+        response = Mock(status_code=200, content=b'{"response": {"player_count": 5}}', text="")
+        normalized = client._normalize_response(response, "https://api.steampowered.com/x")
+        assert normalized.data == {"response": {"player_count": 5}}
+        response.json.assert_not_called()
+
+        response = Mock(status_code=200, content=b"<html>", text="<html>")
+        assert client._normalize_response(response, "https://api.steampowered.com/x").data == {"raw_text": "<html>"}
+
+    def test_api_response_to_json(self):
+        """Test that APIResponse serializes with dataclass payloads."""
+        response = APIResponse(ok=True, source="test", data={"games": [Game(appid=10, name="CS")]})
+        decoded = codec.loads(response.to_json())
+        assert decoded["data"]["games"][0]["appid"] == 10
+        assert "error" not in decoded
@@ -0,0 +1,131 @@
+"""
+Tests for the currency module.
+
+These tests verify:
+- Localized price strings parse into hundredths for each currency format
+- Parsing without a currency guesses the decimal separator
+- Counts, bulk parsing, currency lookup and symbol detection
+- PriceOverview and MarketItem carry the parsed fields, including through search views
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from steam.client import APIResponse
+from steam.currency import (
+    detect_currency,
+    get_currency,
+    parse_count,
+    parse_price,
+    parse_prices,
+    price_parser,
+)
+from steam.market import SteamMarketAPI
+from steam.schemas import MarketItem, PriceOverview
+
+
+class TestParsePrice:
+    """Test price string parsing."""
+
+    @pytest.mark.parametrize("text,currency,expected", [
+        ("$1,234.56", 1, 123456),
+        ("$0.03", 1, 3),
+        ("£12.5", 2, 1250),
+        ("1.234,56€", 3, 123456),
+        ("1 234,56€", 3, 123456),
+        ("1 234,56 €", 3, 123456),
+        ("0,03€", 3, 3),
+        ("1 234,56 pуб.", 5, 123456),
+        ("R$ 1.234,56", 7, 123456),
+        ("¥ 1,234", 8, 123400),
+        ("CHF 1'234.50", 4, 123450),
+        ("12.345₫", 15, 1234500),
+        ("--", 1, None),
+        ("", 1, None),
+        (None, 3, None),
+    ])
+    def test_formats(self, text, currency, expected):
+        """Test strings in each currency's format."""
+        assert parse_price(text, currency) == expected
+
+    def test_iso_codes_and_cache(self):
+        """Test that codes and IDs share one cached parser."""
+        assert parse_price("1.234,56€", "eur") == 123456
+        assert price_parser("EUR") is price_parser("EUR")
+        assert price_parser(3).currency == 3
+        assert price_parser(999).currency is None
+
+    def test_guessed(self):
+        """Test parsing without a currency."""
+        assert parse_price("$1,234.56") == 123456
+        assert parse_price("1.234,56€") == 123456
+        assert parse_price("1,5€") == 150
+        assert parse_price("12,345") == 1234500
+
+    def test_bulk_and_counts(self):
+        """Test parse_prices and parse_count."""
+        assert parse_prices(["$1", "$2.50", None, "n/a"], 1) == [100, 250, None, None]
+        assert parse_count("12,345") == 12345
+        assert parse_count("1 234") == 1234
+        assert parse_count(7) == 7
+        assert parse_count(None) is None
+        assert parse_count("none") is None
+
+
+class TestCurrencies:
+    """Test currency lookup and detection."""
+
+    def test_get_currency(self):
+        """Test lookup by ID and code."""
+        assert get_currency(3).code == "EUR"
+        assert get_currency("usd").id == 1
+        assert get_currency("5").code == "RUB"
+        with pytest.raises(ValueError):
+            get_currency("XXX")
+
+    def test_detect(self):
+        """Test detection, longest symbol first, and ambiguous symbols."""
+        assert detect_currency("$0.03") == 1
+        assert detect_currency("CDN$ 0.03") == 20
+        assert detect_currency("R$ 1,00") == 7
+        assert detect_currency("1,00€") == 3
+        assert detect_currency("12,34 pуб.") == 5
+        assert detect_currency("¥ 1,234") is None
+        assert detect_currency("12.34") is None
+        assert detect_currency(None) is None
+
+
+class TestSchemas:
+    """Test the parsed schema fields."""
+
+    def test_price_overview(self):
+        """Test that the overview strings are parsed for the requested currency."""
+        overview = PriceOverview.from_api_response(
+            {"success": True, "lowest_price": "1.234,56€", "median_price": "1.200,--€", "volume": "12.345"}, 3)
+        assert overview.lowest_price_minor == 123456
+        assert overview.median_price_minor == 120000
+        assert overview.volume_count == 12345
+        assert overview.to_dict()["currency"] == 3
+        detected = PriceOverview.from_api_response({"success": True, "lowest_price": "$0.31"})
+        assert (detected.currency, detected.lowest_price_minor) == (1, 31)
+
+    def test_market_item(self):
+        """Test that market items parse sell_price_text."""
+        item = MarketItem.from_record({"name": "Case", "sell_price": 31, "sell_price_text": "$0.31"})
+        assert (item.sell_price_minor, item.currency) == (31, 1)
+
+    def test_search_view_matches_records(self, monkeypatch):
+        """Test that search results parsed in bulk serialize like the records."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        results = [{"name": "A", "sell_price_text": "1,05€"}, {"name": "B", "sell_price_text": "1.234,00€"},
+                   {"name": "C"}]
+        raw = {"results": [dict(r) for r in results]}
+        with patch.object(market.client, 'get', return_value=APIResponse(ok=True, source="steam_community", data=raw)):
+            response = market.search_items("case")
+
+        items = response.to_dict()["data"]["items"]
+        assert [i["sell_price_minor"] for i in items] == [105, 123400, None]
+        assert items[0]["currency"] == 3
+        assert items == [MarketItem.from_record(r).to_dict() for r in results]
@@ -0,0 +1,99 @@
+"""
+Tests for the concurrent players leaderboard module.
+
+These tests verify:
+- Ranking, top-N and rank-change queries
+- Stale counts for failed polls
+- Feeding the player count sampler
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse
+from steam.leaderboard import PlayerLeaderboard
+from steam.players import PlayerCountSampler
+from steam.web import SteamWebAPI
+
+
+def _players(counts):
+    def route(url, params=None):
+        count = counts.get(params["appid"])
+        if count is None:
+            return APIResponse(ok=False, source="steam_web_api", data={}, error={"message": "boom"})
+        return APIResponse(ok=True, source="steam_web_api",
+                           data={"response": {"player_count": count, "result": 1}})
+    return route
+
+
+@pytest.fixture
+def web(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamWebAPI()
+
+
+class TestPlayerLeaderboard:
+    """Test PlayerLeaderboard class."""
+
+    def test_top_and_rank(self, web):
+        """Test ranking after a refresh."""
+        leaderboard = PlayerLeaderboard(web, [10, 20, 30, 40], rate=1000)
+        with patch.object(web.client, 'get', side_effect=_players({10: 5, 20: 50, 30: 500, 40: 50})):
+            leaderboard.run_once()
+
+        top = leaderboard.top(3)
+        assert [e["appid"] for e in top["entries"]] == [30, 20, 40]
+        assert [e["rank"] for e in top["entries"]] == [1, 2, 3]
+        assert top["ranked_apps"] == 4
+        assert top["age_seconds"] is not None
+        assert leaderboard.top(2, offset=2)["entries"][0]["appid"] == 40
+        assert leaderboard.rank(10)["rank"] == 4
+        assert leaderboard.rank(99) is None
+
+    def test_rank_change(self, web):
+        """Test that rank changes are reported against the previous refresh."""
+        leaderboard = PlayerLeaderboard(web, [10, 20, 30], rate=1000)
+        with patch.object(web.client, 'get', side_effect=_players({10: 100, 20: 50, 30: 10})):
+            leaderboard.run_once()
+        with patch.object(web.client, 'get', side_effect=_players({10: 40, 20: 50, 30: 60})):
+            leaderboard.run_once()
+
+        assert leaderboard.rank(30)["rank"] == 1
+        assert leaderboard.rank(30)["previous_rank"] == 3
+        assert leaderboard.rank(30)["rank_change"] == 2
+        assert leaderboard.rank(10)["rank_change"] == -2
+
+    def test_failed_poll_keeps_last_count(self, web):
+        """Test that a failed poll does not drop an app from the ranking."""
+        leaderboard = PlayerLeaderboard(web, [10, 20], rate=1000)
+        with patch.object(web.client, 'get', side_effect=_players({10: 100, 20: 50})):
+            leaderboard.run_once()
+        with patch.object(web.client, 'get', side_effect=_players({20: 500})):
+            leaderboard.run_once()
+
+        assert leaderboard.last_failed == 1
+        assert leaderboard.rank(10)["current_players"] == 100
+        assert leaderboard.rank(20)["rank"] == 1
+
+    def test_feeds_sampler(self, web):
+        """Test that tracked apps' counts are recorded by the sampler."""
+        sampler = PlayerCountSampler(web, [10])
+        leaderboard = PlayerLeaderboard(web, [10, 20], rate=1000, sampler=sampler)
+        with patch.object(web.client, 'get', side_effect=_players({10: 100, 20: 50})):
+            leaderboard.run_once()
+
+        assert sampler.stats(10)["current_players"] == 100
+        assert sampler.stats(20) is None
+
+    def test_responses(self, web):
+        """Test APIResponse wrappers before and without configuration."""
+        assert PlayerLeaderboard(web, []).get_top().ok is False
+
+        leaderboard = PlayerLeaderboard(web, [10])
+        response = leaderboard.get_top()
+        assert response.ok is True
+        assert response.data["entries"] == []
+        assert response.warnings
+
+        assert leaderboard.get_rank(10).ok is False
+        assert leaderboard.get_rank("abc").ok is False
@@ -0,0 +1,136 @@
+"""
+Tests for the game library set operations module.
+
+These tests verify:
+- AppSet bitset operations
+- "Owned by at least k" queries
+- GroupLibraries caching and response shape
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.cache import library_cache
+from steam.client import APIResponse
+from steam.library import AppIndex, AppSet, GroupLibraries
+
+
+USER_A = "76561198000000001"
+USER_B = "76561198000000002"
+USER_C = "76561198000000003"
+
+
+class TestAppSet:
+    """Test AppSet bitset."""
+
+    def test_from_appids_and_membership(self):
+        """Test building a set and checking membership."""
+        apps = AppSet.from_appids([730, 570, 10, 730], index=AppIndex())
+        assert len(apps) == 3
+        assert 570 in apps
+        assert 440 not in apps
+        assert apps.to_list() == [10, 570, 730]
+
+    def test_set_operations(self):
+        """Test intersection, union and difference."""
+        index = AppIndex()
+        a = AppSet.from_appids([10, 570, 730], index=index)
+        b = AppSet.from_appids([570, 730, 440], index=index)
+        assert (a & b).to_list() == [570, 730]
+        assert (a | b).to_list() == [10, 440, 570, 730]
+        assert (a - b).to_list() == [10]
+        assert a.jaccard(b) == pytest.approx(0.5)
+
+    def test_empty_sets(self):
+        """Test operations on empty sets."""
+        index = AppIndex()
+        empty = AppSet.from_appids([], index=index)
+        assert len(empty) == 0
+        assert not empty
+        assert empty.jaccard(AppSet(0, index)) == 0.0
+
+    def test_different_indexes_rejected(self):
+        """Test that sets from different indexes cannot be combined."""
+        a = AppSet.from_appids([10], index=AppIndex())
+        b = AppSet.from_appids([10], index=AppIndex())
+        with pytest.raises(ValueError, match="different indexes"):
+            a & b
+
+    def test_group_queries(self):
+        """Test intersection, union and at-least-k over several sets."""
+        index = AppIndex()
+        sets = [
+            AppSet.from_appids([10, 20, 30], index=index),
+            AppSet.from_appids([20, 30, 40], index=index),
+            AppSet.from_appids([30, 40, 50], index=index),
+        ]
+        assert AppSet.intersection(sets).to_list() == [30]
+        assert AppSet.union(sets).to_list() == [10, 20, 30, 40, 50]
+        assert AppSet.at_least(sets, 2).to_list() == [20, 30, 40]
+        assert AppSet.at_least(sets, 3).to_list() == [30]
+        assert AppSet.at_least(sets, 4).to_list() == []
+
+
+class TestGroupLibraries:
+    """Test GroupLibraries class."""
+
+    @staticmethod
+    def _owned(appids):
+        return APIResponse(
+            ok=True,
+            source="steam_web_api",
+            data={"games": [{"appid": a, "name": f"Game {a}"} for a in appids]}
+        )
+
+    def test_compare(self, monkeypatch):
+        """Test comparing libraries of a group."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        library_cache.clear()
+        groups = GroupLibraries()
+        owned = {USER_A: [10, 20, 30], USER_B: [20, 30], USER_C: [30, 40]}
+
+        with patch.object(groups.web, 'get_owned_games',
+                          side_effect=lambda sid, **kw: self._owned(owned[sid])) as mock_get:
+            response = groups.compare([USER_A, USER_B, USER_C], min_owners=2)
+
+        assert response.ok is True
+        assert mock_get.call_count == 3
+        assert response.data["common"] == {"count": 1, "games": [{"appid": 30, "name": "Game 30"}]}
+        assert response.data["union_count"] == 4
+        assert response.data["owned_by_at_least"]["count"] == 2
+        assert len(response.data["similarity"]) == 3
+
+    def test_libraries_are_cached(self, monkeypatch):
+        """Test that repeated comparisons reuse cached bitsets."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        library_cache.clear()
+        groups = GroupLibraries()
+
+        with patch.object(groups.web, 'get_owned_games',
+                          return_value=self._owned([10, 20])) as mock_get:
+            groups.compare([USER_A, USER_B])
+            groups.compare([USER_A, USER_B])
+
+        assert mock_get.call_count == 2
+
+    def test_private_library_is_skipped(self, monkeypatch):
+        """Test that an empty library is reported but not intersected."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        library_cache.clear()
+        groups = GroupLibraries()
+        owned = {USER_A: [10, 20], USER_B: [20], USER_C: []}
+
+        with patch.object(groups.web, 'get_owned_games',
+                          side_effect=lambda sid, **kw: self._owned(owned[sid])):
+            response = groups.compare([USER_A, USER_B, USER_C])
+
+        assert response.ok is True
+        assert response.data["common"]["count"] == 1
+        assert any(USER_C in w for w in response.warnings)
+
+    def test_compare_requires_two_ids(self, monkeypatch):
+        """Test validation of the group size."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        groups = GroupLibraries()
+        response = groups.compare([USER_A])
+        assert response.ok is False
@@ -0,0 +1,147 @@
+"""
+Tests for the nameids module.
+
+These tests verify:
+- item_nameid extraction from listing page HTML
+- NameIDStore persistence across instances
+- ItemNameIDResolver scrapes each item once, including in bulk
+- SteamMarketAPI.get_item_orders_histogram_by_name and resolve_item_nameids
+"""
+
+from unittest.mock import patch
+
+from steam.client import APIResponse, SteamClient
+from steam.market import SteamMarketAPI
+from steam.nameids import ItemNameIDResolver, NameIDStore, extract_item_nameid
+
+PAGE = """
+<script type="text/javascript">
+    var g_rgAssets = {};
+    $J(function() {
+        Market_LoadOrderSpread( 176321160 );	// initial load
+        ItemActivityTicker.Start( 176321160 );
+    });
+</script>
+"""
+
+
+def _page(url, **kwargs):
+    if "Missing" in url:
+        return APIResponse(ok=True, source="steam_community", data={"raw_text": "<html>There are no listings</html>"})
+    return APIResponse(ok=True, source="steam_community", data={"raw_text": PAGE})
+
+
+class TestExtract:
+    """Test item_nameid extraction."""
+
+    def test_extract(self):
+        """Test both page patterns and pages without an ID."""
+        assert extract_item_nameid(PAGE) == "176321160"
+        assert extract_item_nameid("ItemActivityTicker.Start(42);") == "42"
+        assert extract_item_nameid("<html></html>") is None
+        assert extract_item_nameid(None) is None
+
+
+class TestNameIDStore:
+    """Test the persistent store."""
+
+    def test_persists(self, tmp_path):
+        """Test that mappings survive a reload and bad lines are skipped."""
+        path = str(tmp_path / "nameids.jsonl")
+        store = NameIDStore(path)
+        store.set(730, "Recoil Case", "176321160")
+        store.set(730, "Recoil Case", "176321160")
+        store.set(570, "Recoil Case", "7")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+
+        reloaded = NameIDStore(path)
+        assert len(reloaded) == 2
+        assert reloaded.get(730, "Recoil Case") == "176321160"
+        assert reloaded.get(570, "Recoil Case") == "7"
+        assert reloaded.get(730, "Kilowatt Case") is None
+        with open(path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        """Test that STEAM_NAMEID_FILE configures the path."""
+        monkeypatch.setenv("STEAM_NAMEID_FILE", str(tmp_path / "ids.jsonl"))
+        assert NameIDStore.from_env().path == str(tmp_path / "ids.jsonl")
+        monkeypatch.delenv("STEAM_NAMEID_FILE")
+        assert NameIDStore.from_env().path is None
+
+
+class TestResolver:
+    """Test scraping through the resolver."""
+
+    def test_scrapes_once(self, monkeypatch):
+        """Test that a resolved item is not scraped again and the name is quoted in the URL."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+        resolver = ItemNameIDResolver(client, NameIDStore(), rate=100)
+        with patch.object(client, 'get', side_effect=_page) as mock_get:
+            assert resolver.resolve(730, "AK-47 | Redline (Field-Tested)") == "176321160"
+            assert resolver.resolve(730, "AK-47 | Redline (Field-Tested)") == "176321160"
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[0][0].endswith("/market/listings/730/AK-47%20%7C%20Redline%20%28Field-Tested%29")
+
+    def test_resolve_many(self, monkeypatch):
+        """Test bulk resolution with stored, scraped and unresolvable items."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+        store = NameIDStore()
+        store.set(730, "Known", "1")
+        resolver = ItemNameIDResolver(client, store, rate=100)
+        with patch.object(client, 'get', side_effect=_page) as mock_get:
+            resolved = resolver.resolve_many(730, ["Known", "Recoil Case", "Missing", "Recoil Case"])
+        assert resolved == {"Known": "1", "Recoil Case": "176321160", "Missing": None}
+        assert mock_get.call_count == 2
+        assert store.get(730, "Missing") is None
+
+    def test_request_failure(self, monkeypatch):
+        """Test that a failed page request is returned as is."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+        resolver = ItemNameIDResolver(client, NameIDStore(), rate=100)
+        failed = APIResponse(ok=False, source="steam_community", data={}, error={"message": "Too Many Requests"})
+        with patch.object(client, 'get', return_value=failed):
+            assert resolver.lookup(730, "Recoil Case") is failed
+
+
+class TestMarketByName:
+    """Test the market API methods."""
+
+    def test_histogram_by_name(self, monkeypatch):
+        """Test that the histogram is requested with the scraped item_nameid."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        market.nameids = ItemNameIDResolver(market.client, NameIDStore(), rate=100)
+
+        def respond(url, params=None, **kwargs):
+            if "itemordershistogram" in url:
+                assert params["item_nameid"] == "176321160"
+                return APIResponse(ok=True, source="steam_community", data={
+                    "success": 1, "buy_order_graph": [[0.41, 3, "3 buy orders at $0.41 or higher"]]})
+            return _page(url)
+
+        with patch.object(market.client, 'get', side_effect=respond) as mock_get:
+            response = market.get_item_orders_histogram_by_name(730, "Recoil Case")
+            again = market.get_item_orders_histogram_by_name(730, "Recoil Case")
+        assert response.ok is True
+        assert response.data["item_nameid"] == "176321160"
+        assert response.data["buy"] == [[0.41, 3]]
+        assert again.ok is True
+        assert mock_get.call_count == 3
+
+    def test_unresolvable(self, monkeypatch):
+        """Test errors for empty and unresolvable names."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        market.nameids = ItemNameIDResolver(market.client, NameIDStore(), rate=100)
+        assert market.get_item_orders_histogram_by_name(730, "").ok is False
+        with patch.object(market.client, 'get', side_effect=_page):
+            assert market.get_item_orders_histogram_by_name(730, "Missing").ok is False
+            response = market.resolve_item_nameids(730, ["Recoil Case", "Missing"])
+        assert response.data["item_nameids"] == {"Recoil Case": "176321160"}
+        assert any("Missing" in w for w in response.warnings)
+        assert market.resolve_item_nameids(730, []).ok is False
@@ -0,0 +1,166 @@
+"""
+Tests for the incremental news tracking module.
+
+These tests verify:
+- Deduplicated storage and cursors
+- Probe-then-page incremental syncs, resuming catch-ups cut short by max_pages
+- "Since" queries served from the local store
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse
+from steam.news import NewsStore, NewsTracker
+from steam.web import SteamWebAPI
+
+
+def _item(gid, date, feed="steam_community_announcements"):
+    return {"gid": str(gid), "title": f"News {gid}", "url": "", "is_external_url": False,
+            "author": "", "contents": f"Contents {gid}", "feedlabel": "Community Announcements",
+            "date": date, "feedname": feed, "feed_type": 1, "appid": 730}
+
+
+class FakeNewsFeed:
+    """Serves GetNewsForApp from a list of items, honouring count and enddate."""
+
+    def __init__(self, items):
+        self.items = sorted(items, key=lambda n: n["date"], reverse=True)
+        self.calls = []
+
+    def __call__(self, url, params=None):
+        self.calls.append(dict(params))
+        items = self.items
+        if params.get("enddate") is not None:
+            items = [n for n in items if n["date"] <= params["enddate"]]
+        return APIResponse(ok=True, source="steam_web_api",
+                           data={"appnews": {"appid": params["appid"], "newsitems": items[:params["count"]]}})
+
+
+@pytest.fixture
+def web(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamWebAPI()
+
+
+@pytest.fixture
+def tracker(web):
+    return NewsTracker(web, store=NewsStore(), page_size=3, min_age=0, rate=1000)
+
+
+class TestNewsStore:
+    """Test NewsStore class."""
+
+    def test_dedup_and_cursor(self):
+        """Test that items are stored once and the cursor tracks the newest."""
+        store = NewsStore()
+        assert len(store.add(730, [_item(1, 100), _item(2, 200)])) == 2
+        assert store.add(730, [_item(2, 200)]) == []
+        cursor = store.cursor(730)
+        assert cursor.newest_gid == "2"
+        assert cursor.newest_date == 200
+        assert cursor.feeds == {"steam_community_announcements"}
+
+    def test_since_and_trim(self):
+        """Test date filtering across apps and the per-app limit."""
+        store = NewsStore(max_items_per_app=2)
+        store.add(730, [_item(1, 100), _item(2, 200), _item(3, 300)])
+        store.add(570, [_item(4, 250)])
+        assert [n["gid"] for n in store.since(since=150)] == ["3", "4", "2"]
+        assert [n["gid"] for n in store.since([730])] == ["3", "2"]
+        assert len(store.since(limit=1)) == 1
+
+
+class TestNewsTracker:
+    """Test NewsTracker class."""
+
+    def test_first_sync_fetches_one_page(self, web, tracker):
+        """Test that an unknown app gets a single page."""
+        feed = FakeNewsFeed([_item(i, i * 100) for i in range(1, 8)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            new = tracker.sync(730)
+        assert [n["gid"] for n in new] == ["7", "6", "5"]
+        assert len(feed.calls) == 1
+        assert feed.calls[0]["maxlength"] == tracker.maxlength
+
+    def test_unchanged_app_costs_one_small_probe(self, web, tracker):
+        """Test that an up-to-date app only needs a one-item probe."""
+        feed = FakeNewsFeed([_item(1, 100), _item(2, 200)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            tracker.sync(730)
+            assert tracker.sync(730) == []
+        assert feed.calls[-1]["count"] == 1
+        assert feed.calls[-1]["maxlength"] == 1
+        assert len(feed.calls) == 2
+
+    def test_catch_up_pages_with_enddate(self, web, tracker):
+        """Test that only items newer than the cursor are fetched and stored."""
+        feed = FakeNewsFeed([_item(1, 100), _item(2, 200)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            tracker.sync(730)
+            feed.items = sorted(feed.items + [_item(i, i * 100) for i in range(3, 9)],
+                                key=lambda n: n["date"], reverse=True)
+            new = tracker.sync(730)
+
+        assert [n["gid"] for n in new] == ["8", "7", "6", "5", "4", "3"]
+        assert any(c.get("enddate") for c in feed.calls)
+        assert tracker.store.cursor(730).newest_gid == "8"
+
+    def test_truncated_catch_up_resumes(self, web, tracker):
+        """Test that a catch-up cut short by max_pages is resumed, not lost."""
+        tracker.max_pages = 2
+        feed = FakeNewsFeed([_item(1, 100), _item(2, 200)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            tracker.sync(730)
+            feed.items = sorted(feed.items + [_item(i, i * 100) for i in range(3, 12)],
+                                key=lambda n: n["date"], reverse=True)
+            first = tracker.sync(730)
+            gap = tracker.store.cursor(730).gap
+            tracker.min_age = 3600
+            response = tracker.get_news_since(730, since=0, limit=50)
+            tracker.min_age = 0
+            second = tracker.sync(730)
+            third = tracker.sync(730)
+
+        assert [n["gid"] for n in first] == ["11", "10", "9", "8", "7"]
+        assert gap == (700, 200)
+        assert any("incomplete" in w for w in response.warnings)
+        assert response.data["cursors"][0]["gap_enddate"] == 700
+        assert [n["gid"] for n in second] == ["6", "5", "4", "3"]
+        assert third == []
+        assert tracker.store.cursor(730).gap is None
+        assert [n["gid"] for n in tracker.store.since([730])] == [str(i) for i in range(11, 0, -1)]
+
+    def test_min_age_skips_requests(self, web):
+        """Test that a fresh cursor is trusted without a request."""
+        tracker = NewsTracker(web, store=NewsStore(), min_age=3600, rate=1000)
+        feed = FakeNewsFeed([_item(1, 100)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            tracker.sync(730)
+            tracker.sync(730)
+        assert len(feed.calls) == 1
+
+    def test_get_news_since(self, web, tracker):
+        """Test the since query for a single app."""
+        feed = FakeNewsFeed([_item(1, 100), _item(2, 200), _item(3, 300)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            response = tracker.get_news_since(730, since=150)
+        assert response.ok is True
+        assert [n["gid"] for n in response.data["news"]] == ["3", "2"]
+        assert response.data["cursors"][0]["newest_gid"] == "3"
+
+    def test_get_news_since_errors(self, web, tracker):
+        """Test failures with no stored items and without tracked apps."""
+        error = APIResponse(ok=False, source="steam_web_api", data={}, error={"message": "boom"})
+        with patch.object(web.client, 'get', return_value=error):
+            assert tracker.get_news_since(730).ok is False
+        assert tracker.get_news_since().ok is False
+
+    def test_run_once_syncs_tracked_apps(self, web):
+        """Test the scheduled batch over tracked apps."""
+        tracker = NewsTracker(web, [730, 570], store=NewsStore(), rate=1000)
+        feed = FakeNewsFeed([_item(1, 100)])
+        with patch.object(web.client, 'get', side_effect=feed):
+            tracker.run_once()
+        assert {c["appid"] for c in feed.calls} == {730, 570}
+        assert tracker.store.cursor(570) is not None
@@ -0,0 +1,108 @@
+"""
+Tests for the local news full-text index.
+
+These tests verify:
+- Tokenization of marked-up news contents
+- BM25 ranking with app and date filters
+- Incremental adds and replacement of truncated copies
+- The per-app cap evicts the oldest items
+- Indexing of items returned by get_game_news
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse
+from steam.newsindex import NewsIndex, news_index, tokenize
+from steam.web import SteamWebAPI
+
+
+def _item(gid, appid, date, title, contents=""):
+    return {"gid": str(gid), "appid": appid, "date": date, "title": title,
+            "contents": contents, "url": f"https://example.com/{gid}", "feedlabel": "Announcements"}
+
+
+@pytest.fixture
+def index():
+    index = NewsIndex()
+    index.add_many([
+        _item(1, 730, 100, "Anti-cheat update", "We improved VAC anti-cheat detection."),
+        _item(2, 730, 200, "Operation launch", "New maps and a new operation pass."),
+        _item(3, 570, 300, "Patch 7.35", "Balance changes. Anti-cheat: more cheaters banned."),
+        _item(4, 440, 400, "Summer event", "Hats, maps and more hats."),
+    ])
+    return index
+
+
+class TestTokenize:
+    """Test the tokenizer."""
+
+    def test_strips_markup(self):
+        """Test that HTML, BBCode and URLs are not indexed."""
+        text = "[b]Patch[/b] <p>notes</p> https://store.steampowered.com/app/730 and the VAC"
+        assert tokenize(text) == ["patch", "notes", "vac"]
+
+
+class TestNewsIndex:
+    """Test NewsIndex class."""
+
+    def test_ranking(self, index):
+        """Test that title matches rank above contents-only matches."""
+        results = index.search("anti-cheat")
+        assert [r["gid"] for r in results] == ["1", "3"]
+        assert results[0]["score"] > results[1]["score"]
+        assert results[0]["snippet"].startswith("We improved")
+
+    def test_filters(self, index):
+        """Test app and date filters."""
+        assert [r["gid"] for r in index.search("maps", appids=[440])] == ["4"]
+        assert [r["gid"] for r in index.search("anti cheat", since=150)] == ["3"]
+        assert [r["gid"] for r in index.search("maps", until=250)] == ["2"]
+        assert index.search("nothing-matches-this") == []
+
+    def test_truncated_copy_does_not_replace_full(self, index):
+        """Test that only longer contents replace an indexed item."""
+        assert index.add(_item(1, 730, 100, "Anti-cheat update", "W")) is False
+        assert index.add(_item(1, 730, 100, "Anti-cheat update",
+                               "We improved VAC anti-cheat detection. Also trading changes.")) is True
+        assert len(index) == 4
+        assert [r["gid"] for r in index.search("trading")] == ["1"]
+
+    def test_per_app_cap(self):
+        """Test that each app keeps only its newest items and evicted ones leave the postings."""
+        index = NewsIndex(max_items_per_app=2)
+        index.add_many([_item(i, 730, i * 100, f"Update {i}", f"word{i}") for i in range(1, 5)])
+        index.add(_item(9, 570, 50, "Other app", "word1"))
+        assert len(index) == 3
+        assert {r["gid"] for r in index.search("update")} == {"3", "4"}
+        assert [r["gid"] for r in index.search("word1")] == ["9"]
+        assert index.add(_item(0, 730, 10, "Ancient", "old")) is False
+        assert index.search("ancient") == []
+
+    def test_search_response(self, index):
+        """Test the APIResponse wrapper."""
+        response = index.search_news("hats", limit=5)
+        assert response.ok is True
+        assert response.data["indexed_items"] == 4
+        assert response.data["results"][0]["gid"] == "4"
+        assert index.search_news("the and").ok is False
+
+
+class TestGameNewsIndexing:
+    """Test that fetched news is indexed."""
+
+    def test_get_game_news_feeds_index(self, monkeypatch):
+        """Test that get_game_news adds items to the shared index."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        news_index.clear()
+        web = SteamWebAPI()
+        data = {"appnews": {"appid": 730, "newsitems": [
+            {"gid": "99", "title": "Anti-cheat overhaul", "contents": "Details", "date": 500}
+        ]}}
+
+        with patch.object(web.client, 'get',
+                          return_value=APIResponse(ok=True, source="steam_web_api", data=data)):
+            web.get_game_news(730)
+
+        results = news_index.search("overhaul")
+        assert [(r["gid"], r["appid"]) for r in results] == [("99", 730)]
@@ -0,0 +1,187 @@
+"""
+Tests for the orderbook module.
+
+These tests verify:
+- Cumulative histogram graphs are parsed into per-level quantities in cents
+- Spread, mid price and depth within a percentage of the mid price
+- OrderBookHistory reconstructs every snapshot from deltas, including after eviction
+- Delta storage holds far fewer bytes than full snapshots
+- SteamMarketAPI.get_order_book_summary returns metrics and the change since the last call
+"""
+
+import random
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.nameids import ItemNameIDResolver, NameIDStore
+from steam.orderbook import OrderBook, OrderBookHistory, OrderBookStore
+
+HISTOGRAM = {
+    "success": 1,
+    "buy_order_count": "1,250",
+    "sell_order_count": 900,
+    "price_prefix": "$",
+    "price_suffix": "",
+    "buy_order_graph": [[1.00, 10, ""], [0.99, 15, ""], [0.95, 40, ""], [0.80, 100, ""]],
+    "sell_order_graph": [[1.04, 2, ""], [1.05, 7, ""], [1.10, 27, ""], [1.50, 60, ""]],
+}
+
+
+def _random_book(rng, timestamp=0.0):
+    buy = sorted(rng.sample(range(100, 1000), 60), reverse=True)
+    sell = sorted(rng.sample(range(1001, 2000), 60))
+    total, buy_graph = 0, []
+    for price in buy:
+        total += rng.randint(1, 50)
+        buy_graph.append([price / 100, total, ""])
+    total, sell_graph = 0, []
+    for price in sell:
+        total += rng.randint(1, 50)
+        sell_graph.append([price / 100, total, ""])
+    return OrderBook.from_histogram({"buy_order_graph": buy_graph, "sell_order_graph": sell_graph}, timestamp)
+
+
+def _mutate(rng, book, timestamp):
+    """Change a few levels of a book, as between two polls."""
+    buy = dict(zip(book.buy_prices.tolist(), book.buy_quantities.tolist()))
+    sell = dict(zip(book.sell_prices.tolist(), book.sell_quantities.tolist()))
+    for side, low, high in ((buy, 100, 1000), (sell, 1001, 2000)):
+        for _ in range(3):
+            side[rng.randint(low, high)] = rng.randint(1, 50)
+        side.pop(rng.choice(list(side)))
+    buy_prices, sell_prices = sorted(buy), sorted(sell)
+    return OrderBook(np.array(buy_prices, dtype=np.int64), np.array([buy[p] for p in buy_prices], dtype=np.int32),
+                     np.array(sell_prices, dtype=np.int64), np.array([sell[p] for p in sell_prices], dtype=np.int32),
+                     timestamp=timestamp)
+
+
+def _assert_same(a, b):
+    assert a.buy_prices.tolist() == b.buy_prices.tolist()
+    assert a.buy_quantities.tolist() == b.buy_quantities.tolist()
+    assert a.sell_prices.tolist() == b.sell_prices.tolist()
+    assert a.sell_quantities.tolist() == b.sell_quantities.tolist()
+    assert a.timestamp == b.timestamp
+
+
+class TestOrderBook:
+    """Test parsing and metrics."""
+
+    def test_parse(self):
+        """Test that levels are per-price quantities in cents, best price first in to_dict."""
+        book = OrderBook.from_histogram(HISTOGRAM)
+        assert book.buy_prices.tolist() == [80, 95, 99, 100]
+        assert book.buy_quantities.tolist() == [60, 25, 5, 10]
+        assert book.sell_quantities.tolist() == [2, 5, 20, 33]
+        assert book.buy_order_count == 1250
+        assert book.to_dict()["buy"][0] == [1.0, 10]
+        assert book.to_dict()["sell"][-1] == [1.5, 33]
+
+    def test_metrics(self):
+        """Test spread, mid price and depth."""
+        book = OrderBook.from_histogram(HISTOGRAM)
+        assert (book.best_bid, book.best_ask, book.spread, book.mid) == (100, 104, 4, 102.0)
+        depth = book.depth([5, 10])
+        # 5% of 1.02: bids >= 0.969, asks <= 1.071
+        assert depth["5%"] == {"bid_quantity": 15, "ask_quantity": 7,
+                               "bid_value": 14.95, "ask_value": 7.33}
+        assert depth["10%"]["bid_quantity"] == 40
+        assert depth["10%"]["ask_quantity"] == 27
+        summary = book.summary()
+        assert summary["spread"] == 0.04
+        assert summary["spread_pct"] == round(4 / 102 * 100, 3)
+
+    def test_one_sided(self):
+        """Test that a book without asks has no spread or depth."""
+        book = OrderBook.from_histogram({"buy_order_graph": HISTOGRAM["buy_order_graph"]})
+        assert book.best_ask is None and book.mid is None
+        assert book.depth() == {}
+        assert book.summary()["spread_pct"] is None
+
+
+class TestOrderBookHistory:
+    """Test delta storage."""
+
+    def test_round_trip_with_eviction(self):
+        """Test that every kept snapshot is reconstructed exactly after old ones are dropped."""
+        rng = random.Random(7)
+        history = OrderBookHistory(max_snapshots=10, keyframe_interval=4)
+        books = [_random_book(rng)]
+        for i in range(1, 25):
+            books.append(_mutate(rng, books[-1], float(i)))
+        for book in books:
+            history.append(book)
+
+        assert len(history) == 10
+        assert history.timestamps() == [b.timestamp for b in books[-10:]]
+        for index, book in enumerate(books[-10:]):
+            _assert_same(history.snapshot(index), book)
+        _assert_same(history.snapshot(-1), books[-1])
+        with pytest.raises(IndexError):
+            history.snapshot(10)
+
+    def test_deltas_are_small(self):
+        """Test that delta storage holds far less than full snapshots."""
+        rng = random.Random(3)
+        history = OrderBookHistory()
+        book = _random_book(rng)
+        full = 0
+        for i in range(100):
+            history.append(book)
+            full += book.nbytes
+            book = _mutate(rng, book, float(i + 1))
+        assert history.nbytes < full / 4
+
+    def test_store(self):
+        """Test that the store returns the previous snapshot per item and currency."""
+        store = OrderBookStore()
+        first, second = OrderBook.from_histogram(HISTOGRAM, 1.0), OrderBook.from_histogram(HISTOGRAM, 2.0)
+        assert store.record("1", 1, first) is None
+        assert store.record("1", 3, first) is None
+        assert store.record("1", 1, second) is first
+        assert len(store.history("1", 1)) == 2
+        assert store.history("2") is None
+
+
+class TestMarketOrderBook:
+    """Test get_order_book_summary."""
+
+    def _market(self, monkeypatch):
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        store = NameIDStore()
+        store.set(730, "Recoil Case", "176321160")
+        market.nameids = ItemNameIDResolver(market.client, store, rate=100)
+        return market
+
+    def test_summary_and_change(self, monkeypatch):
+        """Test that only metrics are returned and the second call reports the change."""
+        market = self._market(monkeypatch)
+        later = dict(HISTOGRAM, buy_order_count=1300,
+                     buy_order_graph=[[1.02, 4, ""]] + [[p, q + 4, ""] for p, q, _ in HISTOGRAM["buy_order_graph"]])
+        responses = [APIResponse(ok=True, source="steam_community", data=HISTOGRAM),
+                     APIResponse(ok=True, source="steam_community", data=later)]
+        with patch.object(market.client, 'get', side_effect=responses):
+            first = market.get_order_book_summary(730, "Recoil Case", depths=[5])
+            second = market.get_order_book_summary(730, "Recoil Case", depths=[5])
+
+        assert first.ok is True
+        assert first.data["best_bid"] == 1.0 and first.data["mid"] == 1.02
+        assert set(first.data["depth"]) == {"5%"}
+        assert "change" not in first.data
+        assert "buy_order_graph" not in first.data
+        assert second.data["change"]["best_bid"] == 0.02
+        assert second.data["change"]["best_ask"] == 0.0
+        assert second.data["change"]["buy_order_count"] == 50
+
+    def test_errors(self, monkeypatch):
+        """Test invalid depths and unsuccessful histograms."""
+        market = self._market(monkeypatch)
+        assert market.get_order_book_summary(730, "Recoil Case", depths=[0]).ok is False
+        assert market.get_order_book_summary(730, "").ok is False
+        failed = APIResponse(ok=True, source="steam_community", data={"success": 16})
+        with patch.object(market.client, 'get', return_value=failed):
+            assert market.get_order_book_summary(730, "Recoil Case").ok is False
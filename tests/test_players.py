@@ -0,0 +1,161 @@
+"""
+Tests for the current-player sampler module.
+
+These tests verify:
+- RingBuffer eviction and windowed reads
+- Concurrent polling and sample recording
+- Locally computed peaks, averages and trends
+- JSONL persistence and replay
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse
+from steam.players import PlayerCountSampler, RingBuffer, fetch_player_counts
+from steam.schemas import PlayerCount
+from steam.web import SteamWebAPI
+
+
+NOW = 1_700_000_000.0
+
+
+def _players(url, params=None):
+    counts = {730: 1000, 570: 500}
+    appid = params["appid"]
+    if appid not in counts:
+        return APIResponse(ok=False, source="steam_web_api", data={}, error={"message": "boom"})
+    return APIResponse(ok=True, source="steam_web_api",
+                       data={"response": {"player_count": counts[appid], "result": 1}})
+
+
+@pytest.fixture
+def web(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamWebAPI()
+
+
+class TestRingBuffer:
+    """Test RingBuffer class."""
+
+    def test_eviction_keeps_newest(self):
+        """Test that the oldest samples are overwritten when full."""
+        buffer = RingBuffer(3)
+        for i in range(5):
+            buffer.append(float(i), i * 10)
+        assert len(buffer) == 3
+        assert list(buffer) == [(2.0, 20), (3.0, 30), (4.0, 40)]
+        assert buffer.latest() == (4.0, 40)
+
+    def test_since(self):
+        """Test reading a time window."""
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.append(float(i), i)
+        assert buffer.since(3.5) == [(4.0, 4), (5.0, 5)]
+        assert buffer.since(100.0) == []
+
+    def test_empty(self):
+        """Test an empty buffer."""
+        buffer = RingBuffer(2)
+        assert buffer.latest() is None
+        assert list(buffer) == []
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestPlayerCount:
+    """Test PlayerCount schema."""
+
+    def test_peaks_unknown_from_api(self):
+        """Test that the API response does not invent peak values."""
+        count = PlayerCount.from_api_response({"response": {"player_count": 42}}, 730)
+        assert count.to_dict() == {
+            "appid": 730,
+            "current_players": 42,
+            "current_24h_peak": None,
+            "current_all_time_peak": None,
+        }
+
+
+class TestPlayerCountSampler:
+    """Test PlayerCountSampler class."""
+
+    def test_fetch_player_counts(self, web):
+        """Test concurrent polling with a failed app."""
+        with patch.object(web.client, 'get', side_effect=_players) as mock_get:
+            counts = fetch_player_counts(web, [730, 570, 1, 730])
+        assert counts == {730: 1000, 570: 500, 1: None}
+        assert mock_get.call_count == 3
+
+    def test_run_once_records_samples(self, web):
+        """Test that a poll records one sample per successful app."""
+        sampler = PlayerCountSampler(web, [730, 570, 1])
+        with patch.object(web.client, 'get', side_effect=_players):
+            sampler.run_once()
+        assert sampler.stats(730)["current_players"] == 1000
+        assert sampler.stats(570)["samples"] == 1
+        assert sampler.stats(1) is None
+
+    def test_stats(self, web):
+        """Test 24h and all-time statistics."""
+        sampler = PlayerCountSampler(web, [730])
+        sampler.record(730, 5000, NOW - 2 * 86400)
+        for hour, count in enumerate([100, 200, 300, 400]):
+            sampler.record(730, count, NOW - (3 - hour) * 3600)
+
+        stats = sampler.stats(730, now=NOW)
+        assert stats["current_players"] == 400
+        assert stats["samples"] == 5
+        assert stats["samples_24h"] == 4
+        assert stats["peak_24h"] == 400
+        assert stats["min_24h"] == 100
+        assert stats["avg_24h"] == 250
+        assert stats["all_time_peak"] == 5000
+        assert stats["trend_24h"] == {"slope_per_hour": 100.0, "direction": "rising"}
+
+    def test_all_time_peak_survives_eviction(self, web):
+        """Test that the peak is kept after its sample leaves the buffer."""
+        sampler = PlayerCountSampler(web, [730], capacity=2)
+        sampler.record(730, 900, NOW - 30)
+        sampler.record(730, 10, NOW - 20)
+        sampler.record(730, 20, NOW - 10)
+        stats = sampler.stats(730, now=NOW)
+        assert stats["samples"] == 2
+        assert stats["peak_24h"] == 20
+        assert stats["all_time_peak"] == 900
+
+    def test_untracked_apps_are_ignored(self, web):
+        """Test that samples for unknown apps are dropped."""
+        sampler = PlayerCountSampler(web, [730])
+        sampler.record(440, 10)
+        assert sampler.appids == [730]
+        response = sampler.get_stats(440)
+        assert response.ok is False
+        assert "not sampled" in response.error["message"]
+
+    def test_persistence_and_compaction(self, web, tmp_path):
+        """Test that samples are replayed from disk and the file is compacted."""
+        path = str(tmp_path / "players.jsonl")
+        sampler = PlayerCountSampler(web, [730], capacity=2, path=path)
+        for i, count in enumerate([900, 10, 20, 30, 40]):
+            sampler.record(730, count, NOW + i)
+
+        with open(path) as f:
+            assert len(f.readlines()) <= 4
+
+        restored = PlayerCountSampler(web, [730], capacity=2, path=path)
+        stats = restored.stats(730, now=NOW + 10)
+        assert stats["current_players"] == 40
+        assert stats["samples"] == 2
+        assert stats["all_time_peak"] == 900
+
+    def test_from_env(self, web, monkeypatch):
+        """Test configuration from environment variables."""
+        monkeypatch.setenv("STEAM_PLAYER_SAMPLER_APPIDS", "730, 570")
+        monkeypatch.setenv("STEAM_PLAYER_SAMPLER_INTERVAL", "60")
+        monkeypatch.delenv("STEAM_PLAYER_SAMPLER_FILE", raising=False)
+        sampler = PlayerCountSampler.from_env(web)
+        assert sampler.appids == [570, 730]
+        assert sampler.interval == 60
+        assert sampler.path is None
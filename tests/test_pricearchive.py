@@ -0,0 +1,225 @@
+"""
+Tests for the pricearchive module.
+
+These tests verify:
+- Block encoding round-trips timestamps, prices and volumes exactly
+- Merges add only newer points, rewrite the mutable window and seal blocks
+- Range reads through the block index, and recovery from a torn index record
+  or a .recent file left behind by an interrupted merge
+- SteamMarketAPI serves repeat price-history queries from the archive, reading
+  only the blocks a range query overlaps, and backfills items
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from steam.cache import price_cache
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.pricearchive import PriceArchive, decode_block, encode_block
+from steam.priceseries import PriceSeries
+
+HOUR = 3600
+START = 1704067200  # Jan 01 2024 00:00 UTC
+
+
+def _hourly(prices, start=START):
+    return PriceSeries(np.arange(len(prices), dtype=np.int64) * HOUR + start,
+                       np.array(prices, dtype=np.float64),
+                       np.arange(len(prices), dtype=np.int32) % 50, "$", "")
+
+
+def _assert_same(a, b):
+    assert a.timestamps.tolist() == b.timestamps.tolist()
+    assert a.prices.tolist() == b.prices.tolist()
+    assert a.volumes.tolist() == b.volumes.tolist()
+
+
+class TestBlocks:
+    """Test the block codec."""
+
+    def test_round_trip(self):
+        """Test exact round trips for cent prices, arbitrary floats and empty blocks."""
+        cents = _hourly([round(0.03 + i * 0.017, 3) for i in range(500)])
+        _assert_same(decode_block(encode_block(cents)), cents)
+        floats = _hourly([1.0 / (i + 3) for i in range(50)])
+        _assert_same(decode_block(encode_block(floats)), floats)
+        assert len(decode_block(encode_block(PriceSeries()))) == 0
+
+    def test_compresses(self):
+        """Test that regular hourly points compress well below their raw size."""
+        series = _hourly([1.5] * 1000)
+        assert len(encode_block(series)) < 1000 * 20 / 10
+
+    def test_corrupt(self):
+        """Test that corrupt blocks raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_block(encode_block(_hourly([1.0, 2.0]))[:-4])
+
+
+class TestPriceArchive:
+    """Test merging and reading."""
+
+    def test_merge_and_read(self, tmp_path):
+        """Test the first merge, an incremental merge and a revised recent point."""
+        archive = PriceArchive(str(tmp_path), mutable_window=2 * HOUR, block_points=4)
+        assert archive.read(730, "Case", 1) is None
+
+        first = _hourly([1.0 + i for i in range(10)])
+        assert archive.merge(730, "Case", 1, first, refreshed_at=100.0) == 10
+        _assert_same(archive.read(730, "Case", 1), first)
+        info = archive.info(730, "Case", 1)
+        assert info["points"] == 10 and info["blocks"] == 2 and info["refreshed_at"] == 100.0
+
+        second = _hourly([1.0 + i for i in range(12)])
+        second.prices[9] = 99.0   # inside the mutable window: replaced
+        second.prices[2] = 55.0   # sealed: kept as archived
+        assert archive.merge(730, "Case", 1, second) == 2
+        merged = archive.read(730, "Case", 1)
+        assert len(merged) == 12
+        assert merged.prices[9] == 99.0
+        assert merged.prices[2] == 3.0
+        assert merged.price_prefix == "$"
+
+    def test_keeps_points_dropped_upstream(self, tmp_path):
+        """Test that archived hourly points survive when Steam folds them into fewer points."""
+        archive = PriceArchive(str(tmp_path), mutable_window=HOUR)
+        archive.merge(730, "Case", 1, _hourly([1.0] * 24))
+        folded = PriceSeries(np.array([START, START + 30 * HOUR], dtype=np.int64),
+                             np.array([1.0, 2.0]), np.array([24, 1], dtype=np.int32))
+        assert archive.merge(730, "Case", 1, folded) == 1
+        assert len(archive.read(730, "Case", 1)) == 25
+
+    def test_range_reads_overlapping_blocks(self, tmp_path):
+        """Test that a range read decodes only the blocks it overlaps."""
+        archive = PriceArchive(str(tmp_path), mutable_window=HOUR, block_points=10)
+        series = _hourly(list(range(100)))
+        archive.merge(730, "Case", 1, series)
+        assert archive.info(730, "Case", 1)["blocks"] == 10
+
+        with patch("steam.pricearchive.decode_block", wraps=decode_block) as decode:
+            window = archive.read(730, "Case", 1, start=START + 25 * HOUR, end=START + 34 * HOUR)
+        assert window.prices.tolist() == [float(i) for i in range(25, 35)]
+        # Two sealed blocks plus the recent block
+        assert decode.call_count == 3
+
+    def test_torn_index_record(self, tmp_path):
+        """Test that a partial index record left by an interrupted append is ignored."""
+        archive = PriceArchive(str(tmp_path), mutable_window=HOUR, block_points=10)
+        archive.merge(730, "Case", 1, _hourly(list(range(30))))
+        path = archive._path(730, "Case", 1)
+        with open(f"{path}.idx", "ab") as f:
+            f.write(b"\x01\x02\x03")
+        assert len(archive.read(730, "Case", 1)) == 30
+        archive.merge(730, "Case", 1, _hourly(list(range(45))))
+        assert os.path.getsize(f"{path}.idx") % 32 == 0
+        assert archive.read(730, "Case", 1).prices.tolist() == [float(i) for i in range(45)]
+
+    def test_stale_recent_after_interrupted_merge(self, tmp_path):
+        """Test that recent points already sealed are neither read twice nor sealed again."""
+        archive = PriceArchive(str(tmp_path), mutable_window=HOUR, block_points=10)
+        archive.merge(730, "Case", 1, _hourly(list(range(5))))
+        path = archive._path(730, "Case", 1)
+        with open(f"{path}.recent", "rb") as f:
+            stale = f.read()
+        archive.merge(730, "Case", 1, _hourly(list(range(25))))
+        assert archive.info(730, "Case", 1)["points"] == 25
+        # Crash after the blocks were appended, before .recent was replaced
+        with open(f"{path}.recent", "wb") as f:
+            f.write(stale)
+
+        # Points 0-22 were sealed; the stale file only repeats some of them
+        assert archive.read(730, "Case", 1).prices.tolist() == [float(i) for i in range(23)]
+        assert archive.info(730, "Case", 1)["points"] == 23
+        archive.merge(730, "Case", 1, _hourly(list(range(40))))
+        assert archive.read(730, "Case", 1).prices.tolist() == [float(i) for i in range(40)]
+        assert archive.info(730, "Case", 1)["points"] == 40
+
+    def test_keys_are_separate(self, tmp_path):
+        """Test that currencies and names are archived separately."""
+        archive = PriceArchive(str(tmp_path))
+        archive.merge(730, "AK-47 | Redline (Field-Tested)", 1, _hourly([1.0]))
+        archive.merge(730, "AK-47 | Redline (Field-Tested)", 3, _hourly([2.0, 3.0]))
+        assert len(archive.read(730, "AK-47 | Redline (Field-Tested)", 1)) == 1
+        assert len(archive.read(730, "AK-47 | Redline (Field-Tested)", 3)) == 2
+        assert archive.read(570, "AK-47 | Redline (Field-Tested)", 1) is None
+
+
+class TestMarketArchive:
+    """Test the archive through SteamMarketAPI."""
+
+    def setup_method(self):
+        price_cache.clear()
+
+    def teardown_method(self):
+        price_cache.clear()
+
+    @staticmethod
+    def _respond(url, params=None, **kwargs):
+        if params["market_hash_name"] == "Missing":
+            return APIResponse(ok=False, source="steam_community", data={},
+                               error={"status_code": 500, "message": "Server error"})
+        prices = _hourly([1.0, 2.0, 3.0]).to_prices()
+        return APIResponse(ok=True, source="steam_community",
+                           data={"success": True, "price_prefix": "$", "price_suffix": "", "prices": prices})
+
+    def test_repeat_queries_served_locally(self, monkeypatch, tmp_path):
+        """Test that a second query within max age makes no request."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI(archive=PriceArchive(str(tmp_path)))
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            first = market.get_item_price_history(730, "Case")
+            second = market.get_item_price_history(730, "Case", interval="1d")
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[1]["params"]["currency"] == 1
+        assert first.data["price_history"]["prices"] == _hourly([1.0, 2.0, 3.0]).to_prices()
+        assert first.data["price_history"]["price_prefix"] == "$"
+        assert second.data["price_history"]["bars"][0][1:] == [1.0, 3.0, 1.0, 3.0, 3]
+
+    def test_range_query_reads_overlapping_blocks(self, monkeypatch, tmp_path):
+        """Test that a price-history range query decodes only the archive blocks it overlaps."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        archive = PriceArchive(str(tmp_path), mutable_window=HOUR, block_points=10)
+        archive.merge(730, "Case", 1, _hourly([float(i) for i in range(100)]), refreshed_at=time.time())
+        market = SteamMarketAPI(archive=archive)
+        with patch.object(market.client, 'get') as mock_get, \
+             patch("steam.pricearchive.decode_block", wraps=decode_block) as decode:
+            response = market.get_item_price_history(730, "Case", start=START + 25 * HOUR, end=START + 34 * HOUR)
+        mock_get.assert_not_called()
+        # The recent points for info() and read(), then the two overlapping blocks
+        assert decode.call_count == 4
+        prices = response.data["price_history"]["prices"]
+        assert [p[1] for p in prices] == [float(i) for i in range(25, 35)]
+
+    def test_archive_from_env(self, monkeypatch, tmp_path):
+        """Test that STEAM_PRICE_ARCHIVE_DIR enables the archive."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        monkeypatch.delenv("STEAM_PRICE_ARCHIVE_DIR", raising=False)
+        assert SteamMarketAPI().archive is None
+        monkeypatch.setenv("STEAM_PRICE_ARCHIVE_DIR", str(tmp_path))
+        assert SteamMarketAPI().archive.root == str(tmp_path)
+
+    def test_backfill(self, monkeypatch, tmp_path):
+        """Test that backfill archives items concurrently and reports failures."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI(archive=PriceArchive(str(tmp_path)))
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            response = market.backfill_price_archive(730, ["Case", "Missing", "Key"], rate=100)
+            again = market.backfill_price_archive(730, ["Case", "Key"], rate=100)
+        assert mock_get.call_count == 3
+        assert response.data["items"] == [
+            {"market_hash_name": "Case", "points": 3, "new_points": 3},
+            {"market_hash_name": "Key", "points": 3, "new_points": 3},
+        ]
+        assert any("Missing" in w for w in response.warnings)
+        assert [i["new_points"] for i in again.data["items"]] == [0, 0]
+
+    def test_backfill_without_archive(self, monkeypatch):
+        """Test that backfill needs a configured archive."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        monkeypatch.delenv("STEAM_PRICE_ARCHIVE_DIR", raising=False)
+        assert SteamMarketAPI().backfill_price_archive(730, ["Case"]).ok is False
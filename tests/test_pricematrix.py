@@ -0,0 +1,180 @@
+"""
+Tests for the pricematrix module.
+
+These tests verify:
+- PriceMatrix derives implied rates from the median item ratio, in both directions
+- Tables estimate missing cells through implied rates, rounded to the displayed unit
+- Stale cells and rates are ignored
+- SteamMarketAPI.get_price_matrix fetches only anchor items outside the base currency,
+  reuses fresh rates and cells on later calls and dates cells from cached overviews
+  by their fetch time
+"""
+
+import time
+from unittest.mock import patch
+
+from steam.cache import overview_cache
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.pricematrix import PriceMatrix
+from steam.scheduler import MarketScheduler
+
+
+class TestPriceMatrix:
+    """Test cells, implied rates and tables."""
+
+    def test_derive_rate_median(self):
+        """Test that an outlier ratio does not move the rate and the inverse is kept."""
+        matrix = PriceMatrix()
+        for name, usd, eur in [("A", 100, 90), ("B", 200, 180), ("C", 1000, 1500)]:
+            matrix.record(730, name, 1, usd)
+            matrix.record(730, name, 3, eur)
+        rate = matrix.derive_rate(730, ["A", "B", "C"], 1, 3)
+        assert rate.rate == 0.9 and rate.items == 3
+        assert abs(matrix.rate(3, 1).rate - 1 / 0.9) < 1e-9
+        assert matrix.rate(1, 1).rate == 1.0
+        assert matrix.derive_rate(730, ["A"], 1, 5) is None
+
+    def test_table_estimates(self):
+        """Test fetched, estimated and missing cells and whole-unit rounding."""
+        matrix = PriceMatrix()
+        matrix.record(730, "A", 1, 100)
+        matrix.record(730, "A", 3, 92)
+        matrix.record(730, "A", 8, 15000)
+        matrix.record(730, "B", 1, 333)
+        matrix.derive_rate(730, ["A"], 1, 3)
+        matrix.derive_rate(730, ["A"], 1, 8)
+        table = matrix.table(730, ["A", "B", "C"], [1, 3, 8, 5])
+
+        assert table["currencies"] == ["USD", "EUR", "JPY", "RUB"]
+        assert table["prices"] == [[100, 92, 15000, None],
+                                   [333, 306, 50000, None],
+                                   [None, None, None, None]]
+        assert table["estimated"][1] == [0, 1, 1, 0]
+        assert table["ages"][0][0] == 0 and table["ages"][2][0] is None
+        assert table["fx"]["EUR"] == {"rate": 0.92, "items": 1, "age": 0}
+        assert "RUB" not in table["fx"]
+
+    def test_max_age(self):
+        """Test that old cells and rates are treated as missing."""
+        matrix = PriceMatrix()
+        matrix.record(730, "A", 1, 100, fetched_at=time.time() - 100)
+        matrix.record(730, "A", 3, 90)
+        assert matrix.cell(730, "A", 1, max_age=50) is None
+        assert matrix.derive_rate(730, ["A"], 1, 3, max_age=50) is None
+        matrix.derive_rate(730, ["A"], 1, 3)
+        assert matrix.rate(1, 3, max_age=-1) is None
+        assert matrix.table(730, ["A"], [1, 3], max_age=50)["prices"] == [[None, 90]]
+
+    def test_max_cells(self):
+        """Test that the oldest cells are evicted first."""
+        matrix = PriceMatrix(max_cells=2)
+        for name in ["A", "B", "C"]:
+            matrix.record(730, name, 1, 100)
+        assert len(matrix) == 2
+        assert matrix.cell(730, "A", 1) is None
+
+
+class TestMarketPriceMatrix:
+    """Test cross-currency price tables from the market."""
+
+    # Display formats by currency, given the price in hundredths
+    FORMATS = {1: lambda c: f"${c / 100:.2f}",
+               3: lambda c: f"{c / 100:.2f}€".replace(".", ","),
+               8: lambda c: f"¥ {c // 100}"}
+    RATES = {1: 1, 3: 0.9, 8: 1.5}
+
+    def setup_method(self):
+        overview_cache.clear()
+
+    def teardown_method(self):
+        overview_cache.clear()
+
+    def _respond(self, url, params=None, **kwargs):
+        """Price each item at $1 per character of its name."""
+        currency = params["currency"]
+        cents = round(len(params["market_hash_name"]) * 100 * self.RATES[currency])
+        return APIResponse(ok=True, source="steam_community",
+                           data={"success": True, "lowest_price": self.FORMATS[currency](cents), "volume": "5"})
+
+    def _market(self, monkeypatch):
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        market.scheduler = MarketScheduler(rate=1000)
+        return market
+
+    def test_anchors_and_estimates(self, monkeypatch):
+        """Test that only anchors are fetched per currency and the rest is estimated."""
+        market = self._market(monkeypatch)
+        names = ["Case", "Agents", "Graffiti", "Music Kit"]
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            response = market.get_price_matrix(730, names, ["JPY", 3], "USD", anchors=2)
+
+        assert response.ok is True
+        data = response.data
+        assert data["base_currency"] == "USD"
+        assert data["currencies"] == ["USD", "JPY", "EUR"]
+        # Four base prices plus two anchors for each other currency
+        assert mock_get.call_count == 8 and data["requests"] == 8
+        assert data["pending"] == []
+        assert data["fx"]["JPY"]["rate"] == 1.5 and data["fx"]["JPY"]["items"] == 2
+        assert data["prices"][2] == [800, 1200, 720]
+        assert data["estimated"][2] == [0, 1, 1]
+        assert data["estimated"][0] == [0, 0, 0]
+
+    def test_fresh_rate_reused(self, monkeypatch):
+        """Test that a second call with fresh cells and rates makes no requests."""
+        market = self._market(monkeypatch)
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            market.get_price_matrix(730, ["Case", "Sticker"], ["EUR"], anchors=1)
+            first = mock_get.call_count
+            again = market.get_price_matrix(730, ["Case", "Sticker"], ["EUR"], anchors=1)
+            # A new item needs only its base price
+            wider = market.get_price_matrix(730, ["Case", "Sticker", "Patch"], ["EUR"], anchors=1)
+
+        assert first == 3
+        assert again.data["requests"] == 0
+        assert mock_get.call_count == 4
+        assert wider.data["prices"][2] == [500, 450]
+        assert wider.data["estimated"][2] == [0, 1]
+
+    def test_cached_overview_keeps_fetch_time(self, monkeypatch):
+        """Test that a cell built from a cached overview is as old as the overview."""
+        market = self._market(monkeypatch)
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            market.get_item_price_overviews([(730, "Case")])
+            key = "priceoverview:730:Case:1"
+            overview, fetched_at = overview_cache.get(key)
+            overview_cache.set(key, (overview, fetched_at - 200))
+            response = market.get_price_matrix(730, ["Case"], ["EUR"])
+
+        # Only the EUR anchor is requested; the USD cell comes from the cache
+        assert mock_get.call_count == 2
+        assert response.data["prices"][0] == [400, 360]
+        assert 200 <= response.data["ages"][0][0] <= 202
+        assert response.data["ages"][0][1] <= 2
+
+    def test_missing_prices(self, monkeypatch):
+        """Test warnings when no anchor has a price in a currency."""
+        market = self._market(monkeypatch)
+
+        def respond(url, params=None, **kwargs):
+            if params["currency"] == 3:
+                return APIResponse(ok=True, source="steam_community", data={"success": True})
+            return self._respond(url, params, **kwargs)
+
+        with patch.object(market.client, 'get', side_effect=respond):
+            response = market.get_price_matrix(730, ["Case"], ["EUR"])
+
+        assert response.ok is True
+        assert response.data["prices"] == [[400, None]]
+        assert any("No EUR price" in w for w in response.warnings)
+        assert any("No implied EUR rate" in w for w in response.warnings)
+
+    def test_invalid_input(self, monkeypatch):
+        """Test errors for unknown currencies and bad item counts."""
+        market = self._market(monkeypatch)
+        assert market.get_price_matrix(730, ["Case"], ["XYZ"]).ok is False
+        assert market.get_price_matrix(730, ["Case"], ["EUR"], base_currency=99).ok is False
+        assert market.get_price_matrix(730, [], ["EUR"]).ok is False
+        assert market.get_price_matrix(730, [f"Item {i}" for i in range(101)], ["EUR"]).ok is False
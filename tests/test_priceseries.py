@@ -0,0 +1,191 @@
+"""
+Tests for the priceseries module.
+
+These tests verify:
+- Vectorized date parsing matches strptime, with a fallback for odd layouts
+- Columnar parsing of pricehistory rows and time-range slicing
+- OHLC resampling and LTTB downsampling
+- Time-range, interval and max_points handling in SteamMarketAPI.get_item_price_history
+"""
+
+import calendar
+from datetime import datetime
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.priceseries import PriceSeries, format_dates, lttb_indices, parse_dates
+from steam.schemas import PriceHistory
+
+
+def _strptime(value):
+    return calendar.timegm(datetime.strptime(value[:-3], "%b %d %Y %H:").timetuple())
+
+
+PRICES = [
+    ["Nov 27 2013 01: +0", 1.234, "12"],
+    ["Feb 29 2016 00: +0", 2.5, "3"],
+    ["Dec 31 2019 23: +0", 4.0, "1"],
+    ["Jan 01 2020 01: +0", 3.75, "250"],
+]
+
+
+class TestParseDates:
+    """Test date parsing."""
+
+    def test_matches_strptime(self):
+        """Test that every month, leap days and hours match strptime."""
+        dates = [f"{m} {d:02d} {y} {h:02d}: +0"
+                 for m in ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+                 for d, y, h in ((1, 1999, 0), (28, 2000, 23), (15, 2024, 7))]
+        dates.append("Feb 29 2024 12: +0")
+        parsed = parse_dates(dates)
+        assert parsed.dtype == np.int64
+        assert parsed.tolist() == [_strptime(d) for d in dates]
+        assert format_dates(parsed) == dates
+
+    def test_fallback_layouts(self):
+        """Test that unpadded days and non-zero offsets use the scalar parser."""
+        parsed = parse_dates(["Mar 1 2013 01: +0", "Nov 27 2013 01: +3", "Nov 27 2013 01: +0"])
+        assert parsed[0] == _strptime("Mar 01 2013 01: +0")
+        assert parsed[1] == parsed[2] - 3 * 3600
+
+    def test_invalid_date(self):
+        """Test that unparseable dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_dates(["Foo 27 2013 01: +0"])
+
+
+class TestPriceSeries:
+    """Test the columnar series."""
+
+    def test_columns(self):
+        """Test column dtypes and values, including messy volumes."""
+        series = PriceHistory.from_api_response({"success": True, "price_prefix": "$", "prices": PRICES}).to_series()
+        assert len(series) == 4
+        assert series.timestamps.dtype == np.int64
+        assert series.prices.dtype == np.float64
+        assert series.volumes.dtype == np.int32
+        assert series.volumes.tolist() == [12, 3, 1, 250]
+        assert series.price_prefix == "$"
+        assert series.to_prices() == PRICES
+
+        messy = PriceSeries.from_prices([["Nov 27 2013 01: +0", 1, ""], ["Nov 28 2013 01: +0", 2, "1,024"]])
+        assert messy.volumes.tolist() == [0, 1024]
+
+    def test_sorts_and_slices(self):
+        """Test that rows are sorted and between() is inclusive and shares memory."""
+        series = PriceSeries.from_prices(list(reversed(PRICES)))
+        assert series.prices.tolist() == [1.234, 2.5, 4.0, 3.75]
+
+        start, end = _strptime(PRICES[1][0]), _strptime(PRICES[2][0])
+        window = series.between(start, end)
+        assert window.prices.tolist() == [2.5, 4.0]
+        assert np.shares_memory(window.prices, series.prices)
+        assert len(series.between(start=_strptime(PRICES[3][0]) + 1)) == 0
+        assert len(series.between()) == 4
+        assert len(PriceSeries.from_prices([])) == 0
+
+
+def _hourly(prices, start=_strptime("Jan 01 2024 00: +0")):
+    return PriceSeries(np.arange(len(prices), dtype=np.int64) * 3600 + start,
+                       np.array(prices, dtype=np.float64), np.ones(len(prices), dtype=np.int32))
+
+
+class TestResampling:
+    """Test OHLC bars and downsampling."""
+
+    def test_daily_bars(self):
+        """Test open, high, low, close and volume of daily bars."""
+        series = _hourly([float(h % 24) for h in range(48)])
+        series.prices[30] = 99.0
+        bars = series.resample("1d")
+        assert len(bars) == 2
+        assert bars.timestamps.tolist() == [_strptime("Jan 01 2024 00: +0"), _strptime("Jan 02 2024 00: +0")]
+        assert bars.open.tolist() == [0.0, 0.0]
+        assert bars.high.tolist() == [23.0, 99.0]
+        assert bars.low.tolist() == [0.0, 0.0]
+        assert bars.close.tolist() == [23.0, 23.0]
+        assert bars.volume.tolist() == [24, 24]
+
+        data = bars.last(1).to_dict()
+        assert data["interval"] == "1d"
+        assert data["bars"] == [["Jan 02 2024 00: +0", 0.0, 99.0, 0.0, 23.0, 24]]
+
+    def test_weekly_bars_start_on_monday(self):
+        """Test that weekly bars are aligned to Monday 00:00 UTC."""
+        # Jan 01 2024 was a Monday; Jan 07 a Sunday
+        series = PriceSeries.from_prices([["Jan 07 2024 12: +0", 1, "1"], ["Jan 08 2024 00: +0", 2, "1"]])
+        bars = series.resample("1w")
+        assert format_dates(bars.timestamps) == ["Jan 01 2024 00: +0", "Jan 08 2024 00: +0"]
+
+    def test_invalid_interval(self):
+        """Test that unsupported intervals raise ValueError."""
+        with pytest.raises(ValueError, match="Interval"):
+            _hourly([1.0]).resample("5m")
+        assert len(PriceSeries().resample("1h")) == 0
+
+    def test_lttb_keeps_extremes(self):
+        """Test that downsampling keeps the endpoints and an isolated spike."""
+        prices = [10.0] * 1000
+        prices[437] = 500.0
+        series = _hourly(prices)
+        small = series.downsample(20)
+        assert len(small) == 20
+        assert small.timestamps[0] == series.timestamps[0]
+        assert small.timestamps[-1] == series.timestamps[-1]
+        assert 500.0 in small.prices.tolist()
+        assert (np.diff(small.timestamps) > 0).all()
+        assert series.downsample(5000) is series
+        assert lttb_indices(np.arange(5), np.arange(5), 2).tolist() == [0, 1, 2, 3, 4]
+
+
+class TestPriceHistoryRange:
+    """Test time-range filtering through the market API."""
+
+    def test_range(self, monkeypatch):
+        """Test that start/end trim the returned prices and the name is sent unquoted."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        body = {"success": True, "price_prefix": "$", "price_suffix": "", "prices": PRICES}
+        with patch.object(market.client, 'get',
+                          return_value=APIResponse(ok=True, source="steam_community", data=body)) as mock_get:
+            response = market.get_item_price_history(730, "AK-47 | Redline (Field-Tested)",
+                                                     start=_strptime(PRICES[1][0]))
+
+        assert response.data["price_history"]["prices"] == PRICES[1:]
+        assert mock_get.call_args[1]["params"]["market_hash_name"] == "AK-47 | Redline (Field-Tested)"
+
+    def test_invalid_range(self, monkeypatch):
+        """Test that start after end is rejected."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        response = SteamMarketAPI().get_item_price_history(730, "Case", start=10, end=5)
+        assert response.ok is False
+
+    def test_interval_and_max_points(self, monkeypatch):
+        """Test that interval returns bars and max_points limits points or bars."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        prices = _hourly([1.0 + (h % 7) for h in range(24 * 10)]).to_prices()
+        body = {"success": True, "price_prefix": "$", "price_suffix": "", "prices": prices}
+        with patch.object(market.client, 'get',
+                          side_effect=lambda *a, **k: APIResponse(ok=True, source="steam_community", data=dict(body))):
+            bars = market.get_item_price_history(730, "Case", interval="1d", max_points=3)
+            points = market.get_item_price_history(730, "Case", max_points=50)
+
+        history = bars.data["price_history"]
+        assert "prices" not in history
+        assert history["interval"] == "1d"
+        assert [b[0] for b in history["bars"]] == ["Jan 08 2024 00: +0", "Jan 09 2024 00: +0", "Jan 10 2024 00: +0"]
+        assert any("3 of 10 bars" in w for w in bars.warnings)
+        assert len(points.data["price_history"]["prices"]) == 50
+
+    def test_invalid_interval_and_max_points(self, monkeypatch):
+        """Test that bad interval and max_points values are rejected."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        assert market.get_item_price_history(730, "Case", interval="1m").ok is False
+        assert market.get_item_price_history(730, "Case", max_points=2).ok is False
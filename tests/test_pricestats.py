@@ -0,0 +1,236 @@
+"""
+Tests for the pricestats module.
+
+These tests verify:
+- Rolling mean/std, EMA, VWAP, drawdown and percent change match plain loops
+- Aligning several series onto one forward-filled grid of bars
+- Per-item summaries that do not depend on the other items of a batch, and
+  SteamMarketAPI.get_item_price_stats, including caching and request pacing
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from steam.cache import price_cache
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.priceseries import PriceSeries, format_dates
+from steam.pricestats import align, drawdown, ema, pct_change, rolling_mean, rolling_std, summarize, vwap
+
+DAY = 86400
+START = 1704067200  # Jan 01 2024 00:00 UTC
+
+
+def _ema_loop(values, span):
+    alpha = 2.0 / (span + 1)
+    out, average = [], None
+    for value in values:
+        average = value if average is None else average + alpha * (value - average)
+        out.append(average)
+    return out
+
+
+def _daily(prices, start=START, volume=1):
+    return PriceSeries(np.arange(len(prices), dtype=np.int64) * DAY + start,
+                       np.array(prices, dtype=np.float64), np.full(len(prices), volume, dtype=np.int32))
+
+
+class TestIndicators:
+    """Test the vectorized indicators against plain loops."""
+
+    def test_rolling(self):
+        """Test rolling mean and standard deviation."""
+        values = np.random.default_rng(0).random((3, 50))
+        mean = rolling_mean(values, 5)
+        std = rolling_std(values, 5)
+        assert np.isnan(mean[:, :4]).all()
+        for row in range(3):
+            expected = [values[row, i - 4:i + 1].mean() for i in range(4, 50)]
+            assert np.allclose(mean[row, 4:], expected)
+            assert np.allclose(std[row, 4:], [values[row, i - 4:i + 1].std() for i in range(4, 50)])
+        assert np.isnan(rolling_mean(values, 51)).all()
+
+    def test_ema_matches_recursion(self):
+        """Test that the blocked EMA matches the recursive definition across blocks."""
+        values = np.random.default_rng(1).random((4, 300)) * 100
+        values[1, :20] = np.nan
+        result = ema(values, 10)
+        for row in (0, 2, 3):
+            assert np.allclose(result[row], _ema_loop(values[row], 10))
+        assert np.isnan(result[1, :20]).all()
+        assert np.allclose(result[1, 20:], _ema_loop(values[1, 20:], 10))
+        assert np.isnan(ema([np.nan, np.nan], 3)).all()
+
+    def test_vwap_drawdown_change(self):
+        """Test VWAP, drawdown from the running peak and percent change."""
+        prices = np.array([10.0, 20.0, 30.0])
+        volumes = np.array([1.0, 3.0, 0.0])
+        assert vwap(prices, volumes, 2)[0, 1] == pytest.approx(17.5)
+        assert vwap(prices, volumes, 2)[0, 2] == pytest.approx(20.0)
+        assert np.isnan(vwap(prices, np.zeros(3), 2)[0, 2])
+        assert drawdown([1.0, 2.0, 1.0, 3.0]).tolist() == [[0.0, 0.0, -0.5, 0.0]]
+        change = pct_change([1.0, 2.0, 4.0], 2)
+        assert np.isnan(change[0, 1]) and change[0, 2] == pytest.approx(300.0)
+
+
+class TestAlign:
+    """Test aligning series onto a shared grid."""
+
+    def test_forward_fill_and_turnover(self):
+        """Test that gaps carry the last close and items starting later lead with NaN."""
+        first = PriceSeries.from_prices([["Jan 01 2024 01: +0", 1.0, "2"], ["Jan 01 2024 05: +0", 3.0, "1"],
+                                         ["Jan 04 2024 01: +0", 4.0, "1"]])
+        second = _daily([7.0, 8.0], start=START + 2 * DAY, volume=5)
+        matrix = align([first, second], "1d")
+        assert format_dates(matrix.timestamps) == ["Jan 01 2024 00: +0", "Jan 02 2024 00: +0",
+                                                   "Jan 03 2024 00: +0", "Jan 04 2024 00: +0"]
+        assert matrix.close[0].tolist() == [3.0, 3.0, 3.0, 4.0]
+        assert np.isnan(matrix.close[1, :2]).all()
+        assert matrix.close[1, 2:].tolist() == [7.0, 8.0]
+        assert matrix.volume[0].tolist() == [3, 0, 0, 1]
+        assert matrix.turnover[0].tolist() == [5.0, 0.0, 0.0, 4.0]
+        assert matrix.points.tolist() == [3, 2]
+
+    def test_empty(self):
+        """Test that series without points give an empty grid."""
+        matrix = align([PriceSeries()], "1d")
+        assert matrix.close.shape == (1, 0)
+        assert summarize(matrix) == [{"points": 0}]
+        with pytest.raises(ValueError, match="Interval"):
+            align([PriceSeries()], "5m")
+
+
+class TestSummarize:
+    """Test per-item summaries."""
+
+    def test_fields(self):
+        """Test summary values for a simple rising then falling history."""
+        matrix = align([_daily([1.0, 2.0, 4.0, 2.0])], "1d")
+        stats = summarize(matrix, windows=(2,))[0]
+        assert stats["points"] == 4
+        assert stats["last_bar"] == "Jan 04 2024 00: +0"
+        assert stats["last_price"] == 2.0
+        assert stats["drawdown"] == -50.0
+        assert stats["max_drawdown"] == -50.0
+        assert stats["change_2"] == 0.0
+        assert stats["sma_2"] == 3.0
+        assert stats["high_2"] == 4.0 and stats["low_2"] == 2.0
+        assert stats["volume_2"] == 2
+        assert stats["ema_2"] == pytest.approx(_ema_loop([1.0, 2.0, 4.0, 2.0], 2)[-1], abs=1e-4)
+        assert stats["volatility_2"] is not None
+
+    def test_same_stats_alone_and_batched(self):
+        """Test that an item's windows end at its own last bar, whatever else is in the matrix."""
+        short = _daily([float(i) for i in range(1, 11)])
+        longer = _daily([10.0] * 40, start=START - 5 * DAY)
+        alone = summarize(align([short], "1d"), windows=(7, 30))[0]
+        batched = summarize(align([longer, short], "1d"), windows=(7, 30))[1]
+        assert batched == alone
+        assert alone["last_bar"] == "Jan 10 2024 00: +0"
+        assert alone["change_7"] == pytest.approx(233.33)
+        assert alone["sma_7"] == 7.0 and alone["volume_7"] == 7
+
+    def test_vwap_uses_points(self):
+        """Test that VWAP weights every history point, not the bar close."""
+        hours = [["Jan 01 2024 01: +0", 1.0, "100"], ["Jan 01 2024 02: +0", 10.0, "1"],
+                 ["Jan 02 2024 01: +0", 1.0, "100"], ["Jan 02 2024 02: +0", 10.0, "1"]]
+        stats = summarize(align([PriceSeries.from_prices(hours)], "1d"), windows=(2,))[0]
+        assert stats["vwap_2"] == pytest.approx(220 / 202, abs=1e-4)
+        assert stats["volume_2"] == 202
+
+    def test_short_history(self):
+        """Test that windows longer than the history give None."""
+        stats = summarize(align([_daily([1.0, 2.0])], "1d"), windows=(7,))[0]
+        assert stats["sma_7"] is None
+        assert stats["change_7"] is None
+
+
+class TestGetItemPriceStats:
+    """Test the market API method."""
+
+    def setup_method(self):
+        price_cache.clear()
+
+    def teardown_method(self):
+        price_cache.clear()
+
+    def _response(self, url, params=None, **kwargs):
+        offset = 1.0 if params["market_hash_name"] == "Case A" else 5.0
+        prices = _daily([offset + (d % 5) for d in range(40)]).to_prices()
+        return APIResponse(ok=True, source="steam_community",
+                           data={"success": True, "price_prefix": "$", "prices": prices})
+
+    def test_stats_and_cache(self, monkeypatch):
+        """Test that items are summarized together and served from cache afterwards."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        with patch.object(market.client, 'get', side_effect=self._response) as mock_get:
+            response = market.get_item_price_stats(730, ["Case A", "Case B"], windows=[7])
+            assert mock_get.call_count == 2
+            again = market.get_item_price_stats(730, ["Case B", "Case A"], windows=[7])
+            assert mock_get.call_count == 2
+
+        assert response.ok is True
+        assert response.data["interval"] == "1d"
+        assert response.data["windows"] == [7]
+        items = response.data["items"]
+        assert [i["market_hash_name"] for i in items] == ["Case A", "Case B"]
+        assert items[0]["points"] == 40
+        assert "sma_7" in items[0] and "sma_30" not in items[0]
+        assert [i["market_hash_name"] for i in again.data["items"]] == ["Case B", "Case A"]
+        assert again.data["items"][1] == items[0]
+
+    def test_batch_does_not_change_cached_stats(self, monkeypatch):
+        """Test that an item summarized with a longer history matches it summarized alone."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+
+        def respond(url, params=None, **kwargs):
+            days = 10 if params["market_hash_name"] == "Short" else 40
+            prices = _daily([1.0 + d for d in range(days)]).to_prices()
+            return APIResponse(ok=True, source="steam_community",
+                               data={"success": True, "price_prefix": "$", "prices": prices})
+
+        with patch.object(market.client, 'get', side_effect=respond):
+            batched = market.get_item_price_stats(730, ["Long", "Short"], windows=[7])
+            price_cache.clear()
+            alone = market.get_item_price_stats(730, ["Short"], windows=[7])
+        assert batched.data["items"][1] == alone.data["items"][0]
+
+    def test_fetches_are_paced(self, monkeypatch):
+        """Test that each history request takes a rate limiter token and cached histories take none."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        with patch.object(market.client, 'get', side_effect=self._response), \
+             patch('steam.market.RateLimiter.acquire') as acquire:
+            market.get_item_price_stats(730, ["Case A", "Case B"], windows=[7])
+            assert acquire.call_count == 2
+            market.get_item_price_stats(730, ["Case A", "Case B"], windows=[30])
+            assert acquire.call_count == 2
+
+    def test_failed_item(self, monkeypatch):
+        """Test that a failed history is reported as a warning."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+
+        def respond(url, params=None, **kwargs):
+            if params["market_hash_name"] == "Missing":
+                return APIResponse(ok=False, source="steam_community", data={},
+                                   error={"status_code": 500, "message": "Server error"})
+            return self._response(url, params)
+
+        with patch.object(market.client, 'get', side_effect=respond):
+            response = market.get_item_price_stats(730, ["Case A", "Missing"])
+        assert response.ok is True
+        assert [i["market_hash_name"] for i in response.data["items"]] == ["Case A"]
+        assert any("Missing" in w for w in response.warnings)
+
+    def test_invalid_arguments(self, monkeypatch):
+        """Test that bad names, intervals and windows are rejected."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        assert market.get_item_price_stats(730, []).ok is False
+        assert market.get_item_price_stats(730, [f"Item {i}" for i in range(51)]).ok is False
+        assert market.get_item_price_stats(730, "Case", interval="5m").ok is False
+        assert market.get_item_price_stats(730, "Case", windows=[0]).ok is False
@@ -0,0 +1,201 @@
+"""
+Tests for the scheduler module.
+
+These tests verify:
+- MarketScheduler runs jobs by priority, then submission order
+- Jobs queued under the same key share one request
+- A 429 pauses the queue for Retry-After, requeues the job and gives up after max_attempts
+- ETA reporting
+- SteamMarketAPI.get_item_price_overviews serves cached items, streams the rest and reports pending ones
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from steam.cache import overview_cache
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.scheduler import MarketScheduler
+
+
+def _ok(value=None):
+    return APIResponse(ok=True, source="steam_community", data={"value": value})
+
+
+def _limited(retry_after=None):
+    return APIResponse(ok=False, source="steam_community", data={},
+                       rate_limit_hint={"retry_after": retry_after, "limited": True},
+                       error={"status_code": 429, "message": "Too Many Requests"})
+
+
+class TestMarketScheduler:
+    """Test queueing, pacing and cooldowns."""
+
+    def test_priority_order(self):
+        """Test that queued jobs run lowest priority first, then in submission order."""
+        scheduler = MarketScheduler(rate=1000)
+        gate = threading.Event()
+        order = []
+
+        def job(name):
+            def run():
+                gate.wait(5)
+                order.append(name)
+                return _ok(name)
+            return run
+
+        first = scheduler.submit(job("first"))
+        time.sleep(0.05)  # let the worker pick up the first job
+        futures = [scheduler.submit(job("low"), priority=5),
+                   scheduler.submit(job("high-a"), priority=0),
+                   scheduler.submit(job("high-b"), priority=0)]
+        assert scheduler.pending == 4
+        gate.set()
+        for future in [first] + futures:
+            future.result(5)
+        assert order == ["first", "high-a", "high-b", "low"]
+        assert scheduler.completed == 4
+
+    def test_same_key_shares_request(self):
+        """Test that a key already queued is not requested twice."""
+        scheduler = MarketScheduler(rate=1000)
+        gate = threading.Event()
+        calls = []
+
+        def run():
+            gate.wait(5)
+            calls.append(1)
+            return _ok()
+
+        a = scheduler.submit(run, key="item")
+        b = scheduler.submit(run, key="item")
+        gate.set()
+        assert a is b
+        assert a.result(5).ok is True
+        assert len(calls) == 1
+
+    def test_cooldown_and_requeue(self):
+        """Test that a 429 pauses for Retry-After and the job is retried."""
+        scheduler = MarketScheduler(rate=1000, cooldown=5.0)
+        responses = iter([_limited(retry_after=0.2), _ok("done")])
+        start = time.monotonic()
+        future = scheduler.submit(lambda: next(responses))
+        assert future.result(5).data["value"] == "done"
+        assert time.monotonic() - start >= 0.2
+        assert scheduler.rate_limited == 1
+        assert scheduler.completed == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that a job keeps its 429 after max_attempts and cooldowns double."""
+        scheduler = MarketScheduler(rate=1000, cooldown=0.01, max_attempts=3)
+        calls = []
+
+        def run():
+            calls.append(time.monotonic())
+            return _limited()
+
+        response = scheduler.submit(run).result(5)
+        assert response.error["status_code"] == 429
+        assert len(calls) == 3
+        assert calls[2] - calls[1] >= 0.02
+
+    def test_exception(self):
+        """Test that a failing job resolves its future with the exception."""
+        scheduler = MarketScheduler(rate=1000)
+
+        def run():
+            raise RuntimeError("boom")
+
+        assert isinstance(scheduler.submit(run).exception(5), RuntimeError)
+        assert scheduler.submit(lambda: _ok(1)).result(5).data["value"] == 1
+
+    def test_eta(self):
+        """Test ETA from the pace and the remaining cooldown."""
+        scheduler = MarketScheduler(rate=0.5)
+        assert scheduler.eta() == 0.0
+        assert scheduler.eta(10) == 20.0
+        scheduler._paused_until = time.monotonic() + 30
+        assert 49 < scheduler.eta(10) <= 50
+        assert scheduler.stats()["pending"] == 0
+
+
+class TestMarketPriceOverviews:
+    """Test batch price overviews."""
+
+    def setup_method(self):
+        overview_cache.clear()
+
+    def teardown_method(self):
+        overview_cache.clear()
+
+    @staticmethod
+    def _respond(url, params=None, **kwargs):
+        assert kwargs["retry_rate_limited"] is False
+        name = params["market_hash_name"]
+        if name == "Missing":
+            return APIResponse(ok=True, source="steam_community", data={"success": False})
+        return APIResponse(ok=True, source="steam_community",
+                           data={"success": True, "lowest_price": f"${len(name)}.00", "volume": "10"})
+
+    def _market(self, monkeypatch):
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        market = SteamMarketAPI()
+        market.scheduler = MarketScheduler(rate=1000)
+        return market
+
+    def test_batch(self, monkeypatch):
+        """Test fetching, deduplication, failures and cache hits on the second call."""
+        market = self._market(monkeypatch)
+        items = [(730, "Recoil Case"), {"appid": 730, "market_hash_name": "Missing", "priority": 1},
+                 (730, "AK-47 | Redline (Field-Tested)", 3), (730, "Recoil Case", 1, 0)]
+        with patch.object(market.client, 'get', side_effect=self._respond) as mock_get:
+            response = market.get_item_price_overviews(items)
+            again = market.get_item_price_overviews(items)
+
+        assert response.ok is True
+        assert [item["market_hash_name"] for item in response.data["items"]] == [
+            "Recoil Case", "AK-47 | Redline (Field-Tested)"]
+        assert response.data["items"][1]["currency"] == 3
+        assert response.data["items"][0]["price_overview"]["lowest_price"] == "$11.00"
+        assert response.data["fetched"] == 2 and response.data["pending"] == []
+        assert any("Missing" in w for w in response.warnings)
+        # Names are passed unencoded; requests encodes them once
+        assert {c[1]["params"]["market_hash_name"] for c in mock_get.call_args_list} == {
+            "Recoil Case", "Missing", "AK-47 | Redline (Field-Tested)"}
+        # Only the missing item is requested again
+        assert mock_get.call_count == 4
+        assert again.data["cached"] == 2
+
+    def test_stream_and_pending(self, monkeypatch):
+        """Test that results stream with ETAs and unfinished items are reported as pending."""
+        market = self._market(monkeypatch)
+        gate = threading.Event()
+
+        def slow(url, params=None, **kwargs):
+            if params["market_hash_name"] == "Slow":
+                gate.wait(5)
+            return self._respond(url, params, **kwargs)
+
+        with patch.object(market.client, 'get', side_effect=slow):
+            records = list(market.iter_price_overviews([(730, "Fast"), (730, "Slow", 1, 1)], timeout=0.3))
+            response = market.get_item_price_overviews([(730, "Fast"), (730, "Slow")], max_wait=0.1)
+            gate.set()
+            market.scheduler.submit(lambda: _ok(), key="barrier").result(5)
+            done = market.get_item_price_overviews([(730, "Slow")])
+
+        assert [r["market_hash_name"] for r in records] == ["Fast"]
+        assert records[0]["remaining"] == 1 and "eta_seconds" in records[0]
+        assert response.ok is True
+        assert response.data["items"][0]["cached"] is True
+        assert response.data["pending"] == [{"appid": 730, "market_hash_name": "Slow", "currency": 1}]
+        assert done.data["cached"] == 1
+
+    def test_invalid_items(self, monkeypatch):
+        """Test errors for empty, oversized and malformed batches."""
+        market = self._market(monkeypatch)
+        assert market.get_item_price_overviews([]).ok is False
+        assert market.get_item_price_overviews([(730, "Case")] * 501).ok is False
+        assert market.get_item_price_overviews([(730,)]).ok is False
+        assert market.get_item_price_overviews([(730, "")]).ok is False
+        assert market.get_item_price_overviews([(-1, "Case")]).ok is False
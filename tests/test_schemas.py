@@ -0,0 +1,36 @@
+"""
+Tests for the schemas module.
+
+These tests verify:
+- Slots-based record types keep their attributes and to_dict output
+"""
+
+import pytest
+
+from steam.schemas import Achievement, Friend, Game, GameNews, MarketItem, PricePoint
+
+
+class TestCompactRecords:
+    """Test the __slots__ record types."""
+
+    @pytest.mark.parametrize("cls", [Achievement, Friend, Game, GameNews, MarketItem, PricePoint])
+    def test_no_instance_dict(self, cls):
+        """Test that list-heavy records do not carry a per-instance __dict__."""
+        assert "__slots__" in cls.__dict__
+        assert not hasattr(cls.__new__(cls), "__dict__")
+
+    def test_to_dict_output(self):
+        """Test that records still convert to the same dicts."""
+        friends = Friend.from_api_response(
+            {"friendslist": {"friends": [{"steamid": "1", "relationship": "friend", "friend_since": 5}]}}
+        )
+        assert friends[0].to_dict() == {"steamid": "1", "relationship": "friend", "friend_since": 5}
+
+        items = MarketItem.from_api_response({"results": [{"name": "Case", "hash_name": "Case", "sell_price": 3}]})
+        assert items[0].to_dict()["sell_price"] == 3
+        assert items[0].to_dict()["appid"] is None
+
+        game = Game.from_record({"appid": 10, "name": "CS", "playtime_forever": 7})
+        assert game.to_dict()["playtime_forever"] == 7
+        with pytest.raises(AttributeError):
+            game.extra = 1
@@ -18,7 +18,8 @@ from steam.client import (
     SteamAPIError, 
     MarketAPIError,
     APIResponse,
-    RateLimitInfo
+    RateLimitInfo,
+    RateLimiter
 )
 
 
@@ -136,6 +137,26 @@ class TestRateLimitInfo:
         assert info.retry_after == 5
 
 
+class TestRateLimiter:
+    """Test RateLimiter token bucket."""
+    
+    def test_burst_then_limited(self):
+        """Test that only `burst` tokens are available without waiting."""
+        limiter = RateLimiter(rate=1, burst=3)
+        assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+    
+    def test_acquire_waits_for_refill(self):
+        """Test that acquire waits once the bucket is empty."""
+        limiter = RateLimiter(rate=200, burst=1)
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() > 0.0
+    
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
 class TestSteamClient:
     """Test SteamClient class."""
     
@@ -247,6 +268,34 @@ class TestSteamClient:
             assert mock_request.call_count == 2
             mock_sleep.assert_called_once()
     
+    def test_get_rate_limited_after_retries(self, monkeypatch):
+        """Test that a 429 outlasting the retries is reported as 429 with Retry-After."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient(max_retries=1, backoff_factor=0.1)
+        
+        with patch('requests.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_response_429 = Mock()
+            mock_response_429.status_code = 429
+            mock_response_429.headers = {"Retry-After": "60"}
+            mock_response_429.content = b""
+            mock_response_429.text = "Too Many Requests"
+            mock_request.return_value = mock_response_429
+            
+            response = client.get("https://steamcommunity.com/market/priceoverview")
+            assert response.ok is False
+            assert response.error["status_code"] == 429
+            assert response.rate_limit_hint["retry_after"] == 60
+            assert mock_request.call_count == 2
+            assert mock_sleep.call_count == 1
+            
+            mock_request.reset_mock()
+            mock_sleep.reset_mock()
+            response = client.get("https://steamcommunity.com/market/priceoverview", retry_rate_limited=False)
+            assert response.error["status_code"] == 429
+            assert mock_request.call_count == 1
+            mock_sleep.assert_not_called()
+    
     def test_make_request_retry_on_500(self, monkeypatch):
         """Test retry on 500 server error."""
         monkeypatch.setenv("STEAM_API_KEY", "test_key")
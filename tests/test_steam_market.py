@@ -0,0 +1,112 @@
+"""
+Tests for steam/market.py module.
+
+These tests verify:
+- Concurrent crawling of every market search page
+- Deduplication by hash name across pages
+- Resuming a crawl from a saved checkpoint
+"""
+
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from steam.client import APIResponse, MarketAPIError
+from steam.market import SearchCheckpoint, SteamMarketAPI
+
+
+def _page(start, names, total):
+    results = [{"name": n, "hash_name": n, "sell_price": 100 + i, "app_name": "Counter-Strike 2"}
+               for i, n in enumerate(names)]
+    return APIResponse(ok=True, source="steam_community",
+                       data={"success": True, "start": start, "total_count": total, "results": results})
+
+
+class FakeSearch:
+    """Serves market/search/render pages by start offset."""
+
+    def __init__(self, pages, fail=()):
+        self.pages = pages
+        self.fail = set(fail)
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params=None, **kwargs):
+        assert url.endswith("/market/search/render")
+        assert params["count"] == 100
+        start = params["start"]
+        with self._lock:
+            self.starts.append(start)
+        if start in self.fail:
+            return APIResponse(ok=False, source="steam_community", data={},
+                               error={"status_code": 429, "message": "Too Many Requests"})
+        return self.pages[start]
+
+
+@pytest.fixture
+def market(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamMarketAPI()
+
+
+def _pages(total=250):
+    names = [f"Item {i}" for i in range(total)]
+    pages = {start: _page(start, names[start:start + 100], total) for start in range(0, total, 100)}
+    # A listing that moved down a page while the crawl was running
+    pages[100].data["results"].append({"name": "Item 5", "hash_name": "Item 5"})
+    return pages
+
+
+class TestIterSearch:
+    """Test the concurrent search crawl."""
+
+    def test_crawls_all_pages(self, market):
+        """Test that every page is fetched once and items are deduplicated."""
+        fake = FakeSearch(_pages())
+        checkpoint = SearchCheckpoint()
+        with patch.object(market.client, 'get', side_effect=fake):
+            items = list(market.iter_search(appid=730, rate=1000, checkpoint=checkpoint))
+
+        assert sorted(fake.starts) == [0, 100, 200]
+        assert fake.starts[0] == 0
+        assert len(items) == 250
+        assert len({i.hash_name for i in items}) == 250
+        assert items[0].sell_price == 100
+        assert checkpoint.complete
+        assert checkpoint.appid == 730
+
+    def test_resume_from_checkpoint(self, market):
+        """Test that failed pages stay pending and a resumed crawl fetches only those."""
+        pages = _pages()
+        checkpoint = SearchCheckpoint()
+        with patch.object(market.client, 'get', side_effect=FakeSearch(pages, fail={200})):
+            first = list(market.iter_search(appid=730, rate=1000, checkpoint=checkpoint))
+
+        assert len(first) == 200
+        assert not checkpoint.complete
+        assert checkpoint.pending == [200]
+
+        restored = SearchCheckpoint.from_dict(checkpoint.to_dict())
+        fake = FakeSearch(pages)
+        with patch.object(market.client, 'get', side_effect=fake):
+            rest = list(market.iter_search(appid=730, rate=1000, checkpoint=restored))
+
+        assert fake.starts == [200]
+        assert [i.hash_name for i in rest] == [f"Item {i}" for i in range(200, 250)]
+        assert restored.complete
+
+    def test_first_page_failure(self, market):
+        """Test that a failed first page raises MarketAPIError."""
+        with patch.object(market.client, 'get', side_effect=FakeSearch({}, fail={0})):
+            with pytest.raises(MarketAPIError) as exc:
+                list(market.iter_search("AK-47", rate=1000))
+        assert exc.value.status_code == 429
+
+    def test_checkpoint_mismatch(self, market):
+        """Test that a checkpoint cannot resume a different search."""
+        checkpoint = SearchCheckpoint(query="AK-47", total_count=10, done={0})
+        with pytest.raises(ValueError, match="different search"):
+            list(market.iter_search("M4A4", checkpoint=checkpoint))
+        with pytest.raises(ValueError, match="Sort column"):
+            list(market.iter_search("M4A4", sort_column="bogus"))
@@ -13,6 +13,8 @@ from unittest.mock import patch, Mock
 
 from steam.store import SteamStoreAPI
 from steam.client import APIResponse
+from steam.news import news_store
+from steam.cache import app_cache
 
 
 class TestSteamStoreAPI:
@@ -192,7 +194,7 @@ class TestSteamStoreAPI:
         
         # Mock app details response
         with patch.object(store, 'get_app_details') as mock_app_details, \
-             patch('steam.web.SteamWebAPI') as mock_web_api_class:
+             patch('steam.store.SteamWebAPI') as mock_web_api_class:
             
             # Mock app details with real APIResponse
             mock_app_response = APIResponse(
@@ -214,16 +216,18 @@ class TestSteamStoreAPI:
                 source="steam_web_api",
                 data={
                     "news": [
-                        {"date": 1234567890, "title": "Update 1.0"}
+                        {"gid": "1", "date": 1234567890, "title": "Update 1.0"}
                     ]
                 }
             )
             mock_web_api.get_game_news.return_value = mock_news_response
             mock_web_api_class.return_value = mock_web_api
             
+            news_store.clear()
             response = store.get_app_update_signal(730)
             assert response.ok is True
             assert "update_signal" in response.data
+            assert response.data["update_signal"]["has_recent_news"] is False
 
 
 class TestCacheIntegration:
@@ -291,6 +295,26 @@ class TestCacheIntegration:
             mock_cache.get.assert_called()
 
 
+    def test_app_details_projection_from_cache(self, monkeypatch):
+        """Test that projections are cut from one cached payload."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        store = SteamStoreAPI()
+        payload = {"440": {"success": True, "data": {"name": "Team Fortress 2", "is_free": True,
+                                                     "about_the_game": "long html"}}}
+        
+        with patch.object(store.client, 'get') as mock_get:
+            mock_get.return_value = APIResponse(ok=True, source="steam_store_api", data=payload)
+            app_cache.clear()
+            full = store.get_app_details(440)
+            projected = store.get_app_details(440, fields=["is_free"])
+            app_cache.clear()
+        
+        assert mock_get.call_count == 1
+        assert full.data["app"]["about_the_game"] == "long html"
+        assert projected.data["app"] == {"appid": 440, "is_free": True}
+        assert store.get_app_details(440, fields=["bogus"]).ok is False
+
+
 class TestParameterValidation:
     """Test parameter validation in Store API."""
     
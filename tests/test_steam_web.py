@@ -0,0 +1,344 @@
+"""
+Tests for the Steam Web API module.
+
+These tests verify:
+- Composite achievement queries
+- Schema and percentage caching
+- Response normalization
+- Field projection
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.cache import schema_cache
+from steam.client import APIResponse
+from steam.schemas import AppDetails, Game, select_fields
+from steam.web import SteamWebAPI
+
+
+PLAYER_ACHIEVEMENTS = {
+    "playerstats": {
+        "steamID": "76561198006409530",
+        "gameName": "Test Game",
+        "achievements": [
+            {"apiname": "ACH_COMMON", "achieved": 1, "unlocktime": 1600000000},
+            {"apiname": "ACH_RARE", "achieved": 1, "unlocktime": 1700000000},
+            {"apiname": "ACH_LOCKED", "achieved": 0, "unlocktime": 0},
+        ],
+        "success": True,
+    }
+}
+
+GAME_SCHEMA = {
+    "game": {
+        "gameName": "Test Game",
+        "availableGameStats": {
+            "achievements": [
+                {"name": "ACH_COMMON", "displayName": "Common", "description": "Easy", "hidden": 0},
+                {"name": "ACH_RARE", "displayName": "Rare", "description": "Hard", "hidden": 1},
+                {"name": "ACH_LOCKED", "displayName": "Locked", "description": "Later", "hidden": 0},
+            ]
+        }
+    }
+}
+
+GLOBAL_PERCENTAGES = {
+    "achievementpercentages": {
+        "achievements": [
+            {"name": "ACH_COMMON", "percent": 75.5},
+            {"name": "ACH_LOCKED", "percent": "20.1"},
+            {"name": "ACH_RARE", "percent": 1.2},
+        ]
+    }
+}
+
+
+def _response(data, ok=True):
+    return APIResponse(ok=ok, source="steam_web_api", data=data)
+
+
+def _route(url, params=None):
+    """Return canned responses for the achievement endpoints."""
+    if "GetPlayerAchievements" in url:
+        return _response(PLAYER_ACHIEVEMENTS)
+    if "GetSchemaForGame" in url:
+        return _response(GAME_SCHEMA)
+    if "GetGlobalAchievementPercentagesForApp" in url:
+        return _response(GLOBAL_PERCENTAGES)
+    return _response({}, ok=False)
+
+
+class TestAchievementRarity:
+    """Test the achievement rarity join."""
+
+    def test_join_sorted_by_rarity(self, monkeypatch):
+        """Test that records are joined on apiname and sorted rarest first."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        with patch.object(web.client, 'get', side_effect=_route) as mock_get:
+            response = web.get_achievement_rarity("76561198006409530", 440)
+
+        assert response.ok is True
+        assert mock_get.call_count == 3
+        names = [a["apiname"] for a in response.data["achievements"]]
+        assert names == ["ACH_RARE", "ACH_LOCKED", "ACH_COMMON"]
+        rare = response.data["achievements"][0]
+        assert rare["name"] == "Rare"
+        assert rare["hidden"] is True
+        assert rare["unlocktime"] == 1700000000
+        assert response.data["achievements"][1]["unlocktime"] is None
+        assert response.data["achievements"][1]["percent"] == pytest.approx(20.1)
+        assert response.data["unlocked"] == 2
+        assert response.data["total"] == 3
+
+    def test_unlocked_only_and_limit(self, monkeypatch):
+        """Test filtering to unlocked achievements with a limit."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        with patch.object(web.client, 'get', side_effect=_route):
+            response = web.get_achievement_rarity("76561198006409530", 440,
+                                                  unlocked_only=True, limit=1)
+
+        assert [a["apiname"] for a in response.data["achievements"]] == ["ACH_RARE"]
+
+    def test_schema_and_percentages_cached(self, monkeypatch):
+        """Test that only the player call is repeated on a second query."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        with patch.object(web.client, 'get', side_effect=_route) as mock_get:
+            web.get_achievement_rarity("76561198006409530", 440)
+            web.get_achievement_rarity("76561198006409531", 440)
+
+        assert mock_get.call_count == 4
+
+    def test_private_profile_returns_error(self, monkeypatch):
+        """Test that a failed player call is returned as-is."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        def route(url, params=None):
+            if "GetPlayerAchievements" in url:
+                return _response({"playerstats": {"error": "Profile is not public", "success": False}},
+                                 ok=False)
+            return _route(url, params)
+
+        with patch.object(web.client, 'get', side_effect=route):
+            response = web.get_achievement_rarity("76561198006409530", 440)
+
+        assert response.ok is False
+
+
+class TestLibraryAchievements:
+    """Test the whole-library achievement sweep."""
+
+    OWNED = {
+        "games": [
+            {"appid": 10, "name": "With Stats", "has_community_visible_stats": True, "playtime_forever": 60},
+            {"appid": 20, "name": "No Stats Flag", "has_community_visible_stats": False},
+            {"appid": 30, "name": "Stats Only", "has_community_visible_stats": True},
+            {"appid": 40, "name": "Perfect", "has_community_visible_stats": True},
+        ]
+    }
+
+    @staticmethod
+    def _route(url, params=None):
+        appid = params.get("appid") if params else None
+        if "GetSchemaForGame" in url:
+            if appid == 30:
+                return _response({"game": {"gameName": "Stats Only", "availableGameStats": {"stats": []}}})
+            return _response(GAME_SCHEMA)
+        if "GetPlayerAchievements" in url:
+            if appid == 40:
+                return _response({"playerstats": {"achievements": [
+                    {"apiname": "A", "achieved": 1, "unlocktime": 5}]}})
+            return _response(PLAYER_ACHIEVEMENTS)
+        return _response({}, ok=False)
+
+    def test_sweep_only_queries_games_with_stats(self, monkeypatch):
+        """Test that games without stats are skipped and totals are aggregated."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        with patch.object(web, 'get_owned_games', return_value=_response(self.OWNED)), \
+             patch.object(web.client, 'get', side_effect=self._route) as mock_get:
+            response = web.get_library_achievements("76561198006409530", max_workers=2)
+
+        assert response.ok is True
+        player_calls = [c for c in mock_get.call_args_list if "GetPlayerAchievements" in c.args[0]]
+        assert sorted(c.kwargs["params"]["appid"] for c in player_calls) == [10, 40]
+        assert response.data["games_with_achievements"] == 2
+        assert response.data["perfect_games"] == 1
+        assert response.data["total_achievements"] == 4
+        assert response.data["unlocked_achievements"] == 3
+        assert [g["appid"] for g in response.data["games"]] == [40, 10]
+        assert response.warnings == []
+
+    def test_failed_games_are_reported(self, monkeypatch):
+        """Test that games whose achievements fail to load are listed in the warnings."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        def route(url, params=None):
+            if "GetPlayerAchievements" in url and params["appid"] == 10:
+                return _response({"playerstats": {"error": "Profile is not public"}}, ok=False)
+            return self._route(url, params)
+
+        with patch.object(web, 'get_owned_games', return_value=_response(self.OWNED)), \
+             patch.object(web.client, 'get', side_effect=route):
+            response = web.get_library_achievements("76561198006409530")
+
+        assert response.ok is True
+        assert response.data["games_with_achievements"] == 1
+        assert response.warnings == ["1 games skipped, totals exclude them: 10"]
+
+    def test_no_stats_error_is_remembered(self, monkeypatch):
+        """Test that "Requested app has no stats" skips the app on later sweeps."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+        owned = {"games": [{"appid": 50, "name": "X", "has_community_visible_stats": True}]}
+
+        def route(url, params=None):
+            if "GetPlayerAchievements" in url:
+                return _response({"playerstats": {"error": "Requested app has no stats",
+                                                  "success": False}}, ok=False)
+            return _response({}, ok=False)
+
+        with patch.object(web, 'get_owned_games', return_value=_response(owned)), \
+             patch.object(web.client, 'get', side_effect=route) as mock_get:
+            first = web.get_library_achievements("76561198006409530")
+            calls_after_first = mock_get.call_count
+            web.get_library_achievements("76561198006409531")
+
+        assert first.ok is True
+        assert first.data["games_with_achievements"] == 0
+        assert mock_get.call_count == calls_after_first
+
+    def test_iterator_streams_results(self, monkeypatch):
+        """Test that the iterator yields GameCompletion records."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        schema_cache.clear()
+        web = SteamWebAPI()
+
+        with patch.object(web, 'get_owned_games', return_value=_response(self.OWNED)), \
+             patch.object(web.client, 'get', side_effect=self._route):
+            first = next(web.iter_library_achievements("76561198006409530", max_workers=1))
+
+        assert first.appid in (10, 40)
+        assert first.total > 0
+
+    def test_owned_games_failure(self, monkeypatch):
+        """Test that a failed owned-games call is reported."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+
+        with patch.object(web, 'get_owned_games', return_value=_response({}, ok=False)):
+            response = web.get_library_achievements("76561198006409530")
+
+        assert response.ok is False
+
+
+APP_DETAILS = {
+    "570": {
+        "success": True,
+        "data": {
+            "name": "Dota 2",
+            "is_free": True,
+            "detailed_description": "<p>" + "x" * 5000 + "</p>",
+            "screenshots": [{"id": i} for i in range(20)],
+        }
+    }
+}
+
+
+class TestFieldProjection:
+    """Test the fields parameter on Web API methods."""
+
+    def test_select_fields(self):
+        """Test field validation, ordering and always-included fields."""
+        assert select_fields(Game, None) is None
+        assert select_fields(Game, []) is None
+        assert select_fields(Game, "playtime_forever, name", always=("appid",)) == \
+            ("appid", "name", "playtime_forever")
+        with pytest.raises(ValueError, match="Unknown fields for Game: price"):
+            select_fields(Game, ["name", "price"])
+
+    def test_app_details_projection(self, monkeypatch):
+        """Test that only the requested fields are returned."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+        with patch.object(web.client, 'get',
+                          side_effect=lambda *a, **k: APIResponse(ok=True, source="steam_store_api",
+                                                                  data=APP_DETAILS)):
+            full = web.get_app_details(570)
+            projected = web.get_app_details(570, fields=["name", "price_overview"])
+
+        assert full.data["app"] == AppDetails.from_api_response(APP_DETAILS, 570).to_dict()
+        assert projected.data["app"] == {"appid": 570, "name": "Dota 2", "price_overview": None}
+
+    def test_owned_games_projection(self, monkeypatch):
+        """Test projection of every record in a games list."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+        data = {"response": {"games": [{"appid": 10, "name": "CS", "playtime_forever": 5,
+                                        "img_icon_url": "abc"}]}}
+        with patch.object(web.client, 'get',
+                          return_value=APIResponse(ok=True, source="steam_web_api", data=data)):
+            response = web.get_owned_games("76561198006409530", fields="playtime_forever")
+
+        assert response.data["games"] == [{"appid": 10, "playtime_forever": 5}]
+
+    def test_projection_uses_schema_defaults(self, monkeypatch):
+        """Test that missing fields take the same defaults as the full view."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+        data = {"response": {"games": [{"appid": 10, "name": "CS"}]}}
+        fields = ["playtime_forever", "has_community_visible_stats", "img_icon_url"]
+        with patch.object(web.client, 'get',
+                          side_effect=lambda *a, **k: APIResponse(ok=True, source="steam_web_api", data=data)):
+            full = web.get_owned_games("76561198006409530")
+            projected = web.get_owned_games("76561198006409530", fields=fields)
+
+        game = projected.data["games"][0]
+        assert game == {"appid": 10, "playtime_forever": 0, "has_community_visible_stats": False,
+                        "img_icon_url": None}
+        assert all(game[name] == full.data["games"][0][name] for name in fields)
+        assert AppDetails.project_response({"570": {"success": True, "data": {}}}, 570,
+                                           ["is_free", "name"]) == {"is_free": False, "name": None}
+
+    def test_news_projection_still_indexes(self, monkeypatch):
+        """Test that projected news is still fully indexed."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        from steam.newsindex import news_index
+        news_index.clear()
+        web = SteamWebAPI()
+        data = {"appnews": {"newsitems": [{"gid": "1", "title": "Patch", "contents": "anticheat fixes",
+                                           "date": 100, "appid": 570}]}}
+        with patch.object(web.client, 'get',
+                          return_value=APIResponse(ok=True, source="steam_web_api", data=data)):
+            response = web.get_game_news(570, fields=["title"])
+
+        assert response.data["news"] == [{"gid": "1", "title": "Patch"}]
+        assert news_index.search("anticheat")[0]["gid"] == "1"
+        news_index.clear()
+
+    def test_unknown_fields_rejected(self, monkeypatch):
+        """Test that unknown fields return an error without a request."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+        with patch.object(web.client, 'get') as mock_get:
+            response = web.get_app_details(570, fields=["nope"])
+
+        assert response.ok is False
+        assert "nope" in response.error["message"]
+        mock_get.assert_not_called()
@@ -0,0 +1,112 @@
+"""
+Tests for Steam ID parsing and vanity URL resolution.
+
+These tests verify:
+- Local conversion of Steam ID formats
+- Vanity lookup caching, including negative entries
+- Bulk resolution of mixed inputs
+- SteamID.validate with a resolver
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam.cache import TTLCache
+from steam.client import APIResponse, SteamClient
+from steam.schemas import SteamID
+from steam.steamid import SteamIDResolver, parse_steam_id
+
+
+GABEN = "76561197960287930"
+
+
+def _vanity_response(url, params=None):
+    if params["vanityurl"].lower() == "gabelogannewell":
+        return APIResponse(ok=True, source="steam_web_api",
+                           data={"response": {"steamid": GABEN, "success": 1}})
+    return APIResponse(ok=True, source="steam_web_api",
+                       data={"response": {"success": 42, "message": "No match"}})
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    monkeypatch.setenv("STEAM_API_KEY", "test_key")
+    return SteamIDResolver(SteamClient(), cache=TTLCache(default_ttl=60))
+
+
+class TestParseSteamID:
+    """Test local Steam ID parsing."""
+
+    @pytest.mark.parametrize("value", [
+        GABEN,
+        "STEAM_0:0:11101",
+        "STEAM_1:0:11101",
+        "[U:1:22202]",
+        "U:1:22202",
+        "https://steamcommunity.com/profiles/76561197960287930/",
+        "steamcommunity.com/profiles/[U:1:22202]",
+    ])
+    def test_numeric_forms(self, value):
+        """Test that numeric forms convert to the same SteamID64."""
+        assert parse_steam_id(value) == (GABEN, None)
+
+    def test_vanity_forms(self):
+        """Test that vanity names and /id/ URLs are recognized."""
+        assert parse_steam_id("gabelogannewell") == (None, "gabelogannewell")
+        assert parse_steam_id("https://steamcommunity.com/id/gabelogannewell/") == (None, "gabelogannewell")
+
+    def test_invalid_values(self):
+        """Test values that cannot be Steam identifiers."""
+        assert parse_steam_id("") == (None, None)
+        assert parse_steam_id("not a name!") == (None, None)
+        assert parse_steam_id("https://steamcommunity.com/market/") == (None, None)
+
+
+class TestSteamIDResolver:
+    """Test SteamIDResolver class."""
+
+    def test_lookup_is_cached(self, resolver):
+        """Test that a resolved vanity name is only requested once."""
+        with patch.object(resolver.client, 'get', side_effect=_vanity_response) as mock_get:
+            assert resolver.resolve("gabelogannewell") == GABEN
+            assert resolver.resolve("GabeLoganNewell") == GABEN
+        assert mock_get.call_count == 1
+
+    def test_negative_entries(self, resolver):
+        """Test that unknown names are cached as misses."""
+        with patch.object(resolver.client, 'get', side_effect=_vanity_response) as mock_get:
+            first = resolver.lookup_vanity("nobody_here")
+            second = resolver.lookup_vanity("nobody_here")
+        assert first.ok is False
+        assert second.ok is False
+        assert mock_get.call_count == 1
+
+    def test_errors_are_not_cached(self, resolver):
+        """Test that transport errors are retried on the next lookup."""
+        error = APIResponse(ok=False, source="steam_web_api", data={}, error={"message": "boom"})
+        with patch.object(resolver.client, 'get', return_value=error) as mock_get:
+            resolver.lookup_vanity("gabelogannewell")
+            resolver.lookup_vanity("gabelogannewell")
+        assert mock_get.call_count == 2
+
+    def test_resolve_many_mixed(self, resolver):
+        """Test bulk resolution of mixed inputs."""
+        values = ["gabelogannewell", "STEAM_0:0:11101", "[U:1:22202]", "nobody_here", "bad value!"]
+        with patch.object(resolver.client, 'get', side_effect=_vanity_response) as mock_get:
+            resolved = resolver.resolve_many(values)
+        assert resolved == {
+            "gabelogannewell": GABEN,
+            "STEAM_0:0:11101": GABEN,
+            "[U:1:22202]": GABEN,
+            "nobody_here": None,
+            "bad value!": None,
+        }
+        assert mock_get.call_count == 2
+
+    def test_validate_with_resolver(self, resolver):
+        """Test that SteamID.validate normalizes through the resolver."""
+        with patch.object(resolver.client, 'get', side_effect=_vanity_response):
+            assert SteamID.validate("STEAM_0:0:11101", resolver=resolver).steamid == GABEN
+            assert SteamID.validate("gabelogannewell", resolver=resolver).steamid == GABEN
+            with pytest.raises(ValueError, match="Could not resolve"):
+                SteamID.validate("nobody_here", resolver=resolver)
@@ -0,0 +1,138 @@
+"""
+Tests for the streaming JSON module.
+
+These tests verify:
+- Incremental array parsing across arbitrary chunk boundaries
+- Envelope values around the streamed array
+- Error bodies and malformed input
+- SteamClient.stream and the typed iterators built on it
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from steam.client import SteamAPIError, SteamClient
+from steam.streaming import JSONArrayStream
+
+
+OWNED_GAMES = {
+    "response": {
+        "game_count": 3,
+        "games": [
+            {"appid": 10, "name": "Counter-Strike", "playtime_forever": 120},
+            {"appid": 570, "name": "Dota 2 — «Ünïcode»", "playtime_forever": 123456789},
+            {"appid": 730, "name": "Counter-Strike 2", "playtime_forever": 0,
+             "playtime_windows_forever": {"total": 5}},
+        ],
+        "more": True,
+    }
+}
+
+
+def _chunks(data, size):
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestJSONArrayStream:
+    """Test JSONArrayStream class."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+    def test_chunk_boundaries(self, size):
+        """Test that any chunking yields the same elements and envelope."""
+        stream = JSONArrayStream(_chunks(OWNED_GAMES, size), ("response", "games"))
+        assert list(stream) == OWNED_GAMES["response"]["games"]
+        assert stream.envelope == {"game_count": 3, "more": True}
+        assert stream.count == 3
+
+    def test_top_level_array_and_str_chunks(self):
+        """Test an empty path with text chunks."""
+        stream = JSONArrayStream(["[1, 2", "3, [4", "], null]"], ())
+        assert list(stream) == [1, 23, [4], None]
+
+    def test_missing_or_empty_array(self):
+        """Test bodies without elements to stream."""
+        assert list(JSONArrayStream([b'{"response": {}}'], ("response", "games"))) == []
+        assert list(JSONArrayStream([b'{"response": {"games": []}}'], ("response", "games"))) == []
+        stream = JSONArrayStream([b'{"success": false}'], ("prices",))
+        assert list(stream) == []
+        assert stream.envelope == {"success": False}
+        assert list(JSONArrayStream([b"[]"], ("prices",))) == []
+
+    def test_malformed_input(self):
+        """Test that truncated or invalid documents raise ValueError."""
+        with pytest.raises(ValueError):
+            list(JSONArrayStream([b'{"prices": [[1, 2], [3'], ("prices",)))
+        with pytest.raises(ValueError):
+            list(JSONArrayStream([b'{"prices": [1 2]}'], ("prices",)))
+        with pytest.raises(ValueError):
+            list(JSONArrayStream([b'{"prices": []} x'], ("prices",)))
+
+    def test_close_on_early_exit(self):
+        """Test that breaking out of the loop releases the response once."""
+        on_close = Mock()
+        with JSONArrayStream(_chunks(OWNED_GAMES, 16), ("response", "games"), on_close=on_close) as stream:
+            for _ in stream:
+                break
+        on_close.assert_called_once()
+
+
+class TestClientStream:
+    """Test SteamClient.stream and the iterators using it."""
+
+    def _response(self, status_code, data):
+        response = Mock()
+        response.status_code = status_code
+        response.text = json.dumps(data)
+        response.iter_content.return_value = iter(_chunks(data, 32))
+        return response
+
+    def test_stream_success(self, monkeypatch):
+        """Test that the request is made in streaming mode."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+
+        with patch('requests.request', return_value=self._response(200, OWNED_GAMES)) as mock_request:
+            stream = client.stream("https://api.steampowered.com/test", ("response", "games"))
+            assert [g["appid"] for g in stream] == [10, 570, 730]
+
+        assert mock_request.call_args[1]["stream"] is True
+
+    def test_stream_error_status(self, monkeypatch):
+        """Test that non-200 responses raise before streaming."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        client = SteamClient()
+
+        with patch('requests.request', return_value=self._response(403, {"error": "denied"})):
+            with pytest.raises(SteamAPIError) as exc_info:
+                client.stream("https://api.steampowered.com/test", ("response", "games"))
+        assert exc_info.value.status_code == 403
+
+    def test_iter_owned_games(self, monkeypatch):
+        """Test that owned games stream as typed records."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        from steam.web import SteamWebAPI
+        web = SteamWebAPI()
+
+        with patch('requests.request', return_value=self._response(200, OWNED_GAMES)):
+            games = list(web.iter_owned_games("76561198006409530"))
+
+        assert [g.appid for g in games] == [10, 570, 730]
+        assert games[1].playtime_forever == 123456789
+        assert games[2].playtime_windows_forever == {"total": 5}
+
+    def test_iter_price_history(self, monkeypatch):
+        """Test that price history streams as typed records."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        from steam.market import SteamMarketAPI
+        market = SteamMarketAPI()
+        data = {"success": True, "price_prefix": "$",
+                "prices": [["Dec 06 2018 01: +0", 1.5, "12"], ["Dec 07 2018 01: +0", 1.25, "3"]]}
+
+        with patch('requests.request', return_value=self._response(200, data)) as mock_request:
+            points = list(market.iter_price_history(730, "AK-47 | Redline (Field-Tested)"))
+
+        assert [(p.price, p.volume) for p in points] == [(1.5, 12), (1.25, 3)]
+        assert mock_request.call_args[1]["params"]["market_hash_name"] == "AK-47 | Redline (Field-Tested)"
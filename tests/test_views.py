@@ -0,0 +1,135 @@
+"""
+Tests for the lazy views module.
+
+These tests verify:
+- Record views read raw records with schema keys, defaults and attributes
+- List views wrap elements lazily and compare equal to plain lists
+- Views are materialized by APIResponse.to_dict and encoded by the codec
+- API methods return views that serialize like the former dict lists
+"""
+
+import pytest
+from unittest.mock import patch
+
+from steam import codec
+from steam.client import APIResponse
+from steam.market import SteamMarketAPI
+from steam.schemas import Friend, Game, GameNews, MarketItem
+from steam.views import ListView, RecordView, list_view, materialize, view_type
+from steam.web import SteamWebAPI
+
+
+GAMES = [
+    {"appid": 570, "name": "Dota 2", "playtime_forever": 10, "rtime_last_played": 1},
+    {"appid": 730, "name": "CS2"},
+]
+
+
+class TestRecordView:
+    """Test views over single records."""
+
+    def test_keys_and_defaults_match_schema(self):
+        """Test that a view reads like the schema's to_dict output."""
+        view = view_type(Game)(GAMES[1])
+        expected = Game.from_record(GAMES[1]).to_dict()
+        assert isinstance(view, RecordView)
+        assert list(view) == list(expected)
+        assert view == expected
+        assert view.to_dict() == expected
+        assert view["playtime_forever"] == 0
+        assert view.get("img_icon_url") is None
+        assert view.get("rtime_last_played", "missing") == "missing"
+        with pytest.raises(KeyError):
+            view["rtime_last_played"]
+
+    def test_typed_attributes(self):
+        """Test that schema fields are exposed as attributes without copying."""
+        raw = dict(GAMES[0])
+        view = view_type(Game)(raw)
+        assert view.appid == 570
+        assert view.playtime_2weeks is None
+        assert view.raw is raw
+        assert view.to_record() == Game.from_record(raw)
+        with pytest.raises(AttributeError):
+            view.extra = 1
+
+    def test_unpacking_copies(self):
+        """Test that ** unpacking produces a plain dict with the schema keys."""
+        item = {**view_type(GameNews)({"gid": "1", "title": "Patch"}), "appid": 570}
+        assert type(item) is dict
+        assert item["title"] == "Patch"
+        assert item["appid"] == 570
+
+
+class TestListView:
+    """Test views over record lists."""
+
+    def test_sequence_access(self):
+        """Test indexing, slicing, iteration and equality with lists."""
+        games = list_view(Game, GAMES)
+        assert isinstance(games, ListView)
+        assert len(games) == 2
+        assert games[0]["appid"] == 570
+        assert games[-1].name == "CS2"
+        assert isinstance(games[:1], ListView)
+        assert [g["appid"] for g in games] == [570, 730]
+        assert games == [g.to_dict() for g in Game.from_api_response({"response": {"games": GAMES}})]
+        assert games.to_records()[0] == Game.from_record(GAMES[0])
+
+    def test_malformed_input(self):
+        """Test that non-list containers and non-dict records read as empty."""
+        assert len(list_view(Friend, None)) == 0
+        friends = list_view(Friend, ["bad"])
+        assert friends[0]["steamid"] == ""
+        assert friends.to_list() == [Friend.from_record({}).to_dict()]
+
+
+class TestMaterialization:
+    """Test serialization of responses holding views."""
+
+    def test_materialize(self):
+        """Test that only views are copied and view-free data is returned as is."""
+        data = {"games": list_view(Game, GAMES), "count": 2}
+        plain = materialize(data)
+        assert type(plain["games"]) is list
+        assert type(plain["games"][0]) is dict
+        assert "rtime_last_played" not in plain["games"][0]
+
+        untouched = {"nested": {"a": [1]}}
+        assert materialize(untouched) is untouched
+
+    def test_response_to_dict_and_codec(self):
+        """Test that APIResponse.to_dict and the codec emit plain JSON."""
+        response = APIResponse(ok=True, source="test", data={"items": list_view(MarketItem, [{"name": "Case"}])})
+        assert type(response.to_dict()["data"]["items"]) is list
+        assert codec.loads(response.to_json())["data"]["items"][0]["name"] == "Case"
+        assert codec.loads(codec.dumps({"items": response.data["items"]}))["items"][0]["appid"] is None
+
+
+class TestAPIViews:
+    """Test views returned by API methods."""
+
+    def test_owned_games_view(self, monkeypatch):
+        """Test that get_owned_games keeps the raw list and serializes like before."""
+        monkeypatch.setenv("STEAM_API_KEY", "test_key")
+        web = SteamWebAPI()
+        raw = {"response": {"game_count": 2, "games": GAMES}}
+        with patch.object(web.client, 'get', return_value=APIResponse(ok=True, source="steam_web_api", data=raw)):
+            response = web.get_owned_games("76561197960287930")
+
+        assert isinstance(response.data["games"], ListView)
+        assert response.data["games"].raw is GAMES
+        assert response.to_dict()["data"]["games"] == [
+            g.to_dict() for g in Game.from_api_response(raw)
+        ]
+
+    def test_market_search_view(self):
+        """Test that market search results are lazy views."""
+        market = SteamMarketAPI()
+        raw = {"results": [{"name": "AK-47", "hash_name": "AK-47 | Redline", "sell_price": 1000}]}
+        with patch.object(market.client, 'get', return_value=APIResponse(ok=True, source="steam_community", data=raw)):
+            response = market.search_items("AK-47")
+
+        item = response.data["items"][0]
+        assert item.hash_name == "AK-47 | Redline"
+        assert response.to_dict()["data"]["items"] == [MarketItem.from_record(raw["results"][0]).to_dict()]